@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+'''Benchmark for converting large test outputs
+
+Compares the conversion pipeline with the old Test.convert on about
+10 MB of output for some typical combinations of conversion options,
+and the streaming comparison with converting everything first when the
+output differs early:
+
+    python benchmarks/conversion.py --size 10
+'''
+#
+## SAUCE - System for AUtomated Code Evaluation
+## Copyright (C) 2013 Moritz Schlarb
+##
+## This program is free software: you can redistribute it and/or modify
+## it under the terms of the GNU Affero General Public License as published by
+## the Free Software Foundation, either version 3 of the License, or
+## any later version.
+##
+## This program is distributed in the hope that it will be useful,
+## but WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+## GNU Affero General Public License for more details.
+##
+## You should have received a copy of the GNU Affero General Public License
+## along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+import sys
+from argparse import ArgumentParser
+from random import Random
+from time import time
+
+from sauce.lib.conversion import conversion_options, Converter, compare
+from sauce.tests.test_conversion import legacy_convert, legacy_unconvert
+
+OPTIONS = [
+    ('default', conversion_options(u'#', True, False, None, False, True, False, False, False, False)),
+    ('splitlines', conversion_options(u'#', True, False, None, True, False, False, False, False, False)),
+    ('splitlines+split+float', conversion_options(u'#', True, False, u',', True, True, False,
+        False, True, False)),
+    ('split+int+sort', conversion_options(None, False, False, None, False, True, True,
+        True, False, False)),
+    ('parallel_sort', conversion_options(u'#', False, True, None, True, False, False,
+        False, False, False)),
+    ('no splitting', conversion_options(u'#', True, False, None, False, False, False,
+        False, False, False)),
+]
+
+
+def output(size):
+    '''About size MB of output with numbers, comments and thread ids'''
+    rnd = Random(4711)
+    lines, length = [u'#Result:'], 0
+    while length < size * 1024 * 1024:
+        line = u'[%d] %s' % (rnd.randint(0, 7), u','.join(u'%.3f' % rnd.random() for _ in xrange(8)))
+        if rnd.random() < 0.05:
+            line = u'# ' + line
+        lines.append(line)
+        length += len(line) + 1
+    return u'\n'.join(lines) + u'\n'
+
+
+def measure(function, options, data):
+    start = time()
+    result = function(options, data)
+    return time() - start, result
+
+
+def main(argv=None):
+    parser = ArgumentParser(description='Benchmark the conversion of test output')
+    parser.add_argument('--size', type=float, default=10,
+        help='size of the output in MB (default: %(default)s)')
+    args = parser.parse_args(argv)
+
+    data = output(args.size)
+    print 'Output: %.1f MB, %d lines' % (len(data) / 1024.0 / 1024, data.count(u'\n'))
+    print '%-24s %10s %10s %8s' % ('Options', 'old', 'pipeline', 'speedup')
+    for (name, options) in OPTIONS:
+        old, expected = measure(legacy_convert, options, data)
+        new, result = measure(lambda o, d: Converter(o)(d), options, data)
+        assert result == expected, 'Conversion results differ for %s' % name
+        print '%-24s %9.3fs %9.3fs %7.2fx' % (name, old, new, old / new)
+
+    print
+    print '%-24s %10s %10s %8s' % ('Early mismatch', 'full', 'streaming', 'speedup')
+    wrong = u'#Result:\n[9] wrong\n' + data
+    for (name, options) in OPTIONS:
+        if options.sort or options.parallel_sort:
+            continue
+        expected = legacy_unconvert(options, legacy_convert(options, data)).strip()
+        old, result = measure(lambda o, d: expected == legacy_unconvert(o, legacy_convert(o, d)).strip(),
+            options, wrong)
+        new, c = measure(lambda o, d: compare(expected, Converter(o).chunks(d, unicode, o.separator or u' ')),
+            options, wrong)
+        assert result == c.result, 'Comparison results differ for %s' % name
+        print '%-24s %9.3fs %9.3fs %7.2fx' % (name, old, new, old / new)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+'''Benchmark for saving the testruns of a submission
+
+Compares replacing the testruns through the ORM unit of work, like
+Submission.run_tests used to do, with Submission.store_testruns for an
+assignment with 50 tests:
+
+    python benchmarks/testruns.py --url sqlite:////tmp/testruns.db
+    python benchmarks/testruns.py --url postgresql://sauce@localhost/sauce_bench
+
+All tables in the database are dropped and created again!
+'''
+#
+## SAUCE - System for AUtomated Code Evaluation
+## Copyright (C) 2013 Moritz Schlarb
+##
+## This program is free software: you can redistribute it and/or modify
+## it under the terms of the GNU Affero General Public License as published by
+## the Free Software Foundation, either version 3 of the License, or
+## any later version.
+##
+## This program is distributed in the hope that it will be useful,
+## but WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+## GNU Affero General Public License for more details.
+##
+## You should have received a copy of the GNU Affero General Public License
+## along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+import sys
+from argparse import ArgumentParser
+from time import time
+
+import transaction
+from sqlalchemy import create_engine
+
+from sauce.lib.runner import testresult, usage
+from sauce.model import (DBSession, init_model, metadata, Assignment, Interpreter, Language,
+    Submission, Test, Testrun, User)
+
+
+def setup(url, tests):
+    engine = create_engine(url)
+    init_model(engine)
+    metadata.drop_all(engine)
+    metadata.create_all(engine)
+    assignment = Assignment(id=1, name=u'Benchmark', assignment_id=1, timeout=1)
+    for i in xrange(tests):
+        Test(assignment=assignment, name=u'Test %d' % i, output_data=u'%d' % i)
+    language = Language(id=1, name=u'Python', extension_src=u'py', extension_bin=u'py',
+        interpreter=Interpreter(id=1, name=u'Python', path=u'/usr/bin/python2.7', argv=u'{binfile}'))
+    user = User(user_name=u'bench', email_address=u'bench@example.com', display_name=u'Bench')
+    DBSession.add_all((assignment, language, user,
+        Submission(id=1, assignment=assignment, language=language, user=user, source=u'pass')))
+    transaction.commit()
+
+
+def results(submission, size):
+    output = u'x' * (size * 1024)
+    return [testresult(True, False, test, 0.01, test.output_data, output, u'', 0, usage(0.01, 0.0, 4096), None)
+        for test in submission.assignment.tests]
+
+
+def orm(submission, testresults):
+    '''How Submission.run_tests saved the testruns before'''
+    submission.testruns = []
+    for t in testresults:
+        submission.testruns.append(Testrun(submission=submission, test=t.test,
+            result=t.result, partial=t.partial, runtime=t.runtime,
+            output_data=t.output_data, error_data=t.error_data,
+            limit_hit=t.limit, skipped=t.skipped, **Testrun.usage_args(t.usage)))
+    DBSession.flush()
+
+
+def bulk(submission, testresults):
+    submission.store_testruns(testresults)
+
+
+def measure(name, store, size, iterations):
+    elapsed = 0.0
+    for _ in xrange(iterations):
+        submission = DBSession.query(Submission).get(1)
+        testresults = results(submission, size)
+        # Load the old testruns, like Submission.result would
+        len(submission.testruns)
+        start = time()
+        store(submission, testresults)
+        transaction.commit()
+        elapsed += time() - start
+    print '%-24s %8.3f s  %8.1f ms/submission' % (name, elapsed, elapsed / iterations * 1e3)
+    return elapsed
+
+
+def main(argv=None):
+    parser = ArgumentParser(description='Benchmark saving the testruns of a submission')
+    parser.add_argument('--url', default='sqlite:///:memory:',
+        help='database to run the benchmark in, all tables get dropped (default: %(default)s)')
+    parser.add_argument('--tests', type=int, default=50,
+        help='number of tests of the assignment (default: %(default)s)')
+    parser.add_argument('--size', type=int, default=64,
+        help='size of the output of each testrun in KB (default: %(default)s)')
+    parser.add_argument('-n', '--iterations', type=int, default=50,
+        help='number of times the testruns are replaced (default: %(default)s)')
+    args = parser.parse_args(argv)
+
+    setup(args.url, args.tests)
+    baseline = measure('ORM unit of work', orm, args.size, args.iterations)
+    bulked = measure('store_testruns', bulk, args.size, args.iterations)
+    print 'Speedup: %.2fx' % (baseline / bulked)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
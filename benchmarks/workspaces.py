@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+'''Benchmark for setting up and tearing down grading workspaces
+
+Compares the mkdtemp/rmtree cycle that each Runner used to do with
+pooled workspaces, optionally below a different root like a tmpfs:
+
+    python benchmarks/workspaces.py --root /dev/shm/sauce --pool 8
+'''
+#
+## SAUCE - System for AUtomated Code Evaluation
+## Copyright (C) 2013 Moritz Schlarb
+##
+## This program is free software: you can redistribute it and/or modify
+## it under the terms of the GNU Affero General Public License as published by
+## the Free Software Foundation, either version 3 of the License, or
+## any later version.
+##
+## This program is distributed in the hope that it will be useful,
+## but WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+## GNU Affero General Public License for more details.
+##
+## You should have received a copy of the GNU Affero General Public License
+## along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+import os
+import sys
+from argparse import ArgumentParser
+from shutil import rmtree
+from tempfile import mkdtemp
+from time import time
+
+from sauce.lib.runner import WorkspacePool
+
+SOURCE = '#include <stdio.h>\n\nint main(void) {\n    printf("Hello World!\\n");\n    return 0;\n}\n' * 50
+
+
+def fill(dir):  # pylint:disable=redefined-builtin
+    '''Write what a typical compiled submission leaves behind'''
+    with open(os.path.join(dir, 'a1_s1.c'), 'w') as fd:
+        fd.write(SOURCE)
+    with open(os.path.join(dir, 'a1_s1'), 'w') as fd:
+        fd.write('\0' * 16 * 1024)
+    with open(os.path.join(dir, 'outdata'), 'w') as fd:
+        fd.write('Hello World!\n')
+
+
+def mkdtemp_cycle(root):
+    dir = mkdtemp(dir=root)  # pylint:disable=redefined-builtin
+    fill(dir)
+    rmtree(dir)
+
+
+def pool_cycle(pool):
+    dir = pool.acquire()  # pylint:disable=redefined-builtin
+    fill(dir)
+    pool.release(dir)
+
+
+def measure(name, cycle, arg, iterations):
+    start = time()
+    for _ in xrange(iterations):
+        cycle(arg)
+    elapsed = time() - start
+    print '%-24s %8.3f s  %8.1f us/workspace' % (name, elapsed, elapsed / iterations * 1e6)
+    return elapsed
+
+
+def main(argv=None):
+    parser = ArgumentParser(description='Benchmark grading workspace setup and teardown')
+    parser.add_argument('--root', default=None,
+        help='directory to create the workspaces in (default: system temporary directory)')
+    parser.add_argument('--pool', type=int, default=8,
+        help='number of pooled workspaces (default: %(default)s)')
+    parser.add_argument('-n', '--iterations', type=int, default=5000,
+        help='number of workspaces to set up and tear down (default: %(default)s)')
+    args = parser.parse_args(argv)
+
+    if args.root and not os.path.isdir(args.root):
+        os.makedirs(args.root)
+
+    baseline = measure('mkdtemp + rmtree', mkdtemp_cycle, args.root, args.iterations)
+    pool = WorkspacePool(args.root, args.pool)
+    try:
+        pooled = measure('WorkspacePool(%d)' % args.pool, pool_cycle, pool, args.iterations)
+    finally:
+        pool.close()
+    print 'Speedup: %.2fx' % (baseline / pooled)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
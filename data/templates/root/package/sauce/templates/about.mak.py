@@ -0,0 +1,58 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+STOP_RENDERING = runtime.STOP_RENDERING
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792327267.152433
+_enable_loop = True
+_template_filename = '/root/package/sauce/templates/about.mak'
+_template_uri = '/root/package/sauce/templates/about.mak'
+_source_encoding = 'utf-8'
+from markupsafe import escape_silent as escape
+_exports = ['title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'local:templates.master', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        tg = context.get('tg', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n\n<div class="page-header">\n  <h1>About</h1>\n</div>\n\n<div class="row"><div class="span9">\n\n<p>\n<strong>SAUCE</strong> is a web-based system for automated testing of \nprogramming exercises.\nIt aims to help both students and teachers by providing\nan environment for correcting, testing and annotating\nsource code.</p>\n\n<p><strong>SAUCE</strong> uses some state-of-the-art technologies for rapid web\ndevelopment like the\n<a href="http://en.wikipedia.org/wiki/Model%E2%80%93view%E2%80%93controller">Model-View-Controller pattern</a>\nusing a sophisticated framework (<a href="http://turbogears.org/">TurboGears2</a>),\nan <a href="http://en.wikipedia.org/wiki/Object-relational_mapping">object\nrelational mapper</a> (<a href="http://www.sqlalchemy.org/">SQLAlchemy</a>),\nboth written in the most flexible and beautiful programming language,\n<a href="http://www.python.org/">Python</a>.<br />\nWe use <a href="http://git-scm.com/">Git</a> for soure code management and\n<a href="https://github.com/">Github</a> as an open source project hosting\nplatform.</p>\n\n<h3>Support</h3>\n\nThe development of <strong>SAUCE</strong> is supported and financially\nsponsored by the <a href="http://www.informatik.uni-mainz.de/">Institut of Computer Science</a>\nat the <a href="http://www.uni-mainz.de/">Johannes Gutenberg-Universit\xe4t Mainz</a>.\n\n<h3>See also</h3>\nThe <a href="')
+        __M_writer(escape(tg.url('/docs/')))
+        __M_writer(u'">documentation page</a> holds several\npages of documentation about the usage and configuration of <strong>SAUCE</strong>.\n\n<div>&nbsp;</div>\n\n<div class="well">\n  <h2>Acknowledgements</h2>\n  <p>\n    <strong>SAUCE</strong> wouldn\'t be possible without some other\n    great open source projects and people. I\'d like to thank all of\n    them for their work, including but not limited to:\n  </p>\n  <dl>\n    <dt><a href="http://turbogears.org/">TurboGears 2</a></dt>\n    <dd>The Webframework</dd>\n    <dt><a href="http://toscawidgets.org/">Toscawidgets 2</a></dt>\n    <dd>The Widget library</dd>\n    <dt><a href="http://www.sqlalchemy.org/">SQLAlchemy</a></dt>\n    <dd>The Python SQL Toolkit and Object Relational Mapper</dd>\n    <dt><a href="http://twitter.github.com/bootstrap">Twitter Bootstrap</a></dt>\n    <dd>The CSS framework - which includes <a href="http://jquery.com/">jQuery</a>\n      and <a href="http://glyphicons.com/">Glyphicons Free</a></dd>\n    <dt><a href="http://pygments.org/">Pygments</a></dt>\n    <dd>The Python Syntax Highlighter</dd>\n  </dl>\n  <p><small>And many more...</small></p>\n</div>\n\n</div></div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_writer = context.writer()
+        __M_writer(u'\n  About\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"34": 16, "35": 17, "36": 21, "37": 56, "38": 56, "44": 19, "48": 19, "54": 48, "28": 0}, "uri": "/root/package/sauce/templates/about.mak", "filename": "/root/package/sauce/templates/about.mak"}
+__M_END_METADATA
+"""
@@ -0,0 +1,158 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+STOP_RENDERING = runtime.STOP_RENDERING
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792327264.062359
+_enable_loop = True
+_template_filename = '/root/package/sauce/templates/assignment.mak'
+_template_uri = '/root/package/sauce/templates/assignment.mak'
+_source_encoding = 'utf-8'
+from markupsafe import escape_silent as escape
+_exports = ['details', 'title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    ns = runtime.TemplateNamespace('__anon_0x7fb1c7ed29d0', context._clean_inheritance_tokens(), templateuri=u'local:templates.misc', callables=None,  calling_uri=_template_uri)
+    context.namespaces[(__name__, '__anon_0x7fb1c7ed29d0')] = ns
+
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'local:templates.master', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        _import_ns = {}
+        _mako_get_namespace(context, '__anon_0x7fb1c7ed29d0')._populate(_import_ns, [u'times_dl'])
+        assignment = _import_ns.get('assignment', context.get('assignment', UNDEFINED))
+        getattr = _import_ns.get('getattr', context.get('getattr', UNDEFINED))
+        request = _import_ns.get('request', context.get('request', UNDEFINED))
+        event = _import_ns.get('event', context.get('event', UNDEFINED))
+        self = _import_ns.get('self', context.get('self', UNDEFINED))
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(u'\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n<div class="page-header">\n')
+        if getattr(request, 'user', None) in event.teachers or 'manage' in request.permissions:
+            __M_writer(u'    <div class="pull-right">\n      <a href="')
+            __M_writer(escape(assignment.sheet.event.url))
+            __M_writer(u'/admin/assignments/')
+            __M_writer(escape(assignment.id))
+            __M_writer(u'/edit" class="btn"><i class="icon-pencil"></i>&nbsp;Edit</a>\n    </div>\n')
+        __M_writer(u'  <h1>')
+        __M_writer(escape(assignment.name))
+        __M_writer(u' <small>Assignment</small></h1>\n</div>\n\n')
+        __M_writer(escape(self.details(assignment)))
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_details(context,assignment):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        _import_ns = {}
+        _mako_get_namespace(context, '__anon_0x7fb1c7ed29d0')._populate(_import_ns, [u'times_dl'])
+        c = _import_ns.get('c', context.get('c', UNDEFINED))
+        set = _import_ns.get('set', context.get('set', UNDEFINED))
+        request = _import_ns.get('request', context.get('request', UNDEFINED))
+        times_dl = _import_ns.get('times_dl', context.get('times_dl', UNDEFINED))
+        values = _import_ns.get('values', context.get('values', UNDEFINED))
+        tg = _import_ns.get('tg', context.get('tg', UNDEFINED))
+        event = _import_ns.get('event', context.get('event', UNDEFINED))
+        dict = _import_ns.get('dict', context.get('dict', UNDEFINED))
+        __M_writer = context.writer()
+        __M_writer(u'\n\n<p class="description">')
+        __M_writer(assignment.description or u'' )
+        __M_writer(u'</p>\n\n')
+        __M_writer(u'\n<dl>\n')
+        if assignment.submission_scaffold_show and assignment.submission_scaffold_head:
+            __M_writer(u'<dt title="This code will always come before your submission source code">Scaffold Head</dt>\n<dd>\n  ')
+            __M_writer(c.source_display.display(assignment.submission_scaffold_head, id='scaffold_head', compound_id='scaffold_head') )
+            __M_writer(u'\n</dd>\n')
+        if assignment.submission_scaffold_show and assignment.submission_scaffold_foot:
+            __M_writer(u'<dt title="This code will always come after your submission source code">Scaffold Foot</dt>\n<dd>\n  ')
+            __M_writer(c.source_display.display(assignment.submission_scaffold_foot, id='scaffold_foot', compound_id='scaffold_foot') )
+            __M_writer(u'\n</dd>\n')
+        __M_writer(u'</dl>\n\n')
+        __M_writer(escape(times_dl(assignment)))
+        __M_writer(u'\n\n')
+        if assignment.timeout:
+            __M_writer(u'  <dl>\n    <dt>General test timeout:</dt>\n    <dd>')
+            __M_writer(escape(assignment.timeout))
+            __M_writer(u' seconds</dd>\n  </dl>\n')
+        __M_writer(u'\n')
+        if 'manage' in request.permissions or \
+    request.user and (request.user in set(event.members) | set(event.tutorsandteachers) \
+        and (assignment.is_active or request.allowance(assignment))):
+            __M_writer(u'    <p>\n')
+            if values:
+                __M_writer(u'      <div class="modal hide fade" id="submitModal">\n        <div class="modal-header">\n          <button type="button" class="close" data-dismiss="modal">\xd7</button>\n          <h3>Are you sure?</h3>\n        </div>\n        <div class="modal-body">\n          <p>\n            You already made a Submission for this Assignment,\n            are you sure you want to create another one?\n          </p>\n        </div>\n        <div class="modal-footer">\n          <a href="#" class="btn" data-dismiss="modal">Cancel</a>\n          <a href="')
+                __M_writer(escape(tg.url('%s/submit' % (assignment.url))))
+                __M_writer(u'" class="btn btn-primary">Submit new solution</a>\n        </div>\n      </div>\n      <a href="#submitModal" data-toggle="modal" class="btn btn-primary">Submit new solution</a>\n')
+            else:
+                __M_writer(u'      <a href="')
+                __M_writer(escape(tg.url('%s/submit' % (assignment.url))))
+                __M_writer(u'" class="btn btn-primary">Submit new solution</a>\n')
+            __M_writer(u'    </p>\n')
+        __M_writer(u'\n')
+        if request.user:
+            __M_writer(u'  <div class="crud_table">\n    ')
+            __M_writer(c.table(value=values, attrs=dict(style="height:200px; border:solid black 3px;")) )
+            __M_writer(u'\n  </div>\n')
+        __M_writer(u'\n')
+        if assignment.visible_tests:
+            __M_writer(u'  <h2>Tests</h2>\n    <table class="table table-bordered table-condensed test-and-result-table">\n')
+            for test in assignment.visible_tests:
+                if test.argv:
+                    __M_writer(u'        <tr>\n          <th>Command line arguments</th>\n          <td><code>')
+                    __M_writer(escape(test.argv))
+                    __M_writer(u'</code></td>\n        </tr>\n')
+                if test.comment_prefix:
+                    __M_writer(u'        <tr>\n          <th>Comment prefix</th>\n          <td><code>')
+                    __M_writer(escape(test.comment_prefix))
+                    __M_writer(u'</code></td>\n        </tr>\n')
+                __M_writer(u'      <tr>\n        <th>Given input</th>\n        <td><pre>')
+                __M_writer(escape(test.input_data))
+                __M_writer(u'</pre></td>\n      </tr>\n      <tr>\n        <th>Expected output</th>\n        <td><pre>')
+                __M_writer(escape(test.output_data))
+                __M_writer(u'</pre></td>\n      </tr>\n')
+            __M_writer(u'  </table>\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        _import_ns = {}
+        _mako_get_namespace(context, '__anon_0x7fb1c7ed29d0')._populate(_import_ns, [u'times_dl'])
+        assignment = _import_ns.get('assignment', context.get('assignment', UNDEFINED))
+        __M_writer = context.writer()
+        __M_writer(u'\n  ')
+        __M_writer(escape(assignment.name))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"128": 117, "129": 117, "130": 121, "131": 121, "132": 124, "133": 126, "139": 20, "146": 20, "147": 21, "148": 21, "24": 18, "154": 148, "30": 0, "42": 16, "43": 17, "44": 18, "45": 22, "46": 25, "47": 26, "48": 27, "49": 27, "50": 27, "51": 27, "52": 30, "53": 30, "54": 30, "55": 33, "56": 33, "57": 127, "63": 35, "77": 35, "78": 37, "79": 37, "80": 40, "81": 42, "82": 43, "83": 45, "84": 45, "85": 48, "86": 49, "87": 51, "88": 51, "89": 54, "90": 56, "91": 56, "92": 58, "93": 59, "94": 61, "95": 61, "96": 64, "97": 65, "100": 68, "101": 69, "102": 70, "103": 83, "104": 83, "105": 87, "106": 88, "107": 88, "108": 88, "109": 90, "110": 92, "111": 93, "112": 94, "113": 95, "114": 95, "115": 98, "116": 99, "117": 100, "118": 102, "119": 103, "120": 104, "121": 106, "122": 106, "123": 109, "124": 110, "125": 112, "126": 112, "127": 115}, "uri": "/root/package/sauce/templates/assignment.mak", "filename": "/root/package/sauce/templates/assignment.mak"}
+__M_END_METADATA
+"""
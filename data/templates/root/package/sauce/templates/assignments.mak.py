@@ -0,0 +1,107 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+STOP_RENDERING = runtime.STOP_RENDERING
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792327249.904627
+_enable_loop = True
+_template_filename = u'/root/package/sauce/templates/assignments.mak'
+_template_uri = u'/root/package/sauce/templates/assignments.mak'
+_source_encoding = 'utf-8'
+from markupsafe import escape_silent as escape
+_exports = ['list', 'title']
+
+
+
+import sauce.lib.helpers as h
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'local:templates.master', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        sheet = context.get('sheet', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        request = context.get('request', UNDEFINED)
+        assignments = context.get('assignments', UNDEFINED)
+        getattr = context.get('getattr', UNDEFINED)
+        event = context.get('event', UNDEFINED)
+        hasattr = context.get('hasattr', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n<div class="page-header">\n')
+        if getattr(request, 'user', None) in event.teachers or 'manage' in request.permissions:
+            __M_writer(u'    <div class="pull-right">\n      <a href="')
+            __M_writer(escape(sheet.event.url))
+            __M_writer(u'/admin/assignments/?sheet_id=')
+            __M_writer(escape(sheet.id))
+            __M_writer(u'" class="btn"><i class="icon-pencil"></i>&nbsp;Edit</a>\n    </div>\n')
+        __M_writer(u'  <h1>')
+        __M_writer(escape(sheet.name))
+        __M_writer(u' <small>Assignments</small></h1>\n</div>\n\n')
+        __M_writer(escape(self.list(assignments)))
+        __M_writer(u'\n')
+        if hasattr(assignments, 'pager'):
+            __M_writer(u'  <p>')
+            __M_writer(escape(assignments.pager('Pages: $link_previous ~2~ $link_next')))
+            __M_writer(u'</p>\n')
+        __M_writer(u'\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_list(context,assignments):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_writer = context.writer()
+        __M_writer(u'\n\n<dl>\n')
+        for assignment in assignments:
+            __M_writer(u'    <dt>')
+            __M_writer(escape(assignment.link))
+            __M_writer(u' \n')
+            if not assignment.public:
+                __M_writer(u'        <i class="icon-lock"></i>\n')
+            __M_writer(u'    </dt>\n    \n    <dd>')
+            __M_writer(h.cut(h.striphtml(assignment.description )))
+            __M_writer(u'</dd>\n')
+        __M_writer(u'</dl>\n\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        sheet = context.get('sheet', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n  ')
+        __M_writer(escape(sheet.name))
+        __M_writer(u' - Assignments\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"17": 19, "32": 0, "44": 16, "45": 17, "46": 21, "47": 25, "48": 28, "49": 29, "50": 30, "51": 30, "52": 30, "53": 30, "54": 33, "55": 33, "56": 33, "57": 36, "58": 36, "59": 37, "60": 38, "61": 38, "62": 38, "63": 40, "64": 55, "70": 41, "74": 41, "75": 44, "76": 45, "77": 45, "78": 45, "79": 46, "80": 47, "81": 49, "82": 51, "83": 51, "84": 53, "90": 23, "95": 23, "96": 24, "97": 24, "103": 97}, "uri": "/root/package/sauce/templates/assignments.mak", "filename": "/root/package/sauce/templates/assignments.mak"}
+__M_END_METADATA
+"""
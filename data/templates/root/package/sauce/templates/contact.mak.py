@@ -0,0 +1,60 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+STOP_RENDERING = runtime.STOP_RENDERING
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792327267.167728
+_enable_loop = True
+_template_filename = '/root/package/sauce/templates/contact.mak'
+_template_uri = '/root/package/sauce/templates/contact.mak'
+_source_encoding = 'utf-8'
+from markupsafe import escape_silent as escape
+_exports = ['title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'local:templates.master', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        tg = context.get('tg', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n<div class="page-header">\n  <h1>SAUCE <small>System for AUtomated Code Evaluation</small></h1>\n</div>\n\n<h2>Contact</h2>\n\n<p>There are two different people which you can contact, depending on your\nconcern at hand:</p>\n\n<div class="row">\n\n<div class="span6">\n<h3>Maintainer</h3>\n<p>\nIf you have any questions, problems or issues regarding this specific instance of <strong>SAUCE</strong>,\nlike the available programming languages or data protection issues,\nplease contact the maintainer at <a href="mailto:')
+        __M_writer(escape(tg.config.get('email_to')))
+        __M_writer(u'">')
+        __M_writer(escape(tg.config.get('email_to')))
+        __M_writer(u'</a>.\n</p>\n</div>\n\n<div class="span6">\n<h3>Developer</h3>\n<p>\nIf you have general questions about <strong>SAUCE</strong> or want to report a bug or an idea\nfor improvement, you can simply file an <a href="https://github.com/moschlar/SAUCE/issues">issue</a>\nin the GitHub issue tracking system or you can contact the\n<a href="https://github.com/moschlar">developer</a> directly.\n</p>\n</div>\n\n</div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_writer = context.writer()
+        __M_writer(u'\n  Contact\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"34": 16, "35": 17, "36": 21, "37": 39, "38": 39, "39": 39, "40": 39, "46": 19, "50": 19, "56": 50, "28": 0}, "uri": "/root/package/sauce/templates/contact.mak", "filename": "/root/package/sauce/templates/contact.mak"}
+__M_END_METADATA
+"""
@@ -0,0 +1,134 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+STOP_RENDERING = runtime.STOP_RENDERING
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792327248.806844
+_enable_loop = True
+_template_filename = '/root/package/sauce/templates/crc/get_all.mak'
+_template_uri = '/root/package/sauce/templates/crc/get_all.mak'
+_source_encoding = 'utf-8'
+from markupsafe import escape_silent as escape
+_exports = ['headers', 'title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    ns = runtime.TemplateNamespace('__anon_0x7fb1c8844e10', context._clean_inheritance_tokens(), templateuri=u'local:templates.crc.menu', callables=None,  calling_uri=_template_uri)
+    context.namespaces[(__name__, '__anon_0x7fb1c8844e10')] = ns
+
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'local:templates.master', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        _import_ns = {}
+        _mako_get_namespace(context, '__anon_0x7fb1c8844e10')._populate(_import_ns, [u'crud_menu'])
+        c = _import_ns.get('c', context.get('c', UNDEFINED))
+        mount_point = _import_ns.get('mount_point', context.get('mount_point', UNDEFINED))
+        crud_menu = _import_ns.get('crud_menu', context.get('crud_menu', UNDEFINED))
+        value_list = _import_ns.get('value_list', context.get('value_list', UNDEFINED))
+        self = _import_ns.get('self', context.get('self', UNDEFINED))
+        search_fields = _import_ns.get('search_fields', context.get('search_fields', UNDEFINED))
+        len = _import_ns.get('len', context.get('len', UNDEFINED))
+        tmpl_context = _import_ns.get('tmpl_context', context.get('tmpl_context', UNDEFINED))
+        getattr = _import_ns.get('getattr', context.get('getattr', UNDEFINED))
+        current_search = _import_ns.get('current_search', context.get('current_search', UNDEFINED))
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(u'\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n<div id="main_content" class="row">\n')
+        if getattr(c, 'show_menu', True):
+            __M_writer(u'    ')
+            __M_writer(escape(crud_menu()))
+            __M_writer(u'\n')
+        __M_writer(u'  <div class="span10">\n    <div class="page-header">\n      <h1>')
+        __M_writer(escape(self.title()))
+        __M_writer(u'</h1>\n    </div>\n    <div class="row">\n      <div class="span4" style="margin-bottom: 18px;">\n        ')
+        __M_writer(c.bulk_actions or '&nbsp;' )
+        __M_writer(u'\n      </div>\n      <div class="span1" style="padding: 4px 0;">\n        <span class="badge">')
+        __M_writer(escape(len(value_list)))
+        __M_writer(u'</span>\n      </div>\n      <div class="span5">\n')
+        if search_fields:
+            __M_writer(u'          <div id="crud_search" class="pull-right">\n            <form class="form-search">\n                <select id="crud_search_field" class="input-small" onchange="crud_search_field_changed(this);">\n')
+            for field, name, selected in search_fields:
+                if selected is not False:
+                    __M_writer(u'                        <option value="')
+                    __M_writer(escape(field))
+                    __M_writer(u'" selected="selected">')
+                    __M_writer(escape(name))
+                    __M_writer(u'</option>\n')
+                else:
+                    __M_writer(u'                        <option value="')
+                    __M_writer(escape(field))
+                    __M_writer(u'">')
+                    __M_writer(escape(name))
+                    __M_writer(u'</option>\n')
+            __M_writer(u'                </select>\n                <input id="crud_search_value" class="search-query input-small" name="')
+            __M_writer(escape(current_search[0]))
+            __M_writer(u'" type="text" placeholder="equals / contains" value="')
+            __M_writer(escape(current_search[1]))
+            __M_writer(u'" />\n                <button type="submit" class="btn"><i class="icon-search"></i>&nbsp;Search</button>\n            </form>\n          </div>\n')
+        __M_writer(u'      </div>\n    </div>\n    <div>\n     ')
+        __M_writer(tmpl_context.widget(value=value_list, action=mount_point+'.json') )
+        __M_writer(u'\n    </div>\n    <div class="row">\n      <div class="offset2 span3">\n')
+        if tmpl_context.paginators:
+            __M_writer(u'           <span>')
+            __M_writer(escape(tmpl_context.paginators.value_list.pager(link=mount_point+'/')))
+            __M_writer(u'</span>\n')
+        else:
+            __M_writer(u'           &nbsp;\n')
+        __M_writer(u'      </div>\n    </div>\n  </div>\n  <div style="clear:both;"> &nbsp; </div>\n</div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_headers(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        _import_ns = {}
+        _mako_get_namespace(context, '__anon_0x7fb1c8844e10')._populate(_import_ns, [u'crud_menu'])
+        parent = _import_ns.get('parent', context.get('parent', UNDEFINED))
+        __M_writer = context.writer()
+        __M_writer(u'\n<script>\n    function crud_search_field_changed(select) {\n        var selected = \'\';\n        for (var idx=0; idx != select.options.length; ++idx) {\n            if (select.options[idx].selected)\n                selected = select.options[idx];\n        }\n        var field = document.getElementById(\'crud_search_value\');\n        field.name = selected.value;\n    }\n</script>\n<script type="text/javascript">\n    function show_processing_modal(text) {\n        var modaldiv = $(\'<div class="modal hide" id="pleaseWaitDialog" data-backdrop="static" data-keyboard="false"><div class="modal-header"><h1>Processing...</h1></div><div class="modal-body"><p>\' + (text || \'\') + \'</p><div class="progress progress-striped active"><div class="bar" style="width: 100%;"></div></div></div></div>\');\n        modaldiv.modal();\n    }\n</script>\n')
+        __M_writer(escape(parent.headers()))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        _import_ns = {}
+        _mako_get_namespace(context, '__anon_0x7fb1c8844e10')._populate(_import_ns, [u'crud_menu'])
+        c = _import_ns.get('c', context.get('c', UNDEFINED))
+        model = _import_ns.get('model', context.get('model', UNDEFINED))
+        getattr = _import_ns.get('getattr', context.get('getattr', UNDEFINED))
+        __M_writer = context.writer()
+        __M_writer(u'\n  ')
+        __M_writer(escape(getattr(c, 'menu_item', model)))
+        __M_writer(u' Listing\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"130": 124, "24": 18, "30": 0, "47": 16, "48": 17, "49": 18, "50": 22, "51": 43, "52": 46, "53": 47, "54": 47, "55": 47, "56": 49, "57": 51, "58": 51, "59": 55, "60": 55, "61": 58, "62": 58, "63": 61, "64": 62, "65": 65, "66": 66, "67": 67, "68": 67, "69": 67, "70": 67, "71": 67, "72": 68, "73": 69, "74": 69, "75": 69, "76": 69, "77": 69, "78": 72, "79": 73, "80": 73, "81": 73, "82": 73, "83": 78, "84": 81, "85": 81, "86": 85, "87": 86, "88": 86, "89": 86, "90": 87, "91": 88, "92": 90, "98": 24, "105": 24, "106": 42, "107": 42, "113": 20, "122": 20, "123": 21, "124": 21}, "uri": "/root/package/sauce/templates/crc/get_all.mak", "filename": "/root/package/sauce/templates/crc/get_all.mak"}
+__M_END_METADATA
+"""
@@ -0,0 +1,94 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+STOP_RENDERING = runtime.STOP_RENDERING
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792327258.848817
+_enable_loop = True
+_template_filename = '/root/package/sauce/templates/crc/get_delete.mak'
+_template_uri = '/root/package/sauce/templates/crc/get_delete.mak'
+_source_encoding = 'utf-8'
+from markupsafe import escape_silent as escape
+_exports = ['title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    ns = runtime.TemplateNamespace('__anon_0x7fb1c80e1290', context._clean_inheritance_tokens(), templateuri=u'local:templates.crc.menu', callables=None,  calling_uri=_template_uri)
+    context.namespaces[(__name__, '__anon_0x7fb1c80e1290')] = ns
+
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'local:templates.master', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        _import_ns = {}
+        _mako_get_namespace(context, '__anon_0x7fb1c80e1290')._populate(_import_ns, [u'crud_menu'])
+        c = _import_ns.get('c', context.get('c', UNDEFINED))
+        pk_count = _import_ns.get('pk_count', context.get('pk_count', UNDEFINED))
+        obj = _import_ns.get('obj', context.get('obj', UNDEFINED))
+        deps = _import_ns.get('deps', context.get('deps', UNDEFINED))
+        crud_menu = _import_ns.get('crud_menu', context.get('crud_menu', UNDEFINED))
+        pklist = _import_ns.get('pklist', context.get('pklist', UNDEFINED))
+        self = _import_ns.get('self', context.get('self', UNDEFINED))
+        getattr = _import_ns.get('getattr', context.get('getattr', UNDEFINED))
+        unicode = _import_ns.get('unicode', context.get('unicode', UNDEFINED))
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(u'\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n<div id="main_content" class="row">\n')
+        if getattr(c, 'show_menu', True):
+            __M_writer(u'    ')
+            __M_writer(escape(crud_menu(pk_count)))
+            __M_writer(u'\n')
+        __M_writer(u'  <div id="crud_content" class="span10">\n    <div class="page-header">\n      <h1>')
+        __M_writer(escape(self.title()))
+        __M_writer(u'</h1>\n    </div>\n    <div class="crud_delete">\n       <p>\n         You are about to delete ')
+        __M_writer(escape(unicode(obj)))
+        __M_writer(u' persistently from the database!<br />\n       </p>\n')
+        if deps != u'<dl></dl>':
+            __M_writer(u'         <p>\n           This will also delete:<br />\n           ')
+            __M_writer(deps )
+            __M_writer(u'\n         </p>\n')
+        __M_writer(u'       <p>\n         Are you totally sure to delete this entry?\n       </p>\n           <form method="POST" action="../')
+        __M_writer(escape(pklist))
+        __M_writer(u'">\n             <a href=".." class="btn">Cancel</a>\n             <input type="hidden" name="_method" value="DELETE" />\n             <button type="submit" class="btn btn-danger">\n               <i class="icon-remove icon-white"></i>&nbsp;Delete&nbsp;')
+        __M_writer(escape(unicode(obj)))
+        __M_writer(u'\n             </button>\n           </form>\n    </div>\n  </div>\n</div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        _import_ns = {}
+        _mako_get_namespace(context, '__anon_0x7fb1c80e1290')._populate(_import_ns, [u'crud_menu'])
+        c = _import_ns.get('c', context.get('c', UNDEFINED))
+        model = _import_ns.get('model', context.get('model', UNDEFINED))
+        getattr = _import_ns.get('getattr', context.get('getattr', UNDEFINED))
+        __M_writer = context.writer()
+        __M_writer(u'\n  Delete ')
+        __M_writer(escape(getattr(c, 'menu_item', model)))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"24": 18, "30": 0, "46": 16, "47": 17, "48": 18, "49": 22, "50": 25, "51": 26, "52": 26, "53": 26, "54": 28, "55": 30, "56": 30, "57": 34, "58": 34, "59": 36, "60": 37, "61": 39, "62": 39, "63": 42, "64": 45, "65": 45, "66": 49, "67": 49, "73": 20, "82": 20, "83": 21, "84": 21, "90": 84}, "uri": "/root/package/sauce/templates/crc/get_delete.mak", "filename": "/root/package/sauce/templates/crc/get_delete.mak"}
+__M_END_METADATA
+"""
@@ -0,0 +1,71 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+STOP_RENDERING = runtime.STOP_RENDERING
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792327259.794389
+_enable_loop = True
+_template_filename = '/root/package/sauce/templates/crc/index.mak'
+_template_uri = '/root/package/sauce/templates/crc/index.mak'
+_source_encoding = 'utf-8'
+from markupsafe import escape_silent as escape
+_exports = ['title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    ns = runtime.TemplateNamespace('__anon_0x7fb1c7e044d0', context._clean_inheritance_tokens(), templateuri=u'local:templates.crc.menu', callables=None,  calling_uri=_template_uri)
+    context.namespaces[(__name__, '__anon_0x7fb1c7e044d0')] = ns
+
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'local:templates.master', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        _import_ns = {}
+        _mako_get_namespace(context, '__anon_0x7fb1c7e044d0')._populate(_import_ns, [u'crud_menu'])
+        self = _import_ns.get('self', context.get('self', UNDEFINED))
+        crud_menu = _import_ns.get('crud_menu', context.get('crud_menu', UNDEFINED))
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(u'\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n<div id="main_content" class="row">\n  ')
+        __M_writer(escape(crud_menu(-1)))
+        __M_writer(u'\n  <div id="crud_content" class="span10">\n    <div class="page-header">\n      <h1>')
+        __M_writer(escape(self.title()))
+        __M_writer(u'</h1>\n    </div>\n  </div>\n  <div style="clear:both;"> &nbsp; </div>\n</div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        _import_ns = {}
+        _mako_get_namespace(context, '__anon_0x7fb1c7e044d0')._populate(_import_ns, [u'crud_menu'])
+        c = _import_ns.get('c', context.get('c', UNDEFINED))
+        __M_writer = context.writer()
+        __M_writer(u'\n  ')
+        __M_writer(escape(c.title))
+        __M_writer(u' - Administration\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"67": 61, "39": 16, "40": 17, "41": 18, "42": 22, "43": 25, "44": 25, "45": 28, "46": 28, "52": 20, "24": 18, "59": 20, "60": 21, "61": 21, "30": 0}, "uri": "/root/package/sauce/templates/crc/index.mak", "filename": "/root/package/sauce/templates/crc/index.mak"}
+__M_END_METADATA
+"""
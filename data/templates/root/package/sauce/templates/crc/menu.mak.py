@@ -0,0 +1,53 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+STOP_RENDERING = runtime.STOP_RENDERING
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792327248.60311
+_enable_loop = True
+_template_filename = u'/root/package/sauce/templates/crc/menu.mak'
+_template_uri = u'/root/package/sauce/templates/crc/menu.mak'
+_source_encoding = 'utf-8'
+from markupsafe import escape_silent as escape
+_exports = ['crud_menu']
+
+
+
+from sauce.lib.menu import menu_crc
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_crud_menu(context,pk_count=0):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        model = context.get('model', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        getattr = context.get('getattr', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n  <div id="crud_leftbar" class="span2">\n    <div id="menu_items" class="well" style="padding: 9px 0;">\n      ')
+        __M_writer(menu_crc(((c.crud_helpers.make_link(url, pk_count), name) for (url, name) in c.menu_items.iteritems()), getattr(c, 'menu_item', model)).render(direction='vertical', class_menu='nav nav-list') )
+        __M_writer(u'\n    </div>\n  </div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"34": 21, "49": 43, "41": 21, "42": 24, "43": 24, "17": 17, "21": 0, "26": 16, "27": 19, "28": 27}, "uri": "/root/package/sauce/templates/crc/menu.mak", "filename": "/root/package/sauce/templates/crc/menu.mak"}
+__M_END_METADATA
+"""
@@ -0,0 +1,82 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+STOP_RENDERING = runtime.STOP_RENDERING
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792327248.594121
+_enable_loop = True
+_template_filename = '/root/package/sauce/templates/crc/new.mak'
+_template_uri = '/root/package/sauce/templates/crc/new.mak'
+_source_encoding = 'utf-8'
+from markupsafe import escape_silent as escape
+_exports = ['title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    ns = runtime.TemplateNamespace('__anon_0x7fb1c89caf90', context._clean_inheritance_tokens(), templateuri=u'local:templates.crc.menu', callables=None,  calling_uri=_template_uri)
+    context.namespaces[(__name__, '__anon_0x7fb1c89caf90')] = ns
+
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'local:templates.master', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        _import_ns = {}
+        _mako_get_namespace(context, '__anon_0x7fb1c89caf90')._populate(_import_ns, [u'crud_menu'])
+        c = _import_ns.get('c', context.get('c', UNDEFINED))
+        crud_menu = _import_ns.get('crud_menu', context.get('crud_menu', UNDEFINED))
+        self = _import_ns.get('self', context.get('self', UNDEFINED))
+        tmpl_context = _import_ns.get('tmpl_context', context.get('tmpl_context', UNDEFINED))
+        value = _import_ns.get('value', context.get('value', UNDEFINED))
+        getattr = _import_ns.get('getattr', context.get('getattr', UNDEFINED))
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(u'\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n<div id="main_content" class="row">\n')
+        if getattr(c, 'show_menu', True):
+            __M_writer(u'    ')
+            __M_writer(escape(crud_menu()))
+            __M_writer(u'\n')
+        __M_writer(u'  <div id="crud_content" class="span10">\n    <div class="page-header">\n      <h1>')
+        __M_writer(escape(self.title()))
+        __M_writer(u'</h1>\n    </div>\n    <div class="crud_add">\n       ')
+        __M_writer(tmpl_context.widget(value=value, action='./') )
+        __M_writer(u'\n    </div>\n  </div>\n</div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        _import_ns = {}
+        _mako_get_namespace(context, '__anon_0x7fb1c89caf90')._populate(_import_ns, [u'crud_menu'])
+        c = _import_ns.get('c', context.get('c', UNDEFINED))
+        model = _import_ns.get('model', context.get('model', UNDEFINED))
+        getattr = _import_ns.get('getattr', context.get('getattr', UNDEFINED))
+        __M_writer = context.writer()
+        __M_writer(u'\n  New ')
+        __M_writer(escape(getattr(c, 'menu_item', model)))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"70": 20, "71": 21, "72": 21, "43": 16, "44": 17, "45": 18, "46": 22, "47": 25, "48": 26, "49": 26, "50": 26, "51": 28, "52": 30, "53": 30, "54": 33, "55": 33, "24": 18, "78": 72, "61": 20, "30": 0}, "uri": "/root/package/sauce/templates/crc/new.mak", "filename": "/root/package/sauce/templates/crc/new.mak"}
+__M_END_METADATA
+"""
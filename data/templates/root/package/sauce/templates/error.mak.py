@@ -0,0 +1,74 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+STOP_RENDERING = runtime.STOP_RENDERING
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792334227.882215
+_enable_loop = True
+_template_filename = '/root/package/sauce/templates/error.mak'
+_template_uri = '/root/package/sauce/templates/error.mak'
+_source_encoding = 'utf-8'
+from markupsafe import escape_silent as escape
+_exports = ['title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'local:templates.master', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        status = context.get('status', UNDEFINED)
+        message = context.get('message', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n<h1>Error ')
+        __M_writer(escape(status))
+        __M_writer(u'</h1>\n\n')
+
+        import re
+        mf = re.compile(r'(</?)script', re.IGNORECASE)
+        def fixmessage(message):
+            return mf.sub(r'\1noscript', message)
+        
+        
+        __M_locals_builtin_stored = __M_locals_builtin()
+        __M_locals.update(__M_dict_builtin([(__M_key, __M_locals_builtin_stored[__M_key]) for __M_key in ['re','mf','fixmessage'] if __M_key in __M_locals_builtin_stored]))
+        __M_writer(u'\n\n<div>')
+        __M_writer(fixmessage(message) )
+        __M_writer(u'</div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        code = context.get('code', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n  A ')
+        __M_writer(escape(code))
+        __M_writer(u' Error has Occurred\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"64": 20, "35": 16, "36": 17, "37": 21, "38": 23, "39": 23, "40": 25, "70": 64, "49": 30, "50": 32, "51": 32, "57": 19, "28": 0, "62": 19, "63": 20}, "uri": "/root/package/sauce/templates/error.mak", "filename": "/root/package/sauce/templates/error.mak"}
+__M_END_METADATA
+"""
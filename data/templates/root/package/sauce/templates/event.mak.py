@@ -0,0 +1,177 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+STOP_RENDERING = runtime.STOP_RENDERING
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792327249.878399
+_enable_loop = True
+_template_filename = '/root/package/sauce/templates/event.mak'
+_template_uri = '/root/package/sauce/templates/event.mak'
+_source_encoding = 'utf-8'
+from markupsafe import escape_silent as escape
+_exports = ['details', 'title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    ns = runtime.TemplateNamespace(u'news', context._clean_inheritance_tokens(), templateuri=u'local:templates.news', callables=None,  calling_uri=_template_uri)
+    context.namespaces[(__name__, u'news')] = ns
+
+    ns = runtime.TemplateNamespace('__anon_0x7fb1c8a66710', context._clean_inheritance_tokens(), templateuri=u'local:templates.misc', callables=None,  calling_uri=_template_uri)
+    context.namespaces[(__name__, '__anon_0x7fb1c8a66710')] = ns
+
+    ns = runtime.TemplateNamespace(u'sheets', context._clean_inheritance_tokens(), templateuri=u'local:templates.sheets', callables=None,  calling_uri=_template_uri)
+    context.namespaces[(__name__, u'sheets')] = ns
+
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'local:templates.master', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        _import_ns = {}
+        _mako_get_namespace(context, '__anon_0x7fb1c8a66710')._populate(_import_ns, [u'times_dl'])
+        getattr = _import_ns.get('getattr', context.get('getattr', UNDEFINED))
+        request = _import_ns.get('request', context.get('request', UNDEFINED))
+        event = _import_ns.get('event', context.get('event', UNDEFINED))
+        self = _import_ns.get('self', context.get('self', UNDEFINED))
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(u'\n')
+        __M_writer(u'\n')
+        __M_writer(u'\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n\n\n<div class="page-header">\n')
+        if getattr(request, 'user', None) in event.teachers or 'manage' in request.permissions:
+            __M_writer(u'    <div class="pull-right">\n      <a href="')
+            __M_writer(escape(event.url))
+            __M_writer(u'/admin/events/')
+            __M_writer(escape(event.id))
+            __M_writer(u'/edit" class="btn"><i class="icon-pencil"></i>&nbsp;Edit</a>\n    </div>\n')
+        __M_writer(u'  <h1>')
+        __M_writer(escape(event.name))
+        __M_writer(u' <small>Event</small></h1>\n</div>\n\n')
+        __M_writer(escape(self.details(event)))
+        __M_writer(u'\n\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_details(context,event):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        _import_ns = {}
+        _mako_get_namespace(context, '__anon_0x7fb1c8a66710')._populate(_import_ns, [u'times_dl'])
+        set = _import_ns.get('set', context.get('set', UNDEFINED))
+        request = _import_ns.get('request', context.get('request', UNDEFINED))
+        times_dl = _import_ns.get('times_dl', context.get('times_dl', UNDEFINED))
+        getattr = _import_ns.get('getattr', context.get('getattr', UNDEFINED))
+        sheets = _mako_get_namespace(context, 'sheets')
+        news = _mako_get_namespace(context, 'news')
+        tg = _import_ns.get('tg', context.get('tg', UNDEFINED))
+        __M_writer = context.writer()
+        __M_writer(u'\n\n<p class="description">')
+        __M_writer(event.description or u'' )
+        __M_writer(u'</p>\n\n')
+        if event.teachers:
+            __M_writer(u'  <dl>\n    <dt>Contact:</dt>\n    <dd>\n')
+            for teacher in event.teachers:
+                __M_writer(u'      <a href="mailto:')
+                __M_writer(escape(teacher.email_address))
+                __M_writer(u'" class="btn btn-mini">\n      <i class="icon-envelope"></i>&nbsp;')
+                __M_writer(escape(teacher.display_name))
+                __M_writer(u'</a>\n')
+            __M_writer(u'    </dd>\n  </dl>\n')
+        __M_writer(u'\n')
+        if event.type == 'contest':
+            __M_writer(u'  ')
+            __M_writer(escape(times_dl(event)))
+            __M_writer(u'\n')
+        __M_writer(u'\n\n')
+        if getattr(request, 'user', None):
+            __M_writer(u'\n')
+            if request.user in set(event.members) | set(event.tutorsandteachers):
+                __M_writer(u'\n    You are already enrolled for this event.\n\n')
+            else:
+                __M_writer(u'\n')
+                if event.enroll:
+                    __M_writer(u'\n      <a href="')
+                    __M_writer(escape(tg.url('%s/enroll' % (event.url))))
+                    __M_writer(u'" class="btn btn-primary" title="')
+                    __M_writer(escape('Password required' if event.password else ''))
+                    __M_writer(u'">\n        Enroll for this ')
+                    __M_writer(escape(event.type.title()))
+                    __M_writer(u'\n      </a>\n\n')
+                __M_writer(u'\n')
+            __M_writer(u'\n')
+        __M_writer(u'\n')
+        if event.sheets:
+            __M_writer(u'    <h2><a href="')
+            __M_writer(escape(event.url))
+            __M_writer(u'/sheets">Sheets</a></h2>\n    \n')
+            if event.current_sheets:
+                __M_writer(u'      <h3>Current sheets</h3>\n      ')
+                __M_writer(escape(sheets.list(event.current_sheets)))
+                __M_writer(u'\n')
+            __M_writer(u'\n')
+            if event.future_sheets:
+                __M_writer(u'      <h3>Future sheets</h3>\n      ')
+                __M_writer(escape(sheets.list_short(event.future_sheets)))
+                __M_writer(u'\n')
+            __M_writer(u'\n')
+            if event.previous_sheets:
+                __M_writer(u'      <h3>Previous sheets</h3>\n      ')
+                __M_writer(escape(sheets.list_short(event.previous_sheets)))
+                __M_writer(u'\n')
+        __M_writer(u'\n\n')
+        if getattr(request, 'user', None) in event.teachers or 'manage' in request.permissions:
+            __M_writer(u'  <div class="pull-right">\n    <a href="')
+            __M_writer(escape(event.url))
+            __M_writer(u'/admin/newsitems/?event_id=')
+            __M_writer(escape(event.id))
+            __M_writer(u'" class="btn"><i class="icon-pencil"></i>&nbsp;Edit</a>\n  </div>\n')
+        __M_writer(u'<h2>News</h2>\n')
+        if event.news:
+            __M_writer(u'    ')
+            __M_writer(escape(news.list((_news for _news in event.news if _news.public))))
+            __M_writer(u'\n')
+        else:
+            __M_writer(u'  <p>No news for ')
+            __M_writer(escape(event.name))
+            __M_writer(u'.</p>\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        _import_ns = {}
+        _mako_get_namespace(context, '__anon_0x7fb1c8a66710')._populate(_import_ns, [u'times_dl'])
+        event = _import_ns.get('event', context.get('event', UNDEFINED))
+        __M_writer = context.writer()
+        __M_writer(u'\n  ')
+        __M_writer(escape(event.name))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"24": 19, "27": 20, "30": 18, "36": 0, "47": 16, "48": 17, "49": 18, "50": 19, "51": 20, "52": 24, "53": 29, "54": 30, "55": 31, "56": 31, "57": 31, "58": 31, "59": 34, "60": 34, "61": 34, "62": 37, "63": 37, "64": 117, "70": 39, "83": 39, "84": 41, "85": 41, "86": 43, "87": 44, "88": 47, "89": 48, "90": 48, "91": 48, "92": 49, "93": 49, "94": 51, "95": 54, "96": 55, "97": 56, "98": 56, "99": 56, "100": 58, "101": 60, "102": 61, "103": 62, "104": 63, "105": 66, "106": 67, "107": 68, "108": 69, "109": 70, "110": 70, "111": 70, "112": 70, "113": 71, "114": 71, "115": 75, "116": 77, "117": 79, "118": 80, "119": 81, "120": 81, "121": 81, "122": 83, "123": 84, "124": 85, "125": 85, "126": 87, "127": 88, "128": 89, "129": 90, "130": 90, "131": 92, "132": 93, "133": 94, "134": 95, "135": 95, "136": 98, "137": 100, "138": 101, "139": 102, "140": 102, "141": 102, "142": 102, "143": 105, "144": 106, "145": 111, "146": 111, "147": 111, "148": 113, "149": 114, "150": 114, "151": 114, "152": 116, "158": 22, "165": 22, "166": 23, "167": 23, "173": 167}, "uri": "/root/package/sauce/templates/event.mak", "filename": "/root/package/sauce/templates/event.mak"}
+__M_END_METADATA
+"""
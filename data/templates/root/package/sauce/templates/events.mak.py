@@ -0,0 +1,126 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+STOP_RENDERING = runtime.STOP_RENDERING
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792327267.731714
+_enable_loop = True
+_template_filename = '/root/package/sauce/templates/events.mak'
+_template_uri = '/root/package/sauce/templates/events.mak'
+_source_encoding = 'utf-8'
+from markupsafe import escape_silent as escape
+_exports = ['list', 'title']
+
+
+
+import string
+import sauce.lib.helpers as h
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'local:templates.master', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        c = context.get('c', UNDEFINED)
+        previous_events = context.get('previous_events', UNDEFINED)
+        pending_requests = context.get('pending_requests', UNDEFINED)
+        request = context.get('request', UNDEFINED)
+        def list(events):
+            return render_list(context._locals(__M_locals),events)
+        getattr = context.get('getattr', UNDEFINED)
+        future_events = context.get('future_events', UNDEFINED)
+        events = context.get('events', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n<div class="page-header">\n')
+        if getattr(request, 'user', None):
+            __M_writer(u'    <div class="pull-right">\n      <div class="btn-group">\n')
+            if 'manage' in request.permissions:
+                __M_writer(u'          <a href="/events/request/" class="btn"><i class=" icon-list-alt" title="')
+                __M_writer(escape(pending_requests))
+                __M_writer(u' pending Event requests"></i>&nbsp;Review Requests (')
+                __M_writer(escape(pending_requests))
+                __M_writer(u')</a>\n')
+            __M_writer(u'        <a href="/events/request/new" class="btn"><i class="icon-plus"></i>&nbsp;Request new Event</a>\n      </div>\n    </div>\n')
+        __M_writer(u'  <h1>Events</h1>\n</div>\n\n<h2>Current events:</h2>\n\n')
+        if events:
+            __M_writer(u'  ')
+            __M_writer(escape(list(events)))
+            __M_writer(u'\n  <p>')
+            __M_writer(c.paginators.events.pager('Pages: $link_previous ~2~ $link_next') )
+            __M_writer(u'</p>\n')
+        else:
+            __M_writer(u'  <p>No currently active events found.</p>\n')
+        __M_writer(u'\n')
+        __M_writer(u'\n')
+        if future_events:
+            __M_writer(u'  <h2>Future events:</h2> \n  ')
+            __M_writer(escape(list(future_events)))
+            __M_writer(u'\n  <p>')
+            __M_writer(c.paginators.future_events.pager('Pages: $link_previous ~2~ $link_next') )
+            __M_writer(u'</p>\n')
+        __M_writer(u'\n')
+        if previous_events:
+            __M_writer(u'  <h2>Previous events:</h2> \n  ')
+            __M_writer(escape(list(previous_events)))
+            __M_writer(u'\n  <p>')
+            __M_writer(c.paginators.previous_events.pager('Pages: $link_previous ~2~ $link_next') )
+            __M_writer(u'</p>\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_list(context,events):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_writer = context.writer()
+        __M_writer(u'\n\n<dl>\n')
+        for event in events:
+            __M_writer(u'    <dt>')
+            __M_writer(escape(event.link))
+            __M_writer(u' (')
+            __M_writer(string.capitalize(escape(event.type )))
+            __M_writer(u')\n')
+            if not event.public:
+                __M_writer(u'        <i class="icon-lock"></i>\n')
+            __M_writer(u'    </dt>\n    <dd>')
+            __M_writer(h.cut(h.striphtml(event.description )))
+            __M_writer(u'</dd>\n')
+        __M_writer(u'</dl>\n\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_writer = context.writer()
+        __M_writer(u'\n  Events\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"17": 19, "33": 0, "47": 16, "48": 17, "49": 22, "50": 26, "51": 29, "52": 30, "53": 32, "54": 33, "55": 33, "56": 33, "57": 33, "58": 33, "59": 35, "60": 39, "61": 44, "62": 45, "63": 45, "64": 45, "65": 46, "66": 46, "67": 47, "68": 48, "69": 50, "70": 52, "71": 53, "72": 54, "73": 55, "74": 55, "75": 56, "76": 56, "77": 58, "78": 59, "79": 60, "80": 61, "81": 61, "82": 62, "83": 62, "84": 64, "90": 65, "94": 65, "95": 68, "96": 70, "97": 70, "98": 70, "99": 70, "100": 70, "101": 71, "102": 72, "103": 74, "104": 75, "105": 75, "106": 77, "112": 24, "116": 24, "122": 116}, "uri": "/root/package/sauce/templates/events.mak", "filename": "/root/package/sauce/templates/events.mak"}
+__M_END_METADATA
+"""
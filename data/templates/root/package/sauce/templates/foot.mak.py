@@ -0,0 +1,32 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+STOP_RENDERING = runtime.STOP_RENDERING
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792327247.433434
+_enable_loop = True
+_template_filename = u'/root/package/sauce/templates/foot.mak'
+_template_uri = u'/root/package/sauce/templates/foot.mak'
+_source_encoding = 'utf-8'
+from markupsafe import escape_silent as escape
+_exports = []
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"17": 0, "28": 22, "22": 16}, "uri": "/root/package/sauce/templates/foot.mak", "filename": "/root/package/sauce/templates/foot.mak"}
+__M_END_METADATA
+"""
@@ -0,0 +1,67 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+STOP_RENDERING = runtime.STOP_RENDERING
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792327250.427172
+_enable_loop = True
+_template_filename = '/root/package/sauce/templates/form.mak'
+_template_uri = '/root/package/sauce/templates/form.mak'
+_source_encoding = 'utf-8'
+from markupsafe import escape_silent as escape
+_exports = ['title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'local:templates.master', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        c = context.get('c', UNDEFINED)
+        getattr = context.get('getattr', UNDEFINED)
+        heading = context.get('heading', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n<div class="page-header">\n  <h1>')
+        __M_writer(escape(heading))
+        __M_writer(u'</h1>\n</div>\n\n<div><p>')
+        __M_writer(escape(getattr(c, 'text', '')))
+        __M_writer(u'</p></div>\n\n<div>\n  ')
+        __M_writer(c.form.display() )
+        __M_writer(u'\n</div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        heading = context.get('heading', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n  ')
+        __M_writer(escape(heading))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"36": 16, "37": 17, "38": 21, "39": 24, "40": 24, "41": 27, "42": 27, "43": 30, "44": 30, "50": 19, "55": 19, "56": 20, "57": 20, "28": 0, "63": 57}, "uri": "/root/package/sauce/templates/form.mak", "filename": "/root/package/sauce/templates/form.mak"}
+__M_END_METADATA
+"""
@@ -0,0 +1,60 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+STOP_RENDERING = runtime.STOP_RENDERING
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792327258.148824
+_enable_loop = True
+_template_filename = '/root/package/sauce/templates/index.mak'
+_template_uri = '/root/package/sauce/templates/index.mak'
+_source_encoding = 'utf-8'
+from markupsafe import escape_silent as escape
+_exports = ['title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'local:templates.master', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        tg = context.get('tg', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n<div class="page-header">\n  <h1>SAUCE <small>System for AUtomated Code Evaluation</small></h1>\n</div>\n\n<div class="row">\n  <div class="span8">\n    <div class="hero-unit">\n      <p>\n        <strong>SAUCE</strong> is a language-independent, web-based automated\n        assessment tool for programming assignments in practical programming courses\n        within academic environments like universities and schools.\n      </p>\n      <p><a class="pull-right btn btn-primary btn-large" href="')
+        __M_writer(escape(tg.url('/about')))
+        __M_writer(u'">Learn more &raquo;</a></p>\n    </div>\n  </div>\n\n  <div class="span3 offset1">\n    <div class="pull-right"><img height=248 width=248 src="')
+        __M_writer(escape(tg.url('/images/sauce_logo_big.png')))
+        __M_writer(u'" /></div>\n    <div class="pull-right"><em><small>Image by <a href="http://www.abstractnonsense.de">Christian Hundt</a></small></em></div>\n  </div>\n</div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_writer = context.writer()
+        __M_writer(u'\n  System for AUtomated Code Evaluation\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"34": 16, "35": 17, "36": 21, "37": 35, "38": 35, "39": 40, "40": 40, "46": 19, "50": 19, "56": 50, "28": 0}, "uri": "/root/package/sauce/templates/index.mak", "filename": "/root/package/sauce/templates/index.mak"}
+__M_END_METADATA
+"""
@@ -0,0 +1,115 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+STOP_RENDERING = runtime.STOP_RENDERING
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792327267.563357
+_enable_loop = True
+_template_filename = '/root/package/sauce/templates/language.mak'
+_template_uri = '/root/package/sauce/templates/language.mak'
+_source_encoding = 'utf-8'
+from markupsafe import escape_silent as escape
+_exports = ['title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'local:templates.master', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        language = context.get('language', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n<div class="page-header">\n  <h1>')
+        __M_writer(escape(language.name))
+        __M_writer(u'\n    <small>Language</small>\n  </h1>\n</div>\n\n<div class="row">\n    <div class="span8 well">\n')
+        __M_writer(u'      <h3>Language</h3>\n      <dl>\n        <dt>Lexer name</dt>\n          <dd><code>')
+        __M_writer(escape(language.lexer_name))
+        __M_writer(u'</code></dd>\n        <dt>Source file extension</dt>\n          <dd>\n')
+        if language.extension_src:
+            __M_writer(u'              <code>')
+            __M_writer(escape(language.extension_src))
+            __M_writer(u'</code>\n')
+        else:
+            __M_writer(u'              None\n')
+        __M_writer(u'          </dd>\n        <dt>Binary file extension</dt>\n          <dd>\n')
+        if language.extension_bin:
+            __M_writer(u'              <code>')
+            __M_writer(escape(language.extension_bin))
+            __M_writer(u'</code>\n')
+        else:
+            __M_writer(u'              None\n')
+        __M_writer(u'          </dd>\n       </dl>\n  </div>\n</div>\n\n<div class="row">\n')
+        if language.compiler:
+            __M_writer(u'    <div class="span8 well">\n      <h3>Compiler</h3>\n      <dl>\n        <dt>Name</dt>\n          <dd>')
+            __M_writer(escape(language.compiler.name))
+            __M_writer(u'</dd>\n        <dt>Command line</dt>\n          <dd><code>')
+            __M_writer(escape(language.compiler.path))
+            __M_writer(u' ')
+            __M_writer(escape(language.compiler.argv))
+            __M_writer(u'</code></dd>\n        <dt>Timeout</dt>\n          <dd>')
+            __M_writer(escape('%.1f' % language.compiler.timeout))
+            __M_writer(u'</dd>\n')
+            if language.compiler.version:
+                __M_writer(u'          <dt>Version</dt>\n            <dd><pre>')
+                __M_writer(escape(language.compiler.version))
+                __M_writer(u'</pre></dd>\n')
+            if language.compiler.help:
+                __M_writer(u'          <dt>Help</dt>\n            <dd><pre>')
+                __M_writer(escape(language.compiler.help))
+                __M_writer(u'</pre></dd>\n')
+            __M_writer(u'      </dl>\n    </div>\n')
+        if language.interpreter:
+            __M_writer(u'    <div class="span8 well">\n      <h3>Interpreter</h3>\n      <dl>\n        <dt>Name</dt>\n        <dd>')
+            __M_writer(escape(language.interpreter.name))
+            __M_writer(u'</dd>\n        <dt>Command line</dt>\n        <dd><code>')
+            __M_writer(escape(language.interpreter.path))
+            __M_writer(u' ')
+            __M_writer(escape(language.interpreter.argv))
+            __M_writer(u'</code></dd>\n')
+            if language.interpreter.version:
+                __M_writer(u'          <dt>Version</dt>\n            <dd>\n            <dd><pre>')
+                __M_writer(escape(language.interpreter.version))
+                __M_writer(u'</pre></dd>\n')
+            if language.interpreter.help:
+                __M_writer(u'          <dt>Help</dt>\n            <dd><pre>')
+                __M_writer(escape(language.interpreter.help))
+                __M_writer(u'</pre></dd>\n')
+            __M_writer(u'      </dl>\n    </div>\n')
+        __M_writer(u'</div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        language = context.get('language', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n  ')
+        __M_writer(escape(language))
+        __M_writer(u' - Language\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"28": 0, "34": 16, "35": 17, "36": 21, "37": 24, "38": 24, "39": 32, "40": 35, "41": 35, "42": 38, "43": 39, "44": 39, "45": 39, "46": 40, "47": 41, "48": 43, "49": 46, "50": 47, "51": 47, "52": 47, "53": 48, "54": 49, "55": 51, "56": 57, "57": 58, "58": 62, "59": 62, "60": 64, "61": 64, "62": 64, "63": 64, "64": 66, "65": 66, "66": 67, "67": 68, "68": 69, "69": 69, "70": 71, "71": 72, "72": 73, "73": 73, "74": 75, "75": 78, "76": 79, "77": 83, "78": 83, "79": 85, "80": 85, "81": 85, "82": 85, "83": 86, "84": 87, "85": 89, "86": 89, "87": 91, "88": 92, "89": 93, "90": 93, "91": 95, "92": 98, "98": 19, "103": 19, "104": 20, "105": 20, "111": 105}, "uri": "/root/package/sauce/templates/language.mak", "filename": "/root/package/sauce/templates/language.mak"}
+__M_END_METADATA
+"""
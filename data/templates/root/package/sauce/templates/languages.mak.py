@@ -0,0 +1,68 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+STOP_RENDERING = runtime.STOP_RENDERING
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792327267.529785
+_enable_loop = True
+_template_filename = '/root/package/sauce/templates/languages.mak'
+_template_uri = '/root/package/sauce/templates/languages.mak'
+_source_encoding = 'utf-8'
+from markupsafe import escape_silent as escape
+_exports = ['title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'local:templates.master', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        languages = context.get('languages', UNDEFINED)
+        tg = context.get('tg', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n<div class="page-header">\n  <h1>Languages</h1>\n</div>\n\n')
+        if languages:
+            __M_writer(u'\n<p>These pages allow you to view information about how currently\navailable programming languages are configured.</p>\n\n  <ul>\n')
+            for l in languages:
+                __M_writer(u'    <li><a href="')
+                __M_writer(escape(tg.url('/languages/%d' % l.id)))
+                __M_writer(u'">')
+                __M_writer(escape(l.name))
+                __M_writer(u'</a></li>\n')
+            __M_writer(u'  </ul>\n\n')
+        else:
+            __M_writer(u'  <p>No programming languages defined.</p>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_writer = context.writer()
+        __M_writer(u'\n  Languages\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"64": 58, "35": 16, "36": 17, "37": 21, "38": 27, "39": 28, "40": 33, "41": 34, "42": 34, "43": 34, "44": 34, "45": 34, "46": 36, "47": 38, "48": 39, "54": 19, "58": 19, "28": 0}, "uri": "/root/package/sauce/templates/languages.mak", "filename": "/root/package/sauce/templates/languages.mak"}
+__M_END_METADATA
+"""
@@ -0,0 +1,61 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+STOP_RENDERING = runtime.STOP_RENDERING
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792327247.399246
+_enable_loop = True
+_template_filename = '/root/package/sauce/templates/login.mak'
+_template_uri = '/root/package/sauce/templates/login.mak'
+_source_encoding = 'utf-8'
+from markupsafe import escape_silent as escape
+_exports = ['title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'local:templates.master', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        tg = context.get('tg', UNDEFINED)
+        login_counter = context.get('login_counter', UNDEFINED)
+        came_from = context.get('came_from', UNDEFINED)
+        dict = context.get('dict', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n<div class="page-header">\n  <h1>Login</h1>\n</div>\n\n<div class="row">\n  <div class="span4 offset4">\n    <form action="')
+        __M_writer(escape(tg.url('/login_handler', params=dict(came_from=came_from.encode('utf-8'), __logins=login_counter.encode('utf-8')))))
+        __M_writer(u'" method="POST" class="well">\n      <label for="login">Username:</label>\n      <input type="text" id="login" name="login" class="span3" autofocus="autofocus" />\n      <label for="password">Password:</label>\n      <input type="password" id="password" name="password" class="span3" />\n      <label id="labelremember" for="loginremember" class="checkbox">\n        <input type="checkbox" id="loginremember" name="remember" value="2252000" />\n        Remember me\n      </label>\n      <button type="submit" class="btn btn-primary" id="submit" value="Login">Login</button>\n    </form>\n  </div>\n</div>\n\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_writer = context.writer()
+        __M_writer(u'Login')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"37": 16, "38": 17, "39": 19, "40": 27, "41": 27, "47": 19, "51": 19, "57": 51, "28": 0}, "uri": "/root/package/sauce/templates/login.mak", "filename": "/root/package/sauce/templates/login.mak"}
+__M_END_METADATA
+"""
@@ -0,0 +1,283 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+STOP_RENDERING = runtime.STOP_RENDERING
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792327247.425505
+_enable_loop = True
+_template_filename = u'/root/package/sauce/templates/master.mak'
+_template_uri = u'/root/package/sauce/templates/master.mak'
+_source_encoding = 'utf-8'
+from markupsafe import escape_silent as escape
+_exports = ['sub_menu', 'body_class', 'footer', 'flash', 'headers', 'meta', 'side_menu', 'title', 'main_menu']
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        tg = context.get('tg', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        g = context.get('g', UNDEFINED)
+        next = context.get('next', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n<!DOCTYPE html>\n<html>\n\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n')
+        __M_writer(u'\n\n<head>\n  <title>')
+        __M_writer(escape(self.title()))
+        __M_writer(u' - ')
+        __M_writer(escape(g.title))
+        __M_writer(u'</title>\n\n  ')
+        __M_writer(escape(self.meta()))
+        __M_writer(u'\n\n  <link rel="stylesheet" type="text/css" media="screen" href="')
+        __M_writer(escape(tg.url('/css/bootstrap.min.css')))
+        __M_writer(u'" />\n  <link rel="stylesheet" type="text/css" media="screen" href="')
+        __M_writer(escape(tg.url('/css/style.css')))
+        __M_writer(u'" />\n')
+        __M_writer(u'  <link rel="icon" href="')
+        __M_writer(escape(tg.url('/favicon.ico')))
+        __M_writer(u'" type="image/x-icon" />\n\n  <script type="text/javascript" src="')
+        __M_writer(escape(tg.url('/javascript/jquery.js')))
+        __M_writer(u'"></script>\n  <script type="text/javascript" src="')
+        __M_writer(escape(tg.url('/javascript/bootstrap.js')))
+        __M_writer(u'"></script>\n')
+        __M_writer(u'\n  ')
+        __M_writer(escape(self.headers()))
+        __M_writer(u'\n\n</head>\n\n')
+        __M_writer(u'\n\n<body class="')
+        __M_writer(escape(self.body_class()))
+        __M_writer(u' ')
+        __M_writer(escape(next.body_class()))
+        __M_writer(u'">\n  <div class="container">\n    ')
+        __M_writer(escape(self.main_menu()))
+        __M_writer(u'\n    ')
+        __M_writer(escape(self.sub_menu()))
+        __M_writer(u'\n    ')
+        __M_writer(escape(self.flash()))
+        __M_writer(u'\n\n    <div class="row">\n')
+        if c.side_menu:
+            __M_writer(u'        <div class="span3">\n          ')
+            __M_writer(escape(self.side_menu()))
+            __M_writer(u'\n        </div>\n\n        <div class="span9">\n')
+        else:
+            __M_writer(u'        <div class="span12">\n')
+        __M_writer(u'      ')
+        __M_writer(escape(next.body()))
+        __M_writer(u'\n      </div>\n    </div>\n\n    ')
+        __M_writer(escape(self.footer()))
+        __M_writer(u'\n  </div>\n\n')
+        runtime._include_file(context, u'local:templates.foot', _template_uri)
+        __M_writer(u'\n\n</body>\n\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n</html>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_sub_menu(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        c = context.get('c', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        if c.sub_menu:
+            __M_writer(u'  <div class="navbar">\n    <div class="navbar-inner">\n      <div class="container">\n        ')
+            __M_writer(c.sub_menu.render(direction='horizontal') )
+            __M_writer(u'\n      </div>\n    </div>\n  </div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_body_class(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_writer = context.writer()
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_footer(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        dict = context.get('dict', UNDEFINED)
+        g = context.get('g', UNDEFINED)
+        tg = context.get('tg', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n  <footer class="footer hidden-tablet hidden-phone">\n    <div class="row">\n      <div class="span3">\n        <p>&copy; 2012 - ')
+        __M_writer(escape(h.current_year()))
+        __M_writer(u'\n          <a href="https://github.com/moschlar">Moritz Schlarb</a>\n          <br />\n          <strong>SAUCE</strong> is <a href="http://opensource.org/licenses/AGPL-3.0">free software</a>\n        </p>\n      </div>\n      <div class="span1" style="text-align: left; vertical-align: middle;">\n<a href="http://opensource.org/licenses/AGPL-3.0" title="AGPL-3.0">')
+        __M_writer(u'<img style="vertical-align: middle;" src="')
+        __M_writer(escape(tg.url('/images/agplv3-88x31.png')))
+        __M_writer(u'" alt="AGPL-3.0" />')
+        __M_writer(u'</a>\n      </div>\n      <div class="offset1 span2" style="text-align: center; vertical-align: middle;">\n        <p style="vertical-align: middle;"><span class="label" title="Git revision: ')
+        __M_writer(escape(g.revision))
+        __M_writer(u'">Version: ')
+        __M_writer(escape(g.version))
+        __M_writer(u'</span></p>\n      </div>\n      <div class="offset1 span2" style="text-align: right; vertical-align: middle; ">\n<a href="http://www.python.org/" title="Python">')
+        __M_writer(u'<img style="vertical-align: middle;" src="')
+        __M_writer(escape(tg.url('/images/python-logo.gif')))
+        __M_writer(u'" alt="Python" />')
+        __M_writer(u'</a>\n        <br />\n<a href="http://www.sqlalchemy.org/" title="SQLAlchemy">')
+        __M_writer(u'<img style="vertical-align: middle; padding-right: 8px;" src="')
+        __M_writer(escape(tg.url('/images/sqla-logo6.gif')))
+        __M_writer(u'" width="88" alt="SQLAlchemy" />')
+        __M_writer(u'</a>\n      </div>\n      <div class="span2" style="text-align: right;vertical-align: middle; ">\n<a href="http://www.turbogears.org/" title="TurboGears is a open source front-to-back web development framework written in Python. Copyright &copy; 2005-2012">')
+        __M_writer(u'<img style="vertical-align: middle;" src="')
+        __M_writer(escape(tg.url('/images/under_the_hood_blue.png')))
+        __M_writer(u'" alt="TurboGears 2" />')
+        __M_writer(u'</a>\n      </div>\n    </div>\n    <div class="row">\n      <div class="span4">\n        <p>\n          <iframe src="')
+        __M_writer(escape(tg.url('/github-buttons/github-btn.html', dict(user='moschlar', repo='SAUCE', type='watch', count='true'))))
+        __M_writer(u'"\n            allowtransparency="true" frameborder="0" scrolling="0" width="110px" height="20px"></iframe>\n          <iframe src="')
+        __M_writer(escape(tg.url('/github-buttons/github-btn.html', dict(user='moschlar', repo='SAUCE', type='fork', count='true'))))
+        __M_writer(u'"\n            allowtransparency="true" frameborder="0" scrolling="0" width="110px" height="20px"></iframe>\n        </p>\n      </div>\n    </div>\n  </footer>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_flash(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        tg = context.get('tg', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n  ')
+
+        flash = tg.flash_obj.render('flash', use_js=False)
+          
+        
+        __M_writer(u'\n')
+        if flash:
+            __M_writer(u'    <div class="row"><div class="span8 offset2">\n      ')
+            __M_writer(flash )
+            __M_writer(u'\n    </div></div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_headers(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_writer = context.writer()
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_meta(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        response = context.get('response', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n  <meta content="text/html; charset=')
+        __M_writer(escape(response.charset))
+        __M_writer(u'" http-equiv="content-type" />\n  <meta charset="')
+        __M_writer(escape(response.charset))
+        __M_writer(u'" />\n  <meta name="viewport" content="width=device-width, initial-scale=1.0">\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_side_menu(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        c = context.get('c', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n  <div class="well" style="padding: 9px 0">\n')
+        if c.side_menu:
+            __M_writer(u'      ')
+            __M_writer(c.side_menu.render(class_menu='nav-list') )
+            __M_writer(u'\n')
+        __M_writer(u'  </div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_writer = context.writer()
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_main_menu(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        c = context.get('c', UNDEFINED)
+        g = context.get('g', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        request = context.get('request', UNDEFINED)
+        getattr = context.get('getattr', UNDEFINED)
+        bool = context.get('bool', UNDEFINED)
+        tg = context.get('tg', UNDEFINED)
+        page = context.get('page', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n  <div class="navbar navbar-fixed-top">\n    <div class="navbar-inner">\n      <div class="container">\n        <!-- .btn-navbar is used as the toggle for collapsed navbar content -->\n        <a class="btn btn-navbar" data-toggle="collapse" data-target=".nav-collapse">\n          <span class="icon-bar"></span>\n          <span class="icon-bar"></span>\n          <span class="icon-bar"></span>\n        </a>\n\n        <a class="brand" href="')
+        __M_writer(escape(tg.url('/')))
+        __M_writer(u'" title="')
+        __M_writer(escape(g.subtitle))
+        __M_writer(u'">\n          <img src="')
+        __M_writer(escape(tg.url('/images/sauce_logo.png')))
+        __M_writer(u'" alt="SAUCE"/>\n          SAUCE\n        </a>\n\n        <!-- Everything you want hidden at 940px or less, place within here -->\n        <div class="nav-collapse">\n          <ul class="nav nav-pills">\n            <li class="')
+        __M_writer(escape(('', 'active')[page=='index']))
+        __M_writer(u'">\n              <a href="')
+        __M_writer(escape(tg.url('/')))
+        __M_writer(u'">Home</a>\n            </li>\n\n            <li class="divider-vertical"></li>\n\n            ')
+        __M_writer(c.event_menu.render(direction="dropdown", class_dropdown='dropdown bold' + ('', ' active')[page=='events' or bool(getattr(c, 'event', False))]) )
+        __M_writer(u'\n\n            <li class="divider-vertical"></li>\n\n            <li class="')
+        __M_writer(escape(('', 'active')[page=='news']))
+        __M_writer(u'">\n              ')
+        __M_writer(escape(h.link_to('News', tg.url('/news'))))
+        __M_writer(u'\n            </li>\n\n            ')
+        __M_writer(c.doc_menu.render(direction="dropdown", class_dropdown='dropdown' + ('', ' active')[page in ('docs', 'about', 'language')]) )
+        __M_writer(u'\n\n            <li class="')
+        __M_writer(escape(('', 'active')[page=='contact']))
+        __M_writer(u'">\n              ')
+        __M_writer(escape(h.link_to('Contact', tg.url('/contact'))))
+        __M_writer(u'\n            </li>\n\n          </ul>\n\n          <ul class="nav nav-pills pull-right">\n')
+        if not request.identity:
+            __M_writer(u'              <li>\n                <a href="')
+            __M_writer(escape(h.make_login_url()))
+            __M_writer(u'">\n                  <i class="icon-off icon-white"></i>&nbsp;Login\n                </a>\n              </li>\n')
+        else:
+            if 'manage' in request.identity.get('permissions'):
+                __M_writer(u'                <li class="')
+                __M_writer(escape(('', 'active')[page=='admin']))
+                __M_writer(u'">\n                  <a href="')
+                __M_writer(escape(tg.url('/admin')))
+                __M_writer(u'"><i class="icon-cog icon-white"></i>&nbsp;Admin</a>\n                </li>\n')
+            __M_writer(u'              <li class="')
+            __M_writer(escape(('', 'active')[page=='user']))
+            __M_writer(u'">\n                <a href="')
+            __M_writer(escape(tg.url('/user')))
+            __M_writer(u'"><i class="icon-user icon-white"></i>&nbsp;')
+            __M_writer(escape(request.identity.get('user')))
+            __M_writer(u'</a>\n              </li>\n              <li>\n                <a href="')
+            __M_writer(escape(h.make_logout_url()))
+            __M_writer(u'">\n                  <i class="icon-off icon-white"></i>&nbsp;Logout\n                </a>\n              </li>\n')
+        __M_writer(u'          </ul>\n        </div>\n      </div>\n    </div>\n  </div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"17": 0, "27": 16, "28": 24, "29": 26, "30": 27, "31": 30, "32": 30, "33": 30, "34": 30, "35": 32, "36": 32, "37": 34, "38": 34, "39": 35, "40": 35, "41": 37, "42": 37, "43": 37, "44": 39, "45": 39, "46": 40, "47": 40, "48": 42, "49": 43, "50": 43, "51": 47, "52": 49, "53": 49, "54": 49, "55": 49, "56": 51, "57": 51, "58": 52, "59": 52, "60": 53, "61": 53, "62": 56, "63": 57, "64": 58, "65": 58, "66": 62, "67": 63, "68": 65, "69": 65, "70": 65, "71": 69, "72": 69, "73": 72, "74": 72, "75": 120, "76": 131, "77": 201, "78": 213, "79": 221, "85": 203, "90": 203, "91": 204, "92": 205, "93": 208, "94": 208, "100": 47, "109": 76, "117": 76, "118": 80, "119": 80, "120": 88, "121": 88, "122": 88, "123": 89, "124": 92, "125": 92, "126": 92, "127": 92, "128": 96, "129": 96, "130": 96, "131": 97, "132": 100, "133": 100, "134": 100, "135": 101, "136": 105, "137": 105, "138": 105, "139": 106, "140": 112, "141": 112, "142": 114, "143": 114, "149": 122, "154": 122, "155": 123, "159": 125, "160": 126, "161": 127, "162": 128, "163": 128, "169": 26, "178": 20, "183": 20, "184": 21, "185": 21, "186": 22, "187": 22, "193": 215, "198": 215, "199": 217, "200": 218, "201": 218, "202": 218, "203": 220, "209": 27, "218": 133, "230": 133, "231": 144, "232": 144, "233": 144, "234": 144, "235": 145, "236": 145, "237": 152, "238": 152, "239": 153, "240": 153, "241": 158, "242": 158, "243": 162, "244": 162, "245": 163, "246": 163, "247": 166, "248": 166, "249": 168, "250": 168, "251": 169, "252": 169, "253": 175, "254": 176, "255": 177, "256": 177, "257": 181, "258": 182, "259": 183, "260": 183, "261": 183, "262": 184, "263": 184, "264": 187, "265": 187, "266": 187, "267": 188, "268": 188, "269": 188, "270": 188, "271": 191, "272": 191, "273": 196, "279": 273}, "uri": "/root/package/sauce/templates/master.mak", "filename": "/root/package/sauce/templates/master.mak"}
+__M_END_METADATA
+"""
@@ -0,0 +1,63 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+STOP_RENDERING = runtime.STOP_RENDERING
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792327249.890874
+_enable_loop = True
+_template_filename = u'/root/package/sauce/templates/misc.mak'
+_template_uri = u'/root/package/sauce/templates/misc.mak'
+_source_encoding = 'utf-8'
+from markupsafe import escape_silent as escape
+_exports = ['times_dl']
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_times_dl(context,obj):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        hasattr = context.get('hasattr', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n\n<dl>\n')
+        if hasattr(obj, 'start_time'):
+            __M_writer(u'  <dt>Start time:</dt>\n  <dd title="')
+            __M_writer(escape(h.strftime(obj.start_time, human=False)))
+            __M_writer(u'">')
+            __M_writer(escape(h.strftime(obj.start_time, human=True)))
+            __M_writer(u'</dd>\n')
+        if hasattr(obj, 'end_time'):
+            __M_writer(u'  <dt>End time:</dt>\n  <dd title="')
+            __M_writer(escape(h.strftime(obj.end_time, human=False)))
+            __M_writer(u'">')
+            __M_writer(escape(h.strftime(obj.end_time, human=True)))
+            __M_writer(u'</dd>\n')
+        if hasattr(obj, 'is_active'):
+            if obj.is_active:
+                __M_writer(u'    <dt>Remaining time:</dt>\n    <dd>')
+                __M_writer(escape(h.strftimedelta(obj.remaining_time).decode('utf8')))
+                __M_writer(u'</dd>\n')
+        __M_writer(u'</dl>\n\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"17": 0, "22": 16, "23": 36, "29": 17, "35": 17, "36": 20, "37": 21, "38": 22, "39": 22, "40": 22, "41": 22, "42": 24, "43": 25, "44": 26, "45": 26, "46": 26, "47": 26, "48": 28, "49": 29, "50": 30, "51": 31, "52": 31, "53": 34, "59": 53}, "uri": "/root/package/sauce/templates/misc.mak", "filename": "/root/package/sauce/templates/misc.mak"}
+__M_END_METADATA
+"""
@@ -0,0 +1,94 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+STOP_RENDERING = runtime.STOP_RENDERING
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792327249.885317
+_enable_loop = True
+_template_filename = u'/root/package/sauce/templates/news.mak'
+_template_uri = u'/root/package/sauce/templates/news.mak'
+_source_encoding = 'utf-8'
+from markupsafe import escape_silent as escape
+_exports = ['list', 'title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'local:templates.master', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        news = context.get('news', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        def list(news):
+            return render_list(context._locals(__M_locals),news)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n<div class="page-header">\n  <h1>News</h1>\n</div>\n\n')
+        if news:
+            __M_writer(u'  ')
+            __M_writer(escape(list(news)))
+            __M_writer(u'\n  <p>')
+            __M_writer(escape(c.paginators.news.pager('Pages: $link_previous ~2~ $link_next')))
+            __M_writer(u'</p>\n')
+        __M_writer(u'\n')
+        __M_writer(u'\n\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_list(context,news):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n  <dl>\n')
+        for newsitem in news:
+            __M_writer(u'    <dt>')
+            __M_writer(escape(newsitem.subject))
+            __M_writer(u'\n')
+            if not newsitem.public:
+                __M_writer(u'        <i class="icon-lock"></i>\n')
+            __M_writer(u'    </dt>\n    <dd>\n      <em>Posted by ')
+            __M_writer(escape(newsitem.user.link))
+            __M_writer(u' - <span title="')
+            __M_writer(escape(h.strftime(newsitem.date, human=False)))
+            __M_writer(u'">')
+            __M_writer(escape(h.strftime(newsitem.date, human=True)))
+            __M_writer(u'</span></em>\n      <p>')
+            __M_writer(newsitem.message )
+            __M_writer(u'</p>\n    </dd>\n')
+        __M_writer(u'  </dl>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_writer = context.writer()
+        __M_writer(u'\n  News\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"28": 0, "37": 16, "38": 17, "39": 21, "40": 27, "41": 28, "42": 28, "43": 28, "44": 29, "45": 29, "46": 31, "47": 46, "53": 32, "58": 32, "59": 34, "60": 35, "61": 35, "62": 35, "63": 36, "64": 37, "65": 39, "66": 41, "67": 41, "68": 41, "69": 41, "70": 41, "71": 41, "72": 42, "73": 42, "74": 45, "80": 19, "84": 19, "90": 84}, "uri": "/root/package/sauce/templates/news.mak", "filename": "/root/package/sauce/templates/news.mak"}
+__M_END_METADATA
+"""
@@ -0,0 +1,66 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+STOP_RENDERING = runtime.STOP_RENDERING
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792327267.196295
+_enable_loop = True
+_template_filename = '/root/package/sauce/templates/page.mak'
+_template_uri = '/root/package/sauce/templates/page.mak'
+_source_encoding = 'utf-8'
+from markupsafe import escape_silent as escape
+_exports = ['title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'local:templates.master', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        page_header = context.get('page_header', UNDEFINED)
+        content = context.get('content', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        if page_header:
+            __M_writer(u'  <div class="page-header">\n    <h1>')
+            __M_writer(escape(page_header))
+            __M_writer(u'</h1>\n  </div>\n')
+        __M_writer(u'\n')
+        __M_writer(content )
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        page_title = context.get('page_title', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n  ')
+        __M_writer(escape(page_title))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"35": 16, "36": 17, "37": 21, "38": 23, "39": 24, "40": 25, "41": 25, "42": 28, "43": 29, "49": 19, "54": 19, "55": 20, "56": 20, "28": 0, "62": 56}, "uri": "/root/package/sauce/templates/page.mak", "filename": "/root/package/sauce/templates/page.mak"}
+__M_END_METADATA
+"""
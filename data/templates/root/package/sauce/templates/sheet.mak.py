@@ -0,0 +1,111 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+STOP_RENDERING = runtime.STOP_RENDERING
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792327261.492988
+_enable_loop = True
+_template_filename = '/root/package/sauce/templates/sheet.mak'
+_template_uri = '/root/package/sauce/templates/sheet.mak'
+_source_encoding = 'utf-8'
+from markupsafe import escape_silent as escape
+_exports = ['details', 'title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    ns = runtime.TemplateNamespace(u'assignments', context._clean_inheritance_tokens(), templateuri=u'local:templates.assignments', callables=None,  calling_uri=_template_uri)
+    context.namespaces[(__name__, u'assignments')] = ns
+
+    ns = runtime.TemplateNamespace('__anon_0x7fb1c7eaad10', context._clean_inheritance_tokens(), templateuri=u'local:templates.misc', callables=None,  calling_uri=_template_uri)
+    context.namespaces[(__name__, '__anon_0x7fb1c7eaad10')] = ns
+
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'local:templates.master', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        _import_ns = {}
+        _mako_get_namespace(context, '__anon_0x7fb1c7eaad10')._populate(_import_ns, [u'times_dl'])
+        sheet = _import_ns.get('sheet', context.get('sheet', UNDEFINED))
+        getattr = _import_ns.get('getattr', context.get('getattr', UNDEFINED))
+        request = _import_ns.get('request', context.get('request', UNDEFINED))
+        event = _import_ns.get('event', context.get('event', UNDEFINED))
+        self = _import_ns.get('self', context.get('self', UNDEFINED))
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(u'\n')
+        __M_writer(u'\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n<div class="page-header">\n')
+        if getattr(request, 'user', None) in event.teachers or 'manage' in request.permissions:
+            __M_writer(u'    <div class="pull-right">\n      <a href="')
+            __M_writer(escape(sheet.event.url))
+            __M_writer(u'/admin/sheets/')
+            __M_writer(escape(sheet.id))
+            __M_writer(u'/edit" class="btn"><i class="icon-pencil"></i>&nbsp;Edit</a>\n    </div>\n')
+        __M_writer(u'  <h1>')
+        __M_writer(escape(sheet.name))
+        __M_writer(u' <small>Sheet</small></h1>\n</div>\n\n')
+        __M_writer(escape(self.details(sheet)))
+        __M_writer(u'\n\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_details(context,sheet):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        _import_ns = {}
+        _mako_get_namespace(context, '__anon_0x7fb1c7eaad10')._populate(_import_ns, [u'times_dl'])
+        times_dl = _import_ns.get('times_dl', context.get('times_dl', UNDEFINED))
+        len = _import_ns.get('len', context.get('len', UNDEFINED))
+        assignments = _mako_get_namespace(context, 'assignments')
+        __M_writer = context.writer()
+        __M_writer(u'\n\n<p class="description">')
+        __M_writer(sheet.description or u'' )
+        __M_writer(u'</p>\n\n')
+        __M_writer(escape(times_dl(sheet)))
+        __M_writer(u'\n\n<h2><a href="')
+        __M_writer(escape(sheet.url))
+        __M_writer(u'/assignments">Assignments:</a> <span class="badge">')
+        __M_writer(escape(len(sheet.assignments)))
+        __M_writer(u'</span></h2>\n\n')
+        __M_writer(escape(assignments.list(sheet.assignments)))
+        __M_writer(u'\n\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        _import_ns = {}
+        _mako_get_namespace(context, '__anon_0x7fb1c7eaad10')._populate(_import_ns, [u'times_dl'])
+        sheet = _import_ns.get('sheet', context.get('sheet', UNDEFINED))
+        __M_writer = context.writer()
+        __M_writer(u'\n  ')
+        __M_writer(escape(sheet.name))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"24": 18, "27": 19, "33": 0, "45": 16, "46": 17, "47": 18, "48": 19, "49": 23, "50": 26, "51": 27, "52": 28, "53": 28, "54": 28, "55": 28, "56": 31, "57": 31, "58": 31, "59": 34, "60": 34, "61": 46, "67": 36, "76": 36, "77": 38, "78": 38, "79": 40, "80": 40, "81": 42, "82": 42, "83": 42, "84": 42, "85": 44, "86": 44, "92": 21, "99": 21, "100": 22, "101": 22, "107": 101}, "uri": "/root/package/sauce/templates/sheet.mak", "filename": "/root/package/sauce/templates/sheet.mak"}
+__M_END_METADATA
+"""
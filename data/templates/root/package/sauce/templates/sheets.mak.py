@@ -0,0 +1,172 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+STOP_RENDERING = runtime.STOP_RENDERING
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792327249.896748
+_enable_loop = True
+_template_filename = u'/root/package/sauce/templates/sheets.mak'
+_template_uri = u'/root/package/sauce/templates/sheets.mak'
+_source_encoding = 'utf-8'
+from markupsafe import escape_silent as escape
+_exports = ['list', 'list_short', 'title']
+
+
+
+import sauce.lib.helpers as h
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    ns = runtime.TemplateNamespace(u'assignments', context._clean_inheritance_tokens(), templateuri=u'local:templates.assignments', callables=None,  calling_uri=_template_uri)
+    context.namespaces[(__name__, u'assignments')] = ns
+
+    ns = runtime.TemplateNamespace('__anon_0x7fb1c8981390', context._clean_inheritance_tokens(), templateuri=u'local:templates.misc', callables=None,  calling_uri=_template_uri)
+    context.namespaces[(__name__, '__anon_0x7fb1c8981390')] = ns
+
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'local:templates.master', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        _import_ns = {}
+        _mako_get_namespace(context, '__anon_0x7fb1c8981390')._populate(_import_ns, [u'times_dl'])
+        c = _import_ns.get('c', context.get('c', UNDEFINED))
+        current_sheets = _import_ns.get('current_sheets', context.get('current_sheets', UNDEFINED))
+        previous_sheets = _import_ns.get('previous_sheets', context.get('previous_sheets', UNDEFINED))
+        def list(sheets):
+            return render_list(context._locals(__M_locals),sheets)
+        request = _import_ns.get('request', context.get('request', UNDEFINED))
+        future_sheets = _import_ns.get('future_sheets', context.get('future_sheets', UNDEFINED))
+        getattr = _import_ns.get('getattr', context.get('getattr', UNDEFINED))
+        event = _import_ns.get('event', context.get('event', UNDEFINED))
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(u'\n')
+        __M_writer(u'\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n<div class="page-header">\n')
+        if getattr(request, 'user', None) in event.teachers or 'manage' in request.permissions:
+            __M_writer(u'    <div class="pull-right">\n      <a href="')
+            __M_writer(escape(event.url))
+            __M_writer(u'/admin/sheets/" class="btn"><i class="icon-pencil"></i>&nbsp;Edit</a>\n    </div>\n')
+        __M_writer(u'  <h1>')
+        __M_writer(escape(event.name))
+        __M_writer(u' <small>Sheets</small></h1>\n</div>\n\n')
+        if current_sheets:
+            __M_writer(u'  <h2>Current sheets</h2>\n  ')
+            __M_writer(escape(list(current_sheets)))
+            __M_writer(u'\n  <p>')
+            __M_writer(escape(c.paginators.current_sheets.pager('Pages: $link_previous ~2~ $link_next')))
+            __M_writer(u'</p>\n')
+        __M_writer(u'\n')
+        if future_sheets:
+            __M_writer(u'  <h2>Future sheets</h2>\n  ')
+            __M_writer(escape(list(future_sheets)))
+            __M_writer(u'\n  <p>')
+            __M_writer(escape(c.paginators.future_sheets.pager('Pages: $link_previous ~2~ $link_next')))
+            __M_writer(u'</p>\n')
+        __M_writer(u'\n')
+        if previous_sheets:
+            __M_writer(u'  <h2>Previous sheets</h2>\n  ')
+            __M_writer(escape(list(previous_sheets)))
+            __M_writer(u'\n  <p>')
+            __M_writer(escape(c.paginators.previous_sheets.pager('Pages: $link_previous ~2~ $link_next')))
+            __M_writer(u'</p>\n')
+        __M_writer(u'\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_list(context,sheets):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        _import_ns = {}
+        _mako_get_namespace(context, '__anon_0x7fb1c8981390')._populate(_import_ns, [u'times_dl'])
+        times_dl = _import_ns.get('times_dl', context.get('times_dl', UNDEFINED))
+        assignments = _mako_get_namespace(context, 'assignments')
+        len = _import_ns.get('len', context.get('len', UNDEFINED))
+        tg = _import_ns.get('tg', context.get('tg', UNDEFINED))
+        __M_writer = context.writer()
+        __M_writer(u'\n\n<dl>\n')
+        for sheet in sheets:
+            __M_writer(u'    <dt>')
+            __M_writer(escape(sheet.link))
+            __M_writer(u'\n')
+            if not sheet.public:
+                __M_writer(u'        <i class="icon-lock"></i>\n')
+            __M_writer(u'    </dt>\n    <dd>\n      <p>')
+            __M_writer(h.cut(h.striphtml(sheet.description )))
+            __M_writer(u'</p>\n      ')
+            __M_writer(escape(times_dl(sheet)))
+            __M_writer(u'\n\n')
+            if sheet.public:
+                __M_writer(u'        <h4><a href="')
+                __M_writer(escape(tg.url('%s/assignments' % sheet.url)))
+                __M_writer(u'">Assignments</a>\n          <span class="badge">')
+                __M_writer(escape(len(sheet.assignments)))
+                __M_writer(u'</span></h4>\n        ')
+                __M_writer(escape(assignments.list(sheet.assignments)))
+                __M_writer(u'\n')
+            __M_writer(u'    </dd>\n')
+        __M_writer(u'</dl>\n\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_list_short(context,sheets):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        _import_ns = {}
+        _mako_get_namespace(context, '__anon_0x7fb1c8981390')._populate(_import_ns, [u'times_dl'])
+        __M_writer = context.writer()
+        __M_writer(u'\n\n<dl>\n')
+        for sheet in sheets:
+            __M_writer(u'    <dt>')
+            __M_writer(escape(sheet.link))
+            __M_writer(u'\n')
+            if not sheet.public:
+                __M_writer(u'        <i class="icon-lock"></i>\n')
+            __M_writer(u'    </dt>\n    <dd>\n      <p>')
+            __M_writer(h.cut(h.striphtml(sheet.description )))
+            __M_writer(u'</p>\n    </dd>\n')
+        __M_writer(u'</dl>\n\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        _import_ns = {}
+        _mako_get_namespace(context, '__anon_0x7fb1c8981390')._populate(_import_ns, [u'times_dl'])
+        event = _import_ns.get('event', context.get('event', UNDEFINED))
+        __M_writer = context.writer()
+        __M_writer(u'\n  ')
+        __M_writer(escape(event.name))
+        __M_writer(u' - Sheets\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"131": 56, "137": 56, "138": 59, "139": 60, "140": 60, "141": 60, "142": 61, "143": 62, "144": 64, "17": 21, "146": 66, "147": 69, "153": 25, "28": 18, "31": 19, "160": 25, "161": 26, "162": 26, "37": 0, "168": 162, "53": 16, "54": 17, "55": 18, "56": 19, "57": 23, "58": 27, "59": 30, "60": 31, "61": 32, "62": 32, "63": 35, "64": 35, "65": 35, "66": 38, "67": 39, "68": 40, "69": 40, "70": 41, "71": 41, "72": 43, "73": 44, "74": 45, "75": 46, "76": 46, "77": 47, "78": 47, "79": 49, "80": 50, "81": 51, "82": 52, "83": 52, "84": 53, "85": 53, "86": 55, "87": 71, "88": 95, "94": 73, "145": 66, "104": 73, "105": 76, "106": 77, "107": 77, "108": 77, "109": 78, "110": 79, "111": 81, "112": 83, "113": 83, "114": 84, "115": 84, "116": 86, "117": 87, "118": 87, "119": 87, "120": 88, "121": 88, "122": 89, "123": 89, "124": 91, "125": 93}, "uri": "/root/package/sauce/templates/sheets.mak", "filename": "/root/package/sauce/templates/sheets.mak"}
+__M_END_METADATA
+"""
@@ -0,0 +1,337 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+STOP_RENDERING = runtime.STOP_RENDERING
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792327283.029504
+_enable_loop = True
+_template_filename = u'/root/package/sauce/templates/submission.mak'
+_template_uri = u'/root/package/sauce/templates/submission.mak'
+_source_encoding = 'utf-8'
+from markupsafe import escape_silent as escape
+_exports = ['headers', 'compilation', 'details_judgement', 'details', 'title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'local:templates.master', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        c = context.get('c', UNDEFINED)
+        submission = context.get('submission', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        request = context.get('request', UNDEFINED)
+        len = context.get('len', UNDEFINED)
+        next = context.get('next', UNDEFINED)
+        getattr = context.get('getattr', UNDEFINED)
+        page = context.get('page', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n<div class="page-header">\n  <h1>')
+        __M_writer(escape(self.title()))
+        __M_writer(u'\n')
+        if submission.assignment:
+            __M_writer(u'      <small>for Assignment: ')
+            __M_writer(escape(submission.assignment.link))
+            __M_writer(u'</small>\n')
+        __M_writer(u'  </h1>\n</div>\n\n')
+        if getattr(c, 'newer', False):
+            __M_writer(u'  <div class="alert alert-info">\n  This is not the <abbr title="There are submissions with a later modification time than this one!">newest</abbr>\n  submission for this assignment - \n')
+            if len(c.newer) == 1:
+                __M_writer(u"    there is one submission that's\n")
+            else:
+                __M_writer(u'    there are ')
+                __M_writer(escape(len(c.newer)))
+                __M_writer(u' submissions that are\n')
+            __M_writer(u'    newer:<br />\n')
+            if len(c.newer) == 1:
+                __M_writer(u'    It is\n')
+            else:
+                __M_writer(u'    The most current one is\n')
+            __M_writer(u'    <strong>')
+            __M_writer(escape(c.newer[0].link))
+            __M_writer(u'</strong>\n')
+            if c.newer[0].user != request.user:
+                __M_writer(u'    by ')
+                __M_writer(escape(c.newer[0].user))
+                __M_writer(u'.\n')
+            else:
+                __M_writer(u'    by yourself.\n')
+            __M_writer(u'  </div>\n')
+        __M_writer(u'\n')
+        if request.allowance(submission) or \
+  getattr(request, 'user', None) == submission.user:
+            __M_writer(u'  <div class="modal hide fade" id="deleteModal">\n    <div class="modal-header">\n      <button type="button" class="close" data-dismiss="modal">\xd7</button>\n      <h3>Are you sure?</h3>\n    </div>\n    <div class="modal-body">\n      <p>\n        This will delete ')
+            __M_writer(escape(submission))
+            __M_writer(u' from the database.<br />\n        You can not revert this step!\n      </p>\n    </div>\n    <div class="modal-footer">\n      <a href="#" class="btn" data-dismiss="modal">Cancel</a>\n      <a href="')
+            __M_writer(escape(submission.url))
+            __M_writer(u'/delete" class="btn btn-danger">\n        <i class="icon-remove icon-white"></i>&nbsp;Delete&nbsp;')
+            __M_writer(escape(submission))
+            __M_writer(u'\n      </a>\n    </div>\n  </div>\n')
+        __M_writer(u'\n<ul class="nav nav-tabs">\n  <li class="')
+        __M_writer(escape(('', 'active')['show' in page]))
+        __M_writer(u'">\n    <a href="')
+        __M_writer(escape(submission.url))
+        __M_writer(u'/show"><i class="icon-eye-open"></i>&nbsp;Show</a>\n  </li>\n\n')
+        if getattr(request, 'user', None) == submission.user and (submission.assignment.is_active or request.allowance(submission)):
+            __M_writer(u'    <li class="')
+            __M_writer(escape(('', 'active')['edit' in page]))
+            __M_writer(u'">\n      <a href="')
+            __M_writer(escape(submission.url))
+            __M_writer(u'/edit"><i class="icon-pencil"></i>&nbsp;Edit</a>\n    </li>\n')
+        __M_writer(u'\n  <li class="')
+        __M_writer(escape(('', 'active')['result' in page]))
+        __M_writer(u'">\n    <a href="')
+        __M_writer(escape(submission.url))
+        __M_writer(u'/result"><i class="icon-flag"></i>&nbsp;Result</a>\n  </li>\n\n')
+        if request.allowance(submission):
+            __M_writer(u'    <li class="')
+            __M_writer(escape(('', 'active')['judge' in page]))
+            __M_writer(u'">\n      <a href="')
+            __M_writer(escape(submission.url))
+            __M_writer(u'/judge"><i class="icon-tag"></i>&nbsp;Judge</a>\n    </li>\n')
+        __M_writer(u'\n    <li class="')
+        __M_writer(escape(('', 'active')['clone' in page]))
+        __M_writer(u'">\n      <a href="')
+        __M_writer(escape(submission.url))
+        __M_writer(u'/clone"><i class="icon-retweet"></i>&nbsp;Clone</a>\n    </li>\n\n')
+        if request.allowance(submission) or \
+    getattr(request, 'user', None) == submission.user:
+            __M_writer(u'    <li class="')
+            __M_writer(escape(('', 'active')['delete' in page]))
+            __M_writer(u'">\n      <a href="#deleteModal" data-toggle="modal" title="Delete">\n        <i class="icon-remove"></i>&nbsp;<span style="color:#B94A48;">Delete</span>\n      </a>\n    </li>\n')
+        __M_writer(u'</ul>\n\n<dl class="dl-horizontal">\n  <dt>User:</dt>\n  <dd title="')
+        __M_writer(escape(submission.user.user_name))
+        __M_writer(u'">')
+        __M_writer(escape(submission.user.display_name))
+        __M_writer(u'</dd>\n\n  <dt>Created:</dt>\n  <dd title="')
+        __M_writer(escape(h.strftime(submission.created, False)))
+        __M_writer(u'">')
+        __M_writer(escape(h.strftime(submission.created, True)))
+        __M_writer(u'</dd>\n  <dt>Last modified:</dt>\n  <dd title="')
+        __M_writer(escape(h.strftime(submission.modified, False)))
+        __M_writer(u'">')
+        __M_writer(escape(h.strftime(submission.modified, True)))
+        __M_writer(u'</dd>\n\n  <dt>Publicity:</dt>\n  <dd>\n    <div class="btn-group">\n      <a href="#" class="btn btn-mini disabled"  title="Submission is currently ')
+        __M_writer(escape(('private', 'public')[submission.public]))
+        __M_writer(u'.">\n        ')
+        __M_writer(escape(('Private', 'Public')[submission.public]))
+        __M_writer(u'\n      </a>\n')
+        if request.allowance(submission) or \
+      getattr(request, 'user', None) == submission.user:
+            __M_writer(u'        <a href="')
+            __M_writer(escape(submission.url))
+            __M_writer(u'/public/false" class="btn btn-mini ')
+            __M_writer(escape(('active', '')[submission.public]))
+            __M_writer(u'" title="Click to make private.">\n          <i class="icon-eye-close">&nbsp;</i>\n        </a>\n        <a href="')
+            __M_writer(escape(submission.url))
+            __M_writer(u'/public/true" class="btn btn-mini ')
+            __M_writer(escape(('', 'active')[submission.public]))
+            __M_writer(u'" title="Click to make public.">\n          <i class="icon-eye-open">&nbsp;</i>\n        </a>\n')
+        __M_writer(u'    </div>\n  </dd>\n\n</dl>\n\n')
+        __M_writer(escape(next.body()))
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_headers(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_writer = context.writer()
+        __M_writer(u'\n  <script type="text/javascript">\n    function highline(cm_id, lineno) {\n      var where = \'wrap\';\n      var class_name = \'highlined\';\n      --lineno;\n      var cm = $("#" + cm_id + " + .CodeMirror")[0].CodeMirror\n      var doc = cm.getDoc();\n      doc.eachLine(function (line) {\n          doc.removeLineClass(line, where, class_name);\n      });\n      doc.addLineClass(doc.getLineHandle(lineno), where, class_name);\n    }\n  </script>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_compilation(context,compilation):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_writer = context.writer()
+        __M_writer(u'\n\n  <h3>Compilation result</h3>\n')
+        if compilation.returncode == 0:
+            __M_writer(u'    <p>Success</p>\n')
+        else:
+            __M_writer(u'    <p>Fail</p>\n')
+        __M_writer(u'  <table>\n  <tr>\n    <th>stdout</th><th>stderr</th>\n  </tr>\n  <tr>\n    <td><pre>')
+        __M_writer(escape(compilation.stdout))
+        __M_writer(u'</pre></td>\n    <td><pre>')
+        __M_writer(escape(compilation.stderr))
+        __M_writer(u'</pre></td>\n  </tr>\n  </table>\n\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_details_judgement(context,judgement):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        int = context.get('int', UNDEFINED)
+        sorted = context.get('sorted', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        TypeError = context.get('TypeError', UNDEFINED)
+        len = context.get('len', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n\n')
+        if judgement.annotations:
+            __M_writer(u'  ')
+
+            if judgement.submission.assignment.submission_scaffold_head:
+              offset = len(judgement.submission.assignment.submission_scaffold_head.splitlines())
+            else:
+              offset = 0
+              
+            
+            __M_writer(u'\n  <h3>Annotations:</h3>\n    <dl class="dl-horizontal">\n')
+            for line, ann in sorted(judgement.annotations.iteritems()):
+                try:
+                    __M_writer(u'      ')
+                    line = offset + int(line) 
+                    
+                    __M_writer(u'\n        <dt>\n          <a href="javascript:highline(\'source_display\', ')
+                    __M_writer(escape(line))
+                    __M_writer(u')">Line ')
+                    __M_writer(escape(line))
+                    __M_writer(u'</a>\n        </dt>\n        <dd>\n          ')
+                    __M_writer(escape(ann))
+                    __M_writer(u'\n        </dd>\n')
+                except TypeError:
+                    pass
+            __M_writer(u'    </dl>\n')
+        __M_writer(u'\n')
+        if judgement.comment:
+            __M_writer(u'    <h3>Comment:</h3>\n    <p>')
+            __M_writer(judgement.comment )
+            __M_writer(u'</p>\n')
+        __M_writer(u'\n')
+        if judgement.corrected_source:
+            __M_writer(u'    <h3>Corrected source code:</h3>\n    <p class="btn-group">\n      <a href="')
+            __M_writer(escape(judgement.submission.url))
+            __M_writer(u'/source/judgement" class="btn btn-mini"><i class="icon-file"></i>&nbsp;Full page</a>\n      <a href="')
+            __M_writer(escape(judgement.submission.url))
+            __M_writer(u'/download/judgement" class="btn btn-mini"><i class="icon-download-alt"></i>&nbsp;Download</a>\n    </p>\n    ')
+            __M_writer(c.source_display.display(judgement.corrected_source, id='source_corrected', compound_id='source_corrected') )
+            __M_writer(u'\n\n    <h4>Diff</h4>\n    ')
+            __M_writer(c.source_display.display(judgement.diff, id='source_diff', compound_id='source_diff',
+      mode='diff', lineNumbers=False) )
+            __M_writer(u'\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_details(context,submission,full=True):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        request = context.get('request', UNDEFINED)
+        tg = context.get('tg', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n\n<dl class="dl-horizontal">\n      <dt>Language:</dt>\n      <dd>\n')
+        if submission.language:
+            __M_writer(u'          <a href="')
+            __M_writer(escape(tg.url('/languages/%d' % (submission.language.id))))
+            __M_writer(u'" target="_blank">')
+            __M_writer(escape(submission.language.name))
+            __M_writer(u'</a>\n')
+        else:
+            __M_writer(u'          None\n')
+        __M_writer(u'      </dd>\n\n')
+        if submission.result is not None:
+            __M_writer(u'    <dt>Test result:</dt>\n    <dd>\n')
+            if submission.result:
+                __M_writer(u'      <span class="label label-success">Success</span>\n')
+            else:
+                __M_writer(u'     <span class="label label-important">Failed</span>\n')
+            __M_writer(u'    </dd>\n')
+        if submission.judgement and (submission.judgement.public or request.allowance(submission)):
+            __M_writer(u'    <dt>Tutor:</dt>\n        <dd>')
+            __M_writer(escape(submission.judgement.tutor.display_name))
+            __M_writer(u'</dd>\n    <dt>Judgement date:</dt>\n        <dd title="')
+            __M_writer(escape(h.strftime(submission.judgement.date, False)))
+            __M_writer(u'">')
+            __M_writer(escape(h.strftime(submission.judgement.date, True)))
+            __M_writer(u'</dd>\n')
+            if submission.judgement.grade is not None:
+                __M_writer(u'      <dt>Grade:</dt>\n          <dd><span class="badge badge-info">')
+                __M_writer(escape(submission.judgement.grade))
+                __M_writer(u'</span></dd>\n')
+            if request.allowance(submission):
+                __M_writer(u'      <dt>Judgement status:</dt>\n          <dd>')
+                __M_writer(escape('Published' if submission.judgement.public else 'Draft'))
+                __M_writer(u'</dd>\n')
+        __M_writer(u'\n</dl>\n\n<h2>Submission</h2>\n\n  <h3>Source code:</h3>\n')
+        if submission.source:
+            __M_writer(u'    <p class="btn-group">\n      <a href="')
+            __M_writer(escape(submission.url))
+            __M_writer(u'/source')
+            __M_writer(escape('?what=f' if full else ''))
+            __M_writer(u'" class="btn btn-mini"><i class="icon-file"></i>&nbsp;Full page</a>\n      <a href="')
+            __M_writer(escape(submission.url))
+            __M_writer(u'/download')
+            __M_writer(escape('?what=f' if full else ''))
+            __M_writer(u'" class="btn btn-mini"><i class="icon-download-alt"></i>&nbsp;Download</a>\n')
+            __M_writer(u'    </p>\n\n  ')
+            __M_writer(c.source_display.display(submission.full_source if full else submission.source, id='source_display', compound_id='source_display') )
+            __M_writer(u'\n\n')
+        else:
+            __M_writer(u'    <p>No source code submitted yet.</p>\n')
+        __M_writer(u'\n')
+        if submission.comment:
+            __M_writer(u'    <h3>Comment:</h3>\n    <div>')
+            __M_writer(h.bleach_simple(submission.comment ))
+            __M_writer(u'</div>\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        submission = context.get('submission', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+
+        try:
+          heading = 'Submission %d' % submission.id
+        except:
+          heading = 'Submission'
+        
+        
+        __M_writer(u'\n  ')
+        __M_writer(escape(heading))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"28": 0, "42": 16, "43": 17, "44": 27, "45": 43, "46": 46, "47": 46, "48": 47, "49": 48, "50": 48, "51": 48, "52": 50, "53": 53, "54": 54, "55": 57, "56": 58, "57": 59, "58": 60, "59": 60, "60": 60, "61": 62, "62": 63, "63": 64, "64": 65, "65": 66, "66": 68, "67": 68, "68": 68, "69": 69, "70": 70, "71": 70, "72": 70, "73": 71, "74": 72, "75": 74, "76": 76, "77": 77, "79": 79, "80": 86, "81": 86, "82": 92, "83": 92, "84": 93, "85": 93, "86": 98, "87": 100, "88": 100, "89": 101, "90": 101, "91": 104, "92": 105, "93": 105, "94": 105, "95": 106, "96": 106, "97": 109, "98": 110, "99": 110, "100": 111, "101": 111, "102": 114, "103": 115, "104": 115, "105": 115, "106": 116, "107": 116, "108": 119, "109": 120, "110": 120, "111": 121, "112": 121, "113": 124, "115": 126, "116": 126, "117": 126, "118": 132, "119": 136, "120": 136, "121": 136, "122": 136, "123": 139, "124": 139, "125": 139, "126": 139, "127": 141, "128": 141, "129": 141, "130": 141, "131": 146, "132": 146, "133": 147, "134": 147, "135": 149, "137": 151, "138": 151, "139": 151, "140": 151, "141": 151, "142": 154, "143": 154, "144": 154, "145": 154, "146": 158, "147": 163, "148": 163, "149": 225, "150": 271, "151": 291, "157": 29, "161": 29, "167": 273, "171": 273, "172": 276, "173": 277, "174": 278, "175": 279, "176": 281, "177": 286, "178": 286, "179": 287, "180": 287, "186": 227, "195": 227, "196": 229, "197": 230, "198": 230, "205": 235, "206": 238, "207": 239, "208": 240, "209": 240, "211": 240, "212": 242, "213": 242, "214": 242, "215": 242, "216": 245, "217": 245, "218": 247, "220": 250, "221": 252, "222": 253, "223": 254, "224": 255, "225": 255, "226": 257, "227": 258, "228": 259, "229": 261, "230": 261, "231": 262, "232": 262, "233": 264, "234": 264, "235": 267, "237": 268, "238": 270, "244": 165, "252": 165, "253": 170, "254": 171, "255": 171, "256": 171, "257": 171, "258": 171, "259": 172, "260": 173, "261": 175, "262": 177, "263": 178, "264": 180, "265": 181, "266": 182, "267": 183, "268": 185, "269": 187, "270": 188, "271": 189, "272": 189, "273": 191, "274": 191, "275": 191, "276": 191, "277": 192, "278": 193, "279": 194, "280": 194, "281": 196, "282": 197, "283": 198, "284": 198, "285": 201, "286": 207, "287": 208, "288": 209, "289": 209, "290": 209, "291": 209, "292": 210, "293": 210, "294": 210, "295": 210, "296": 212, "297": 214, "298": 214, "299": 216, "300": 217, "301": 219, "302": 220, "303": 221, "304": 222, "305": 222, "306": 224, "312": 19, "317": 19, "318": 20, "325": 25, "326": 26, "327": 26, "333": 327}, "uri": "/root/package/sauce/templates/submission.mak", "filename": "/root/package/sauce/templates/submission.mak"}
+__M_END_METADATA
+"""
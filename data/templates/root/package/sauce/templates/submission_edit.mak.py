@@ -0,0 +1,48 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+STOP_RENDERING = runtime.STOP_RENDERING
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792327283.531438
+_enable_loop = True
+_template_filename = '/root/package/sauce/templates/submission_edit.mak'
+_template_uri = '/root/package/sauce/templates/submission_edit.mak'
+_source_encoding = 'utf-8'
+from markupsafe import escape_silent as escape
+_exports = []
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'local:templates.submission', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        c = context.get('c', UNDEFINED)
+        submission = context.get('submission', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(u'\n\n')
+        __M_writer(c.form.display(submission) )
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"35": 16, "36": 17, "37": 19, "38": 19, "44": 38, "28": 0}, "uri": "/root/package/sauce/templates/submission_edit.mak", "filename": "/root/package/sauce/templates/submission_edit.mak"}
+__M_END_METADATA
+"""
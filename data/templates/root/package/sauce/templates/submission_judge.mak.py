@@ -0,0 +1,59 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+STOP_RENDERING = runtime.STOP_RENDERING
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792327286.378177
+_enable_loop = True
+_template_filename = '/root/package/sauce/templates/submission_judge.mak'
+_template_uri = '/root/package/sauce/templates/submission_judge.mak'
+_source_encoding = 'utf-8'
+from markupsafe import escape_silent as escape
+_exports = []
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    ns = runtime.TemplateNamespace('__anon_0x7fb1c81cfcd0', context._clean_inheritance_tokens(), templateuri=u'local:templates.submission', callables=None,  calling_uri=_template_uri)
+    context.namespaces[(__name__, '__anon_0x7fb1c81cfcd0')] = ns
+
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'local:templates.submission', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        _import_ns = {}
+        _mako_get_namespace(context, '__anon_0x7fb1c81cfcd0')._populate(_import_ns, [u'details'])
+        c = _import_ns.get('c', context.get('c', UNDEFINED))
+        details = _import_ns.get('details', context.get('details', UNDEFINED))
+        submission = _import_ns.get('submission', context.get('submission', UNDEFINED))
+        options = _import_ns.get('options', context.get('options', UNDEFINED))
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(u'\n')
+        __M_writer(u'\n\n')
+        __M_writer(escape(details(submission, full=False)))
+        __M_writer(u'\n\n<h2>Judgement</h2>\n')
+        __M_writer(c.judgement_form.display(options) )
+        __M_writer(u'\n\n')
+        __M_writer(u'\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"41": 16, "42": 17, "43": 18, "44": 21, "45": 21, "46": 24, "47": 24, "48": 30, "49": 34, "55": 49, "24": 18, "30": 0}, "uri": "/root/package/sauce/templates/submission_judge.mak", "filename": "/root/package/sauce/templates/submission_judge.mak"}
+__M_END_METADATA
+"""
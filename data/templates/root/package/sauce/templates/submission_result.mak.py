@@ -0,0 +1,194 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+STOP_RENDERING = runtime.STOP_RENDERING
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792335376.951134
+_enable_loop = True
+_template_filename = '/root/package/sauce/templates/submission_result.mak'
+_template_uri = '/root/package/sauce/templates/submission_result.mak'
+_source_encoding = 'utf-8'
+from markupsafe import escape_silent as escape
+_exports = ['list']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'local:templates.submission', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        submission = context.get('submission', UNDEFINED)
+        compilation = context.get('compilation', UNDEFINED)
+        dict = context.get('dict', UNDEFINED)
+        tg = context.get('tg', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        pending = context.get('pending', UNDEFINED)
+        testruns = context.get('testruns', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(u'\n\n<div class="pull-right">\n  <a href="')
+        __M_writer(escape(tg.url(submission.url + '/result', dict(force_test=1))))
+        __M_writer(u'" class="btn">\n    <i class="icon-repeat"></i>&nbsp;Run tests again\n  </a>\n</div>\n\n')
+        if pending:
+            __M_writer(u'  <div class="alert alert-info" id="grading-pending">\n    <strong>Your submission is being tested.</strong>\n    This page will be updated automatically once the results are available.\n  </div>\n  <script type="text/javascript">\n    (function poll() {\n      setTimeout(function() {\n        $.getJSON("')
+            __M_writer(escape(tg.url(submission.url + '/status')))
+            __M_writer(u'", function(data) {\n          if (data.pending) {\n            poll();\n          } else {\n            window.location.reload();\n          }\n        }).error(poll);\n      }, 2000);\n    })();\n  </script>\n')
+        __M_writer(u'\n')
+        if compilation:
+            __M_writer(u'  <h2>Compilation result</h2>\n')
+            if compilation.result:
+                __M_writer(u'    <p class="label label-success">Success</p>\n')
+            else:
+                __M_writer(u'    <p class="label label-important">Fail</p>\n')
+            __M_writer(u'    <table class="table table-bordered table-condensed test-and-result-table">\n      <tr>\n        <th>Runtime</th>\n        <td>')
+            __M_writer(escape(compilation.runtime))
+            __M_writer(u' seconds</td>\n      </tr>\n')
+            if submission.assignment.show_compiler_msg:
+                if compilation.stdout:
+                    __M_writer(u'        <tr>\n          <th>stdout</th>\n          <td><pre>')
+                    __M_writer(escape(compilation.stdout))
+                    __M_writer(u'</pre></td>\n        </tr>\n')
+                if compilation.stderr:
+                    __M_writer(u'        <tr>\n          <th>stderr</th>\n          <td><pre>')
+                    __M_writer(escape(compilation.stderr))
+                    __M_writer(u'</pre></td>\n        </tr>\n')
+            __M_writer(u'    </table>\n')
+        __M_writer(u'\n')
+        if testruns:
+            __M_writer(u'  <h2>Testrun results</h2>\n  ')
+            __M_writer(escape(self.list(testruns)))
+            __M_writer(u'\n')
+        __M_writer(u'\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_list(context,testruns):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        loop = __M_loop = runtime.LoopStack()
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        request = context.get('request', UNDEFINED)
+        len = context.get('len', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        loop = __M_loop._enter(testruns)
+        try:
+            for testrun in loop:
+                if testrun.test.visibility != 'invisible' or request.allowance(testrun):
+                    __M_writer(u'      <table class="table table-bordered table-condensed test-and-result-table">\n')
+                    if request.allowance(testrun):
+                        __M_writer(u'        <tr>\n          <th>Test</th>\n          <th>')
+                        __M_writer(escape(testrun.test.name))
+                        __M_writer(u'</th>\n          <th>\n')
+                        if testrun.test.visibility == 'visible':
+                            __M_writer(u'            <span class="label"><i class="icon-eye-open icon-white"></i>&nbsp;Visible</span>\n')
+                        elif testrun.test.visibility == 'result_only':
+                            __M_writer(u'            <span class="label"><i class="icon-eye-close icon-white"></i>&nbsp;Only result visible</span>\n')
+                        elif testrun.test.visibility == 'data_only':
+                            __M_writer(u'            <span class="label"><i class="icon-eye-close icon-white"></i>&nbsp;Only data visible</span>\n')
+                        elif testrun.test.visibility == 'invisible':
+                            __M_writer(u'            <span class="label label-inverse"><i class="icon-eye-close icon-white"></i>&nbsp;Invisible</span>\n')
+                        __M_writer(u'          </th>\n        </tr>\n')
+                    __M_writer(u'      <tr>\n        <th>Date</th>\n        <td colspan="2"><span title="')
+                    __M_writer(escape(h.strftime(testrun.date, False)))
+                    __M_writer(u'">')
+                    __M_writer(escape(h.strftime(testrun.date, True)))
+                    __M_writer(u'</td>\n      </tr>\n      <tr>\n        <th>Runtime</th>\n        <td colspan="2">')
+                    __M_writer(escape(testrun.runtime))
+                    __M_writer(u' seconds</td>\n      </tr>\n')
+                    if testrun.cpu_time is not None:
+                        __M_writer(u'      <tr>\n        <th>CPU time</th>\n        <td colspan="2">')
+                        __M_writer(escape('%.3f' % testrun.cpu_time))
+                        __M_writer(u' seconds\n          (')
+                        __M_writer(escape('%.3f' % testrun.user_time))
+                        __M_writer(u' user, ')
+                        __M_writer(escape('%.3f' % testrun.system_time))
+                        __M_writer(u' system)</td>\n      </tr>\n')
+                    if testrun.max_rss is not None:
+                        __M_writer(u'      <tr>\n        <th>Peak memory</th>\n        <td colspan="2">')
+                        __M_writer(escape('%.1f' % (testrun.max_rss / 1024.0)))
+                        __M_writer(u' MB</td>\n      </tr>\n')
+                    if testrun.test.visibility in ('visible', 'result_only') or request.allowance(testrun):
+                        __M_writer(u'        <tr>\n          <th>Result</th>\n          <td colspan="2">\n')
+                        if testrun.limit_hit:
+                            __M_writer(u'            <span class="label label-inverse" title="Your program was stopped because it used too many resources.">\n              ')
+                            __M_writer(escape(h.resource_limit_name(testrun.limit_hit)))
+                            __M_writer(u' limit exceeded\n            </span>\n')
+                        if testrun.skipped:
+                            __M_writer(u'            <span class="label label-info" title="This test was not run because too many other tests failed already.\n  Fix these first, all tests are run when the assignment is over.">\n              Skipped\n            </span>\n')
+                        elif testrun.result:
+                            __M_writer(u'            <span class="label label-success" title="Your submission is correct. Congratulations!">\n              Success\n            </span>\n')
+                        else:
+                            if testrun.partial:
+                                __M_writer(u'              <span class="label label-warning" title="Your submission is partially correct.\n  Check the output below and compare it to the expected output.\n  Check your program for missing characters or a probable infinite loop.">\n                 Partial match\n               </span>\n')
+                            else:
+                                __M_writer(u'              <span class="label label-important" title="Your submission is producing wrong or no output.\n  Check the output and error listing below to see what went wrong.">\n                Fail\n              </span>\n')
+                        __M_writer(u'          </td>\n        </tr>\n')
+                    if not testrun.skipped and (testrun.test.visibility in ('visible', 'data_only') or request.allowance(testrun)):
+                        if testrun.test.argv:
+                            __M_writer(u'          <tr>\n            <th>Command line arguments</th>\n            <td colspan="2"><pre>')
+                            __M_writer(escape(testrun.test.argv))
+                            __M_writer(u'</pre></td>\n          </tr>\n')
+                        if testrun.test.visibility == 'data_only':
+                            __M_writer(u'            <tr>\n              <th>Observed output</th>\n              <td colspan="2"><pre>')
+                            __M_writer(escape(testrun.output_data))
+                            __M_writer(u'</pre></td>\n            </tr>\n')
+                        else:
+                            if testrun.test.input_data:
+                                __M_writer(u'            <tr>\n              <th>Given input</th>\n              <td colspan="2"><pre>')
+                                __M_writer(escape(testrun.test.input_data))
+                                __M_writer(u'</pre></td>\n            </tr>\n')
+                            if testrun.result:
+                                __M_writer(u'            <tr>\n              <th>Expected and<br />observed output</th>\n              <td colspan="2"><pre>')
+                                __M_writer(escape(testrun.output_data))
+                                __M_writer(u'</pre></td>\n            </tr>\n')
+                            else:
+                                __M_writer(u'            <tr>\n              <th>Expected vs.<br />observed output</th>\n              <td><pre>')
+                                __M_writer(escape(testrun.test.output_data))
+                                __M_writer(u'</pre></td>\n              <td><pre>')
+                                __M_writer(escape(testrun.output_data))
+                                __M_writer(u'</pre></td>\n            </tr>\n')
+                                if len(testrun.output_data) < 65536:
+                                    __M_writer(u'            <tr>\n              <th>\n              Expected vs.<br />observed output<br />\n              <em>\n                (<a href="http://en.wikipedia.org/wiki/Diff#Unified_format">Unified diff format</a>)\n              </em>\n              </th>\n              <td colspan="2">\n                ')
+                                    __M_writer(c.source_display.display(h.udiff(testrun.test.output_data, testrun.output_data, 'expected', 'observed'),
+                  id='diff_%d' % loop.index, compound_id='diff_%d' % loop.index,
+                  mode='diff', lineNumbers=False) )
+                                    __M_writer(u'\n')
+                                    if testrun.test.comment_prefix:
+                                        __M_writer(u'                  <em>(Highlighted lines that start with the test comment prefix <code>')
+                                        __M_writer(escape(testrun.test.comment_prefix))
+                                        __M_writer(u'</code>\n                  are not relevant for the result!)</em>\n')
+                                    __M_writer(u'              </td>\n            </tr>\n')
+                        if testrun.error_data:
+                            __M_writer(u'          <tr>\n            <th>Error message(s)</th>\n            <td colspan="2"><pre>')
+                            __M_writer(escape(testrun.error_data))
+                            __M_writer(u'</pre></td>\n          </tr>\n')
+                    __M_writer(u'      </table>\n')
+        finally:
+            loop = __M_loop._exit()
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"28": 0, "40": 16, "41": 17, "42": 20, "43": 20, "44": 25, "45": 26, "46": 33, "47": 33, "48": 44, "49": 45, "50": 46, "51": 47, "52": 48, "53": 49, "54": 50, "55": 52, "56": 55, "57": 55, "58": 57, "59": 58, "60": 59, "61": 61, "62": 61, "63": 64, "64": 65, "65": 67, "66": 67, "67": 71, "68": 73, "69": 74, "70": 75, "71": 76, "72": 76, "73": 78, "74": 217, "80": 79, "89": 79, "90": 80, "93": 81, "94": 82, "95": 83, "96": 84, "97": 86, "98": 86, "99": 88, "100": 89, "101": 90, "102": 91, "103": 92, "104": 93, "105": 94, "106": 95, "107": 97, "108": 100, "109": 102, "110": 102, "111": 102, "112": 102, "113": 106, "114": 106, "115": 108, "116": 109, "117": 111, "118": 111, "119": 112, "120": 112, "121": 112, "122": 112, "123": 115, "124": 116, "125": 118, "126": 118, "127": 121, "128": 122, "129": 125, "130": 126, "131": 127, "132": 127, "133": 130, "134": 131, "135": 135, "136": 136, "137": 139, "138": 140, "139": 141, "140": 146, "141": 147, "142": 153, "143": 156, "144": 157, "145": 158, "146": 160, "147": 160, "148": 163, "149": 164, "150": 166, "151": 166, "152": 168, "153": 169, "154": 170, "155": 172, "156": 172, "157": 175, "158": 176, "159": 178, "160": 178, "161": 180, "162": 181, "163": 183, "164": 183, "165": 184, "166": 184, "167": 186, "168": 187, "169": 195, "172": 197, "173": 198, "174": 199, "175": 199, "176": 199, "177": 202, "178": 207, "179": 208, "180": 210, "181": 210, "182": 214, "190": 182}, "uri": "/root/package/sauce/templates/submission_result.mak", "filename": "/root/package/sauce/templates/submission_result.mak"}
+__M_END_METADATA
+"""
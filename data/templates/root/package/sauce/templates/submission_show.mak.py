@@ -0,0 +1,63 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+STOP_RENDERING = runtime.STOP_RENDERING
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792327283.003589
+_enable_loop = True
+_template_filename = '/root/package/sauce/templates/submission_show.mak'
+_template_uri = '/root/package/sauce/templates/submission_show.mak'
+_source_encoding = 'utf-8'
+from markupsafe import escape_silent as escape
+_exports = []
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    ns = runtime.TemplateNamespace('__anon_0x7fb1c7d76b10', context._clean_inheritance_tokens(), templateuri=u'local:templates.submission', callables=None,  calling_uri=_template_uri)
+    context.namespaces[(__name__, '__anon_0x7fb1c7d76b10')] = ns
+
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'local:templates.submission', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        _import_ns = {}
+        _mako_get_namespace(context, '__anon_0x7fb1c7d76b10')._populate(_import_ns, [u'details', u'details_judgement'])
+        details_judgement = _import_ns.get('details_judgement', context.get('details_judgement', UNDEFINED))
+        request = _import_ns.get('request', context.get('request', UNDEFINED))
+        details = _import_ns.get('details', context.get('details', UNDEFINED))
+        submission = _import_ns.get('submission', context.get('submission', UNDEFINED))
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(u'\n')
+        __M_writer(u'\n\n')
+        __M_writer(escape(details(submission)))
+        __M_writer(u'\n\n')
+        if submission.judgement and (submission.judgement.public or request.allowance(submission)):
+            __M_writer(u'  <h2>Judgement\n')
+            if not submission.judgement.public:
+                __M_writer(u'    <small>Draft</small>\n')
+            __M_writer(u'  </h2>\n  ')
+            __M_writer(escape(details_judgement(submission.judgement)))
+            __M_writer(u'\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"41": 16, "42": 17, "43": 18, "44": 20, "45": 20, "46": 22, "47": 23, "48": 24, "49": 25, "50": 27, "51": 28, "52": 28, "53": 30, "24": 18, "59": 53, "30": 0}, "uri": "/root/package/sauce/templates/submission_show.mak", "filename": "/root/package/sauce/templates/submission_show.mak"}
+__M_END_METADATA
+"""
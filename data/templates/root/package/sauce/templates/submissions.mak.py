@@ -0,0 +1,134 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+STOP_RENDERING = runtime.STOP_RENDERING
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792337644.686709
+_enable_loop = True
+_template_filename = '/root/package/sauce/templates/submissions.mak'
+_template_uri = '/root/package/sauce/templates/submissions.mak'
+_source_encoding = 'utf-8'
+from markupsafe import escape_silent as escape
+_exports = ['title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'local:templates.master', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        count = context.get('count', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        real_filters = context.get('real_filters', UNDEFINED)
+        unicode = context.get('unicode', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        table_args = context.get('table_args', UNDEFINED)
+        tmpl_context = context.get('tmpl_context', UNDEFINED)
+        len = context.get('len', UNDEFINED)
+        next_cursor = context.get('next_cursor', UNDEFINED)
+        values = context.get('values', UNDEFINED)
+        filters = context.get('filters', UNDEFINED)
+        definite_filters = context.get('definite_filters', UNDEFINED)
+        dict = context.get('dict', UNDEFINED)
+        rows_url = context.get('rows_url', UNDEFINED)
+        hasattr = context.get('hasattr', UNDEFINED)
+        view = context.get('view', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n<div class="page-header">\n  <h1>Submissions</h1>\n</div>\n\n<!--\n')
+        try:
+            __M_writer(u'filters:          ')
+            __M_writer(unicode(filters) )
+            __M_writer(u'\nreal_filters:     ')
+            __M_writer(unicode(real_filters) )
+            __M_writer(u'\ndefinite_filters: ')
+            __M_writer(unicode(definite_filters) )
+            __M_writer(u'\n')
+        except:
+            __M_writer(u'\n')
+        __M_writer(u'-->\n\n')
+        if not view:
+            if next_cursor:
+                __M_writer(c.table(value=values, **table_args) )
+                __M_writer(u'\n<p id="submissions-more">\n  <button class="btn" data-next="')
+                __M_writer(escape(next_cursor))
+                __M_writer(u'">More submissions</button>\n  <span class="muted">Showing <span class="shown">')
+                __M_writer(escape(len(values)))
+                __M_writer(u'</span> of ')
+                __M_writer(escape(count))
+                __M_writer(u' submissions</span>\n</p>\n<script type="text/javascript">\n  $(\'#submissions-more button\').click(function() {\n    var button = $(this).attr(\'disabled\', true);\n    $.getJSON("')
+                __M_writer(escape(rows_url))
+                __M_writer(u'", {after: button.data(\'next\')}, function(data) {\n      var table = $(\'table.tablesorter\'), tbody = table.children(\'tbody\');\n      $.each(data.rows, function(i, row) {\n        // The cells are escaped by the server like in the datagrid\n        var tr = $(\'<tr>\').addClass(tbody.children(\'tr\').length % 2 ? \'odd\' : \'even\');\n        $.each(row, function(j, cell) {\n          tr.append($(\'<td>\').addClass(\'col_\' + j).html(cell));\n        });\n        tbody.append(tr);\n      });\n      table.trigger(\'update\');\n      $(\'#submissions-more .shown\').text(table.find(\'tbody tr\').length);\n      if (data.next) {\n        button.data(\'next\', data.next).attr(\'disabled\', false);\n      } else {\n        button.remove();\n      }\n    }).error(function() {\n      button.attr(\'disabled\', false);\n    });\n  });\n</script>\n')
+            else:
+                __M_writer(c.table(value=values) )
+                __M_writer(u'\n')
+        else:
+            __M_writer(u'\n<p>\n')
+            __M_writer(escape(h.link_to_unless(view=='by_team', 'by Team', '?view=by_team') ))
+            __M_writer(u', \n')
+            __M_writer(escape(h.link_to_unless(view=='by_sheet', 'by Sheet', '?view=by_sheet') ))
+            __M_writer(u', \n')
+            __M_writer(escape(h.link_to_unless(view=='by_student', 'by Student', '?view=by_student') ))
+            __M_writer(u'\n</p>\n\n')
+            if hasattr(c, 'table'):
+                if values:
+                    if values['sheets']:
+                        __M_writer(u'      <h3>Sheets:</h3>\n')
+                        for sheet in values['sheets']:
+                            if sheet.submissions_:
+                                __M_writer(u'          <h4>')
+                                __M_writer(escape(sheet.name))
+                                __M_writer(u'</h4>\n          <div class="crud_table">\n            ')
+                                __M_writer(tmpl_context.table(id='sheet_%d' % sheet.id, value=sheet.submissions_, attrs=dict(style="height:200px; border:solid black 3px;")) )
+                                __M_writer(u'\n          </div>\n')
+                    if values['teams']:
+                        __M_writer(u'      <h3>Teams:</h3>\n')
+                        for team in values['teams']:
+                            if team.submissions_:
+                                __M_writer(u'          <h4>')
+                                __M_writer(escape(team.name))
+                                __M_writer(u'</h4>\n          <div class="crud_table">\n            ')
+                                __M_writer(tmpl_context.table(id='team_%d' % team.id, value=team.submissions_, attrs=dict(style="height:200px; border:solid black 3px;")) )
+                                __M_writer(u'\n          </div>\n')
+                    if values['students']:
+                        __M_writer(u'      <h3>Students:</h3>\n')
+                        for student in values['students']:
+                            if student.submissions_:
+                                __M_writer(u'          <h4>')
+                                __M_writer(escape(student.display_name))
+                                __M_writer(u'</h4>\n          <div class="crud_table">\n            ')
+                                __M_writer(tmpl_context.table(id='student_%d' % student.id, value=student.submissions_, attrs=dict(style="height:200px; border:solid black 3px;")) )
+                                __M_writer(u'\n          </div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_writer = context.writer()
+        __M_writer(u'\n  Submissions\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"130": 124, "28": 0, "49": 16, "50": 17, "51": 21, "52": 28, "53": 29, "54": 29, "55": 29, "56": 30, "57": 30, "58": 31, "59": 31, "60": 32, "61": 33, "62": 35, "63": 37, "64": 38, "65": 39, "66": 39, "67": 41, "68": 41, "69": 42, "70": 42, "71": 42, "72": 42, "73": 47, "74": 47, "75": 69, "76": 70, "77": 70, "78": 72, "79": 73, "80": 75, "81": 75, "82": 76, "83": 76, "84": 77, "85": 77, "86": 80, "87": 81, "88": 82, "89": 83, "90": 84, "91": 85, "92": 86, "93": 86, "94": 86, "95": 88, "96": 88, "97": 93, "98": 94, "99": 95, "100": 96, "101": 97, "102": 97, "103": 97, "104": 99, "105": 99, "106": 104, "107": 105, "108": 106, "109": 107, "110": 108, "111": 108, "112": 108, "113": 110, "114": 110, "120": 19, "124": 19}, "uri": "/root/package/sauce/templates/submissions.mak", "filename": "/root/package/sauce/templates/submissions.mak"}
+__M_END_METADATA
+"""
@@ -0,0 +1,112 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+STOP_RENDERING = runtime.STOP_RENDERING
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792327269.73034
+_enable_loop = True
+_template_filename = '/root/package/sauce/templates/user.mak'
+_template_uri = '/root/package/sauce/templates/user.mak'
+_source_encoding = 'utf-8'
+from markupsafe import escape_silent as escape
+_exports = ['title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'local:templates.master', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        c = context.get('c', UNDEFINED)
+        request = context.get('request', UNDEFINED)
+        memberships = context.get('memberships', UNDEFINED)
+        getattr = context.get('getattr', UNDEFINED)
+        values = context.get('values', UNDEFINED)
+        user = context.get('user', UNDEFINED)
+        tg = context.get('tg', UNDEFINED)
+        dict = context.get('dict', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n<div class="page-header">\n  <h1>')
+        __M_writer(escape(user))
+        __M_writer(u' <small>Profile page</small></h1>\n</div>\n\n<p><a href="')
+        __M_writer(escape(tg.url('/user/profile')))
+        __M_writer(u'" class="btn btn-primary">\n  <i class="icon-user icon-white"></i>&nbsp;Edit profile\n</a></p>\n\n')
+        if memberships['teams']:
+            __M_writer(u'  <h4>Your teams:</h4>\n  <ul>\n')
+            for team in memberships['teams']:
+                __M_writer(u'    <li>')
+                __M_writer(escape(team.name))
+                __M_writer(u' - ')
+                __M_writer(escape(team.lesson.name))
+                __M_writer(u' (')
+                __M_writer(escape(team.lesson.event.link))
+                __M_writer(u')</li>\n')
+            __M_writer(u'  </ul>\n')
+        if memberships['lessons']:
+            __M_writer(u'  <h4>Your lessons:</h4>\n  <ul>\n')
+            for lesson in memberships['lessons']:
+                __M_writer(u'    <li>\n')
+                if getattr(request, 'user', None) == lesson.tutor:
+                    __M_writer(u'        <a href="')
+                    __M_writer(escape(tg.url('%s/lessons/%d'%(lesson.event.url,lesson.id))))
+                    __M_writer(u'">')
+                    __M_writer(escape(lesson.name))
+                    __M_writer(u'</a>\n')
+                else:
+                    __M_writer(u'        ')
+                    __M_writer(escape(lesson.name))
+                    __M_writer(u'\n')
+                __M_writer(u'      (')
+                __M_writer(escape(lesson.event.link))
+                __M_writer(u')\n    </li>\n')
+            __M_writer(u'  </ul>\n')
+        if memberships['events']:
+            __M_writer(u'  <h4>Your events:</h4>\n  <ul>\n')
+            for event in memberships['events']:
+                __M_writer(u'    <li>')
+                __M_writer(escape(event.link))
+                __M_writer(u'</li>\n')
+            __M_writer(u'  </ul>\n')
+        __M_writer(u'\n<h3>Your \n')
+        __M_writer(u'submissions:</h3>\n\n<div class="crud_table">\n  ')
+        __M_writer(c.table(value=values, attrs=dict(style="height:200px; border:solid black 3px;")) )
+        __M_writer(u'\n</div>\n\n<div class="alert alert-info alert-block">\n  <h4 class="alert-heading">Note: Teammates submissions</h4>\n  <p>\n    In previous versions of <strong>SAUCE</strong>, you used to see the\n    <strong>submissions of your teammates</strong> listed here, too.<br />\n    They are not shown here anymore since there was a bug in the listing anyways,\n    but you can still see them on the corresponding assignment pages.<br />\n    If you really liked having the submissions in the listing here,\n    please <a href="')
+        __M_writer(escape(tg.url('/contact')))
+        __M_writer(u'">drop a note to the developer</a>.\n  </p>\n</div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        user = context.get('user', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n  ')
+        __M_writer(escape(user))
+        __M_writer(u' - Profile page\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"28": 0, "41": 16, "42": 17, "43": 21, "44": 24, "45": 24, "46": 27, "47": 27, "48": 31, "49": 32, "50": 34, "51": 35, "52": 35, "53": 35, "54": 35, "55": 35, "56": 35, "57": 35, "58": 37, "59": 39, "60": 40, "61": 42, "62": 43, "63": 44, "64": 45, "65": 45, "66": 45, "67": 45, "68": 45, "69": 46, "70": 47, "71": 47, "72": 47, "73": 49, "74": 49, "75": 49, "76": 52, "77": 54, "78": 55, "79": 57, "80": 58, "81": 58, "82": 58, "83": 60, "84": 62, "85": 67, "86": 70, "87": 70, "88": 81, "89": 81, "95": 19, "100": 19, "101": 20, "102": 20, "108": 102}, "uri": "/root/package/sauce/templates/user.mak", "filename": "/root/package/sauce/templates/user.mak"}
+__M_END_METADATA
+"""
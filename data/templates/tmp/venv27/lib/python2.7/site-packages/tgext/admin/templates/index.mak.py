@@ -0,0 +1,62 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+STOP_RENDERING = runtime.STOP_RENDERING
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792327270.212635
+_enable_loop = True
+_template_filename = '/tmp/venv27/lib/python2.7/site-packages/tgext/admin/templates/index.mak'
+_template_uri = '/tmp/venv27/lib/python2.7/site-packages/tgext/admin/templates/index.mak'
+_source_encoding = 'utf-8'
+from markupsafe import escape_silent as escape
+_exports = ['title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'local:templates.master', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        models = context.get('models', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n<div style="height:0px;"> &nbsp; </div>\n    <h2>TurboGears Admin</h2>\n    This is a fully-configurable administrative tool to help you administer your website.\n    Below is links to all of your models.<br/>    They will bring you to a listing of the objects\n    in your database.\n\n<table class="admin_grid">\n')
+        for model in models:
+            __M_writer(u'    <tr py:for="model in models">\n      <td>\n        <a href=\'')
+            __M_writer(escape(model.lower()))
+            __M_writer(u's/\' class="edit_link">')
+            __M_writer(escape(model))
+            __M_writer(u'</a>\n      </td>\n    </tr>\n')
+        __M_writer(u'</table>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_writer = context.writer()
+        __M_writer(u'\nTurbogears Administration System\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"34": 1, "35": 5, "36": 14, "37": 15, "38": 17, "39": 17, "40": 17, "41": 17, "42": 21, "48": 3, "52": 3, "58": 52, "28": 0}, "uri": "/tmp/venv27/lib/python2.7/site-packages/tgext/admin/templates/index.mak", "filename": "/tmp/venv27/lib/python2.7/site-packages/tgext/admin/templates/index.mak"}
+__M_END_METADATA
+"""
@@ -0,0 +1,59 @@
+"""Grading memos refer to blobs
+
+Revision ID: 0a8e4d2c6b19
+Revises: f7d3c5b9a268
+Create Date: 2026-10-18 18:04:12.551390
+
+"""
+#
+# # SAUCE - System for AUtomated Code Evaluation
+# # Copyright (C) 2013 Moritz Schlarb
+# #
+# # This program is free software: you can redistribute it and/or modify
+# # it under the terms of the GNU Affero General Public License as published by
+# # the Free Software Foundation, either version 3 of the License, or
+# # any later version.
+# #
+# # This program is distributed in the hope that it will be useful,
+# # but WITHOUT ANY WARRANTY; without even the implied warranty of
+# # MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# # GNU Affero General Public License for more details.
+# #
+# # You should have received a copy of the GNU Affero General Public License
+# # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+
+# revision identifiers, used by Alembic.
+revision = '0a8e4d2c6b19'
+down_revision = 'f7d3c5b9a268'
+
+
+from collections import Counter
+
+from alembic import op
+#from alembic.operations import Operations as op
+import sqlalchemy as sa
+
+
+grading_memos = sa.sql.table('grading_memos',
+    sa.sql.column('id', sa.Integer), sa.sql.column('testruns', sa.PickleType))
+blobs = sa.sql.table('blobs',
+    sa.sql.column('hash', sa.String), sa.sql.column('refcount', sa.Integer))
+
+
+def upgrade():
+    # The memos held the testresults with their output before, they are only
+    # a cache and are stored again on the next miss
+    op.execute(grading_memos.delete())
+
+
+def downgrade():
+    # Release the references of the memos to the blobs
+    conn = op.get_bind()
+    counts = Counter(row[key] for (testruns,) in conn.execute(sa.select([grading_memos.c.testruns]))
+        for row in testruns or () for key in ('output_blob', 'error_blob', 'expected_blob') if row.get(key))
+    for (h, n) in counts.iteritems():
+        conn.execute(blobs.update().where(blobs.c.hash == h).values(refcount=blobs.c.refcount - n))
+    conn.execute(blobs.delete().where(blobs.c.refcount <= 0))
+    op.execute(grading_memos.delete())
@@ -0,0 +1,59 @@
+"""Count grading memo hits and misses per assignment
+
+Revision ID: 1b9f5e3d7c20
+Revises: 0a8e4d2c6b19
+Create Date: 2026-10-18 21:37:45.102846
+
+"""
+#
+# # SAUCE - System for AUtomated Code Evaluation
+# # Copyright (C) 2013 Moritz Schlarb
+# #
+# # This program is free software: you can redistribute it and/or modify
+# # it under the terms of the GNU Affero General Public License as published by
+# # the Free Software Foundation, either version 3 of the License, or
+# # any later version.
+# #
+# # This program is distributed in the hope that it will be useful,
+# # but WITHOUT ANY WARRANTY; without even the implied warranty of
+# # MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# # GNU Affero General Public License for more details.
+# #
+# # You should have received a copy of the GNU Affero General Public License
+# # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+
+# revision identifiers, used by Alembic.
+revision = '1b9f5e3d7c20'
+down_revision = '0a8e4d2c6b19'
+
+from alembic import op
+#from alembic.operations import Operations as op
+import sqlalchemy as sa
+
+
+grading_memos = sa.sql.table('grading_memos',
+    sa.sql.column('assignment_id', sa.Integer), sa.sql.column('hits', sa.Integer),
+    sa.sql.column('runtime', sa.Float))
+
+
+def upgrade():
+    grading_memo_counters = op.create_table('grading_memo_counters',
+        sa.Column('assignment_id', sa.Integer(), nullable=False),
+        sa.Column('hits', sa.Integer(), nullable=False),
+        sa.Column('misses', sa.Integer(), nullable=False),
+        sa.Column('saved_runtime', sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(['assignment_id'], ['assignments.id'], ),
+        sa.PrimaryKeyConstraint('assignment_id')
+    )
+    # Start with what the remaining memos know, every one of them was a miss
+    op.execute(grading_memo_counters.insert().from_select(
+        ['assignment_id', 'hits', 'misses', 'saved_runtime'],
+        sa.select([grading_memos.c.assignment_id, sa.func.sum(grading_memos.c.hits),
+            sa.func.count(), sa.func.sum(grading_memos.c.hits * grading_memos.c.runtime)])
+        .group_by(grading_memos.c.assignment_id)))
+
+
+def downgrade():
+    op.drop_table('grading_memo_counters')
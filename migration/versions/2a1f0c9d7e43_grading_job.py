@@ -0,0 +1,59 @@
+"""GradingJob
+
+Revision ID: 2a1f0c9d7e43
+Revises: 1e52c8ddf5a0
+Create Date: 2026-10-18 10:12:31.402817
+
+"""
+#
+# # SAUCE - System for AUtomated Code Evaluation
+# # Copyright (C) 2013 Moritz Schlarb
+# #
+# # This program is free software: you can redistribute it and/or modify
+# # it under the terms of the GNU Affero General Public License as published by
+# # the Free Software Foundation, either version 3 of the License, or
+# # any later version.
+# #
+# # This program is distributed in the hope that it will be useful,
+# # but WITHOUT ANY WARRANTY; without even the implied warranty of
+# # MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# # GNU Affero General Public License for more details.
+# #
+# # You should have received a copy of the GNU Affero General Public License
+# # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+# revision identifiers, used by Alembic.
+revision = '2a1f0c9d7e43'
+down_revision = '1e52c8ddf5a0'
+
+from alembic import op
+#from alembic.operations import Operations as op
+import sqlalchemy as sa
+
+grading_job_state = sa.Enum('pending', 'running', 'done', 'failed', name='grading_job_state')
+
+
+def upgrade():
+    op.create_table('grading_jobs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('state', grading_job_state, nullable=False),
+        sa.Column('created', sa.DateTime(), nullable=False),
+        sa.Column('started', sa.DateTime(), nullable=True),
+        sa.Column('finished', sa.DateTime(), nullable=True),
+        sa.Column('worker', sa.Unicode(length=255), nullable=True),
+        sa.Column('compilation', sa.PickleType(), nullable=True),
+        sa.Column('error', sa.Unicode(length=65536), nullable=True),
+        sa.Column('submission_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['submission_id'], ['submissions.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_grading_jobs_state', 'grading_jobs', ['state'])
+    op.create_index('ix_grading_jobs_submission_id', 'grading_jobs', ['submission_id'])
+
+
+def downgrade():
+    op.drop_index('ix_grading_jobs_submission_id', 'grading_jobs')
+    op.drop_index('ix_grading_jobs_state', 'grading_jobs')
+    op.drop_table('grading_jobs')
+    grading_job_state.drop(op.get_bind(), checkfirst=False)
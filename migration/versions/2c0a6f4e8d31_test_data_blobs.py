@@ -0,0 +1,118 @@
+"""Store the input and output data of tests as blobs
+
+Revision ID: 2c0a6f4e8d31
+Revises: 1b9f5e3d7c20
+Create Date: 2026-10-18 22:14:09.531822
+
+"""
+#
+# # SAUCE - System for AUtomated Code Evaluation
+# # Copyright (C) 2013 Moritz Schlarb
+# #
+# # This program is free software: you can redistribute it and/or modify
+# # it under the terms of the GNU Affero General Public License as published by
+# # the Free Software Foundation, either version 3 of the License, or
+# # any later version.
+# #
+# # This program is distributed in the hope that it will be useful,
+# # but WITHOUT ANY WARRANTY; without even the implied warranty of
+# # MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# # GNU Affero General Public License for more details.
+# #
+# # You should have received a copy of the GNU Affero General Public License
+# # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+
+# revision identifiers, used by Alembic.
+revision = '2c0a6f4e8d31'
+down_revision = '1b9f5e3d7c20'
+
+import zlib
+from hashlib import sha256
+
+from alembic import op
+#from alembic.operations import Operations as op
+import sqlalchemy as sa
+
+# Text column and hash column of the test data
+data_columns = (
+    ('input_data', 'input_hash'),
+    ('output_data', 'output_hash'),
+)
+
+blobs = sa.sql.table('blobs',
+    sa.sql.column('hash', sa.String()),
+    sa.sql.column('compression', sa.Unicode()),
+    sa.sql.column('size', sa.Integer()),
+    sa.sql.column('data', sa.LargeBinary()),
+    sa.sql.column('refcount', sa.Integer()),
+)
+
+tests = sa.sql.table('tests',
+    sa.sql.column('id', sa.Integer()),
+    sa.sql.column('input_data', sa.Unicode()),
+    sa.sql.column('output_data', sa.Unicode()),
+    sa.sql.column('input_hash', sa.String()),
+    sa.sql.column('output_hash', sa.String()),
+)
+
+
+def _pack(text):
+    data = text.encode('utf-8')
+    packed = zlib.compress(data)
+    if len(data) < 256 or len(packed) >= len(data):
+        return dict(compression=None, size=len(data), data=data)
+    return dict(compression=u'zlib', size=len(data), data=packed)
+
+
+def _unpack(compression, data):
+    data = bytes(data)
+    if compression == 'zlib':
+        data = zlib.decompress(data)
+    elif compression == 'lzma':
+        try:
+            import lzma
+        except ImportError:
+            from backports import lzma
+        data = lzma.decompress(data)
+    return data.decode('utf-8')
+
+
+def upgrade():
+    conn = op.get_bind()
+    for (column, hash_column) in data_columns:
+        ids = [row[0] for row in conn.execute(sa.select([tests.c.id]).where(tests.c[column].isnot(None)))]
+        # One row at a time, the texts can be large
+        for test_id in ids:
+            text = conn.execute(sa.select([tests.c[column]]).where(tests.c.id == test_id)).scalar()
+            h = sha256(text.encode('utf-8')).hexdigest()
+            # The same text may already be stored, e.g. as expected output of a testrun
+            if not conn.execute(blobs.update().where(blobs.c.hash == h)
+                    .values(refcount=blobs.c.refcount + 1)).rowcount:
+                conn.execute(blobs.insert().values(hash=h, refcount=1, **_pack(text)))
+            conn.execute(tests.update().where(tests.c.id == test_id).values({hash_column: h}))
+        # Hashes without data are left over from cleared data
+        conn.execute(tests.update().where(tests.c[column].is_(None)).values({hash_column: None}))
+
+    for (column, hash_column) in data_columns:
+        op.create_foreign_key('fk_tests_%s' % hash_column, 'tests',
+            'blobs', [hash_column], ['hash'])
+        op.drop_column('tests', column)
+
+
+def downgrade():
+    for (column, hash_column) in data_columns:
+        op.add_column('tests', sa.Column(column, sa.Unicode(length=10 * 1024 * 1024), nullable=True))
+
+    conn = op.get_bind()
+    for (column, hash_column) in data_columns:
+        rows = conn.execute(sa.select([tests.c.id, tests.c[hash_column]])
+            .where(tests.c[hash_column].isnot(None))).fetchall()
+        for (test_id, h) in rows:
+            (compression, data) = conn.execute(sa.select([blobs.c.compression, blobs.c.data])
+                .where(blobs.c.hash == h)).first()
+            conn.execute(tests.update().where(tests.c.id == test_id).values({column: _unpack(compression, data)}))
+            conn.execute(blobs.update().where(blobs.c.hash == h).values(refcount=blobs.c.refcount - 1))
+        op.drop_constraint('fk_tests_%s' % hash_column, 'tests', type_='foreignkey')
+    conn.execute(blobs.delete().where(blobs.c.refcount <= 0))
@@ -0,0 +1,55 @@
+"""GradingMemo
+
+Revision ID: 3c6e1b7a9f02
+Revises: 2a1f0c9d7e43
+Create Date: 2026-10-18 11:03:52.118904
+
+"""
+#
+# # SAUCE - System for AUtomated Code Evaluation
+# # Copyright (C) 2013 Moritz Schlarb
+# #
+# # This program is free software: you can redistribute it and/or modify
+# # it under the terms of the GNU Affero General Public License as published by
+# # the Free Software Foundation, either version 3 of the License, or
+# # any later version.
+# #
+# # This program is distributed in the hope that it will be useful,
+# # but WITHOUT ANY WARRANTY; without even the implied warranty of
+# # MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# # GNU Affero General Public License for more details.
+# #
+# # You should have received a copy of the GNU Affero General Public License
+# # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+# revision identifiers, used by Alembic.
+revision = '3c6e1b7a9f02'
+down_revision = '2a1f0c9d7e43'
+
+from alembic import op
+#from alembic.operations import Operations as op
+import sqlalchemy as sa
+
+
+def upgrade():
+    op.create_table('grading_memos',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('key', sa.String(length=64), nullable=False),
+        sa.Column('compilation', sa.PickleType(), nullable=True),
+        sa.Column('testruns', sa.PickleType(), nullable=True),
+        sa.Column('runtime', sa.Float(), nullable=False),
+        sa.Column('created', sa.DateTime(), nullable=False),
+        sa.Column('last_hit', sa.DateTime(), nullable=True),
+        sa.Column('hits', sa.Integer(), nullable=False),
+        sa.Column('assignment_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['assignment_id'], ['assignments.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('key')
+    )
+    op.create_index('ix_grading_memos_assignment_id', 'grading_memos', ['assignment_id'])
+
+
+def downgrade():
+    op.drop_index('ix_grading_memos_assignment_id', 'grading_memos')
+    op.drop_table('grading_memos')
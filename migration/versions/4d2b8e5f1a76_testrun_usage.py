@@ -0,0 +1,44 @@
+"""Testrun resource usage
+
+Revision ID: 4d2b8e5f1a76
+Revises: 3c6e1b7a9f02
+Create Date: 2026-10-18 11:47:09.563211
+
+"""
+#
+# # SAUCE - System for AUtomated Code Evaluation
+# # Copyright (C) 2013 Moritz Schlarb
+# #
+# # This program is free software: you can redistribute it and/or modify
+# # it under the terms of the GNU Affero General Public License as published by
+# # the Free Software Foundation, either version 3 of the License, or
+# # any later version.
+# #
+# # This program is distributed in the hope that it will be useful,
+# # but WITHOUT ANY WARRANTY; without even the implied warranty of
+# # MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# # GNU Affero General Public License for more details.
+# #
+# # You should have received a copy of the GNU Affero General Public License
+# # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+# revision identifiers, used by Alembic.
+revision = '4d2b8e5f1a76'
+down_revision = '3c6e1b7a9f02'
+
+from alembic import op
+#from alembic.operations import Operations as op
+import sqlalchemy as sa
+
+
+def upgrade():
+    op.add_column('testruns', sa.Column('user_time', sa.Float(), nullable=True))
+    op.add_column('testruns', sa.Column('system_time', sa.Float(), nullable=True))
+    op.add_column('testruns', sa.Column('max_rss', sa.Integer(), nullable=True))
+
+
+def downgrade():
+    op.drop_column('testruns', 'max_rss')
+    op.drop_column('testruns', 'system_time')
+    op.drop_column('testruns', 'user_time')
@@ -0,0 +1,60 @@
+"""Resource profiles
+
+Revision ID: 5e8a3c1d9b24
+Revises: 4d2b8e5f1a76
+Create Date: 2026-10-18 12:31:52.108734
+
+"""
+#
+# # SAUCE - System for AUtomated Code Evaluation
+# # Copyright (C) 2013 Moritz Schlarb
+# #
+# # This program is free software: you can redistribute it and/or modify
+# # it under the terms of the GNU Affero General Public License as published by
+# # the Free Software Foundation, either version 3 of the License, or
+# # any later version.
+# #
+# # This program is distributed in the hope that it will be useful,
+# # but WITHOUT ANY WARRANTY; without even the implied warranty of
+# # MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# # GNU Affero General Public License for more details.
+# #
+# # You should have received a copy of the GNU Affero General Public License
+# # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+# revision identifiers, used by Alembic.
+revision = '5e8a3c1d9b24'
+down_revision = '4d2b8e5f1a76'
+
+from alembic import op
+#from alembic.operations import Operations as op
+import sqlalchemy as sa
+
+profile_tables = ('languages', 'assignments', 'tests')
+
+
+def upgrade():
+    op.create_table('resource_profiles',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.Unicode(length=255), nullable=False),
+        sa.Column('memory', sa.Integer(), nullable=True),
+        sa.Column('cpu_time', sa.Integer(), nullable=True),
+        sa.Column('file_size', sa.Integer(), nullable=True),
+        sa.Column('processes', sa.Integer(), nullable=True),
+        sa.Column('cgroup', sa.Unicode(length=255), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    for table in profile_tables:
+        op.add_column(table, sa.Column('resource_profile_id', sa.Integer(), nullable=True))
+        op.create_foreign_key('fk_%s_resource_profile_id' % table, table,
+            'resource_profiles', ['resource_profile_id'], ['id'])
+    op.add_column('testruns', sa.Column('limit_hit', sa.Unicode(length=32), nullable=True))
+
+
+def downgrade():
+    op.drop_column('testruns', 'limit_hit')
+    for table in reversed(profile_tables):
+        op.drop_constraint('fk_%s_resource_profile_id' % table, table, type_='foreignkey')
+        op.drop_column(table, 'resource_profile_id')
+    op.drop_table('resource_profiles')
@@ -0,0 +1,58 @@
+"""Test expected output
+
+Revision ID: 7a3c9e5b2d18
+Revises: 6f1b7d2e4c95
+Create Date: 2026-10-18 13:48:12.651094
+
+"""
+#
+# # SAUCE - System for AUtomated Code Evaluation
+# # Copyright (C) 2013 Moritz Schlarb
+# #
+# # This program is free software: you can redistribute it and/or modify
+# # it under the terms of the GNU Affero General Public License as published by
+# # the Free Software Foundation, either version 3 of the License, or
+# # any later version.
+# #
+# # This program is distributed in the hope that it will be useful,
+# # but WITHOUT ANY WARRANTY; without even the implied warranty of
+# # MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# # GNU Affero General Public License for more details.
+# #
+# # You should have received a copy of the GNU Affero General Public License
+# # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+# revision identifiers, used by Alembic.
+revision = '7a3c9e5b2d18'
+down_revision = '6f1b7d2e4c95'
+
+from hashlib import sha256
+
+from alembic import op
+#from alembic.operations import Operations as op
+import sqlalchemy as sa
+
+tests = sa.sql.table('tests',
+    sa.sql.column('id', sa.Integer()),
+    sa.sql.column('output_data', sa.Unicode()),
+    sa.sql.column('output_hash', sa.String()),
+)
+
+
+def upgrade():
+    op.add_column('tests', sa.Column('output_hash', sa.String(length=64), nullable=True))
+    op.add_column('tests', sa.Column('expected_key', sa.String(length=64), nullable=True))
+    op.add_column('tests', sa.Column('expected_output', sa.Unicode(length=10 * 1024 * 1024), nullable=True))
+
+    conn = op.get_bind()
+    for (test_id, output_data) in conn.execute(sa.select([tests.c.id, tests.c.output_data])).fetchall():
+        if output_data is not None:
+            conn.execute(tests.update().where(tests.c.id == test_id)
+                .values(output_hash=sha256(output_data.encode('utf-8')).hexdigest()))
+
+
+def downgrade():
+    op.drop_column('tests', 'expected_output')
+    op.drop_column('tests', 'expected_key')
+    op.drop_column('tests', 'output_hash')
@@ -0,0 +1,43 @@
+"""Test float tolerances
+
+Revision ID: 8b4d1f6a3e27
+Revises: 7a3c9e5b2d18
+Create Date: 2026-10-18 15:02:37.418230
+
+"""
+#
+# # SAUCE - System for AUtomated Code Evaluation
+# # Copyright (C) 2013 Moritz Schlarb
+# #
+# # This program is free software: you can redistribute it and/or modify
+# # it under the terms of the GNU Affero General Public License as published by
+# # the Free Software Foundation, either version 3 of the License, or
+# # any later version.
+# #
+# # This program is distributed in the hope that it will be useful,
+# # but WITHOUT ANY WARRANTY; without even the implied warranty of
+# # MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# # GNU Affero General Public License for more details.
+# #
+# # You should have received a copy of the GNU Affero General Public License
+# # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+
+# revision identifiers, used by Alembic.
+revision = '8b4d1f6a3e27'
+down_revision = '7a3c9e5b2d18'
+
+from alembic import op
+#from alembic.operations import Operations as op
+import sqlalchemy as sa
+
+
+def upgrade():
+    op.add_column('tests', sa.Column('abs_tolerance', sa.Float(), nullable=True))
+    op.add_column('tests', sa.Column('rel_tolerance', sa.Float(), nullable=True))
+
+
+def downgrade():
+    op.drop_column('tests', 'rel_tolerance')
+    op.drop_column('tests', 'abs_tolerance')
@@ -0,0 +1,45 @@
+"""Staged grading
+
+Revision ID: 9c5e2a7b4f31
+Revises: 8b4d1f6a3e27
+Create Date: 2026-10-18 16:21:05.730912
+
+"""
+#
+# # SAUCE - System for AUtomated Code Evaluation
+# # Copyright (C) 2013 Moritz Schlarb
+# #
+# # This program is free software: you can redistribute it and/or modify
+# # it under the terms of the GNU Affero General Public License as published by
+# # the Free Software Foundation, either version 3 of the License, or
+# # any later version.
+# #
+# # This program is distributed in the hope that it will be useful,
+# # but WITHOUT ANY WARRANTY; without even the implied warranty of
+# # MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# # GNU Affero General Public License for more details.
+# #
+# # You should have received a copy of the GNU Affero General Public License
+# # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+
+# revision identifiers, used by Alembic.
+revision = '9c5e2a7b4f31'
+down_revision = '8b4d1f6a3e27'
+
+from alembic import op
+#from alembic.operations import Operations as op
+import sqlalchemy as sa
+
+
+def upgrade():
+    op.add_column('testruns', sa.Column('skipped', sa.Boolean(), nullable=False,
+        default=False, server_default='False'))
+    op.add_column('grading_jobs', sa.Column('staged', sa.Boolean(), nullable=False,
+        default=False, server_default='False'))
+
+
+def downgrade():
+    op.drop_column('grading_jobs', 'staged')
+    op.drop_column('testruns', 'skipped')
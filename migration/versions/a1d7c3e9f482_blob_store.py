@@ -0,0 +1,135 @@
+"""Blob store
+
+Revision ID: a1d7c3e9f482
+Revises: 9c5e2a7b4f31
+Create Date: 2026-10-18 17:35:44.208116
+
+"""
+#
+# # SAUCE - System for AUtomated Code Evaluation
+# # Copyright (C) 2013 Moritz Schlarb
+# #
+# # This program is free software: you can redistribute it and/or modify
+# # it under the terms of the GNU Affero General Public License as published by
+# # the Free Software Foundation, either version 3 of the License, or
+# # any later version.
+# #
+# # This program is distributed in the hope that it will be useful,
+# # but WITHOUT ANY WARRANTY; without even the implied warranty of
+# # MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# # GNU Affero General Public License for more details.
+# #
+# # You should have received a copy of the GNU Affero General Public License
+# # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+
+# revision identifiers, used by Alembic.
+revision = 'a1d7c3e9f482'
+down_revision = '9c5e2a7b4f31'
+
+import zlib
+from hashlib import sha256
+
+from alembic import op
+#from alembic.operations import Operations as op
+import sqlalchemy as sa
+
+# Table, text column and blob column of all texts that are moved to blobs
+blob_columns = (
+    ('submissions', 'source', 'source_blob'),
+    ('judgements', 'corrected_source', 'corrected_source_blob'),
+    ('testruns', 'output_data', 'output_blob'),
+    ('testruns', 'error_data', 'error_blob'),
+)
+
+blobs = sa.sql.table('blobs',
+    sa.sql.column('hash', sa.String()),
+    sa.sql.column('compression', sa.Unicode()),
+    sa.sql.column('size', sa.Integer()),
+    sa.sql.column('data', sa.LargeBinary()),
+    sa.sql.column('refcount', sa.Integer()),
+)
+
+
+def _table(table, column, blob_column):
+    return sa.sql.table(table,
+        sa.sql.column('id', sa.Integer()),
+        sa.sql.column(column, sa.Unicode()),
+        sa.sql.column(blob_column, sa.String()),
+    )
+
+
+def _pack(text):
+    data = text.encode('utf-8')
+    packed = zlib.compress(data)
+    if len(data) < 256 or len(packed) >= len(data):
+        return dict(compression=None, size=len(data), data=data)
+    return dict(compression=u'zlib', size=len(data), data=packed)
+
+
+def _unpack(compression, data):
+    data = bytes(data)
+    if compression == 'zlib':
+        data = zlib.decompress(data)
+    elif compression == 'lzma':
+        try:
+            import lzma
+        except ImportError:
+            from backports import lzma
+        data = lzma.decompress(data)
+    return data.decode('utf-8')
+
+
+def upgrade():
+    op.create_table('blobs',
+        sa.Column('hash', sa.String(length=64), nullable=False),
+        sa.Column('compression', sa.Unicode(length=8), nullable=True),
+        sa.Column('size', sa.Integer(), nullable=False),
+        sa.Column('data', sa.LargeBinary(), nullable=False),
+        sa.Column('refcount', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('hash')
+    )
+    for (table, column, blob_column) in blob_columns:
+        op.add_column(table, sa.Column(blob_column, sa.String(length=64), nullable=True))
+        op.create_foreign_key('fk_%s_%s' % (table, blob_column), table,
+            'blobs', [blob_column], ['hash'])
+
+    conn = op.get_bind()
+    refcounts = {}
+    for (table, column, blob_column) in blob_columns:
+        t = _table(table, column, blob_column)
+        ids = [row[0] for row in conn.execute(sa.select([t.c.id]).where(t.c[column].isnot(None)))]
+        # One row at a time, the texts can be large
+        for row_id in ids:
+            text = conn.execute(sa.select([t.c[column]]).where(t.c.id == row_id)).scalar()
+            h = sha256(text.encode('utf-8')).hexdigest()
+            if h not in refcounts:
+                refcounts[h] = 0
+                conn.execute(blobs.insert().values(hash=h, refcount=0, **_pack(text)))
+            refcounts[h] += 1
+            conn.execute(t.update().where(t.c.id == row_id).values({blob_column: h}))
+    for (h, refcount) in refcounts.iteritems():
+        conn.execute(blobs.update().where(blobs.c.hash == h).values(refcount=refcount))
+
+    for (table, column, blob_column) in blob_columns:
+        op.drop_column(table, column)
+
+
+def downgrade():
+    for (table, column, blob_column) in blob_columns:
+        op.add_column(table, sa.Column(column, sa.Unicode(length=10 * 1024 * 1024), nullable=True))
+
+    conn = op.get_bind()
+    for (table, column, blob_column) in blob_columns:
+        t = _table(table, column, blob_column)
+        rows = conn.execute(sa.select([t.c.id, t.c[blob_column]]).where(t.c[blob_column].isnot(None))).fetchall()
+        for (row_id, h) in rows:
+            (compression, data) = conn.execute(sa.select([blobs.c.compression, blobs.c.data])
+                .where(blobs.c.hash == h)).first()
+            conn.execute(t.update().where(t.c.id == row_id).values({column: _unpack(compression, data)}))
+
+    for (table, column, blob_column) in reversed(blob_columns):
+        op.drop_constraint('fk_%s_%s' % (table, blob_column), table, type_='foreignkey')
+        op.drop_column(table, blob_column)
+    op.drop_table('blobs')
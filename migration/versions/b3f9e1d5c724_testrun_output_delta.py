@@ -0,0 +1,132 @@
+"""Testrun output as marker or delta
+
+Revision ID: b3f9e1d5c724
+Revises: a1d7c3e9f482
+Create Date: 2026-10-18 19:12:05.531872
+
+"""
+#
+# # SAUCE - System for AUtomated Code Evaluation
+# # Copyright (C) 2013 Moritz Schlarb
+# #
+# # This program is free software: you can redistribute it and/or modify
+# # it under the terms of the GNU Affero General Public License as published by
+# # the Free Software Foundation, either version 3 of the License, or
+# # any later version.
+# #
+# # This program is distributed in the hope that it will be useful,
+# # but WITHOUT ANY WARRANTY; without even the implied warranty of
+# # MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# # GNU Affero General Public License for more details.
+# #
+# # You should have received a copy of the GNU Affero General Public License
+# # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3f9e1d5c724'
+down_revision = 'a1d7c3e9f482'
+
+import zlib
+from hashlib import sha256
+
+from alembic import op
+#from alembic.operations import Operations as op
+import sqlalchemy as sa
+
+testruns = sa.sql.table('testruns',
+    sa.sql.column('id', sa.Integer()),
+    sa.sql.column('test_id', sa.Integer()),
+    sa.sql.column('output_blob', sa.String()),
+    sa.sql.column('output_mode', sa.Unicode()),
+    sa.sql.column('expected_blob', sa.String()),
+)
+
+tests = sa.sql.table('tests',
+    sa.sql.column('id', sa.Integer()),
+    sa.sql.column('output_hash', sa.String()),
+)
+
+blobs = sa.sql.table('blobs',
+    sa.sql.column('hash', sa.String()),
+    sa.sql.column('compression', sa.Unicode()),
+    sa.sql.column('size', sa.Integer()),
+    sa.sql.column('data', sa.LargeBinary()),
+    sa.sql.column('refcount', sa.Integer()),
+)
+
+
+def _pack(text):
+    data = text.encode('utf-8')
+    packed = zlib.compress(data)
+    if len(data) < 256 or len(packed) >= len(data):
+        return dict(compression=None, size=len(data), data=data)
+    return dict(compression=u'zlib', size=len(data), data=packed)
+
+
+def _unpack(compression, data):
+    data = bytes(data)
+    if compression == 'zlib':
+        data = zlib.decompress(data)
+    elif compression == 'lzma':
+        try:
+            import lzma
+        except ImportError:
+            from backports import lzma
+        data = lzma.decompress(data)
+    return data.decode('utf-8')
+
+
+def _load(conn, h):
+    (compression, data) = conn.execute(sa.select([blobs.c.compression, blobs.c.data])
+        .where(blobs.c.hash == h)).first()
+    return _unpack(compression, data)
+
+
+def _patch(base, d):
+    header, _, middle = d.partition(u'\n')
+    prefix, suffix = map(int, header.split())
+    return base[:prefix] + middle + base[len(base) - suffix:]
+
+
+def upgrade():
+    op.add_column('testruns', sa.Column('output_mode', sa.Unicode(length=8), nullable=True))
+    op.add_column('testruns', sa.Column('expected_blob', sa.String(length=64), nullable=True))
+    op.create_foreign_key('fk_testruns_expected_blob', 'testruns',
+        'blobs', ['expected_blob'], ['hash'])
+
+    # Output that is identical to the expected output is only marked,
+    # the reference to the blob just moves to expected_blob
+    conn = op.get_bind()
+    expected = (sa.select([tests.c.output_hash]).where(tests.c.id == testruns.c.test_id)
+        .as_scalar())
+    conn.execute(testruns.update().where(testruns.c.output_blob == expected)
+        .values(output_mode=u'same', expected_blob=testruns.c.output_blob, output_blob=None))
+
+
+def downgrade():
+    conn = op.get_bind()
+    conn.execute(testruns.update().where(testruns.c.output_mode == u'same')
+        .values(output_mode=None, output_blob=testruns.c.expected_blob, expected_blob=None))
+
+    rows = conn.execute(sa.select([testruns.c.id, testruns.c.output_blob, testruns.c.expected_blob])
+        .where(testruns.c.output_mode == u'delta')).fetchall()
+    for (row_id, delta_hash, expected_hash) in rows:
+        text = _patch(_load(conn, expected_hash), _load(conn, delta_hash))
+        h = sha256(text.encode('utf-8')).hexdigest()
+        if conn.execute(sa.select([blobs.c.hash]).where(blobs.c.hash == h)).first():
+            conn.execute(blobs.update().where(blobs.c.hash == h)
+                .values(refcount=blobs.c.refcount + 1))
+        else:
+            conn.execute(blobs.insert().values(hash=h, refcount=1, **_pack(text)))
+        conn.execute(testruns.update().where(testruns.c.id == row_id)
+            .values(output_mode=None, output_blob=h, expected_blob=None))
+        for old in (delta_hash, expected_hash):
+            conn.execute(blobs.update().where(blobs.c.hash == old)
+                .values(refcount=blobs.c.refcount - 1))
+            conn.execute(blobs.delete().where(blobs.c.hash == old).where(blobs.c.refcount <= 0))
+
+    op.drop_constraint('fk_testruns_expected_blob', 'testruns', type_='foreignkey')
+    op.drop_column('testruns', 'expected_blob')
+    op.drop_column('testruns', 'output_mode')
@@ -0,0 +1,81 @@
+"""Submission summary
+
+Revision ID: c4a0f2e6d835
+Revises: b3f9e1d5c724
+Create Date: 2026-10-18 21:03:47.126530
+
+"""
+#
+# # SAUCE - System for AUtomated Code Evaluation
+# # Copyright (C) 2013 Moritz Schlarb
+# #
+# # This program is free software: you can redistribute it and/or modify
+# # it under the terms of the GNU Affero General Public License as published by
+# # the Free Software Foundation, either version 3 of the License, or
+# # any later version.
+# #
+# # This program is distributed in the hope that it will be useful,
+# # but WITHOUT ANY WARRANTY; without even the implied warranty of
+# # MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# # GNU Affero General Public License for more details.
+# #
+# # You should have received a copy of the GNU Affero General Public License
+# # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4a0f2e6d835'
+down_revision = 'b3f9e1d5c724'
+
+
+from alembic import op
+#from alembic.operations import Operations as op
+import sqlalchemy as sa
+
+submissions = sa.sql.table('submissions',
+    sa.sql.column('id', sa.Integer()),
+    sa.sql.column('result', sa.Boolean()),
+    sa.sql.column('passed', sa.Integer()),
+    sa.sql.column('failed', sa.Integer()),
+    sa.sql.column('total', sa.Integer()),
+    sa.sql.column('runtime', sa.Float()),
+    sa.sql.column('testrun_date', sa.DateTime()),
+)
+
+testruns = sa.sql.table('testruns',
+    sa.sql.column('submission_id', sa.Integer()),
+    sa.sql.column('id', sa.Integer()),
+    sa.sql.column('date', sa.DateTime()),
+    sa.sql.column('runtime', sa.Float()),
+    sa.sql.column('result', sa.Boolean()),
+    sa.sql.column('skipped', sa.Boolean()),
+)
+
+
+def upgrade():
+    op.add_column('submissions', sa.Column('result', sa.Boolean(), nullable=True))
+    op.add_column('submissions', sa.Column('passed', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('submissions', sa.Column('failed', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('submissions', sa.Column('total', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('submissions', sa.Column('runtime', sa.Float(), nullable=False, server_default='0'))
+    op.add_column('submissions', sa.Column('testrun_date', sa.DateTime(), nullable=True))
+
+    # Same as Submission.update_summaries, see also sauce-backfill
+    def aggregate(expr):
+        return sa.select([expr]).where(testruns.c.submission_id == submissions.c.id).as_scalar()
+
+    total = aggregate(sa.func.count(testruns.c.id))
+    passed = aggregate(sa.func.coalesce(sa.func.sum(sa.case([(testruns.c.result, 1)], else_=0)), 0))
+    op.get_bind().execute(submissions.update().values(
+        total=total, passed=passed,
+        failed=aggregate(sa.func.coalesce(sa.func.sum(
+            sa.case([(sa.and_(~testruns.c.result, ~testruns.c.skipped), 1)], else_=0)), 0)),
+        result=sa.case([(total == 0, None), (passed == total, True)], else_=False),
+        runtime=aggregate(sa.func.coalesce(sa.func.sum(testruns.c.runtime), 0.0)),
+        testrun_date=aggregate(sa.func.max(testruns.c.date))))
+
+
+def downgrade():
+    for column in ('testrun_date', 'runtime', 'total', 'failed', 'passed', 'result'):
+        op.drop_column('submissions', column)
@@ -0,0 +1,52 @@
+"""Testrun archives
+
+Revision ID: d5b1a3f7e946
+Revises: c4a0f2e6d835
+Create Date: 2026-10-18 22:41:19.804215
+
+"""
+#
+# # SAUCE - System for AUtomated Code Evaluation
+# # Copyright (C) 2013 Moritz Schlarb
+# #
+# # This program is free software: you can redistribute it and/or modify
+# # it under the terms of the GNU Affero General Public License as published by
+# # the Free Software Foundation, either version 3 of the License, or
+# # any later version.
+# #
+# # This program is distributed in the hope that it will be useful,
+# # but WITHOUT ANY WARRANTY; without even the implied warranty of
+# # MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# # GNU Affero General Public License for more details.
+# #
+# # You should have received a copy of the GNU Affero General Public License
+# # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+
+# revision identifiers, used by Alembic.
+revision = 'd5b1a3f7e946'
+down_revision = 'c4a0f2e6d835'
+
+
+from alembic import op
+#from alembic.operations import Operations as op
+import sqlalchemy as sa
+
+
+def upgrade():
+    op.create_table('testrun_archives',
+        sa.Column('submission_id', sa.Integer(), nullable=False),
+        sa.Column('archived', sa.DateTime(), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.Column('compression', sa.Unicode(length=8), nullable=True),
+        sa.Column('size', sa.Integer(), nullable=False),
+        sa.Column('data', sa.LargeBinary(), nullable=False),
+        sa.ForeignKeyConstraint(['submission_id'], ['submissions.id'], ),
+        sa.PrimaryKeyConstraint('submission_id')
+    )
+
+
+def downgrade():
+    # The archived testruns are lost, the tests have to be run again
+    op.drop_table('testrun_archives')
@@ -0,0 +1,98 @@
+"""Event membership closure
+
+Revision ID: e6c2b4a8f157
+Revises: d5b1a3f7e946
+Create Date: 2026-10-18 23:52:07.316840
+
+"""
+#
+# # SAUCE - System for AUtomated Code Evaluation
+# # Copyright (C) 2013 Moritz Schlarb
+# #
+# # This program is free software: you can redistribute it and/or modify
+# # it under the terms of the GNU Affero General Public License as published by
+# # the Free Software Foundation, either version 3 of the License, or
+# # any later version.
+# #
+# # This program is distributed in the hope that it will be useful,
+# # but WITHOUT ANY WARRANTY; without even the implied warranty of
+# # MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# # GNU Affero General Public License for more details.
+# #
+# # You should have received a copy of the GNU Affero General Public License
+# # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+
+# revision identifiers, used by Alembic.
+revision = 'e6c2b4a8f157'
+down_revision = 'd5b1a3f7e946'
+
+
+from alembic import op
+#from alembic.operations import Operations as op
+import sqlalchemy as sa
+
+
+event_membership = sa.sql.table('event_membership',
+    sa.sql.column('event_id', sa.Integer), sa.sql.column('lesson_id', sa.Integer),
+    sa.sql.column('team_id', sa.Integer), sa.sql.column('user_id', sa.Integer),
+    sa.sql.column('role', sa.Unicode))
+event_teachers = sa.sql.table('event_teachers',
+    sa.sql.column('event_id', sa.Integer), sa.sql.column('user_id', sa.Integer))
+event_members = sa.sql.table('event_members',
+    sa.sql.column('event_id', sa.Integer), sa.sql.column('user_id', sa.Integer))
+lesson_tutors = sa.sql.table('lesson_tutors',
+    sa.sql.column('lesson_id', sa.Integer), sa.sql.column('user_id', sa.Integer))
+lesson_members = sa.sql.table('lesson_members',
+    sa.sql.column('lesson_id', sa.Integer), sa.sql.column('user_id', sa.Integer))
+team_members = sa.sql.table('team_members',
+    sa.sql.column('team_id', sa.Integer), sa.sql.column('user_id', sa.Integer))
+lessons = sa.sql.table('lessons',
+    sa.sql.column('id', sa.Integer), sa.sql.column('event_id', sa.Integer))
+teams = sa.sql.table('teams',
+    sa.sql.column('id', sa.Integer), sa.sql.column('lesson_id', sa.Integer))
+
+
+def upgrade():
+    op.create_table('event_membership',
+        sa.Column('event_id', sa.Integer(), nullable=False),
+        sa.Column('lesson_id', sa.Integer(), nullable=True),
+        sa.Column('team_id', sa.Integer(), nullable=True),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('role', sa.Unicode(length=8), nullable=False),
+        sa.ForeignKeyConstraint(['event_id'], ['events.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['lesson_id'], ['lessons.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['team_id'], ['teams.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    )
+    op.create_index('ix_event_membership_event_id', 'event_membership', ['event_id', 'role', 'user_id'])
+    op.create_index('ix_event_membership_lesson_id', 'event_membership', ['lesson_id', 'role', 'user_id'])
+    op.create_index('ix_event_membership_team_id', 'event_membership', ['team_id', 'user_id'])
+    op.create_index('ix_event_membership_user_id', 'event_membership', ['user_id'])
+
+    # Fill it from the association tables
+    columns = ['event_id', 'lesson_id', 'team_id', 'user_id', 'role']
+    no_lesson, no_team = sa.null().label('lesson_id'), sa.null().label('team_id')
+    for select in (
+        sa.select([event_teachers.c.event_id, no_lesson, no_team, event_teachers.c.user_id,
+            sa.literal(u'teacher')]),
+        sa.select([lessons.c.event_id, lessons.c.id, no_team, lesson_tutors.c.user_id,
+            sa.literal(u'tutor')]).where(lesson_tutors.c.lesson_id == lessons.c.id),
+        sa.select([event_members.c.event_id, no_lesson, no_team, event_members.c.user_id,
+            sa.literal(u'member')]),
+        sa.select([lessons.c.event_id, lessons.c.id, no_team, lesson_members.c.user_id,
+            sa.literal(u'member')]).where(lesson_members.c.lesson_id == lessons.c.id),
+        sa.select([lessons.c.event_id, lessons.c.id, teams.c.id, team_members.c.user_id,
+            sa.literal(u'member')]).where(team_members.c.team_id == teams.c.id)
+            .where(teams.c.lesson_id == lessons.c.id),
+    ):
+        op.execute(event_membership.insert().from_select(columns, select))
+
+
+def downgrade():
+    op.drop_index('ix_event_membership_user_id', 'event_membership')
+    op.drop_index('ix_event_membership_team_id', 'event_membership')
+    op.drop_index('ix_event_membership_lesson_id', 'event_membership')
+    op.drop_index('ix_event_membership_event_id', 'event_membership')
+    op.drop_table('event_membership')
@@ -0,0 +1,42 @@
+"""Index for paging through submissions
+
+Revision ID: f7d3c5b9a268
+Revises: e6c2b4a8f157
+Create Date: 2026-10-18 16:21:44.102583
+
+"""
+#
+# # SAUCE - System for AUtomated Code Evaluation
+# # Copyright (C) 2013 Moritz Schlarb
+# #
+# # This program is free software: you can redistribute it and/or modify
+# # it under the terms of the GNU Affero General Public License as published by
+# # the Free Software Foundation, either version 3 of the License, or
+# # any later version.
+# #
+# # This program is distributed in the hope that it will be useful,
+# # but WITHOUT ANY WARRANTY; without even the implied warranty of
+# # MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# # GNU Affero General Public License for more details.
+# #
+# # You should have received a copy of the GNU Affero General Public License
+# # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+
+# revision identifiers, used by Alembic.
+revision = 'f7d3c5b9a268'
+down_revision = 'e6c2b4a8f157'
+
+
+from alembic import op
+#from alembic.operations import Operations as op
+import sqlalchemy as sa
+
+
+def upgrade():
+    op.create_index('idx_submission_assignment_modified', 'submissions', ['assignment_id', 'modified', 'id'])
+
+
+def downgrade():
+    op.drop_index('idx_submission_assignment_modified', 'submissions')
@@ -212,6 +212,7 @@ class AssignmentsCrudController(FilterCrudRestController):
             'submission_scaffold_show',
             'submission_scaffold_head', 'submission_scaffold_foot',
             '_lti',
+            'resource_profile_id', 'resource_profile',
         ],
         '__field_order__': [
             'sheet_id', 'sheet', 'assignment_id', 'name',
@@ -264,7 +265,7 @@ class AssignmentsCrudController(FilterCrudRestController):
         '__field_order__': [
             'id', 'sheet', 'assignment_id', 'name', 'description',
             'public', '_start_time', '_end_time',
-            'timeout', 'allowed_languages', 'show_compiler_msg',
+            'timeout', 'resource_profile', 'allowed_languages', 'show_compiler_msg',
             'submission_note',
             'submission_filename', 'submission_template',
             'submission_scaffold_show',
@@ -292,6 +293,10 @@ class AssignmentsCrudController(FilterCrudRestController):
             'timeout': {
                 'help_text': u'Default timeout value for test cases, leave empty for no time limit',
             },
+            'resource_profile': {
+                'help_text': u'Default resource limits for compiling and testing, '
+                    'unset limits are inherited from the language',
+            },
             'show_compiler_msg': {
                 'help_text': u'Show error messages or warnings from the compiler run',
             },
@@ -13,6 +13,7 @@ import status
 from sprox.fillerbase import TableFiller, AddFormFiller, EditFormFiller
 
 from sauce.controllers.crc.provider import FilterSAORMSelector
+from sauce.model.blob import BlobText
 
 
 class MyTableFiller(TableFiller):
@@ -46,6 +47,10 @@ class MyEditFormFiller(EditFormFiller):
         if not obj:
             raise abort(status.HTTP_404_NOT_FOUND)
         values = self.__provider__.dictify(obj, self.__fields__, self.__omit_fields__)
+        # Texts that are stored as blobs are no columns, so sprox does not know them
+        for key in dir(self.__entity__):
+            if isinstance(getattr(self.__entity__, key, None), BlobText):
+                values[key] = getattr(obj, key)
         for key in self.__fields__:
             method = getattr(self, key, None)
             if method:
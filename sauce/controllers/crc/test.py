@@ -30,7 +30,7 @@ Due to the many options on Test entities, this controllers looks like a mess.
 from tg import lurl, flash
 
 from sauce.controllers.crc.base import FilterCrudRestController
-from sauce.model import Test
+from sauce.model import Test, GradingJob
 
 import tw2.bootstrap.forms as twb
 import tw2.jqplugins.chosen.widgets as twjc
@@ -45,6 +45,11 @@ __all__ = ['TestsCrudController']
 
 
 def run_tests(submissions):
+    if GradingJob.queue_enabled():
+        for submission in submissions:
+            GradingJob.enqueue(submission)
+        flash('%d Submission(s) queued for testing' % len(submissions), 'info')
+        return True
     r, s, f = 0, 0, 0
     for submission in submissions:
         _, _, rr = submission.run_tests()
@@ -68,15 +73,17 @@ class TestsCrudController(FilterCrudRestController):
             'assignment_id',
             'argv',
             '_visible',
-            'input_data', 'output_data',
             'input_filename', 'output_filename',
             'ignore_case', 'ignore_returncode', 'show_partial_match',
             'splitlines', 'split', 'comment_prefix',
             'separator',
             'strip_parse_errors',
             'parse_int', 'parse_float', 'float_precision',
+            'abs_tolerance', 'rel_tolerance',
             'sort',
             'user_id', 'user', 'testruns',
+            'resource_profile_id', 'resource_profile',
+            'input_hash', 'output_hash', 'expected_key', 'expected_output',
         ],
         '__field_order__': [
             'id', 'assignment',
@@ -91,14 +98,20 @@ class TestsCrudController(FilterCrudRestController):
             literal(u'''<a href="%d/test" class="btn btn-mini btn-inverse" title="Re-run all tests for this assignment"
                 onclick="show_processing_modal('Testing %d Submission(s) in %d Test(s)...'); return true;">
                 <i class="icon-repeat icon-white"></i>
-            </a>&nbsp;''' % (obj.id, len(obj.assignment.submissions), len(obj.assignment.submissions) * len(obj.assignment.tests))) +
-            link_to(obj.assignment.name, '../assignments/%d/edit' % obj.assignment.id, title='assignment_id=%d' % (obj.assignment_id)),
+            </a>&nbsp;''' % (obj.id, len(obj.assignment.submissions),
+                len(obj.assignment.submissions) * len(obj.assignment.tests))) +
+            link_to(obj.assignment.name, '../assignments/%d/edit' % obj.assignment.id,
+                title='assignment_id=%d' % (obj.assignment_id)),
         '__base_widget_args__': {'sortList': [[1, 0], [2, 0], [3, 0]]},
     }
     __form_options__ = {
-        '__omit_fields__': ['id', 'testruns', '_visible'],
+        '__omit_fields__': ['id', 'testruns', '_visible',
+            'input_hash', 'output_hash', 'expected_key', 'expected_output'],
         '__hide_fields__': ['user'],
         '__add_fields__': {
+            # Stored as blobs, so they are no columns for sprox
+            'input_data': SmallSourceEditor('input_data', label=u'Input Data'),
+            'output_data': SmallSourceEditor('output_data', label=u'Output Data'),
             'docs': twb.Label('docs', text='Please read the <a href="%s">' % lurl('/docs/tests') +
                 'Test configuration documentation</a>!', css_class='bold', escape=False),
             'ignore_opts': twb.Label('ignore_opts', text='Output ignore options', css_class='label'),
@@ -111,7 +124,7 @@ class TestsCrudController(FilterCrudRestController):
             'input_data', 'output_data',
             'input_type', 'output_type',
             'input_filename', 'output_filename',
-            '_timeout', 'argv',
+            '_timeout', 'resource_profile', 'argv',
             'ignore_opts',
             'ignore_case', 'comment_prefix', 'ignore_returncode', 'show_partial_match',
             'split_opts',
@@ -119,6 +132,7 @@ class TestsCrudController(FilterCrudRestController):
             'parse_opts',
             'strip_parse_errors',
             'parse_int', 'parse_float', 'float_precision',
+            'abs_tolerance', 'rel_tolerance',
         ],
         '__field_widget_types__': {
             # 'name': twb.TextField,
@@ -130,8 +144,6 @@ class TestsCrudController(FilterCrudRestController):
             'visibility': twb.RadioButtonTable,
             # 'input_data': FileField,
             # 'output_data': FileField,
-            'input_data': SmallSourceEditor,
-            'output_data': SmallSourceEditor,
         },
         '__field_widget_args__': {
             'argv': {
@@ -160,6 +172,9 @@ Possible variables are:
             '_timeout': {
                 'help_text': u'Timeout value, leave empty to inherit from the parent assignment',
             },
+            'resource_profile': {
+                'help_text': u'Resource limits, unset limits are inherited from the assignment and language',
+            },
             'input_type': {
                 'prompt_text': None,
                 'options': [('stdin', 'stdin'), ('file', 'file')],
@@ -196,7 +211,8 @@ Possible variables are:
                 'default': False,
             },
             'split': {
-                'help_text': u'Call .split() on full output of output before comparison or on each line from .splitlines() if splitlines is set',
+                'help_text': u'Call .split() on full output of output before comparison '
+                    u'or on each line from .splitlines() if splitlines is set',
             },
             'strip_parse_errors': {
                 'help_text': u'Strip (True) or leave (False) unparsed fragments',
@@ -212,11 +228,18 @@ Possible variables are:
             'float_precision': {
                 'help_text': u'''The precision (number of decimal digits) to compare for floats''',
             },
+            'abs_tolerance': {
+                'help_text': u'''Absolute tolerance for comparing floats numerically (needs parse_float)''',
+            },
+            'rel_tolerance': {
+                'help_text': u'''Relative tolerance for comparing floats numerically (needs parse_float)''',
+            },
             'parallel_sort': {
                 'help_text': u'''If set, output will be sorted with the help of the thread ID inside of '[]' ''',
             },
             'sort': {
-                'help_text': u'''Sort output and test data before comparison. Parsing is performed first, if enabled.''',
+                'help_text': u'''Sort output and test data before comparison. '''
+                    u'''Parsing is performed first, if enabled.''',
                 'default': False,
             },
         },
@@ -28,15 +28,17 @@ except ImportError:  # pragma: no cover
     from ordereddict import OrderedDict
 
 # turbogears imports
-from tg import expose, abort, tmpl_context as c, flash, TGController
+from tg import expose, abort, tmpl_context as c, flash, TGController, config, request, url
 #from tg import redirect, validate, flash
 
 # third party imports
 #from tg.i18n import ugettext as _
 import status
+from paste.deploy.converters import asint
 from repoze.what.predicates import Any, has_permission
 from sqlalchemy import union
 from sqlalchemy.orm.exc import NoResultFound, MultipleResultsFound
+from webhelpers.html import escape
 
 # project specific imports
 from sauce.lib.authz import user_is_in
@@ -97,8 +99,12 @@ class SubmissionsController(TGController):
         elif self.event:
             c.sub_menu = menu(self.event)
 
-    @expose('sauce.templates.submissions')
-    def _default(self, *args, **kwargs):
+    def _filters(self, args):
+        '''Parse the filters from the path arguments
+
+        Returns the filters, the filters by assignment and user ids and
+        the filters that are passed to the table filler.
+        '''
         # TODO: This filtering really needs to be rewritten!
         filters = dict(zip(args[::2], args[1::2]))
         real_filters = dict(assignment_id=set(), user_id=set())
@@ -174,10 +180,68 @@ class SubmissionsController(TGController):
                 else:
                     definite_filters[k] = v
 
+        return filters, real_filters, definite_filters
+
+    def _values(self, definite_filters, after=None):
+        '''Get the rows of one page of submissions
+
+        The page size is set by submissions.page_size, 0 shows all
+        submissions at once.
+        '''
+        kw = dict(filters=definite_filters)
+        page_size = asint(config.get('submissions.page_size', 100))
+        if page_size:
+            kw.update(limit=page_size, after=after)
+        try:
+            return self.table_filler.get_value(**kw)
+        except ValueError:
+            abort(status.HTTP_400_BAD_REQUEST, 'Invalid cursor: %s' % after)
+
+    @expose('sauce.templates.submissions')
+    def _default(self, *args, **kwargs):
+        filters, real_filters, definite_filters = self._filters(args)
+
         c.table = self.table
-        values = self.table_filler.get_value(filters=definite_filters)
+        values = self._values(definite_filters, kwargs.get('after', None))
+
+        path = request.path_info.rstrip('/')
+        if args:
+            path = path[:-len('/'.join(args))].rstrip('/')
+        rows_url = url('/'.join([path, 'rows'] + list(args)))
+
+        # The table could only sort the rows that have been loaded so far
+        # and nothing would tell that they are not all, so it is only
+        # sortable if there are no more rows
+        table_args = {}
+        if self.table_filler.next_cursor:
+            table_args = dict(sortList=[],
+                headers=dict((i, {'sorter': False}) for i in range(len(self.table.__fields__))))
+
         return dict(page='event', view=None, values=values,
-            filters=filters, real_filters=real_filters, definite_filters=definite_filters)
+            filters=filters, real_filters=real_filters, definite_filters=definite_filters,
+            count=self.table_filler.__count__, next_cursor=self.table_filler.next_cursor,
+            rows_url=rows_url, table_args=table_args)
+
+    @expose('json')
+    def rows(self, *args, **kwargs):
+        '''The next page of submissions for the table
+
+        Returns the rows as lists of the rendered cells in the order of
+        the table columns and the cursor for the page after them.
+        The cells are escaped like in the datagrid, except for the
+        actions and the xml fields, which are already HTML.
+        '''
+        _, _, definite_filters = self._filters(args)
+        values = self._values(definite_filters, kwargs.get('after', None))
+        fields = self.table.__fields__
+        xml_fields = set(self.table.__xml_fields__) | set(('__actions__', ))
+
+        def cell(row, field):
+            value = row[field] if row[field] is not None else u''
+            return unicode(value) if field in xml_fields else unicode(escape(value))
+
+        return dict(count=self.table_filler.__count__, next=self.table_filler.next_cursor,
+            rows=[[cell(row, f) for f in fields] for row in values])
 
 
 class LessonController(CrudIndexController):
@@ -230,7 +294,8 @@ class LessonController(CrudIndexController):
                 #'members': lambda qry: qry.filter(User.id.in_((u.id for u in self.lesson.event.members))),
                 'members': lambda qry: qry.select_entity_from(union(
                         qry.join(lesson_members).join(Lesson).filter_by(event_id=self.lesson.event.id).order_by(None),
-                        qry.join(team_members).join(Team).join(Team.lesson).filter_by(event_id=self.lesson.event.id).order_by(None),
+                        qry.join(team_members).join(Team).join(Team.lesson)
+                            .filter_by(event_id=self.lesson.event.id).order_by(None),
                     )).order_by(User.id),
                 'lesson': lambda qry: qry.filter_by(id=self.lesson.id),
             },
@@ -45,7 +45,7 @@ from BeautifulSoup import BeautifulSoup
 
 # project specific imports
 from sauce.lib.base import BaseController
-from sauce.model import DBSession, User, Assignment, Sheet, Event, Submission
+from sauce.model import DBSession, User, Assignment, Sheet, Event, Submission, GradingJob
 from sauce.widgets.submission import SubmissionForm
 
 
@@ -216,9 +216,42 @@ class LTIAssignmentController(BaseController):  # pragma: no cover
 #             redirect(self.submission.url + '/result')
             pass
 
-        (compilation, testruns, result) = self.submission.run_tests()
+        if GradingJob.queue_enabled():
+            GradingJob.enqueue(self.submission, staged=True)
+            redirect('./result')
 
-        testruns = sorted(set(self.submission.testruns), key=lambda s: s.date)
+        (compilation, testruns, result) = self.submission.run_tests(staged=True)
+
+        return self._result(compilation)
+
+    @expose('sauce.templates.ltiresult')
+    def result(self, *args, **kwargs):
+        self._get_session_data()
+
+        job = self.submission.grading_job
+        if not job:
+            redirect('./edit')
+        if job.is_pending:
+            return dict(assignment=self.assignment, submission=self.submission, user=self.user,
+                compilation=None, testruns=[], result=None, score=None, pending=True)
+
+        # Only report the outcome of each job once to the tool consumer
+        send = session.get('lti_job') != job.id
+        if send:
+            session['lti_job'] = job.id
+            session.save()
+        return self._result(job.compilation, send=send)
+
+    @expose('json')
+    def status(self, *args, **kwargs):
+        self._get_session_data()
+        job = self.submission.grading_job
+        return dict(state=job.state if job else None,
+            pending=job.is_pending if job else False)
+
+    def _result(self, compilation, send=True):
+        testruns = sorted(set(self.submission.testruns or self.submission.archived_testruns),
+            key=lambda s: (s.date, s.id))
         result = self.submission.result
 
         if result is True:
@@ -228,11 +261,13 @@ class LTIAssignmentController(BaseController):  # pragma: no cover
                 score = (float(len([t for t in testruns if t.result])) / float(len(testruns)))
             else:
                 score = 0.0
-        send = self._send_result(score, str(result))
-        log.info(send)
+        if send:
+            send = self._send_result(score, str(result))
+            log.info(send)
 
         return dict(assignment=self.assignment, submission=self.submission, user=self.user,
-            compilation=compilation, testruns=testruns, result=result, score=score)
+            compilation=compilation, testruns=testruns, result=result, score=score,
+            pending=False)
 
 
 class LTIController(BaseController):  # pragma: no cover
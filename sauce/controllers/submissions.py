@@ -48,7 +48,7 @@ from tw2.pygmentize import Pygmentize  # For full-screen source view
 from sauce.lib.base import post
 from sauce.lib.menu import menu
 from sauce.lib.authz import user_is, user_is_in, is_public
-from sauce.model import DBSession, Submission, Judgement
+from sauce.model import DBSession, Submission, Judgement, GradingJob
 from sauce.widgets import SubmissionForm, JudgementForm, SubmissionTable, SubmissionTableFiller, SourceDisplay
 
 log = logging.getLogger(__name__)
@@ -322,21 +322,57 @@ class SubmissionController(TGController):
     @expose('sauce.templates.submission_result')
     def result(self, force_test=False, *args, **kwargs):
         compilation = None
+        pending = False
 
         #TODO: This totally misses new or changed tests
         # Prepare for laziness!
         # If force_test is set or no tests have been run so far
         # or if any testrun is outdated
-        if (force_test or not self.submission.testruns or
-                self.submission.testrun_date < self.submission.modified):
+        outdated = (not self.submission.testrun_date or
+            self.submission.testrun_date < self.submission.modified)
+        # Staged runs are completed when the assignment is over
+        outdated = outdated or (not self.assignment.is_active and
+            self.submission.skipped > 0)
+        # Teachers always get a full run
+        staged = not request.allowance(self.submission)
+
+        if GradingJob.queue_enabled():
+            job = self.submission.grading_job
+            # The staged job does not complete the skipped tests by itself
+            complete = (job and job.staged and not job.is_pending and
+                not self.assignment.is_active and self.submission.skipped > 0)
+            if force_test or complete or (outdated and
+                    (not job or job.created < self.submission.modified)):
+                job = GradingJob.enqueue(self.submission, staged=staged and not complete)
+                if force_test:
+                    # Don't enqueue again when the page gets reloaded
+                    redirect(self.submission.url + '/result')
+            if job:
+                pending = job.is_pending
+                compilation = job.compilation
+                if job.state == 'failed':
+                    flash('Running the tests for this submission failed, '
+                        'please try again later.', 'error')
+        elif force_test or outdated:
             # re-run tests
-            (compilation, testruns, result) = self.submission.run_tests()
+            (compilation, testruns, result) = self.submission.run_tests(staged=staged)
 
-        testruns = sorted(set(self.submission.testruns), key=lambda s: s.date)
+        testruns = sorted(set(self.submission.testruns or self.submission.archived_testruns),
+            key=lambda s: (s.date, s.id))
         result = self.submission.result
 
         return dict(page=['submissions', 'result'], submission=self.submission,
-            compilation=compilation, testruns=testruns, result=result)
+            compilation=compilation, testruns=testruns, result=result,
+            pending=pending)
+
+    @expose('json')
+    def status(self, *args, **kwargs):
+        '''Current state of the grading job for this submission'''
+        job = self.submission.grading_job
+        return dict(submission_id=self.submission.id,
+            state=job.state if job else None,
+            pending=job.is_pending if job else False,
+            result=self.submission.result)
 
     @expose(content_type='text/plain; charset=utf-8')
     def download(self, what=None, *args, **kwargs):
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+'''Archival of old testruns
+
+Moves the testruns of submissions to events that are over into the
+testrun_archives table, one compressed row per submission, so that the
+testruns table and its indexes only hold the current results:
+
+    sauce-archive production.ini --days 30
+
+The result pages show archived testruns from the archive, running the
+tests of a submission again replaces them.
+'''
+#
+## SAUCE - System for AUtomated Code Evaluation
+## Copyright (C) 2013 Moritz Schlarb
+##
+## This program is free software: you can redistribute it and/or modify
+## it under the terms of the GNU Affero General Public License as published by
+## the Free Software Foundation, either version 3 of the License, or
+## any later version.
+##
+## This program is distributed in the hope that it will be useful,
+## but WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+## GNU Affero General Public License for more details.
+##
+## You should have received a copy of the GNU Affero General Public License
+## along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+import sys
+import logging
+from argparse import ArgumentParser
+from datetime import datetime, timedelta
+
+import transaction
+
+from sauce.lib.worker import load_config
+
+log = logging.getLogger(__name__)
+
+
+def archivable(before, event_id=None):
+    '''Query for the ids of submissions whose testruns can be archived
+
+    These are the submissions with testruns to events that ended before
+    the given date.'''
+    from sauce.model import DBSession, Assignment, Event, Sheet, Submission, Testrun
+
+    q = (DBSession.query(Submission.id)
+        .join(Assignment).join(Sheet).join(Event)
+        .filter(Event.end_time < before)
+        .filter(Submission.id.in_(DBSession.query(Testrun.submission_id)))
+        .order_by(Submission.id))
+    if event_id is not None:
+        q = q.filter(Event.id == event_id)
+    return q
+
+
+def archive(before, event_id=None, batch_size=100, dry_run=False):
+    '''Archive the testruns of all archivable submissions
+
+    Commits after each batch of submissions and returns the number of
+    submissions and testruns that have been archived.
+    '''
+    from sauce.model import Submission, TestrunArchive
+
+    q = archivable(before, event_id)
+    if dry_run:
+        return (q.count(), 0)
+    submissions, testruns, last = 0, 0, 0
+    while True:
+        ids = [i for (i,) in q.filter(Submission.id > last).limit(batch_size)]
+        if not ids:
+            break
+        for submission in Submission.query.filter(Submission.id.in_(ids)):
+            testruns += TestrunArchive.archive(submission)
+            submissions += 1
+        transaction.commit()
+        last = ids[-1]
+        log.info('Archived %d testruns of %d submissions', testruns, submissions)
+    return (submissions, testruns)
+
+
+def parse_args(argv=None):
+    parser = ArgumentParser(description='Archive the testruns of events that are over')
+    parser.add_argument('conf_file', help='configuration to use')
+    parser.add_argument('--days', type=int, default=0,
+        help='only archive events that ended at least that many days ago (default: %(default)s)')
+    parser.add_argument('--event', type=int, default=None,
+        help='only archive the event with this id')
+    parser.add_argument('--batch-size', type=int, default=100,
+        help='number of submissions to archive per transaction (default: %(default)s)')
+    parser.add_argument('--dry-run', action='store_true',
+        help='only report how many submissions would be archived')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    load_config(args.conf_file)
+    before = datetime.now() - timedelta(days=args.days)
+    (submissions, testruns) = archive(before, args.event, args.batch_size, args.dry_run)
+    if args.dry_run:
+        log.info('%d submissions would be archived', submissions)
+    else:
+        log.info('Archival done, %d testruns of %d submissions archived', testruns, submissions)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
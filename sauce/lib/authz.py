@@ -23,15 +23,129 @@
 #
 
 import logging
+from collections import defaultdict
 
 #TODO: Use environ instead of request if possible
 from tg import request
 
 from repoze.what.predicates import Predicate
+from sqlalchemy import case, func, literal, null, select, union_all
 
 log = logging.getLogger(__name__)
 
 
+class RoleIndex(object):
+    '''The roles of a user in all events, sheets, assignments, lessons and teams
+
+    The roles are loaded from event_membership with one query when they
+    are needed first and kept for the request, so that checking them does
+    not need to traverse the object hierarchy and its relationships.
+
+    The index maps (kind, id) to the set of roles, where kind is one of
+    'event', 'lesson', 'team', 'sheet' and 'assignment' and the roles are
+    'teacher', 'tutor' and 'member'. Like Event.tutors and Event.members,
+    a tutor or member of a lesson or team is also one of its event.
+    '''
+
+    # The attributes that user_is_in can answer from the index
+    attributes = {'teachers': 'teacher', 'tutors': 'tutor', 'members': 'member'}
+
+    def __init__(self, user):
+        self.user = user
+        self._roles = None
+        self._allowance = {}
+
+    @staticmethod
+    def kind(obj):
+        '''The kind of obj in the index or None'''
+        from sauce.model import Assignment, Event, Lesson, Sheet, Team
+        for (cls, kind) in ((Event, 'event'), (Lesson, 'lesson'), (Team, 'team'),
+                (Sheet, 'sheet'), (Assignment, 'assignment')):
+            if isinstance(obj, cls):
+                return kind
+        return None
+
+    @staticmethod
+    def query(user_id):
+        '''Select (role, kind, id, event_id, lesson_id) for all roles of the user
+
+        The teachers, tutors and members come from event_membership, only
+        the teachers of sheets and assignments and the legacy single
+        teacher and tutor of events and lessons are selected separately.
+        '''
+        from sauce.model import Assignment, Event, Lesson, Sheet
+        from sauce.model.user import event_membership as m
+        events, lessons = Event.__table__, Lesson.__table__
+        sheets, assignments = Sheet.__table__, Assignment.__table__
+
+        def row(role, kind, ident, event_id, lesson_id=None):
+            return [literal(role).label('role'), literal(kind).label('kind'),
+                ident.label('id'), event_id.label('event_id'),
+                (lesson_id if lesson_id is not None else null()).label('lesson_id')]
+
+        kind = case([(m.c.team_id != None, literal('team')), (m.c.lesson_id != None, literal('lesson'))],
+            else_=literal('event'))
+        return union_all(
+            select([m.c.role, kind.label('kind'), func.coalesce(m.c.team_id, m.c.lesson_id, m.c.event_id),
+                    m.c.event_id, m.c.lesson_id])
+                .where(m.c.user_id == user_id),
+            select(row('teacher', 'event', events.c.id, events.c.id))
+                .where(events.c.teacher_id == user_id),
+            select(row('teacher', 'sheet', sheets.c.id, sheets.c.event_id))
+                .where(sheets.c.teacher_id == user_id),
+            select(row('teacher', 'assignment', assignments.c.id, sheets.c.event_id))
+                .select_from(assignments.join(sheets))
+                .where(assignments.c.teacher_id == user_id),
+            select(row('tutor', 'lesson', lessons.c.id, lessons.c.event_id))
+                .where(lessons.c.tutor_id == user_id),
+        )
+
+    @property
+    def roles(self):
+        if self._roles is None:
+            self._roles = self.load()
+        return self._roles
+
+    def load(self):
+        from sauce.model import DBSession
+        roles = defaultdict(set)
+        if not self.user or self.user.id is None:
+            return roles
+        for (role, kind, ident, event_id, lesson_id) in DBSession.execute(self.query(self.user.id)):
+            roles[(kind, ident)].add(role)
+            if lesson_id is not None:
+                roles[('lesson', lesson_id)].add(role)
+            if role in ('tutor', 'member'):
+                roles[('event', event_id)].add(role)
+        return roles
+
+    def has_role(self, obj, *roles):
+        '''If the user has one of the roles for obj'''
+        kind = self.kind(obj)
+        if kind is None or obj.id is None:
+            return False
+        return not self.roles.get((kind, obj.id), set()).isdisjoint(roles)
+
+    def allowance(self, obj):
+        '''If the user is a teacher or tutor of obj or one of its parents'''
+        if obj is None:
+            return False
+        key = (obj.__class__.__name__, getattr(obj, 'id', None))
+        try:
+            return self._allowance[key]
+        except KeyError:
+            pass
+        if self.kind(obj):
+            result = self.has_role(obj, 'teacher', 'tutor')
+        else:
+            # Judgements have their tutor
+            result = getattr(obj, 'tutor_id', None) == self.user.id
+        result = result or self.allowance(getattr(obj, 'parent', None))
+        if key[1] is not None:
+            self._allowance[key] = result
+        return result
+
+
 class user_is(Predicate):
     '''Generic request.user attribute equality checker class'''
 
@@ -65,9 +179,17 @@ class user_is_in(Predicate):
     def evaluate(self, environ, credentials):
         if request.user and self.obj:
             try:
-                attr = getattr(self.obj, self.attribute, [])
-                if request.user in attr:
-                    return
+                roles = getattr(request, 'roles', None)
+                if roles is not None and self.attribute in roles.attributes and roles.kind(self.obj):
+                    if roles.has_role(self.obj, roles.attributes[self.attribute]):
+                        return
+                else:
+                    attr = getattr(self.obj, self.attribute, [])
+                    if roles is not None and roles.kind(attr):
+                        if roles.has_role(attr, 'member'):
+                            return
+                    elif request.user in attr:
+                        return
             except:
                 log.error('user_is_in failed', exc_info=True)
         self.unmet()
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+'''Backfill of the submission summaries
+
+Computes the summary columns of submissions (result, passed, failed,
+total, runtime and testrun_date) from their testruns. Submission.run_tests
+keeps them up to date, so this is only needed after upgrading or when
+testruns have been changed in the database directly. Submissions whose
+testruns have been archived by sauce-archive are left alone:
+
+    sauce-backfill production.ini
+'''
+#
+## SAUCE - System for AUtomated Code Evaluation
+## Copyright (C) 2013 Moritz Schlarb
+##
+## This program is free software: you can redistribute it and/or modify
+## it under the terms of the GNU Affero General Public License as published by
+## the Free Software Foundation, either version 3 of the License, or
+## any later version.
+##
+## This program is distributed in the hope that it will be useful,
+## but WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+## GNU Affero General Public License for more details.
+##
+## You should have received a copy of the GNU Affero General Public License
+## along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+import sys
+import logging
+from argparse import ArgumentParser
+
+import transaction
+
+from sauce.lib.worker import load_config
+
+log = logging.getLogger(__name__)
+
+
+def backfill(batch_size=1000, assignment_id=None):
+    '''Update the summaries of all submissions, committing after each batch
+
+    Returns the number of updated submissions.
+    '''
+    from sauce.model import DBSession, Submission
+
+    q = DBSession.query(Submission.id).order_by(Submission.id)
+    if assignment_id is not None:
+        q = q.filter_by(assignment_id=assignment_id)
+    count, last = 0, 0
+    while True:
+        ids = [i for (i,) in q.filter(Submission.id > last).limit(batch_size)]
+        if not ids:
+            break
+        count += Submission.update_summaries(ids)
+        transaction.commit()
+        last = ids[-1]
+        log.info('Updated the summaries of %d submissions', count)
+    return count
+
+
+def parse_args(argv=None):
+    parser = ArgumentParser(description='Compute the summary columns of submissions from their testruns')
+    parser.add_argument('conf_file', help='configuration to use')
+    parser.add_argument('--batch-size', type=int, default=1000,
+        help='number of submissions to update per transaction (default: %(default)s)')
+    parser.add_argument('--assignment', type=int, default=None,
+        help='only update the submissions of the assignment with this id')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    load_config(args.conf_file)
+    count = backfill(args.batch_size, args.assignment)
+    log.info('Backfill done, %d submissions updated', count)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -32,8 +32,8 @@ import status
 # import tw2.core as twc
 
 import sauce.model as model
-from sauce.model.event import Event
-from sauce.lib.menu import menu_docs, menu_events
+from sauce.lib.authz import RoleIndex
+from sauce.lib.menu import menu_docs, cached_menu_events
 
 log = logging.getLogger(__name__)
 
@@ -41,22 +41,15 @@ __all__ = ['BaseController']
 
 
 def _allowance(obj):
-    """Recursively get teachers and tutors from the object hierarchy
-    and check if request.user is a member"""
+    """Check if request.user is a teacher or tutor somewhere up
+    the object hierarchy of obj"""
     if request.user:
         if 'manage' in request.permissions:
             return True
         try:
-            while obj:
-                for group in ('teachers', 'tutors'):
-                    if request.user in getattr(obj, group, []):
-                        return True
-                for user in ('teacher', 'tutor'):
-                    if request.user is getattr(obj, user, None):
-                        return True
-                obj = obj.parent
+            return request.roles.allowance(obj)
         except:
-            pass
+            log.debug('allowance failed', exc_info=True)
     return False
 
 
@@ -94,6 +87,7 @@ class BaseController(TGController):
 
         request.referer = request.environ.get('HTTP_REFERER', None)
 
+        request.roles = RoleIndex(request.user)
         request.allowance = _allowance
 
         # Initialize other tmpl_context variables
@@ -111,7 +105,7 @@ class BaseController(TGController):
 
         c.doc_menu = menu_docs(doc_list)
 
-        c.event_menu = menu_events(Event.current_events(), Event.future_events(), Event.previous_events())
+        c.event_menu = cached_menu_events()
 
         return super(BaseController, self).__call__(environ, context)
 
@@ -0,0 +1,402 @@
+# -*- coding: utf-8 -*-
+'''Conversion of test output data
+
+Builds the conversion pipeline for the options of a Test once, as a
+chain of generator stages that process the output in batches of lines.
+The result is exactly the same as if the whole output was stripped,
+split into lines, filtered, lowercased and so on, one step after
+another.
+'''
+#
+## SAUCE - System for AUtomated Code Evaluation
+## Copyright (C) 2013 Moritz Schlarb
+##
+## This program is free software: you can redistribute it and/or modify
+## it under the terms of the GNU Affero General Public License as published by
+## the Free Software Foundation, either version 3 of the License, or
+## any later version.
+##
+## This program is distributed in the hope that it will be useful,
+## but WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+## GNU Affero General Public License for more details.
+##
+## You should have received a copy of the GNU Affero General Public License
+## along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+import logging
+from collections import namedtuple
+from os.path import commonprefix
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+log = logging.getLogger(__name__)
+
+__all__ = ['conversion_options', 'Converter', 'make_formatter', 'compare', 'comparison',
+    'compare_numeric', 'deviation', 'iterlines']
+
+# The Test attributes that make up a conversion
+conversion_options = namedtuple('conversion_options',
+    ['comment_prefix', 'ignore_case', 'parallel_sort', 'separator', 'splitlines', 'split', 'sort',
+     'parse_int', 'parse_float', 'strip_parse_errors'])
+
+# Number of characters of output that are processed at once
+BLOCKSIZE = 64 * 1024
+
+
+def iterlines(data, blocksize=BLOCKSIZE):
+    '''Like data.splitlines(), but yields the lines in batches
+
+    data is processed in blocks of about blocksize characters that end
+    with a newline, so that no line boundary is cut in half.'''
+    start, length = 0, len(data)
+    while start < length:
+        if start + blocksize >= length:
+            end = length
+        else:
+            end = data.rfind('\n', start, start + blocksize) + 1
+            if end <= start:
+                end = data.find('\n', start + blocksize) + 1 or length
+        yield data[start:end].splitlines()
+        start = end
+
+
+def _strip(batches):
+    '''Strip all lines and drop the leading and trailing empty ones
+
+    Gives the same lines as stripping the whole data first.'''
+    empty = None
+    for batch in batches:
+        lines = [line.strip() for line in batch]
+        if empty is None:
+            # Drop the leading empty lines
+            i = next((i for (i, line) in enumerate(lines) if line), None)
+            if i is None:
+                continue
+            lines, empty = lines[i:], []
+        # Hold back the trailing empty lines until there is another line
+        j = len(lines)
+        while j and not lines[j - 1]:
+            j -= 1
+        if j:
+            yield empty + lines[:j]
+            empty = lines[j:]
+        else:
+            empty.extend(lines)
+
+
+def _drop_comments(batches, comment_prefix):
+    for batch in batches:
+        yield [line for line in batch if not line.startswith(comment_prefix)]
+
+
+def _lower(batches):
+    for batch in batches:
+        yield [line.lower() for line in batch]
+
+
+def _parallel_sort(batches):
+    '''Put lines with a thread id inside of '[]' behind the other lines, grouped by id
+
+    Needs all lines at once, of course.'''
+    liste = {}
+    rest = []
+    for batch in batches:
+        for i in batch:
+            u = unicode(i)
+            if u.find("[") > -1 and u.find("]") > -1:
+                pos = int(u[u.find("[") + 1:u.find("]")])
+                liste.setdefault(pos, []).append(u)
+            else:
+                rest.append(u)
+    yield rest
+    for i in liste:
+        yield liste[i]
+
+
+def _splitlines(batches, terminated):
+    '''Lines of the text that the batches make up, like text.splitlines()
+
+    Joining the lines with newlines gives one empty line too much at the
+    end, unless the text is terminated by a newline.'''
+    previous = None
+    for batch in batches:
+        if not batch:
+            continue
+        if previous is not None:
+            yield previous
+        previous = batch
+    if previous is not None:
+        if not (previous[-1] or terminated):
+            previous = previous[:-1]
+        yield previous
+
+
+def _chunks(batches, terminated, newline):
+    '''The pieces of the text that the batches make up'''
+    first = True
+    for batch in batches:
+        if not batch:
+            continue
+        if not first:
+            yield newline
+        first = False
+        yield newline.join(batch)
+    if terminated and not first:
+        yield newline
+
+
+def _split(chunks, separator, empty):
+    '''Like ''.join(chunks).split(separator), without joining the chunks'''
+    k = len(separator)
+    token = []
+    # The end of the current token, where a separator might begin
+    tail = empty
+    for chunk in chunks:
+        s = tail + chunk
+        parts = s.split(separator)
+        if len(parts) > 1:
+            token.append(parts[0])
+            yield empty.join(token)
+            for part in parts[1:-1]:
+                yield part
+            token = []
+            s = parts[-1]
+        if k > 1:
+            token.append(s[:-(k - 1)])
+            tail = s[-(k - 1):]
+        else:
+            token.append(s)
+    token.append(tail)
+    yield empty.join(token)
+
+
+def _make_parser(options):
+    # TODO: Allow parsing errors to be logged/shown somewhere, not hiding them all
+    _parser = None
+
+    if options.parse_float:
+        _parser = float
+    if options.parse_int:
+        _parser = int
+
+    if _parser:
+        if options.strip_parse_errors:
+            def parser(x):
+                try:
+                    return _parser(x)
+                except:
+                    log.debug('Error while parsing', exc_info=True)
+                    return u''
+        else:
+            def parser(x):
+                try:
+                    return _parser(x)
+                except:
+                    log.debug('Error while parsing', exc_info=True)
+                    return x
+        return parser
+    else:
+        return None
+
+
+def make_formatter(parse_float, float_precision):
+    '''Return the function that formats converted items as text again'''
+    if parse_float and float_precision is not None:
+        def fmt(obj):
+            try:
+                return (u'%%.%df' % float_precision) % obj
+            except:
+                log.debug('Error converting float to string with precision', exc_info=True)
+                return unicode(obj)
+        return fmt
+    else:
+        return unicode
+
+
+class Converter(object):
+    '''Conversion of output data for one set of conversion_options
+
+    Calling a Converter converts output data to the form that is used
+    for comparing, which is a string, a list of tokens or lines, or a
+    list of lists of tokens for each line.
+    '''
+
+    def __init__(self, options, blocksize=BLOCKSIZE):
+        self.options = options
+        self.blocksize = blocksize
+        # Normalize the values from database since they might be ''
+        self.separator = options.separator or None
+        self.parser = _make_parser(options)
+
+    def _lines(self, data):
+        '''All stages that work on single lines'''
+        b = _strip(iterlines(data, self.blocksize))
+        if self.options.comment_prefix:
+            b = _drop_comments(b, self.options.comment_prefix)
+        if self.options.ignore_case:
+            b = _lower(b)
+        return b
+
+    def _items(self, data, parse=True):
+        '''Yield the converted items in batches
+
+        Without splitting, there is only one batch with the whole
+        converted data in it.'''
+        options, separator = self.options, self.separator
+        parser = self.parser if parse else None
+        empty, newline = data[:0], data[:0] + '\n'
+
+        b, terminated = self._lines(data), False
+        if options.parallel_sort:
+            # The sorted lines are each terminated by a newline
+            b, terminated = _parallel_sort(_splitlines(b, False)), True
+            empty, newline = u'', u'\n'
+
+        if options.splitlines and options.split:
+            for batch in _splitlines(b, terminated):
+                items = [[ll for ll in line.split(separator) if ll] for line in batch]
+                yield [[parser(t) for t in a] for a in items] if parser else items
+        elif options.splitlines:
+            for batch in _splitlines(b, terminated):
+                yield map(parser, batch) if parser else batch
+        elif options.split:
+            if separator is None:
+                # Newlines are whitespace, so no token spans multiple lines
+                for chunk in _chunks(b, terminated, newline):
+                    items = chunk.split()
+                    yield map(parser, items) if parser else items
+            else:
+                items = (token for token in _split(_chunks(b, terminated, newline), separator, empty) if token)
+                batch = []
+                for token in items:
+                    batch.append(parser(token) if parser else token)
+                    if len(batch) >= self.blocksize:
+                        yield batch
+                        batch = []
+                yield batch
+        else:
+            d = empty.join(_chunks(b, terminated, newline))
+            yield [parser(d) if parser else d]
+
+    def __call__(self, data):
+        options = self.options
+        if options.splitlines or options.split:
+            d = [item for batch in self._items(data) for item in batch]
+        else:
+            d = next(self._items(data))[0]
+
+        if options.sort:
+            d = sorted(d)
+
+        return d
+
+    def array(self, data):
+        '''Parse all items of data into one array of floats at once
+
+        Lines are not kept apart and empty lines are left out, the array
+        holds the items in the order in which they appear. Raises
+        ValueError if an item is not a number. Needs numpy.
+        '''
+        if self.options.splitlines and self.options.split:
+            items = [t for batch in self._items(data, parse=False) for a in batch for t in a]
+        else:
+            items = [t for batch in self._items(data, parse=False) for t in batch if t]
+        a = numpy.array(items, dtype=numpy.float64)
+        if self.options.sort:
+            a.sort()
+        return a
+
+    def chunks(self, data, fmt=unicode, separator=u' '):
+        '''Yield the converted data formatted as text again, piece by piece
+
+        Joining the pieces gives the same text as formatting the result of
+        calling the Converter, unless the data gets sorted.'''
+        options = self.options
+        first = True
+        for batch in self._items(data):
+            if not batch:
+                continue
+            if options.splitlines and options.split:
+                text = u'\n'.join([separator.join(map(fmt, a)) for a in batch])
+            elif options.splitlines:
+                text = u'\n'.join(map(fmt, batch))
+            elif options.split:
+                text = separator.join(map(fmt, batch))
+            else:
+                text = fmt(batch[0])
+            if not first:
+                yield u'\n' if options.splitlines else separator
+            first = False
+            yield text
+
+
+# Result of comparing observed and expected output, position is the index
+# of the first character in the expected output that differs
+comparison = namedtuple('comparison', ['result', 'partial', 'position'])
+
+
+def compare(expected, chunks):
+    '''Compare expected with the stripped text that chunks make up
+
+    Stops at the first difference that can not be trailing whitespace.
+    expected must already be stripped.
+    Partial means that the observed text is a non-empty prefix of
+    expected.'''
+    pos, started = 0, False
+    chunks = iter(chunks)
+    for chunk in chunks:
+        if not started:
+            chunk = chunk.lstrip()
+            if not chunk:
+                continue
+            started = True
+        if expected.startswith(chunk, pos):
+            pos += len(chunk)
+            continue
+        # The texts differ in this chunk
+        i = len(commonprefix([chunk, expected[pos:pos + len(chunk)]]))
+        pos += i
+        if chunk[i:].strip():
+            return comparison(False, False, pos)
+        # Only whitespace may follow, which gets stripped
+        for chunk in chunks:
+            if chunk.strip():
+                return comparison(False, False, pos)
+        break
+    if pos == len(expected):
+        return comparison(True, False, None)
+    return comparison(False, pos > 0, pos)
+
+
+# Result of comparing arrays of numbers, index and magnitude are the ones
+# of the largest deviation of an observed from an expected number that is
+# beyond the tolerances, if any
+deviation = namedtuple('deviation', ['result', 'partial', 'index', 'magnitude',
+    'expected_length', 'observed_length'])
+
+
+def compare_numeric(expected, observed, abs_tolerance=None, rel_tolerance=None):
+    '''Compare two arrays of numbers with tolerances
+
+    An observed number o matches an expected number e if
+    abs(o - e) <= abs_tolerance + rel_tolerance * abs(e).
+    Partial means that observed matches the beginning of expected.
+    Needs numpy.'''
+    n = min(len(expected), len(observed))
+    e, o = expected[:n], observed[:n]
+    with numpy.errstate(invalid='ignore'):
+        diff = numpy.abs(o - e)
+        # Equal infinities and nan in both places are no deviation
+        diff[(o == e) | (numpy.isnan(o) & numpy.isnan(e))] = 0
+        allowed = (abs_tolerance or 0) + (rel_tolerance or 0) * numpy.abs(e)
+        bad = numpy.isnan(diff) | (diff > allowed)
+    if bad.any():
+        index = int(numpy.argmax(numpy.where(bad, numpy.where(numpy.isnan(diff), numpy.inf, diff), -1)))
+        return deviation(False, False, index, float(diff[index]), len(expected), len(observed))
+    result = len(expected) == len(observed)
+    return deviation(result, 0 < n < len(expected), None, None, len(expected), len(observed))
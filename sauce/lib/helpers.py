@@ -36,6 +36,7 @@ from difflib import unified_diff
 from tg import config, request, url as tgurl
 
 from .sanitize import bleach_basic, bleach_simple, bleach_advanced
+from .runner import LIMIT_NAMES
 
 #log = logging.getLogger(__name__)
 
@@ -98,6 +99,12 @@ def udiff(a, b, a_name=None, b_name=None, **kw):
         a_name, b_name, lineterm='', **kw))
 
 
+def resource_limit_name(limit):
+    '''Human readable name of a resource limit recorded on a testrun'''
+    name = LIMIT_NAMES.get(limit, limit)
+    return name[0].upper() + name[1:]
+
+
 #----------------------------------------------------------------------
 
 
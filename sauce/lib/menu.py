@@ -24,14 +24,22 @@ based on Twitter's Bootstrap layout.
 ## along with this program.  If not, see <http://www.gnu.org/licenses/>.
 #
 
+import logging
+from collections import namedtuple
+from datetime import datetime, timedelta
 from itertools import groupby
-from tg import request, url, lurl
+
+from paste.deploy.converters import asint
+from sqlalchemy import event as _event
+from tg import cache, config, request, url, lurl
 
 from webhelpers.html import literal
 from webhelpers.html.tags import link_to
 
 from sauce import model
 
+log = logging.getLogger(__name__)
+
 
 #----------------------------------------------------------------------
 # Menu class definitions
@@ -55,6 +63,7 @@ class Menu(list):
 
     def render(self, *args, **kw):
         direction = kw.get('direction', 'vertical')
+        items = list(self)
 
         if direction == 'dropdown':
             class_ = kw.get('class_dropdown', 'dropdown')
@@ -65,8 +74,9 @@ class Menu(list):
         else:
             res = literal(u'<ul class="nav %s %s">' % (kw.get('class_menu', ''), self.kw.get('class_menu', '')))
             if self.title:
-                self.insert(0, MenuHeader(self.title))
-        for c in self:
+                # Not inserted into the menu itself, so it can be rendered again
+                items.insert(0, MenuHeader(self.title))
+        for c in items:
             # Copy keywords to keep original kw clean
             kkw = kw.copy()
             if isinstance(c, Menu) and direction == 'horizontal':
@@ -391,3 +401,126 @@ def menu_crc(menu_items, active=None):
         nav.append(MenuItem(name, url, class_=class_))
 
     return nav
+
+
+#----------------------------------------------------------------------
+# Cached event menu
+#----------------------------------------------------------------------
+
+# What the event menu needs to know about an event
+menu_event = namedtuple('menu_event', ['name', 'url', 'public', 'start_time', 'end_time'])
+
+# (expires, lists) of the event menu, cached in this process
+_event_menu = None
+
+# The event_menu cache namespace, once it has been used
+_shared_cache = None
+
+
+def _shared_event_cache():
+    '''The cache namespace for the event lists that is shared between processes
+
+    The cache is only available during a request, so the namespace is
+    kept for invalidating it after commits outside of requests.
+    '''
+    global _shared_cache
+    try:
+        _shared_cache = cache.get_cache('event_menu')
+    except Exception:
+        log.debug('Shared event menu cache not available', exc_info=True)
+    return _shared_cache
+
+
+def event_lists():
+    '''Return the current, future and previous events as lists of menu_event
+
+    Also returns when these lists change next by themselves, which is
+    when the first current event ends or the first future event starts.
+    '''
+    Event = model.Event
+    lists = tuple([menu_event(e.name, e.url, e.public, e.start_time, e.end_time) for e in q]
+        for q in (Event.current_events(), Event.future_events(), Event.previous_events()))
+    (curr, future, _) = lists
+    changes = [e.end_time for e in curr] + [e.start_time for e in future]
+    return lists, min(changes) if changes else None
+
+
+def cached_menu_events():
+    '''Return the event menu like menu_events, but with cached event lists
+
+    The event lists are kept in this process and in the shared event_menu
+    cache namespace for events.menu_cache seconds, until an event starts
+    or ends or until an Event is changed in the database. Other processes
+    notice changed Events after events.menu_cache seconds at the latest.
+    Setting it to 0 disables caching.
+
+    The menu itself is built for every request, so that rendering it
+    can not change the cached one.
+    '''
+    global _event_menu
+    ttl = asint(config.get('events.menu_cache', 60))
+    if not ttl:
+        return menu_events(*event_lists()[0])
+    now = datetime.now()
+    cached = _event_menu
+    if cached and now < cached[0]:
+        return menu_events(*cached[1])
+
+    # All users see all events, non-public ones with a lock icon
+    key = 'events'
+    shared = _shared_event_cache()
+    expires, lists = None, None
+    if shared is not None:
+        try:
+            (expires, lists) = shared.get_value(key)
+        except KeyError:
+            pass
+        except Exception:
+            log.warn('Could not load event menu from cache', exc_info=True)
+    if lists is None or not now < expires:
+        (lists, change) = event_lists()
+        expires = now + timedelta(seconds=ttl)
+        if change and change < expires:
+            expires = change
+        if shared is not None:
+            try:
+                shared.set_value(key, (expires, lists))
+            except Exception:
+                log.warn('Could not store event menu in cache', exc_info=True)
+
+    _event_menu = (expires, lists)
+    return menu_events(*lists)
+
+
+def invalidate_event_menu():
+    '''Drop the cached event lists of this process and the shared ones'''
+    global _event_menu
+    _event_menu = None
+    shared = _shared_event_cache()
+    if shared is not None:
+        try:
+            shared.clear()
+        except Exception:
+            log.warn('Could not clear event menu cache', exc_info=True)
+
+
+def _events_flushed(session, flush_context):
+    '''Remember whether an Event has been changed in this transaction'''
+    if any(isinstance(obj, model.Event) for objs in (session.new, session.dirty, session.deleted)
+            for obj in objs):
+        session.info['events_changed'] = True
+
+
+def _events_committed(session):
+    if session.info.pop('events_changed', False):
+        invalidate_event_menu()
+
+
+def _events_rolled_back(session):
+    session.info.pop('events_changed', None)
+
+
+# Only after commit, so that no other request can cache the old events again
+_event.listen(model.DBSession, 'after_flush', _events_flushed)
+_event.listen(model.DBSession, 'after_commit', _events_committed)
+_event.listen(model.DBSession, 'after_rollback', _events_rolled_back)
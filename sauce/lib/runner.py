@@ -26,15 +26,25 @@ TODO: Refactor everything
 #
 
 import os
+import json
+import atexit
 import logging
 import errno
-from tempfile import mkdtemp
+import select
+import signal
+import resource
+from hashlib import sha256
+from tempfile import mkdtemp, mkstemp
 from subprocess import Popen, PIPE
-from threading import Thread
-from shutil import rmtree
+from multiprocessing.pool import ThreadPool
+from threading import Event, Lock
+from shutil import copy2, copytree, rmtree
 from collections import namedtuple
+from functools import partial
+from itertools import izip
 from random import randint
-from time import time
+from time import time, sleep
+from codecs import getincrementaldecoder
 
 from shlex import split as _split
 # Hope to get around with this in older Python 2 versions
@@ -45,13 +55,46 @@ split = lambda a: [b.decode('utf-8') for b in _split(a.encode('utf-8'))]
 
 log = logging.getLogger(__name__)
 
-process = namedtuple('process', ['returncode', 'stdout', 'stderr'])
+# CPU time in seconds and peak resident set size in kilobytes of a process
+usage = namedtuple('usage', ['user_time', 'system_time', 'max_rss'])
+# Resource limits for a process, see sauce.model.ResourceProfile for the units
+limits = namedtuple('limits', ['memory', 'cpu_time', 'file_size', 'processes', 'cgroup'])
+# limit is the name of the resource limit the process probably ran into
+process = namedtuple('process', ['returncode', 'stdout', 'stderr', 'usage', 'limit'])
+process.__new__.__defaults__ = (None, None)
 compileresult = namedtuple('compileresult', ['result', 'runtime', 'stdout', 'stderr'])
+# skipped is set for tests that were not run in a staged run, see Runner.test
 testresult = namedtuple('testresult',
-    ['result', 'partial', 'test', 'runtime', 'output_test', 'output_data', 'error_data', 'returncode'])
-
-# Timeout value for join between sending SIGTERM and SIGKILL to process
-THREADKILLTIMEOUT = 0.5
+    ['result', 'partial', 'test', 'runtime', 'output_test', 'output_data', 'error_data', 'returncode',
+     'usage', 'limit', 'skipped'])
+testresult.__new__.__defaults__ = (None, None, False)
+# Everything needed to run a test, detached from the database session
+testjob = namedtuple('testjob',
+    ['timeout', 'argv', 'stdin', 'input_filename', 'input_data', 'output_filename', 'limits'])
+
+# Human readable names of the resource limits
+LIMIT_NAMES = {
+    'memory': u'memory',
+    'cpu_time': u'CPU time',
+    'file_size': u'file size',
+    'processes': u'number of processes',
+    'workspace': u'workspace size',
+}
+
+# Error messages that hint that a process failed because of a resource limit
+LIMIT_MESSAGES = {
+    'memory': ('MemoryError', 'bad_alloc', 'OutOfMemoryError', 'Cannot allocate memory', 'out of memory'),
+    'file_size': ('File too large',),
+    'processes': ('Resource temporarily unavailable', 'unable to create new native thread'),
+}
+
+# Timeout value for waiting between sending SIGTERM and SIGKILL to process
+KILLTIMEOUT = 0.5
+
+# Number of processes that were left running by the processes
+# started by TimeoutProcess and had to be killed
+stray_processes = [0]
+_stray_processes_lock = Lock()
 
 # Needs to be less than the column size in the model
 # 10 KB - safety buffer for truncation warning
@@ -62,84 +105,378 @@ class CompileFirstException(Exception):
     pass
 
 
+def resource_limits(*profiles):
+    '''Merge resource profiles into limits
+
+    For each limit, the first profile that sets it wins, so profiles
+    have to be given from the most to the least specific one.
+    Returns None if no limit is set at all.
+    '''
+    values = [next((getattr(p, field) for p in profiles if p and getattr(p, field)), None)
+              for field in limits._fields]
+    if not any(values):
+        return None
+    return limits(*values)
+
+
+def _group_members(pgid):
+    '''Return the pids of the running processes in process group pgid
+
+    Returns None if the process table can not be read.'''
+    try:
+        pids = [int(pid) for pid in os.listdir('/proc') if pid.isdigit()]
+    except OSError:  # pragma: no cover
+        return None
+    members = []
+    for pid in pids:
+        try:
+            with open('/proc/%d/stat' % pid) as fd:
+                stat = fd.read()
+        except IOError:
+            # Process exited in the meantime
+            continue
+        # The command name may contain spaces and parentheses
+        fields = stat[stat.rfind(')') + 2:].split()
+        # Zombies are already dead and wait for init to reap them
+        if int(fields[2]) == pgid and fields[0] != 'Z':
+            members.append(pid)
+    return members
+
+
+def _oom_kills(cgroup):
+    '''Return how many processes in cgroup have been killed for lack of memory'''
+    try:
+        with open(os.path.join(cgroup, 'memory.events')) as fd:
+            for line in fd:
+                if line.startswith('oom_kill '):
+                    return int(line.split()[1])
+    except (IOError, ValueError):
+        pass
+    return None
+
+
+class OutputBuffer(object):
+    '''Captures and decodes the output of a process while it arrives
+
+    At most max_length bytes are kept, write returns False once this
+    limit has been exceeded.'''
+
+    def __init__(self, max_length=MAX_DATA_LENGTH):
+        self.max_length = max_length
+        self.length = 0
+        self.truncated = False
+        self.chunks = []
+        self.decoder = getincrementaldecoder('utf-8')()
+
+    def _decode(self, data, final=False):
+        try:
+            self.chunks.append(self.decoder.decode(data, final))
+        except UnicodeDecodeError:
+            log.info('Encoding errors in process output', exc_info=True)
+            # The decoder keeps its state on errors, so data can be decoded again
+            self.decoder.errors = 'ignore'
+            self.chunks.append(self.decoder.decode(data, final))
+
+    def write(self, data):
+        '''Append data to the buffer'''
+        room = self.max_length - self.length
+        if len(data) > room:
+            data = data[:room]
+            self.truncated = True
+        self.length += len(data)
+        self._decode(data)
+        return not self.truncated
+
+    def getvalue(self):
+        '''Return the decoded output, marked if it has been truncated'''
+        if self.truncated:
+            # The last character may have been cut in half
+            self.decoder.errors = 'ignore'
+        self._decode('', final=True)
+        data = u''.join(self.chunks)
+        if self.truncated:
+            log.info('Truncated output to %d bytes', self.max_length)
+            msg = u'\n=== OUTPUT TRUNCATED to %d bytes ===\n' % self.max_length
+            data = msg + data + msg
+        return data
+
+
 class TimeoutProcess(object):
     '''Runs an external command until timeout is reached
 
     Assumes that Popen uses PIPE for stdin, stdout and stderr
     Data for stdin may be supplied on instantiation, stdout and
-    stderr will be returned from the call.'''
+    stderr will be returned from the call.
+
+    The pipes are served by a poll loop in the calling thread. Output
+    is decoded while it arrives and captured up to max_length bytes
+    per stream. If a process exceeds this limit, it gets killed.
 
-    def __init__(self):
+    The process is started in a new session, so that all of its
+    descendants can be signalled at once. Descendants that are still
+    running after the process exited are killed and counted in
+    stray_processes.'''
+
+    def __init__(self, max_length=MAX_DATA_LENGTH):
         self.argv = None
         self.timeout = None
         self.stdin = None
-        self.stdout = ''
-        self.stderr = ''
+        self.stdout = u''
+        self.stderr = u''
         self.p = None
-        self.t = None
         self.returncode = -127
+        self.usage = None
+        self.limits = None
+        self.limit = None
+        self.strays = 0
+        self.max_length = max_length
+
+    def _preexec(self):
+        '''Start a new session and apply the resource limits in the child process before exec'''
+        os.setsid()
+        if not self.limits:
+            return
+        if self.limits.cgroup:
+            with open(os.path.join(self.limits.cgroup, 'cgroup.procs'), 'w') as fd:
+                fd.write(str(os.getpid()))
+        MB = 1024 * 1024
+        if self.limits.memory:
+            resource.setrlimit(resource.RLIMIT_AS, (self.limits.memory * MB,) * 2)
+        if self.limits.cpu_time:
+            # The soft limit sends SIGXCPU, the hard limit one second later SIGKILL
+            resource.setrlimit(resource.RLIMIT_CPU, (self.limits.cpu_time, self.limits.cpu_time + 1))
+        if self.limits.file_size:
+            resource.setrlimit(resource.RLIMIT_FSIZE, (self.limits.file_size * MB,) * 2)
+            # Python ignores SIGXFSZ and the ignore would be inherited
+            signal.signal(signal.SIGXFSZ, signal.SIG_DFL)
+        if self.limits.processes:
+            resource.setrlimit(resource.RLIMIT_NPROC, (self.limits.processes,) * 2)
+
+    def _limit_hit(self, oom_kills=None):
+        '''Guess which resource limit, if any, made the process fail'''
+        if not self.limits or self.returncode == 0:
+            return None
+        rc = self.returncode
+        if self.limits.cpu_time and (rc == -signal.SIGXCPU or rc == -signal.SIGKILL and self.usage and
+                self.usage.user_time + self.usage.system_time >= self.limits.cpu_time):
+            return 'cpu_time'
+        if self.limits.file_size and (rc == -signal.SIGXFSZ or
+                any(m in self.stderr for m in LIMIT_MESSAGES['file_size'])):
+            return 'file_size'
+        if self.limits.memory and (any(m in self.stderr for m in LIMIT_MESSAGES['memory']) or
+                self.usage and self.usage.max_rss >= 0.9 * self.limits.memory * 1024):
+            return 'memory'
+        if self.limits.cgroup and oom_kills is not None and rc == -signal.SIGKILL:
+            if (_oom_kills(self.limits.cgroup) or 0) > oom_kills:
+                return 'memory'
+        if self.limits.processes and any(m in self.stderr for m in LIMIT_MESSAGES['processes']):
+            return 'processes'
+        return None
+
+    def _reap(self):
+        '''Collect the exit status and resource usage of the process
+
+        Uses wait4 instead of Popen.poll, which would discard the
+        resource usage.'''
+        if self.p.returncode is not None:
+            return True
+        try:
+            (pid, status, rusage) = os.wait4(self.p.pid, os.WNOHANG)
+        except OSError as e:  # pragma: no cover
+            if e.args[0] != errno.ECHILD:
+                raise
+            # Someone else reaped the process, resource usage is unknown
+            return self.p.poll() is not None
+        if pid == 0:
+            return False
+        if os.WIFSIGNALED(status):
+            self.p.returncode = -os.WTERMSIG(status)
+        else:
+            self.p.returncode = os.WEXITSTATUS(status)
+        self.usage = usage(rusage.ru_utime, rusage.ru_stime, rusage.ru_maxrss)
+        return True
+
+    def _wait(self, timeout):
+        '''Wait up to timeout seconds for the process to exit'''
+        end = time() + timeout
+        while not self._reap():
+            if time() >= end:
+                return False
+            sleep(0.01)
+        return True
+
+    def _signal(self, sig):
+        '''Send sig to the process group of the process
+
+        Returns whether there was any process left to signal.'''
+        try:
+            os.killpg(self.p.pid, sig)
+        except OSError as e:
+            if e.args[0] not in (errno.ESRCH, errno.EPERM):  # pragma: no cover
+                raise
+            return False
+        return True
+
+    def _stop(self):
+        '''Terminate the process group, kill it if the process does not react'''
+        log.debug("Terminating process group %r", self.p.pid)
+        self._signal(signal.SIGTERM)
+        if not self._wait(KILLTIMEOUT):
+            log.debug("Killing process group %r", self.p.pid)
+            self._signal(signal.SIGKILL)
+            if not self._wait(KILLTIMEOUT):
+                log.warn("Process %r still won't die...", self.p.pid)
+
+    def _kill_strays(self):
+        '''Kill the descendants of the process that are still running
+
+        Returns the number of processes that were killed.'''
+        members = _group_members(self.p.pid)
+        if members is not None and not members:
+            return 0
+        if not self._signal(signal.SIGKILL):
+            return 0
+        # Without a process table, at least one process was left
+        strays = len(members) if members is not None else 1
+        log.warn('Killed %d stray process(es) of %r', strays, self.argv)
+        self.strays += strays
+        with _stray_processes_lock:
+            stray_processes[0] += strays
+        return strays
+
+    def _communicate(self, deadline, stdout, stderr):
+        '''Serve the pipes of the process until they are closed
+
+        Descendants that keep the pipes open after the process exited
+        are killed.
+        Returns False if one of the output buffers exceeded its limit.'''
+        buffers = {self.p.stdout.fileno(): stdout, self.p.stderr.fileno(): stderr}
+        files = dict((f.fileno(), f) for f in (self.p.stdin, self.p.stdout, self.p.stderr))
+
+        poller = select.poll()
+        for fd in buffers:
+            poller.register(fd, select.POLLIN | select.POLLPRI)
+
+        stdin_fd, offset = None, 0
+        if self.stdin:
+            stdin_fd = self.p.stdin.fileno()
+            poller.register(stdin_fd, select.POLLOUT)
+        else:
+            files.pop(self.p.stdin.fileno()).close()
 
-    def __call__(self, argv, timeout, stdin=None, **kwargs):
+        def close(fd):
+            poller.unregister(fd)
+            files.pop(fd).close()
+
+        while files:
+            remaining = deadline - time()
+            if remaining <= 0:
+                break
+            try:
+                events = poller.poll(min(remaining, 0.1) * 1000)
+            except select.error as e:  # pragma: no cover
+                if e.args[0] == errno.EINTR:
+                    continue
+                raise
+
+            for fd, event in events:
+                if fd == stdin_fd:
+                    if event & select.POLLOUT:
+                        # Writing up to PIPE_BUF bytes does not block, just like in communicate
+                        try:
+                            offset += os.write(fd, self.stdin[offset:offset + select.PIPE_BUF])
+                        except OSError as e:
+                            if e.args[0] != errno.EPIPE:
+                                raise
+                            offset = len(self.stdin)
+                    if offset >= len(self.stdin) or event & (select.POLLERR | select.POLLHUP):
+                        close(fd)
+                else:
+                    data = os.read(fd, 65536)
+                    if not data:
+                        close(fd)
+                    elif not buffers[fd].write(data):
+                        return False
+            if self._reap():
+                self._kill_strays()
+        return True
+
+    def __call__(self, argv, timeout, stdin=None, limits=None, **kwargs):
         '''Run external command argv until timeout is reached
 
         If stdin is not none the data will be supplied to the
         processes stdin.
+        If limits is not none, the resource limits are applied to
+        the process.
         Remaining kwargs will be passed to Popen.
-        stderr and stdout are always strings, returncode is -1
+        stderr and stdout are always unicode strings, returncode is -1
         if timeout occured'''
 
         self.argv = argv
         self.timeout = timeout
         self.stdin = stdin
+        self.limits = limits
+        self.strays = 0
 
-        def target():
-            self.p = Popen(self.argv, stdin=PIPE, stdout=PIPE, stderr=PIPE, **kwargs)
-            (self.stdout, self.stderr) = self.p.communicate(self.stdin)
+        oom_kills = None
+        if self.limits and self.limits.cgroup:
+            oom_kills = _oom_kills(self.limits.cgroup)
+
+        stdout, stderr = OutputBuffer(self.max_length), OutputBuffer(self.max_length)
+        timedout = False
+
+        deadline = time() + self.timeout
+        try:
+            self.p = Popen(self.argv, stdin=PIPE, stdout=PIPE, stderr=PIPE,
+                preexec_fn=self._preexec, **kwargs)
+        except EnvironmentError as e:
+            # Errors in _preexec are raised here as well
+            log.warn('Could not start process %r', self.argv, exc_info=True)
+            self.stderr = u'\nAn error occurred: %s\n' % str(e).decode('utf-8', 'ignore')
+            return process(self.returncode, self.stdout, self.stderr, self.usage)
+        try:
+            exceeded = not self._communicate(deadline, stdout, stderr)
+            if exceeded:
+                self._stop()
+            elif not self._wait(max(deadline - time(), 0)):
+                self._stop()
+                timedout = True
+        finally:
+            self._kill_strays()
+            for f in (self.p.stdin, self.p.stdout, self.p.stderr):
+                f.close()
+
+        self.stdout = stdout.getvalue()
+        self.stderr = stderr.getvalue()
+        if self.p.returncode is not None:
             self.returncode = self.p.returncode
+        else:  # pragma: no cover
+            self.returncode = -1
+
+        if exceeded:
+            self.stderr += (u'\n=== %s TRUNCATED to %d bytes, process killed ===\n'
+                % ('stdout' if stdout.truncated else 'stderr', self.max_length))
+        elif timedout:
+            self.stderr += u'\nTimeout occurred\n'
+            self.returncode = -1
+        else:
+            self.limit = self._limit_hit(oom_kills)
+            if self.limit:
+                self.stderr += u'\nResource limit exceeded: %s\n' % LIMIT_NAMES[self.limit]
 
-        self.t = Thread(target=target)
-        self.t.start()
-        self.t.join(self.timeout)
+        return process(self.returncode, self.stdout, self.stderr, self.usage, self.limit)
 
-        if self.t.isAlive():
-            # In strange cases, there is no subprocess...
-            if self.p:
-                log.debug("Terminating process %r in thread %r", self.p.pid, self.t.name)
-                try:
-                    self.p.terminate()
-                except OSError as e:  # pragma: no cover
-                    if e.args[0] != errno.ESRCH:
-                        raise
-                self.t.join(THREADKILLTIMEOUT)
-                if self.t.isAlive():
-                    log.debug("Killing process %r in thread %r", self.p.pid, self.t.name)
-                    try:
-                        self.p.kill()
-                    except OSError as e:  # pragma: no cover
-                        if e.args[0] != errno.ESRCH:
-                            raise
-                    if self.t.isAlive():
-                        log.warn("Process %r in thread %r still won't die...",
-                            self.p and self.p.pid or None, self.t and self.t.name or None)
-                self.stderr += '\nTimeout occurred\n'
-                self.returncode = -1
-            else:  # pragma: no cover
-                log.warn('No subprocess found :-/')
-                self.stderr += '\nAn error occurred\n'
-                self.returncode = -1
-
-        return process(self.returncode, self.stdout, self.stderr)
-
-
-def compile(compiler, dir, srcfile, binfile):  # pylint:disable=redefined-builtin
+
+def compile(compiler, dir, srcfile, binfile, limits=None):  # pylint:disable=redefined-builtin
     '''Compiles a source file
 
     @param compiler: Compiler object
     @param dir: Working directory
     @param srcfile: Filename of source file
     @param binfile: Filename of object file
+    @param limits: Resource limits for the compiler
 
-    @return: (returncode, stdoutdata, stderrdata)
+    @return: (returncode, stdoutdata, stderrdata, usage, limit)
     '''
 
     tp = TimeoutProcess()
@@ -160,54 +497,49 @@ def compile(compiler, dir, srcfile, binfile):  # pylint:disable=redefined-builti
     log.debug('Command line: %s', args)
 
     # Run compiler
-    (returncode, stdoutdata, stderrdata) = tp(args, timeout=compiler.timeout,
-                                              cwd=dir, shell=False,
+    (returncode, stdoutdata, stderrdata, rusage, limit) = tp(args, timeout=compiler.timeout,
+                                              limits=limits, cwd=dir, shell=False,
                                               # This overrides all other locale environment variables
                                               #env={'LC_ALL': 'de_DE.UTF-8'},
                                               )
 
-    l = len(stdoutdata)
-    if l > MAX_DATA_LENGTH:
-        log.info('Truncating stdout of size %s', l)
-        msg = '\n=== OUTPUT TRUNCATED from %d to %d ===\n' % (l, MAX_DATA_LENGTH)
-        stdoutdata = msg + stdoutdata[:MAX_DATA_LENGTH] + msg
-
-    try:
-        stdoutdata = unicode(stdoutdata, encoding='utf-8')
-    except UnicodeDecodeError:
-        log.info('Encoding errors in compilation', exc_info=True)
-        stdoutdata = unicode(stdoutdata, encoding='utf-8', errors='ignore')
-
-    l = len(stderrdata)
-    if l > MAX_DATA_LENGTH:
-        log.info('Truncating stderr of size %s', l)
-        msg = '\n=== OUTPUT TRUNCATED from %d to %d ===\n' % (l, MAX_DATA_LENGTH)
-        stderrdata = msg + stderrdata[:MAX_DATA_LENGTH] + msg
-
-    try:
-        stderrdata = unicode(stderrdata, encoding='utf-8')
-    except UnicodeDecodeError:
-        log.info('Encoding errors in compilation', exc_info=True)
-        stderrdata = unicode(stderrdata, encoding='utf-8', errors='ignore')
-
     log.debug('Process returned: %d', returncode)
 #     log.debug('Process stdout: %s', stdoutdata.strip())
 #     log.debug('Process stderr: %s', stderrdata.strip())
 
-    return process(returncode, stdoutdata, stderrdata)
+    return process(returncode, stdoutdata, stderrdata, rusage, limit)
+
+
+def prepare_stdin(stdin):
+    '''Normalize newlines in stdin and encode it for the process'''
+    #log.debug('stdin: %s', stdin)
+    if stdin:
+        stdin = stdin.strip()
+        #stdin = stdin.replace('\r\n', '\n').replace('\r', '\n').replace('\n\n','\n')
+        stdin = '\n'.join(stdin.splitlines())
+        try:
+            stdin = stdin.encode('utf-8')
+        except UnicodeEncodeError:
+            log.info('Encoding errors in execution', exc_info=True)
+            stdin = stdin.encode('utf-8', errors='ignore')
+    #log.debug('stdin: %s' % stdin)
+    return stdin
 
 
-def execute(interpreter, timeout, dir, basename, binfile, stdin=None, argv=''):  # pylint:disable=too-many-arguments,redefined-builtin
+def execute(interpreter, timeout, dir, basename, binfile,  # pylint:disable=too-many-arguments,redefined-builtin
+        stdin=None, argv='', limits=None):
     '''Execute or interpret a binfile
 
     @param interpreter: Interpreter object or none
     @param dir: Working directory
     @param binfile: Filename of executable or script file
     @param timeout: Timeout value for test run
-    @param stdin: Standard input data
+    @param stdin: Standard input data, unicode data gets normalized
+        with prepare_stdin
     @param argv: Additional argv to command line
+    @param limits: Resource limits for the process
 
-    @return: (returncode, stdoutdata, stderrdata)
+    @return: (returncode, stdoutdata, stderrdata, usage, limit)
     '''
 
     tp = TimeoutProcess()
@@ -228,55 +560,256 @@ def execute(interpreter, timeout, dir, basename, binfile, stdin=None, argv=''):
 
     log.debug('Command line: %s', args)
 
-    # normalize newlines
-    #log.debug('stdin: %s', stdin)
-    if stdin:
-        stdin = stdin.strip()
-        #stdin = stdin.replace('\r\n', '\n').replace('\r', '\n').replace('\n\n','\n')
-        stdin = '\n'.join(stdin.splitlines())
-        try:
-            stdin = stdin.encode('utf-8')
-        except UnicodeEncodeError:
-            log.info('Encoding errors in execution', exc_info=True)
-            stdin = stdin.encode('utf-8', errors='ignore')
-    #log.debug('stdin: %s' % stdin)
+    if isinstance(stdin, unicode):
+        stdin = prepare_stdin(stdin)
 
     # Run
-    (returncode, stdoutdata, stderrdata) = tp(args, timeout=timeout,
-                                              stdin=stdin, cwd=dir, shell=False,
+    (returncode, stdoutdata, stderrdata, rusage, limit) = tp(args, timeout=timeout,
+                                              stdin=stdin, limits=limits, cwd=dir, shell=False,
                                               # This overrides all other locale environment variables
                                               #env={'LC_ALL': 'de_DE.UTF-8'},
                                               )
 
-    l = len(stdoutdata)
-    if l > MAX_DATA_LENGTH:
-        log.info('Truncating stdout of size %s', l)
-        msg = '\n=== OUTPUT TRUNCATED from %d to %d ===\n' % (l, MAX_DATA_LENGTH)
-        stdoutdata = msg + stdoutdata[:MAX_DATA_LENGTH] + msg
+    log.debug('Process returned: %d', returncode)
+#     log.debug('Process stdout: %s', stdoutdata.strip())
+#     log.debug('Process stderr: %s', stderrdata.strip())
+
+    return process(returncode, stdoutdata, stderrdata, rusage, limit)
 
+
+# Compiler versions by executable, so that version_cmd is only run once
+# per process and again when the compiler has been replaced
+_compiler_versions = {}
+
+
+def compiler_version(compiler):
+    '''Return the version string of compiler'''
     try:
-        stdoutdata = unicode(stdoutdata, encoding='utf-8')
-    except UnicodeDecodeError:
-        log.info('Encoding errors in execution', exc_info=True)
-        stdoutdata = unicode(stdoutdata, encoding='utf-8', errors='ignore')
+        st = os.stat(compiler.path)
+        key = (compiler.path, compiler.version_cmd, st.st_size, st.st_mtime)
+    except OSError:
+        return u''
+    if key not in _compiler_versions:
+        _compiler_versions[key] = compiler.version
+    return _compiler_versions[key]
+
 
-    l = len(stderrdata)
-    if l > MAX_DATA_LENGTH:
-        log.info('Truncating stderr of size %s', l)
-        msg = '\n=== OUTPUT TRUNCATED from %d to %d ===\n' % (l, MAX_DATA_LENGTH)
-        stderrdata = msg + stderrdata[:MAX_DATA_LENGTH] + msg
+class CompileCache(object):
+    '''On-disk cache for compilation results
 
+    Entries are addressed by a hash of everything that goes into the
+    compilation and contain the compileresult and a copy of the
+    workspace after compiling.
+    '''
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    @staticmethod
+    def key(compiler, source, srcfile, binfile, limits=None):
+        '''Compute the cache key for compiling source with compiler'''
+        h = sha256()
+        for part in (compiler.path, compiler.argv, compiler_version(compiler),
+                srcfile, binfile, source, repr(limits)):
+            h.update(unicode(part or u'').encode('utf-8'))
+            h.update('\0')
+        return h.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key)
+
+    def load(self, key, dir):  # pylint:disable=redefined-builtin
+        '''Restore the workspace for key into dir
+
+        Returns the cached compileresult or None.
+        '''
+        path = self._path(key)
+        if not os.path.isdir(path):
+            return None
+        try:
+            with open(os.path.join(path, 'compileresult.json')) as fd:
+                compilation = compileresult(**json.load(fd))
+            workspace = os.path.join(path, 'workspace')
+            for name in os.listdir(workspace):
+                src = os.path.join(workspace, name)
+                if os.path.isdir(src):
+                    copytree(src, os.path.join(dir, name), symlinks=True)
+                else:
+                    copy2(src, os.path.join(dir, name))
+        except (IOError, OSError, ValueError, TypeError):
+            log.warn('Could not load compilation %s from cache', key, exc_info=True)
+            return None
+        return compilation
+
+    def store(self, key, dir, compilation):  # pylint:disable=redefined-builtin
+        '''Store the workspace dir and compilation under key'''
+        path = self._path(key)
+        tempdir = None
+        try:
+            if not os.path.isdir(os.path.dirname(path)):
+                os.makedirs(os.path.dirname(path))
+            # Build the entry next to its final location and move it there
+            # in one step, so that concurrent runners never see partial entries
+            tempdir = mkdtemp(dir=self.directory)
+            copytree(dir, os.path.join(tempdir, 'workspace'), symlinks=True)
+            with open(os.path.join(tempdir, 'compileresult.json'), 'w') as fd:
+                json.dump(compilation._asdict(), fd)
+            os.rename(tempdir, path)
+            tempdir = None
+        except (IOError, OSError):
+            if not os.path.isdir(path):
+                log.warn('Could not store compilation %s in cache', key, exc_info=True)
+        finally:
+            if tempdir:
+                rmtree(tempdir, ignore_errors=True)
+
+
+class FixtureCache(object):
+    '''On-disk cache for prepared test input
+
+    Entries are addressed by test id and the hash of the input data,
+    so that the input data does not have to be loaded from the database
+    once it has been prepared. Entries are never modified after they
+    have been written.
+    '''
+
+    # How test input is prepared for stdin or for an input file
+    kinds = {
+        'stdin': prepare_stdin,
+        'file': lambda data: data.encode('utf-8'),
+    }
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def _path(self, test_id, input_hash, kind):
+        return os.path.join(self.directory, str(test_id), '%s.%s' % (input_hash, kind))
+
+    def load(self, test_id, input_hash, kind):
+        '''Return the prepared input or None'''
+        try:
+            with open(self._path(test_id, input_hash, kind), 'rb') as fd:
+                return fd.read()
+        except IOError:
+            return None
+
+    def store(self, test_id, input_hash, kind, data):
+        '''Store the prepared input'''
+        path = self._path(test_id, input_hash, kind)
+        try:
+            if not os.path.isdir(os.path.dirname(path)):
+                os.makedirs(os.path.dirname(path))
+            # Write next to the final location and move it there in one
+            # step, so that concurrent runners never see partial entries
+            (fd, tempfile) = mkstemp(dir=os.path.dirname(path))
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.chmod(tempfile, 0o444)
+            os.rename(tempfile, path)
+        except (IOError, OSError):
+            if not os.path.isfile(path):
+                log.warn('Could not store test input %s in cache', path, exc_info=True)
+
+    def prepare(self, test, kind):
+        '''Return the input of test prepared as kind, from the cache if possible'''
+        prepare = self.kinds[kind]
+        if not test.id or not test.input_hash:
+            return prepare(test.input_data or u'')
+        data = self.load(test.id, test.input_hash, kind)
+        if data is None:
+            data = prepare(test.input_data or u'')
+            self.store(test.id, test.input_hash, kind, data)
+        return data
+
+
+def _clean(dir):  # pylint:disable=redefined-builtin
+    '''Remove everything inside dir
+
+    Returns whether dir is empty afterwards.'''
     try:
-        stderrdata = unicode(stderrdata, encoding='utf-8')
-    except UnicodeDecodeError:
-        log.info('Encoding errors in execution', exc_info=True)
-        stderrdata = unicode(stderrdata, encoding='utf-8', errors='ignore')
+        for name in os.listdir(dir):
+            path = os.path.join(dir, name)
+            if os.path.isdir(path) and not os.path.islink(path):
+                rmtree(path)
+            else:
+                os.unlink(path)
+        return not os.listdir(dir)
+    except (IOError, OSError):
+        log.info('Could not clean workspace %s', dir, exc_info=True)
+        return False
+
+
+def _disk_usage(dir):  # pylint:disable=redefined-builtin
+    '''Return the number of bytes allocated for the files in dir'''
+    total = 0
+    for (root, dirs, files) in os.walk(dir):
+        for name in dirs + files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_blocks * 512
+            except OSError:  # pragma: no cover
+                pass
+    return total
 
-    log.debug('Process returned: %d', returncode)
-#     log.debug('Process stdout: %s', stdoutdata.strip())
-#     log.debug('Process stderr: %s', stderrdata.strip())
 
-    return process(returncode, stdoutdata, stderrdata)
+class WorkspacePool(object):
+    '''Pool of working directories for Runners
+
+    Directories are created below root, e.g. a tmpfs mount, or in the
+    default temporary directory. Up to size directories are kept after
+    use, emptied and handed out again, instead of creating and removing
+    one for every Runner.
+
+    Use WorkspacePool.get to share one pool per process.
+    '''
+
+    _pools = {}
+    _pools_lock = Lock()
+
+    def __init__(self, root=None, size=0):
+        self.root = root
+        self.size = int(size or 0)
+        self.free = []
+        self.lock = Lock()
+        if self.root and not os.path.isdir(self.root):
+            os.makedirs(self.root)
+        for _ in xrange(self.size):
+            self.free.append(self._create())
+
+    @classmethod
+    def get(cls, root=None, size=0):
+        '''Return the shared pool for root and size'''
+        key = (root or None, int(size or 0))
+        with cls._pools_lock:
+            if key not in cls._pools:
+                cls._pools[key] = cls(*key)
+                atexit.register(cls._pools[key].close)
+            return cls._pools[key]
+
+    def _create(self):
+        return mkdtemp(prefix='sauce-', dir=self.root)
+
+    def acquire(self):
+        '''Return an empty working directory'''
+        with self.lock:
+            if self.free:
+                return self.free.pop()
+        return self._create()
+
+    def release(self, dir):  # pylint:disable=redefined-builtin
+        '''Give back a working directory that is not used anymore'''
+        if self.size and _clean(dir):
+            with self.lock:
+                if len(self.free) < self.size:
+                    self.free.append(dir)
+                    return
+        rmtree(dir, ignore_errors=True)
+
+    def close(self):
+        '''Remove all directories in the pool'''
+        with self.lock:
+            free, self.free = self.free, []
+        for dir in free:  # pylint:disable=redefined-builtin
+            rmtree(dir, ignore_errors=True)
 
 
 class Runner(object):
@@ -307,20 +840,49 @@ class Runner(object):
         __del__
     '''
 
-    def __init__(self, submission):
+    def __init__(self, submission, parallel=None, compile_cache=None,
+            workspace_root=None, workspace_pool=None, workspace_quota=None,
+            fixture_cache=None):
         '''Initialize Runner object for given submission
 
         Creates temporary directory and saves source file
+
+        If parallel is greater than 1, up to that many tests are run at
+        the same time, each one in its own copy of the workspace.
+
+        If compile_cache is a directory, compilation results are reused
+        from there for identical sources.
+
+        Workspaces are created below workspace_root and up to
+        workspace_pool of them are reused, see WorkspacePool.
+        If workspace_quota is set, tests that leave more than that many
+        MB of files in their workspace fail.
+
+        If fixture_cache is a directory, prepared test input is reused
+        from there.
         '''
 
         self.submission = submission
         self.assignment = submission.assignment
         self.language = submission.language
+        self.interpreter = self.language.interpreter
 
         self.compilation = True if self.language.compiler else None
 
+        self.limits = resource_limits(self.assignment.resource_profile, self.language.resource_profile)
+
+        self.workspace_quota = int(workspace_quota or 0)
+        if self.workspace_quota:
+            # No single file may be larger than the whole workspace
+            self.limits = resource_limits(self.limits, limits(None, None, self.workspace_quota, None, None))
+
+        self.parallel = int(parallel or 0)
+        self.compile_cache = CompileCache(compile_cache) if compile_cache else None
+        self.fixture_cache = FixtureCache(fixture_cache) if fixture_cache else None
+        self.workspaces = WorkspacePool.get(workspace_root, workspace_pool)
+
         # Create temporary directory
-        self.tempdir = mkdtemp()
+        self.tempdir = self.workspaces.acquire()
         log.debug('tempdir: %s', self.tempdir)
 
         # Create temporary source file
@@ -358,7 +920,7 @@ class Runner(object):
         '''Removes temporary directory'''
         if self.tempdir:
             try:
-                rmtree(self.tempdir)
+                self.workspaces.release(self.tempdir)
             except:  # pragma: no cover
                 pass
             finally:
@@ -380,76 +942,201 @@ class Runner(object):
         '''
 
         if self.language.compiler:
+            key = None
+            if self.compile_cache:
+                key = self.compile_cache.key(self.language.compiler,
+                    self.submission.full_source, self.srcfile, self.binfile, self.limits)
+                self.compilation = self.compile_cache.load(key, self.tempdir)
+                if self.compilation:
+                    log.debug('Compilation %s loaded from cache', key)
+                    return self.compilation
             start = time()
-            (returncode, stdoutdata, stderrdata) = compile(self.language.compiler, self.tempdir, self.srcfile, self.binfile)
+            (returncode, stdoutdata, stderrdata, _, _) = compile(self.language.compiler,
+                self.tempdir, self.srcfile, self.binfile, self.limits)
             end = time()
             self.compilation = compileresult(returncode == 0, end - start, stdoutdata, stderrdata)
+            if key:
+                self.compile_cache.store(key, self.tempdir, self.compilation)
         else:
             self.compilation = None
         return self.compilation
 
-    def test(self, **kwargs):
-        '''Run all associated test cases
+    def _prepare(self, test):
+        '''Collect all test data needed for running test
 
-        Keeps going, even if one test fails.
+        Only this method touches the test object, so that the returned
+        job can be run outside of the request thread.
         '''
+        if test.input_type == 'file':
+            input_filename = test.input_filename or 'indata'
+            input_data = self._fixture(test, 'file')
+            stdin = None
+        else:
+            input_filename = None
+            input_data = None
+            stdin = self._fixture(test, 'stdin')
 
-        if kwargs:  # pragma: no cover
-            from warnings import warn
-            warn('Runner.test() invoked with arguments: %r' % (kwargs), stacklevel=2)
+        if test.output_type == 'file':
+            output_filename = test.output_filename or 'outdata'
+        else:
+            output_filename = None
 
-        if not self.compilation or self.compilation.result:
-            tests = self.assignment.tests
+        return testjob(test.timeout, test.argv, stdin,
+                       input_filename, input_data, output_filename,
+                       resource_limits(test.resource_profile, self.limits))
 
-            for test in tests:
+    def _fixture(self, test, kind):
+        '''Return the input of test prepared for stdin or an input file'''
+        if self.fixture_cache:
+            return self.fixture_cache.prepare(test, kind)
+        return FixtureCache.kinds[kind](test.input_data or u'')
 
-                # Write test file, if needed
-                if test.input_type == 'file':
-                    with open(os.path.join(self.tempdir, test.input_filename or 'indata'), 'w') as infd:
-                        infd.write(test.input_data.encode('utf-8'))
-                    input = None  # pylint:disable=redefined-builtin
-                else:
-                    input = test.input_data  # pylint:disable=redefined-builtin
-
-                # Create output file for convenience
-                if test.output_type == 'file':
-                    with open(os.path.join(self.tempdir, test.output_filename or 'outdata'), 'w') as outfd:
-                        pass
-
-                # Parse argv, if needed
-                if test.argv:
-                    a = test.argv.replace('{infile}', os.path.join(self.tempdir, test.input_filename or 'indata'))
-                    a = a.replace('{outfile}', os.path.join(self.tempdir, test.output_filename or 'outdata'))
-                    a = a.replace('{path}', self.tempdir)
-                else:
-                    a = ''
+    def _run(self, job, dir):  # pylint:disable=redefined-builtin
+        '''Run a prepared test job in working directory dir
 
-                start = time()
-                process = execute(self.language.interpreter, test.timeout,
-                                  self.tempdir, self.basename, self.binfile, input, a)
-                end = time()
-                runtime = end - start
+        @return: (process, runtime, output)
+        '''
 
-                if test.output_type == 'file':
-                    with open(os.path.join(self.tempdir, test.output_filename or 'outdata'), 'r') as outfd:
-                        output = outfd.read()
-                        try:
-                            output = unicode(output, encoding='utf-8')
-                        except UnicodeDecodeError:
-                            log.info('Encoding errors in test %r', test, exc_info=True)
-                            output = unicode(output, encoding='utf-8', errors='ignore')
-                else:
-                    output = process.stdout
+        # Write test file, if needed
+        if job.input_filename:
+            with open(os.path.join(dir, job.input_filename), 'wb') as infd:
+                infd.write(job.input_data)
 
-                (result, partial, output_test, output_data, error) = test.validate(output)
+        # Create output file for convenience
+        if job.output_filename:
+            with open(os.path.join(dir, job.output_filename), 'w') as outfd:
+                pass
 
-                if result or not test.ignore_returncode and process.returncode != 0:
-                    yield testresult(result, partial, test, runtime,
-                                     output_test, output_data,
-                                     process.stderr + error, process.returncode)
-                else:
-                    yield testresult(False, partial, test, runtime,
-                                     output_test, output_data,
-                                     process.stderr + error, process.returncode)
+        # Parse argv, if needed
+        if job.argv:
+            a = job.argv.replace('{infile}', os.path.join(dir, job.input_filename or 'indata'))
+            a = a.replace('{outfile}', os.path.join(dir, job.output_filename or 'outdata'))
+            a = a.replace('{path}', dir)
+        else:
+            a = ''
+
+        start = time()
+        process = execute(self.interpreter, job.timeout,
+                          dir, self.basename, self.binfile, job.stdin, a, job.limits)
+        end = time()
+        runtime = end - start
+
+        if job.output_filename:
+            with open(os.path.join(dir, job.output_filename), 'r') as outfd:
+                output = outfd.read()
+                try:
+                    output = unicode(output, encoding='utf-8')
+                except UnicodeDecodeError:
+                    log.info('Encoding errors in test output file %s', job.output_filename, exc_info=True)
+                    output = unicode(output, encoding='utf-8', errors='ignore')
+        else:
+            output = process.stdout
+
+        if self.workspace_quota and _disk_usage(dir) > self.workspace_quota * 1024 * 1024:
+            process = process._replace(limit='workspace',
+                stderr=process.stderr + u'\nResource limit exceeded: %s\n' % LIMIT_NAMES['workspace'])
+
+        return (process, runtime, output)
+
+    def _run_copy(self, job, stop=None):
+        '''Run a prepared test job in a private copy of the workspace
+
+        Returns None without running the job if the Event stop is set.
+        '''
+        if stop is not None and stop.is_set():
+            return None
+        tempdir = self.workspaces.acquire()
+        try:
+            workdir = os.path.join(tempdir, 'workspace')
+            copytree(self.tempdir, workdir, symlinks=True)
+            return self._run(job, workdir)
+        finally:
+            self.workspaces.release(tempdir)
+
+    def _result(self, test, process, runtime, output):
+        '''Validate the output of a test run'''
+
+        (result, partial, output_test, output_data, error) = test.validate(output)
+
+        if process.returncode == -1 or process.limit == 'workspace':
+            # Timeout occurred, so the output is probably incomplete,
+            # or the test left too much data behind
+            result = False
+
+        if result or not test.ignore_returncode and process.returncode != 0:
+            return testresult(result, partial, test, runtime,
+                              output_test, output_data,
+                              process.stderr + error, process.returncode, process.usage,
+                              process.limit)
+        else:
+            return testresult(False, partial, test, runtime,
+                              output_test, output_data,
+                              process.stderr + error, process.returncode, process.usage,
+                              process.limit)
+
+    @staticmethod
+    def _skipped(test):
+        '''Result for a test that was not run'''
+        return testresult(False, False, test, 0.0, None, u'', u'', None, skipped=True)
+
+    def test(self, max_failures=None, failure_rates=None, **kwargs):
+        '''Run all associated test cases
+
+        Keeps going, even if one test fails, unless max_failures is set:
+        For a staged run, the tests are run in the order of their
+        failure_rates (a dict of test id and rate, highest first) and
+        after max_failures failed tests, the remaining tests are skipped.
+
+        Results are yielded in the order in which the tests are run,
+        which is the order of the assignment's tests for a full run,
+        regardless of whether the tests are run in parallel or not.
+        Skipped tests come last.
+        '''
+
+        if kwargs:  # pragma: no cover
+            from warnings import warn
+            warn('Runner.test() invoked with arguments: %r' % (kwargs), stacklevel=2)
+
+        if not self.compilation or self.compilation.result:
+            tests = list(self.assignment.tests)
+            if max_failures:
+                rates = failure_rates or {}
+                # sorted is stable, so tests with the same rate stay in order
+                tests = sorted(tests, key=lambda t: -rates.get(t.id, 0.0))
+            done, failures = 0, 0
+
+            if self.parallel > 1 and len(tests) > 1:
+                # Test data has to be fetched here, the pool threads
+                # must not use the database session
+                jobs = [self._prepare(test) for test in tests]
+                workers = min(self.parallel, len(jobs))
+                log.debug('Running %d tests with %d workers', len(jobs), workers)
+                pool = ThreadPool(workers)
+                # The pool threads can't be stopped, but they skip the
+                # queued jobs once the results are not needed anymore
+                stop = Event()
+                try:
+                    for test, run in izip(tests, pool.imap(partial(self._run_copy, stop=stop), jobs)):
+                        r = self._result(test, *run)
+                        yield r
+                        done, failures = done + 1, failures + (not r.result)
+                        if max_failures and failures >= max_failures:
+                            break
+                finally:
+                    stop.set()
+                    pool.terminate()
+                    pool.join()
+            else:
+                for test in tests:
+                    r = self._result(test, *self._run(self._prepare(test), self.tempdir))
+                    yield r
+                    done, failures = done + 1, failures + (not r.result)
+                    if max_failures and failures >= max_failures:
+                        break
+
+            if done < len(tests):
+                log.debug('Skipping %d tests after %d failures', len(tests) - done, failures)
+                for test in tests[done:]:
+                    yield self._skipped(test)
         else:
             log.info('Compilation failed, can\'t run tests for Submission %r', self.submission)
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+'''Grading worker
+
+Picks up queued GradingJobs and runs the tests of their submissions,
+so that the web application does not have to wait for them.
+
+Set grading.queue = true in the configuration file of the web
+application and start one or more workers with the same configuration:
+
+    sauce-worker production.ini
+'''
+#
+## SAUCE - System for AUtomated Code Evaluation
+## Copyright (C) 2013 Moritz Schlarb
+##
+## This program is free software: you can redistribute it and/or modify
+## it under the terms of the GNU Affero General Public License as published by
+## the Free Software Foundation, either version 3 of the License, or
+## any later version.
+##
+## This program is distributed in the hope that it will be useful,
+## but WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+## GNU Affero General Public License for more details.
+##
+## You should have received a copy of the GNU Affero General Public License
+## along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+import os
+import sys
+import signal
+import socket
+import logging
+import traceback
+from argparse import ArgumentParser
+from logging.config import fileConfig
+from time import sleep
+
+import transaction
+
+log = logging.getLogger(__name__)
+
+
+def load_config(filename):
+    '''Load the application environment from the configuration file'''
+    from paste.deploy import appconfig
+    from sauce.config.environment import load_environment
+
+    filename = os.path.abspath(filename)
+    try:
+        fileConfig(filename, dict(__file__=filename, here=os.path.dirname(filename)))
+    except Exception:  # pragma: no cover
+        logging.basicConfig(level=logging.INFO)
+        log.warn('Could not configure logging from %s', filename, exc_info=True)
+    conf = appconfig('config:' + filename)
+    load_environment(conf.global_conf, conf.local_conf)
+
+
+def process(worker):
+    '''Claim and run one job from the queue
+
+    Returns whether there was a job to process.
+    '''
+    from sauce.model import GradingJob
+
+    job_id = GradingJob.claim(worker)
+    # Make the claim visible to the other workers
+    transaction.commit()
+    if job_id is None:
+        return False
+
+    log.info('Worker %s processing grading job %d', worker, job_id)
+    try:
+        job = GradingJob.query.get(job_id)
+        job.run()
+        transaction.commit()
+    except Exception:
+        log.exception('Grading job %d failed', job_id)
+        transaction.abort()
+        job = GradingJob.query.get(job_id)
+        job.fail(traceback.format_exc().decode('utf-8', 'ignore'))
+        transaction.commit()
+    return True
+
+
+def parse_args(argv=None):
+    parser = ArgumentParser(description='Run queued grading jobs for SAUCE')
+    parser.add_argument('conf_file', help='configuration to use')
+    parser.add_argument('--name', default='%s:%d' % (socket.gethostname(), os.getpid()),
+        help='worker name recorded on the jobs (default: hostname:pid)')
+    parser.add_argument('--interval', type=float, default=1.0,
+        help='seconds to wait between polls of an empty queue (default: %(default)s)')
+    parser.add_argument('--stale', type=int, default=3600,
+        help='seconds after which running jobs of other workers are requeued (default: %(default)s)')
+    parser.add_argument('--once', action='store_true',
+        help='exit as soon as the queue is empty')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    load_config(args.conf_file)
+
+    from sauce.model import GradingJob
+    from sauce.lib.runner import stray_processes
+
+    running = [True]
+
+    def stop(signum, frame):  # pylint:disable=unused-argument
+        log.info('Worker %s stopping after the current job', args.name)
+        running[0] = False
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    log.info('Worker %s started', args.name)
+    while running[0]:
+        requeued = GradingJob.requeue_stale(args.stale)
+        if requeued:
+            log.warn('Requeued %d stale grading job(s)', requeued)
+        transaction.commit()
+
+        if not process(args.name):
+            if args.once:
+                break
+            sleep(args.interval)
+    log.info('Worker %s stopped, %d stray test process(es) killed',
+        args.name, stray_processes[0])
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -33,12 +33,14 @@ __all__ = (
     'DBSession', 'DeclarativeBase', 'metadata',
     'Group', 'Permission',
     'Assignment', 'Sheet',
+    'Blob',
     'Event', 'Contest', 'Course', 'Lesson',
-    'Language', 'Compiler', 'Interpreter',
+    'GradingJob', 'GradingMemo', 'GradingMemoCounter',
+    'Language', 'Compiler', 'Interpreter', 'ResourceProfile',
     'LTI',
     'NewsItem',
     'Submission', 'Judgement',
-    'Test', 'Testrun',
+    'Test', 'Testrun', 'TestrunArchive',
     'User', 'Team',
 )
 
@@ -99,11 +101,15 @@ def init_model(engine):
 
 # Import your model modules here.
 
+from sauce.model.archive import TestrunArchive
 from sauce.model.assignment import Assignment, Sheet
 from sauce.model.auth import Group, Permission
+from sauce.model.blob import Blob
 from sauce.model.event import Contest, Course, Event, Lesson
-from sauce.model.language import Compiler, Interpreter, Language
+from sauce.model.grading import GradingJob, GradingMemo, GradingMemoCounter
+from sauce.model.language import Compiler, Interpreter, Language, ResourceProfile
 from sauce.model.lti import LTI
+from sauce.model.membership import changed_memberships, update_membership
 from sauce.model.news import NewsItem
 from sauce.model.submission import Judgement, Submission
 from sauce.model.test import Test, Testrun
@@ -126,6 +132,7 @@ def _lesson_team_members(session, flush_context, instances):
     except:  # pragma: no cover
         log.exception('lesson_team_members failed')
 
+
 _event.listen(DBSession, 'before_flush', _lesson_team_members)
 
 
@@ -148,6 +155,7 @@ def _event_lesson_members(session, flush_context, instances):
     except:  # pragma: no cover
         log.exception('event_lesson_members failed')
 
+
 _event.listen(DBSession, 'before_flush', _event_lesson_members)
 
 
@@ -161,4 +169,83 @@ def _test_visibility(session, flush_context, instances):
     except:  # pragma: no cover
         log.exception('test_visibility failed')
 
+
 _event.listen(DBSession, 'before_flush', _test_visibility)
+
+
+def _test_expected_output(session, flush_context):
+    '''Remember new and edited tests for storing their expected output'''
+    try:
+        session.info.setdefault('expected_output_tests', set()).update(
+            obj for obj in session.new | session.dirty
+            if isinstance(obj, Test) and session.is_modified(obj))
+    except:  # pragma: no cover
+        log.exception('test_expected_output failed')
+
+
+def _store_expected_output(session, flush_context):
+    '''Store the expected output of the remembered tests
+
+    Only after the flush, so that the column defaults of new tests are
+    already set.
+    '''
+    try:
+        for obj in session.info.pop('expected_output_tests', ()):
+            if obj in session:
+                obj.store_expected_output()
+    except:  # pragma: no cover
+        log.exception('store_expected_output failed')
+
+
+_event.listen(DBSession, 'after_flush', _test_expected_output)
+_event.listen(DBSession, 'after_flush_postexec', _store_expected_output)
+
+
+def _testrun_summaries(session, flush_context):
+    '''Remember the submissions whose testruns are deleted by the unit of work,
+    e.g. because their test has been deleted'''
+    try:
+        session.info.setdefault('testrun_summaries', set()).update(
+            obj.submission_id for obj in session.deleted if isinstance(obj, Testrun))
+    except:  # pragma: no cover
+        log.exception('testrun_summaries failed')
+
+
+def _update_summaries(session, flush_context):
+    '''Compute the summary columns of the remembered submissions again'''
+    try:
+        ids = session.info.pop('testrun_summaries', set()) - set([None])
+        if ids:
+            Submission.update_summaries(list(ids))
+            for obj in session.identity_map.values():
+                if isinstance(obj, Submission) and obj.id in ids:
+                    session.expire(obj, Submission.summary_columns)
+    except:  # pragma: no cover
+        log.exception('update_summaries failed')
+
+
+_event.listen(DBSession, 'after_flush', _testrun_summaries)
+_event.listen(DBSession, 'after_flush_postexec', _update_summaries)
+
+
+def _event_membership(session, flush_context):
+    '''Update the event_membership rows of the teachers, tutors and
+    members, lessons and teams that have been changed'''
+    try:
+        pairs, entities = changed_memberships(session)
+        if pairs or any(entities.itervalues()):
+            update_membership(session.connection(), pairs, entities)
+    except:  # pragma: no cover
+        # Stale memberships would grant or deny access, so don't go on
+        log.exception('event_membership failed')
+        raise
+
+
+_event.listen(DBSession, 'after_flush', _event_membership)
+
+
+# Reference counting for the large texts in the blobs table
+for _model in (Submission, Judgement, Test, Testrun):
+    Blob.track(_model)
+_event.listen(GradingMemo, 'after_insert', GradingMemo.acquire_blobs)
+_event.listen(GradingMemo, 'after_delete', GradingMemo.release_blobs)
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+'''Archive model module
+
+Testruns of events that are over are moved out of the testruns table
+into one compressed row per submission, so that the hot tables and
+their indexes stay small. Archived testruns can still be shown, they
+are unpacked into Testrun objects that are never added to the session.
+'''
+#
+## SAUCE - System for AUtomated Code Evaluation
+## Copyright (C) 2013 Moritz Schlarb
+##
+## This program is free software: you can redistribute it and/or modify
+## it under the terms of the GNU Affero General Public License as published by
+## the Free Software Foundation, either version 3 of the License, or
+## any later version.
+##
+## This program is distributed in the hope that it will be useful,
+## but WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+## GNU Affero General Public License for more details.
+##
+## You should have received a copy of the GNU Affero General Public License
+## along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+import json
+import logging
+from datetime import datetime
+
+from sqlalchemy import Column, ForeignKey
+from sqlalchemy.orm import backref, deferred, relationship
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.types import DateTime, Integer, LargeBinary, Unicode
+
+from sauce.model import DBSession, DeclarativeBase
+from sauce.model.blob import Blob
+from sauce.model.test import Test, Testrun
+
+try:
+    from nose.tools import nottest
+except ImportError:  # pragma: no cover
+    from decorator import decorator
+    nottest = decorator
+
+log = logging.getLogger(__name__)
+
+__all__ = ('TestrunArchive', )
+
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S.%f'
+
+# Columns of testruns that are archived as they are
+archived_columns = ('id', 'date', 'test_id', 'runtime', 'user_time', 'system_time', 'max_rss',
+    'limit_hit', 'result', 'partial', 'skipped')
+
+
+@nottest
+class TestrunArchive(DeclarativeBase):
+    '''The archived testruns of a submission'''
+    __tablename__ = 'testrun_archives'
+
+    submission_id = Column(Integer, ForeignKey('submissions.id'), primary_key=True, nullable=False)
+    submission = relationship('Submission',
+        backref=backref('testrun_archive',
+            uselist=False,
+            cascade='all, delete-orphan',
+        ),
+        doc='Submission whose testruns are archived'
+    )
+
+    archived = Column(DateTime, nullable=False, default=datetime.now,
+        doc='Date when the testruns were archived')
+    count = Column(Integer, nullable=False, default=0,
+        doc='Number of archived testruns')
+
+    compression = Column(Unicode(8), nullable=True,
+        doc='zlib, lzma or None for uncompressed data')
+    size = Column(Integer, nullable=False,
+        doc='Size of the uncompressed data in bytes')
+    data = deferred(Column(LargeBinary(), nullable=False),
+        doc='The (compressed) testruns as JSON')
+
+    def __repr__(self):
+        return (u'<TestrunArchive: submission_id=%r, count=%r>'
+            % (self.submission_id, self.count)
+        ).encode('utf-8')
+
+    def __unicode__(self):
+        return u'Archived testruns of Submission %s' % (self.submission_id or '')
+
+    @staticmethod
+    def dump(testrun):
+        '''Return testrun as dict that can be serialized to JSON'''
+        d = dict((c, getattr(testrun, c)) for c in archived_columns)
+        d['date'] = d['date'].strftime(DATE_FORMAT)
+        d['output_data'] = testrun.output_data
+        d['error_data'] = testrun.error_data
+        return d
+
+    @classmethod
+    def archive(cls, submission):
+        '''Move the testruns of submission into the archive
+
+        The summary columns of submission are kept as they are.
+        Returns the number of archived testruns.
+        '''
+        testruns = sorted(set(submission.testruns), key=lambda t: (t.date, t.id))
+        if not testruns:
+            return 0
+        if submission.testrun_archive:
+            log.warn('Replacing archived testruns of Submission %d', submission.id)
+        archive = cls(count=len(testruns),
+            **Blob.pack(unicode(json.dumps([cls.dump(t) for t in testruns]))))
+        submission.testrun_archive = archive
+        DBSession.flush()
+        submission.delete_testruns(keep_summary=True)
+        return len(testruns)
+
+    def load(self):
+        '''Return the archived testruns as Testrun objects
+
+        The objects are not added to the session, they are only there
+        for displaying them.
+        '''
+        rows = json.loads(Blob.unpack(self.compression, self.data))
+        tests = dict((t.id, t) for t in
+            Test.query.filter(Test.id.in_(set(r['test_id'] for r in rows)))) if rows else {}
+        testruns = []
+        for r in rows:
+            test = tests.get(r['test_id'])
+            if test is None:
+                # The test has been deleted in the meantime
+                continue
+            testrun = Testrun()
+            for c in archived_columns:
+                setattr(testrun, c, r[c])
+            testrun.date = datetime.strptime(r['date'], DATE_FORMAT)
+            testrun.output_data = r['output_data']
+            testrun.error_data = r['error_data']
+            # Without the backrefs, so that the objects don't end up in the session
+            set_committed_value(testrun, 'test', test)
+            set_committed_value(testrun, 'submission', self.submission)
+            testruns.append(testrun)
+        return testruns
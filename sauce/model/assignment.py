@@ -76,6 +76,10 @@ class Assignment(DeclarativeBase):
 
     timeout = Column(Float, nullable=True, default=10.0)
 
+    resource_profile_id = Column(Integer, ForeignKey('resource_profiles.id'), nullable=True)
+    resource_profile = relationship('ResourceProfile', backref='assignments',
+        doc='Resource limits for the submissions, taking precedence over the ones of the language')
+
     allowed_languages = relationship('Language', secondary=language_to_assignment)
 
     show_compiler_msg = Column(Boolean, nullable=False, default=True)
@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+'''Content-addressed storage for large texts
+
+Large texts like source code and test output are stored only once in
+the blobs table, keyed by their SHA-256 and compressed. The models keep
+the hash in a column and access the text through a BlobText attribute.
+Blobs are reference counted and removed when nothing refers to them
+anymore.
+'''
+#
+## SAUCE - System for AUtomated Code Evaluation
+## Copyright (C) 2013 Moritz Schlarb
+##
+## This program is free software: you can redistribute it and/or modify
+## it under the terms of the GNU Affero General Public License as published by
+## the Free Software Foundation, either version 3 of the License, or
+## any later version.
+##
+## This program is distributed in the hope that it will be useful,
+## but WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+## GNU Affero General Public License for more details.
+##
+## You should have received a copy of the GNU Affero General Public License
+## along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+import logging
+import zlib
+from collections import Counter
+from hashlib import sha256
+from os.path import commonprefix
+
+try:
+    import lzma
+except ImportError:  # pragma: no cover
+    try:
+        from backports import lzma
+    except ImportError:
+        lzma = None
+
+from tg import config
+from sqlalchemy import Column, event, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import attributes, deferred, object_session
+from sqlalchemy.sql.expression import bindparam
+from sqlalchemy.types import Integer, LargeBinary, String, Unicode
+
+from sauce.model import DBSession, DeclarativeBase
+
+log = logging.getLogger(__name__)
+
+__all__ = ('Blob', 'BlobText', 'delta', 'patch')
+
+# Texts shorter than that many bytes are not compressed
+MIN_COMPRESS_SIZE = 256
+
+# Number of characters that are compared at once when looking for the
+# common prefix and suffix of two texts
+COMPARE_BLOCKSIZE = 64 * 1024
+
+
+def _common_prefix(a, b):
+    '''Length of the common prefix of a and b'''
+    n = min(len(a), len(b))
+    i = 0
+    while i < n:
+        j = min(i + COMPARE_BLOCKSIZE, n)
+        if a[i:j] != b[i:j]:
+            return i + len(commonprefix([a[i:j], b[i:j]]))
+        i = j
+    return n
+
+
+def delta(base, text):
+    '''Return text as a delta against base, or None if that does not save much
+
+    The delta consists of the length of the common prefix and suffix
+    of both texts and the part of text in between, which is enough for
+    output that is cut off or differs in one place only.
+    '''
+    prefix = _common_prefix(base, text)
+    suffix = _common_prefix(base[prefix:][::-1], text[prefix:][::-1])
+    d = u'%d %d\n%s' % (prefix, suffix, text[prefix:len(text) - suffix])
+    if len(d) * 2 > len(text):
+        return None
+    return d
+
+
+def patch(base, d):
+    '''Return the text that d is the delta of against base'''
+    header, _, middle = d.partition(u'\n')
+    prefix, suffix = map(int, header.split())
+    return base[:prefix] + middle + base[len(base) - suffix:]
+
+
+class Blob(DeclarativeBase):
+    '''A text, stored once for everything that refers to it'''
+    __tablename__ = 'blobs'
+
+    hash = Column(String(64), primary_key=True, nullable=False,  # pylint:disable=redefined-builtin
+        doc='SHA-256 of the UTF-8 encoded text')
+
+    compression = Column(Unicode(8), nullable=True,
+        doc='zlib, lzma or None for uncompressed data')
+    size = Column(Integer, nullable=False,
+        doc='Size of the UTF-8 encoded text in bytes')
+    data = deferred(Column(LargeBinary(), nullable=False),
+        doc='The (compressed) UTF-8 encoded text')
+
+    refcount = Column(Integer, nullable=False, default=0,
+        doc='Number of references to this blob')
+
+    def __repr__(self):
+        return (u'<Blob: hash=%r, size=%r, refcount=%r>'
+            % (self.hash, self.size, self.refcount)
+        ).encode('utf-8')
+
+    @staticmethod
+    def coerce(value):
+        '''Return value as unicode like a Unicode column would store it'''
+        if value is None or isinstance(value, unicode):
+            return value
+        if isinstance(value, str):
+            return value.decode('utf-8')
+        return unicode(value)
+
+    @staticmethod
+    def hash_text(text):
+        '''Return the key of the blob for text'''
+        return sha256(text.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def pack(text, compression=None):
+        '''Return the column values for storing text
+
+        The compression method is taken from blobs.compression if not
+        given, and not used if it does not make the data smaller.
+        '''
+        data = text.encode('utf-8')
+        compression = compression or config.get('blobs.compression', 'zlib')
+        packed, method = data, None
+        if len(data) >= MIN_COMPRESS_SIZE:
+            if compression == 'zlib':
+                packed, method = zlib.compress(data), u'zlib'
+            elif compression == 'lzma' and lzma:
+                packed, method = lzma.compress(data), u'lzma'
+            if len(packed) >= len(data):
+                packed, method = data, None
+        return dict(compression=method, size=len(data), data=packed)
+
+    @staticmethod
+    def unpack(compression, data):
+        '''Return the text from the stored column values'''
+        data = bytes(data)
+        if compression == 'zlib':
+            data = zlib.decompress(data)
+        elif compression == 'lzma':
+            if not lzma:  # pragma: no cover
+                raise ValueError('Blob is compressed with lzma, but lzma is not available')
+            data = lzma.decompress(data)
+        return data.decode('utf-8')
+
+    @classmethod
+    def load(cls, hash, session=None):  # pylint:disable=redefined-builtin
+        '''Return the text stored under hash'''
+        session = session or DBSession
+        row = (session.query(cls.compression, cls.data).filter(cls.hash == hash)
+            .autoflush(False).first())
+        if row is None:
+            raise KeyError('Blob %s not found' % hash)
+        return cls.unpack(*row)
+
+    @classmethod
+    def acquire(cls, connection, counts, texts):
+        '''Add references to blobs, storing the missing ones
+
+        counts is a dict of hashes and the number of new references and
+        texts has to contain the text of all blobs that may be missing.
+
+        The existing blobs are locked until the end of the transaction,
+        so that a concurrent release can not delete them before their
+        references are added.
+        '''
+        if not counts:
+            return
+        table = cls.__table__
+
+        def lock(hashes):
+            return set(row[0] for row in connection.execute(
+                select([table.c.hash]).where(table.c.hash.in_(hashes)).with_for_update()))
+
+        existing = lock(list(counts))
+        missing = [h for h in counts if h not in existing]
+        if missing:
+            rows = []
+            for h in missing:
+                row = cls.pack(texts[h])
+                row.update(hash=h, refcount=counts[h])
+                rows.append(row)
+            try:
+                if connection.dialect.name == 'sqlite':
+                    # Savepoints don't work with pysqlite, but SQLite
+                    # does not allow concurrent writes anyway
+                    connection.execute(table.insert(), rows)
+                else:
+                    with connection.begin_nested():
+                        connection.execute(table.insert(), rows)
+            except IntegrityError:
+                # Another transaction stored some of them in the meantime
+                log.debug('Blobs stored concurrently')
+                stored = lock(missing)
+                rows = [r for r in rows if r['hash'] not in stored]
+                if rows:
+                    connection.execute(table.insert(), rows)
+                existing.update(stored)
+        if existing:
+            connection.execute(table.update().where(table.c.hash == bindparam('h'))
+                .values(refcount=table.c.refcount + bindparam('n')),
+                [dict(h=h, n=counts[h]) for h in existing])
+
+    @classmethod
+    def release(cls, connection, counts):
+        '''Remove references to blobs, deleting the ones that are not used anymore
+
+        Whether a blob is deleted or its refcount is decremented is
+        decided by the statement that does it, from the refcount at
+        that time.
+        '''
+        if not counts:
+            return
+        table = cls.__table__
+        params = [dict(h=h, n=n) for (h, n) in counts.iteritems()]
+        connection.execute(table.delete().where(table.c.hash == bindparam('h'))
+            .where(table.c.refcount <= bindparam('n')), params)
+        connection.execute(table.update().where(table.c.hash == bindparam('h'))
+            .where(table.c.refcount > bindparam('n'))
+            .values(refcount=table.c.refcount - bindparam('n')), params)
+
+    @classmethod
+    def track(cls, model):
+        '''Keep the references of the BlobText attributes of model up to date'''
+        keys = [attr.key for attr in vars(model).itervalues() if isinstance(attr, BlobText)]
+
+        def acquire(mapper, connection, target):
+            counts, texts = Counter(), {}
+            for key in keys:
+                for h in attributes.get_history(target, key).added:
+                    if h:
+                        counts[h] += 1
+                        texts[h] = target.__dict__.get('_blobs', {}).get(h)
+            cls.acquire(connection, counts, texts)
+
+        def release_old(mapper, connection, target):
+            counts = Counter()
+            for key in keys:
+                counts.update(h for h in attributes.get_history(target, key).deleted if h)
+            cls.release(connection, counts)
+
+        def release(mapper, connection, target):
+            counts = Counter()
+            for key in keys:
+                history = attributes.get_history(target, key)
+                counts.update(h for h in (history.deleted or history.unchanged) if h)
+            cls.release(connection, counts)
+
+        event.listen(model, 'before_insert', acquire)
+        event.listen(model, 'before_update', acquire)
+        event.listen(model, 'after_update', release_old)
+        event.listen(model, 'after_delete', release)
+
+
+class BlobText(object):
+    '''A text attribute whose value is stored as Blob
+
+    key is the name of the mapped column that holds the hash of the
+    text. The text is loaded when it is accessed first.
+    The model has to be registered with Blob.track.
+    '''
+
+    def __init__(self, key, doc=None):
+        self.key = key
+        self.__doc__ = doc
+
+    def __get__(self, obj, cls):
+        if obj is None:
+            return self
+        h = getattr(obj, self.key)
+        if h is None:
+            return None
+        blobs = obj.__dict__.setdefault('_blobs', {})
+        try:
+            return blobs[h]
+        except KeyError:
+            text = blobs[h] = Blob.load(h, object_session(obj))
+            return text
+
+    def __set__(self, obj, value):
+        value = Blob.coerce(value)
+        if value is None:
+            setattr(obj, self.key, None)
+            return
+        h = Blob.hash_text(value)
+        obj.__dict__.setdefault('_blobs', {})[h] = value
+        setattr(obj, self.key, h)
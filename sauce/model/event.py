@@ -24,14 +24,14 @@
 from datetime import datetime, timedelta
 from warnings import warn
 
-from sqlalchemy import Column, ForeignKey, Index, Table, UniqueConstraint, union
+from sqlalchemy import Column, ForeignKey, Index, Table, UniqueConstraint
 from sqlalchemy.inspection import inspect
 from sqlalchemy.orm import backref, relationship
 from sqlalchemy.types import Boolean, DateTime, Enum, Integer, String, Unicode
 
 from sauce.lib.helpers import link
 from sauce.model import DeclarativeBase, metadata
-from sauce.model.user import Team, User, event_members, lesson_members, team_members
+from sauce.model.user import Team, User, event_members, lesson_members, membership_user_ids
 
 
 __all__ = ('Event', 'Course', 'Contest', 'Lesson')
@@ -185,10 +185,12 @@ class Event(DeclarativeBase):
 
     @property
     def teams(self):
-        t = set()
-        for l in self.lessons:
-            t |= set(l.teams)
-        return t
+        if self.id is None:
+            t = set()
+            for l in self.lessons:
+                t |= set(l.teams)
+            return t
+        return set(Team.query.join(Lesson).filter(Lesson.event_id == self.id))
 
     @property
     def children(self):
@@ -210,18 +212,22 @@ class Event(DeclarativeBase):
 
     @property
     def tutors(self):
-        tuts = set()
-        for l in self.lessons:
-            tuts |= set(l.tutors)
-        return tuts
+        if self.id is None:
+            tuts = set()
+            for l in self.lessons:
+                tuts |= set(l.tutors)
+            return tuts
+        return set(self.tutors_query())
         # return [l.tutor for l in self.lessons]
 
     @property
     def members(self):
-        studs = set(self._members)
-        for l in self.lessons:
-            studs |= set(l.members)
-        return studs
+        if self.id is None:
+            studs = set(self._members)
+            for l in self.lessons:
+                studs |= set(l.members)
+            return studs
+        return set(self.members_query())
 
     @property
     def students(self):  # pragma: no cover
@@ -231,20 +237,14 @@ class Event(DeclarativeBase):
     def members_query(self, qry=None):
         if not qry:
             qry = User.query
-        qry = qry.select_entity_from(union(
-            qry.join(event_members).join(Event)
-                .filter_by(id=self.id).order_by(None),
-            qry.join(lesson_members).join(Lesson)
-                .filter_by(event_id=self.id).order_by(None),
-            qry.join(team_members).join(Team).join(Lesson)
-                .filter_by(event_id=self.id).order_by(None),
-        )).order_by(User.user_name)
+        qry = (qry.filter(User.id.in_(membership_user_ids(u'member', event_id=self.id)))
+            .order_by(User.user_name))
         return qry
 
     def tutors_query(self, qry=None):
         if not qry:
             qry = User.query
-        qry = qry.join(lesson_tutors).join(Lesson).filter_by(event_id=self.id)
+        qry = qry.filter(User.id.in_(membership_user_ids(u'tutor', event_id=self.id)))
         return qry
 
     #----------------------------------------------------------------------------
@@ -433,18 +433,18 @@ class Lesson(DeclarativeBase):
 
     @property
     def members(self):
-        s = set(self._members)
-        for t in self.teams:
-            s |= set(t.members)
-        return s
+        if self.id is None:
+            s = set(self._members)
+            for t in self.teams:
+                s |= set(t.members)
+            return s
+        return set(self.members_query())
 
     def members_query(self, qry=None):
         if not qry:
             qry = User.query
-        qry = qry.select_entity_from(union(
-                qry.join(lesson_members).filter_by(lesson_id=self.id).order_by(None),
-                qry.join(team_members).join(Team).filter_by(lesson_id=self.id).order_by(None),
-            )).order_by(User.id)
+        qry = (qry.filter(User.id.in_(membership_user_ids(u'member', lesson_id=self.id)))
+            .order_by(User.id))
         return qry
 
     @property
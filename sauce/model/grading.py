@@ -0,0 +1,410 @@
+# -*- coding: utf-8 -*-
+'''Grading model module
+
+Instead of running the tests of a submission inside of the web request,
+a GradingJob can be enqueued which will be picked up by one of the
+sauce-worker processes (see :mod:`sauce.lib.worker`).
+
+GradingMemos store the outcome of running the tests of an assignment
+for a source code, so that identical submissions don't have to be run
+again. Their hits and misses are counted per assignment by the
+GradingMemoCounters.
+'''
+#
+## SAUCE - System for AUtomated Code Evaluation
+## Copyright (C) 2013 Moritz Schlarb
+##
+## This program is free software: you can redistribute it and/or modify
+## it under the terms of the GNU Affero General Public License as published by
+## the Free Software Foundation, either version 3 of the License, or
+## any later version.
+##
+## This program is distributed in the hope that it will be useful,
+## but WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+## GNU Affero General Public License for more details.
+##
+## You should have received a copy of the GNU Affero General Public License
+## along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+import logging
+from collections import Counter
+from datetime import datetime, timedelta
+from hashlib import sha256
+
+from paste.deploy.converters import asbool
+from tg import config
+
+from sqlalchemy import Column, ForeignKey, func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import backref, relationship
+from sqlalchemy.types import Boolean, DateTime, Enum, Float, Integer, PickleType, String, Unicode
+from zope.sqlalchemy import mark_changed
+
+from sauce.lib.runner import resource_limits
+from sauce.model import DBSession, DeclarativeBase
+from sauce.model.blob import Blob
+from sauce.model.test import Test, Testrun
+
+
+__all__ = ('GradingJob', 'GradingMemo', 'GradingMemoCounter')
+
+
+log = logging.getLogger(__name__)
+
+
+class GradingJob(DeclarativeBase):
+    '''A queued request to run the tests for a Submission'''
+    __tablename__ = 'grading_jobs'
+
+    id = Column(Integer, primary_key=True, nullable=False)
+
+    state = Column(Enum('pending', 'running', 'done', 'failed', name='grading_job_state'),
+        nullable=False, default='pending', index=True)
+
+    created = Column(DateTime, nullable=False, default=datetime.now,
+        doc='Date the job was enqueued')
+    started = Column(DateTime, nullable=True,
+        doc='Date a worker picked up the job')
+    finished = Column(DateTime, nullable=True,
+        doc='Date the job was done or failed')
+
+    worker = Column(Unicode(255), nullable=True,
+        doc='Name of the worker that picked up the job')
+
+    compilation = Column(PickleType, nullable=True,
+        doc='The compileresult from running the job, if any')
+    error = Column(Unicode(64 * 1024), nullable=True,
+        doc='Error message, if the job failed')
+    staged = Column(Boolean, nullable=False, default=False,
+        doc='Run the tests staged for quick feedback instead of all of them, see Submission.run_tests')
+
+    submission_id = Column(Integer, ForeignKey('submissions.id'), nullable=False, index=True)
+    submission = relationship('Submission',
+        backref=backref('grading_jobs',
+            order_by=id,
+            cascade='all, delete-orphan',
+        ),
+        doc='Submission whose tests are run by this job'
+    )
+
+    __mapper_args__ = {'order_by': [created, id]}
+
+    def __repr__(self):
+        return (u'<GradingJob: id=%r, submission_id=%r, state=%r>'
+            % (self.id, self.submission_id, self.state)
+        ).encode('utf-8')
+
+    def __unicode__(self):
+        return u'Grading job %s for Submission %s' % (self.id or '', self.submission_id or '')
+
+    @property
+    def parent(self):
+        '''Parent entity for generic hierarchy traversal'''
+        return self.submission
+
+    @property
+    def is_pending(self):
+        '''If the job has not been finished yet'''
+        return self.state in ('pending', 'running')
+
+    def run(self):
+        '''Run the tests for the submission and store the outcome
+
+        Older finished jobs for the same submission are removed, so that
+        only the most recent outcome is kept.
+        '''
+        (compilation, _, result) = self.submission.run_tests(staged=self.staged)
+        self.compilation = compilation
+        self.state = 'done'
+        self.finished = datetime.now()
+        for job in self.submission.grading_jobs:
+            if job is not self and not job.is_pending and job.created <= self.created:
+                DBSession.delete(job)
+        log.info('Grading job %d for Submission %d done, result: %s', self.id, self.submission_id, result)
+        return result
+
+    def fail(self, error):
+        '''Mark the job as failed'''
+        self.state = 'failed'
+        self.finished = datetime.now()
+        self.error = error
+
+    #----------------------------------------------------------------------------
+    # Classmethods
+
+    @classmethod
+    def queue_enabled(cls):
+        '''If tests should be run by the grading workers instead of inline'''
+        return asbool(config.get('grading.queue', False))
+
+    @classmethod
+    def enqueue(cls, submission, staged=False):
+        '''Return a pending job for submission, creating one if needed
+
+        A pending staged job becomes a full one if a full run is requested.
+        '''
+        job = (cls.query.filter_by(submission_id=submission.id, state='pending')
+            .order_by(cls.id).first()) if submission.id else None
+        if not job:
+            job = cls(submission=submission, state='pending', created=datetime.now(), staged=staged)
+            DBSession.add(job)
+            log.debug('Enqueued %r', job)
+        elif job.staged and not staged:
+            job.staged = False
+        return job
+
+    @classmethod
+    def claim(cls, worker):
+        '''Mark the oldest pending job as running for worker
+
+        The state transition is done with a conditional UPDATE, so
+        that concurrent workers never pick up the same job.
+
+        Returns the id of the claimed job or None if there was none.
+        '''
+        while True:
+            candidate = (DBSession.query(cls.id).filter_by(state='pending')
+                .order_by(cls.created, cls.id).first())
+            if not candidate:
+                return None
+            claimed = (DBSession.query(cls).filter_by(id=candidate.id, state='pending')
+                .update({'state': 'running', 'started': datetime.now(), 'worker': worker},
+                    synchronize_session=False))
+            if claimed == 1:
+                return candidate.id
+
+    @classmethod
+    def requeue_stale(cls, seconds):
+        '''Put jobs back into the queue whose worker took longer than seconds
+
+        This recovers jobs from workers that have crashed or were killed.
+        '''
+        return (DBSession.query(cls).filter_by(state='running')
+            .filter(cls.started < datetime.now() - timedelta(seconds=seconds))
+            .update({'state': 'pending', 'started': None, 'worker': None},
+                synchronize_session=False))
+
+
+class GradingMemo(DeclarativeBase):
+    '''The outcome of running the tests of an assignment for a source code
+
+    Memos are looked up by a hash over everything that influences the
+    test results: the source code, the language and all test settings.
+    '''
+    __tablename__ = 'grading_memos'
+
+    id = Column(Integer, primary_key=True, nullable=False)
+
+    key = Column(String(64), nullable=False, unique=True,
+        doc='sha256 of source code, language and tests')
+
+    compilation = Column(PickleType, nullable=True,
+        doc='The compileresult, if any')
+    testruns = Column(PickleType, nullable=True,
+        doc='The rows of the testruns, their output is referred to by blob hashes')
+    runtime = Column(Float, nullable=False, default=0.0,
+        doc='Runtime of the compilation and the tests that were saved by each hit')
+
+    created = Column(DateTime, nullable=False, default=datetime.now)
+    last_hit = Column(DateTime, nullable=True)
+    hits = Column(Integer, nullable=False, default=0,
+        doc='How often this memo has been used instead of running the tests')
+
+    assignment_id = Column(Integer, ForeignKey('assignments.id'), nullable=False, index=True)
+    assignment = relationship('Assignment',
+        backref=backref('grading_memos',
+            cascade='all, delete-orphan',
+        ),
+    )
+
+    # Test attributes that don't influence the test results, or only through
+    # others, like expected_output through the output_hash of the blob
+    ignored_test_attrs = ('name', 'visibility', '_visible', 'user_id',
+        'expected_key', 'expected_output')
+
+    def __repr__(self):
+        return (u'<GradingMemo: id=%r, assignment_id=%r, hits=%r>'
+            % (self.id, self.assignment_id, self.hits)
+        ).encode('utf-8')
+
+    def __unicode__(self):
+        return u'Grading memo %s' % (self.id or '')
+
+    @staticmethod
+    def enabled():
+        '''If results of identical submissions should be reused'''
+        return asbool(config.get('grading.memo', False))
+
+    @classmethod
+    def key_for(cls, submission):
+        '''Compute the memo key for running the tests of submission
+
+        The test settings are queried as columns, so that neither the
+        input and output data of the tests nor their deferred expected
+        output are loaded.
+        '''
+        h = sha256()
+
+        def update(*values):
+            for value in values:
+                h.update(unicode(value).encode('utf-8'))
+                h.update('\0')
+
+        language = submission.language
+        update(language.id, language.extension_src, language.extension_bin)
+        for tool in (language.compiler, language.interpreter):
+            if tool:
+                update(tool.path, tool.argv)
+        update(submission.filename, submission.full_source)
+        tests = submission.assignment.tests
+        columns = [c.columns[0] for c in Test.__mapper__.column_attrs if c.key not in cls.ignored_test_attrs]
+        settings = dict((row[0], row) for row in DBSession.query(Test.id, *columns)
+            .filter(Test.id.in_([t.id for t in tests]))) if tests else {}
+        for test in tests:
+            update(test.timeout, *settings[test.id][1:])
+            update(resource_limits(test.resource_profile,
+                submission.assignment.resource_profile, language.resource_profile))
+        return h.hexdigest()
+
+    @classmethod
+    def lookup(cls, key, assignment_id=None):
+        '''Return the memo for key, counting a miss for assignment_id if there is none'''
+        memo = cls.query.filter_by(key=key).first()
+        if not memo and assignment_id is not None:
+            GradingMemoCounter.count(assignment_id, misses=1)
+        return memo
+
+    @classmethod
+    def store(cls, key, submission, compilation, testruns, rows):
+        '''Remember the outcome of running the tests of submission
+
+        testruns are the testresults and rows the testruns table rows
+        that have been stored for them, see Submission.store_testruns.
+        Only the rows are remembered, the output is kept in the blobs.
+
+        Outcomes that depend on the load of the host, i.e. timeouts,
+        and incomplete staged runs are not remembered.
+        '''
+        log.info('Grading memo miss for Submission %d', submission.id)
+        if any(t.returncode == -1 or t.skipped for t in testruns):
+            return None
+        runtime = sum(t.runtime for t in testruns)
+        if compilation:
+            runtime += compilation.runtime
+        memo = cls(key=key, assignment=submission.assignment,
+            compilation=compilation, runtime=runtime,
+            testruns=[dict((k, v) for (k, v) in row.iteritems() if k not in ('submission_id', 'date'))
+                for row in rows])
+        try:
+            with DBSession.begin_nested():
+                DBSession.add(memo)
+        except IntegrityError:
+            # Another worker stored the same memo in the meantime
+            log.debug('Grading memo %s already stored', key)
+            return None
+        return memo
+
+    def apply(self, submission):
+        '''Replace the testruns of submission with the remembered ones
+
+        Returns the same tuple as Submission.run_tests, but with the
+        new Testrun objects.
+        '''
+        compilation, testruns = self.compilation, []
+        if not compilation or compilation.result:
+            submission.store_testrun_rows(self.testruns or [])
+            testruns = sorted(submission.testruns, key=lambda t: (t.date, t.id))
+        # Increment in the database, concurrent hits would get lost otherwise
+        self.hits = GradingMemo.hits + 1
+        self.last_hit = datetime.now()
+        DBSession.flush()
+        GradingMemoCounter.count(self.assignment_id, hits=1, saved_runtime=self.runtime)
+        log.info('Grading memo hit for Submission %d, saved %f seconds', submission.id, self.runtime)
+        return (compilation, testruns, submission.result)
+
+    def blob_counts(self):
+        '''Number of references to each blob from the remembered testruns'''
+        return Counter(row[key] for row in self.testruns or () for key in Testrun.blob_keys if row.get(key))
+
+    @staticmethod
+    def acquire_blobs(mapper, connection, target):
+        '''Keep the blobs of the remembered testruns'''
+        Blob.acquire(connection, target.blob_counts(), {})
+
+    @staticmethod
+    def release_blobs(mapper, connection, target):
+        '''Release the blobs of the remembered testruns'''
+        Blob.release(connection, target.blob_counts())
+
+    @classmethod
+    def statistics(cls, assignment=None):
+        '''Return the number of hits, misses and the saved runtime
+
+        Of all assignments or of the given one, see GradingMemoCounter.
+        '''
+        counter = GradingMemoCounter
+        q = DBSession.query(func.sum(counter.hits), func.sum(counter.misses), func.sum(counter.saved_runtime))
+        if assignment:
+            q = q.filter_by(assignment_id=assignment.id)
+        (hits, misses, saved) = q.one()
+        return dict(hits=hits or 0, misses=misses or 0, saved_runtime=saved or 0.0)
+
+
+class GradingMemoCounter(DeclarativeBase):
+    '''The hits and misses of the grading memos of an assignment
+
+    Every lookup is counted, including the misses that don't store a
+    memo, and the counts are kept when memos are deleted.
+    '''
+    __tablename__ = 'grading_memo_counters'
+
+    assignment_id = Column(Integer, ForeignKey('assignments.id'), primary_key=True, nullable=False)
+    assignment = relationship('Assignment',
+        backref=backref('grading_memo_counter',
+            uselist=False,
+            cascade='all, delete-orphan',
+        ),
+    )
+
+    hits = Column(Integer, nullable=False, default=0,
+        doc='How often a memo has been used instead of running the tests')
+    misses = Column(Integer, nullable=False, default=0,
+        doc='How often no memo has been found')
+    saved_runtime = Column(Float, nullable=False, default=0.0,
+        doc='Runtime of the compilations and tests that were saved by the hits')
+
+    def __repr__(self):
+        return (u'<GradingMemoCounter: assignment_id=%r, hits=%r, misses=%r>'
+            % (self.assignment_id, self.hits, self.misses)
+        ).encode('utf-8')
+
+    def __unicode__(self):
+        return u'Grading memo counter %s' % (self.assignment_id or '')
+
+    @classmethod
+    def count(cls, assignment_id, hits=0, misses=0, saved_runtime=0.0):
+        '''Add to the counters of an assignment
+
+        Increments in the database, concurrent lookups would get lost otherwise.
+        '''
+        table, connection = cls.__table__, DBSession.connection()
+        update = table.update().where(table.c.assignment_id == assignment_id).values(
+            hits=table.c.hits + hits, misses=table.c.misses + misses,
+            saved_runtime=table.c.saved_runtime + saved_runtime)
+        if not connection.execute(update).rowcount:
+            insert = table.insert().values(assignment_id=assignment_id, hits=hits, misses=misses,
+                saved_runtime=saved_runtime)
+            try:
+                if connection.dialect.name == 'sqlite':
+                    # Savepoints don't work with pysqlite, but SQLite
+                    # does not allow concurrent writes anyway
+                    connection.execute(insert)
+                else:
+                    with connection.begin_nested():
+                        connection.execute(insert)
+            except IntegrityError:
+                # Another transaction created the counters in the meantime
+                connection.execute(update)
+        mark_changed(DBSession())
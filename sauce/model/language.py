@@ -38,7 +38,7 @@ from sqlalchemy.types import Float, Integer, Unicode
 from sauce.model import DeclarativeBase
 
 
-__all__ = ('Compiler', 'Interpreter', 'Language')
+__all__ = ('Compiler', 'Interpreter', 'Language', 'ResourceProfile')
 
 
 def _cmd(cmd):
@@ -129,6 +129,40 @@ class Interpreter(DeclarativeBase):
             return u''
 
 
+class ResourceProfile(DeclarativeBase):
+    '''Resource limits for compiling and running submissions
+
+    Profiles can be attached to Languages, Assignments and Tests, each
+    limit that is set on a more specific one takes precedence.
+    '''
+    __tablename__ = 'resource_profiles'
+
+    id = Column(Integer, primary_key=True, nullable=False)
+
+    name = Column(Unicode(255), nullable=False)
+
+    memory = Column(Integer, nullable=True,
+        doc='Maximum size of the address space in MB (RLIMIT_AS)')
+    cpu_time = Column(Integer, nullable=True,
+        doc='Maximum CPU time in seconds (RLIMIT_CPU)')
+    file_size = Column(Integer, nullable=True,
+        doc='Maximum size of written files in MB (RLIMIT_FSIZE)')
+    processes = Column(Integer, nullable=True,
+        doc='Maximum number of processes of the user running SAUCE (RLIMIT_NPROC)')
+    cgroup = Column(Unicode(255), nullable=True,
+        doc='Path of a cgroup directory to move the processes into')
+
+    __mapper_args__ = {'order_by': [name]}
+
+    def __repr__(self):
+        return (u'<ResourceProfile: id=%r, name=%r>'
+            % (self.id, self.name)
+        ).encode('utf-8')
+
+    def __unicode__(self):
+        return u'Resource profile "%s"' % self.name
+
+
 class Language(DeclarativeBase):
     __tablename__ = 'languages'
 
@@ -148,6 +182,9 @@ class Language(DeclarativeBase):
     interpreter_id = Column(Integer, ForeignKey('interpreters.id'))
     interpreter = relationship('Interpreter', backref="languages")
 
+    resource_profile_id = Column(Integer, ForeignKey('resource_profiles.id'), nullable=True)
+    resource_profile = relationship('ResourceProfile', backref="languages")
+
     __mapper_args__ = {'order_by': [name]}
 
     def __repr__(self):
@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+'''Event membership closure
+
+The event_membership table holds one row for every teacher, tutor and
+member of an event, with the lesson and team the membership comes from,
+so that Event.members, Lesson.members and the like are single indexed
+lookups instead of collecting the members of all lessons and teams.
+
+After every flush, only the rows of the (user, event, lesson or team)
+pairs and of the events, lessons, teams and users that have been changed
+are deleted and selected again from the association tables. The rows of
+whole events are only rebuilt for the migration.
+'''
+#
+## SAUCE - System for AUtomated Code Evaluation
+## Copyright (C) 2013 Moritz Schlarb
+##
+## This program is free software: you can redistribute it and/or modify
+## it under the terms of the GNU Affero General Public License as published by
+## the Free Software Foundation, either version 3 of the License, or
+## any later version.
+##
+## This program is distributed in the hope that it will be useful,
+## but WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+## GNU Affero General Public License for more details.
+##
+## You should have received a copy of the GNU Affero General Public License
+## along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+import logging
+
+from sqlalchemy import and_, literal, null, select
+from sqlalchemy.orm import attributes
+
+from sauce.model.event import Event, Lesson, event_teachers, lesson_tutors
+from sauce.model.user import Team, User, event_members, event_membership, lesson_members, team_members
+
+log = logging.getLogger(__name__)
+
+__all__ = ('membership_kinds', 'membership_sources', 'rebuild_membership', 'changed_memberships', 'update_membership')
+
+# Attributes whose changes affect the memberships of an event,
+# with the kind of event_membership rows they affect
+watched_attributes = {
+    Event: (('teachers', 'teacher'), ('_members', 'event_member')),
+    Lesson: (('tutors', 'tutor'), ('_members', 'lesson_member')),
+    Team: (('members', 'team_member'),),
+    User: (('teached_events', 'teacher'), ('_events', 'event_member'),
+        ('tutored_lessons', 'tutor'), ('_lessons', 'lesson_member'), ('teams', 'team_member')),
+}
+
+# The attributes that move lessons and teams to another event or lesson
+moving_attributes = {
+    Lesson: ('event', 'event_id'),
+    Team: ('lesson', 'lesson_id'),
+}
+
+# What the changed pairs of a kind of membership are made of besides the users
+pair_keys = {
+    'teacher': 'event',
+    'event_member': 'event',
+    'tutor': 'lesson',
+    'lesson_member': 'lesson',
+    'team_member': 'team',
+}
+
+
+def membership_kinds():
+    '''The kinds of event_membership rows
+
+    Returns a dict of the condition that selects the rows of a kind from
+    the event_membership table, the select of these rows from the
+    association tables and the columns of that select by which they can
+    be restricted to events, lessons, teams and users.
+    '''
+    t, lessons, teams = event_membership, Lesson.__table__, Team.__table__
+    no_lesson, no_team = null().label('lesson_id'), null().label('team_id')
+    return {
+        'teacher': (t.c.role == u'teacher',
+            select([event_teachers.c.event_id, no_lesson, no_team, event_teachers.c.user_id,
+                literal(u'teacher')]),
+            dict(event=event_teachers.c.event_id, user=event_teachers.c.user_id)),
+        'tutor': (t.c.role == u'tutor',
+            select([lessons.c.event_id, lessons.c.id, no_team, lesson_tutors.c.user_id,
+                literal(u'tutor')]).select_from(lesson_tutors.join(lessons)),
+            dict(event=lessons.c.event_id, lesson=lessons.c.id, user=lesson_tutors.c.user_id)),
+        'event_member': (and_(t.c.role == u'member', t.c.lesson_id.is_(None)),
+            select([event_members.c.event_id, no_lesson, no_team, event_members.c.user_id,
+                literal(u'member')]),
+            dict(event=event_members.c.event_id, user=event_members.c.user_id)),
+        'lesson_member': (and_(t.c.role == u'member', t.c.lesson_id.isnot(None), t.c.team_id.is_(None)),
+            select([lessons.c.event_id, lessons.c.id, no_team, lesson_members.c.user_id,
+                literal(u'member')]).select_from(lesson_members.join(lessons)),
+            dict(event=lessons.c.event_id, lesson=lessons.c.id, user=lesson_members.c.user_id)),
+        'team_member': (and_(t.c.role == u'member', t.c.team_id.isnot(None)),
+            select([lessons.c.event_id, lessons.c.id, teams.c.id, team_members.c.user_id,
+                literal(u'member')]).select_from(team_members.join(teams).join(lessons)),
+            dict(event=lessons.c.event_id, lesson=lessons.c.id, team=teams.c.id, user=team_members.c.user_id)),
+    }
+
+
+def membership_sources(event_ids=None):
+    '''Selects of the event_membership rows from the association tables
+
+    If event_ids is given, only the rows of these events are selected.
+    '''
+    sources = []
+    for (_, source, columns) in membership_kinds().itervalues():
+        if event_ids is not None:
+            source = source.where(columns['event'].in_(list(event_ids)))
+        sources.append(source)
+    return sources
+
+
+def _insert(connection, source):
+    connection.execute(event_membership.insert().from_select(
+        ['event_id', 'lesson_id', 'team_id', 'user_id', 'role'], source))
+
+
+def rebuild_membership(connection, event_ids=None):
+    '''Rebuild the event_membership rows of the given events, or of all events'''
+    if event_ids is not None and not event_ids:
+        return
+    t = event_membership
+    delete = t.delete()
+    if event_ids is not None:
+        delete = delete.where(t.c.event_id.in_(list(event_ids)))
+    connection.execute(delete)
+    for source in membership_sources(event_ids):
+        _insert(connection, source)
+
+
+def _refresh(connection, kind, key, ids, user_ids=None):
+    '''Delete and select again the rows of one kind for the given
+    events, lessons, teams or users, restricted to the given users'''
+    condition, source, columns = kind
+    if key not in columns:
+        return
+    t = event_membership
+    conditions, where = [condition, t.c[key + '_id'].in_(list(ids))], [columns[key].in_(list(ids))]
+    if user_ids is not None:
+        conditions.append(t.c.user_id.in_(list(user_ids)))
+        where.append(columns['user'].in_(list(user_ids)))
+    connection.execute(t.delete().where(and_(*conditions)))
+    _insert(connection, source.where(and_(*where)))
+
+
+def _ids(objs):
+    return set(obj.id for obj in objs if obj is not None and obj.id is not None)
+
+
+def changed_memberships(session):
+    '''Collect what a flush of session changed the memberships of
+
+    Has to be called after the flush, so that new objects have their ids,
+    but before it is finished, while the history of the attributes is
+    still there. Returns a dict of the changed user ids by kind of
+    membership and event, lesson or team id, and a dict of the sets of
+    event, lesson, team and user ids whose rows have to be refreshed
+    completely because they have been created, moved or deleted.
+    '''
+    pairs, entities = {}, dict(event=set(), lesson=set(), team=set(), user=set())
+
+    def history(obj, key):
+        # Don't load anything, what is not loaded has not been changed
+        added, _, deleted = attributes.get_history(obj, key, passive=attributes.PASSIVE_NO_INITIALIZE)
+        return list(added or ()) + list(deleted or ())
+
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        for (cls, keys) in watched_attributes.iteritems():
+            if isinstance(obj, cls):
+                break
+        else:
+            continue
+        name = cls.__name__.lower()
+        if obj in session.deleted:
+            entities[name].add(obj.id)
+            continue
+        if obj in session.new and cls is not User:
+            entities[name].add(obj.id)
+            continue
+        if any(history(obj, key) for key in moving_attributes.get(cls, ())):
+            entities[name].add(obj.id)
+        for (key, kind) in keys:
+            for other in _ids(history(obj, key)):
+                if cls is User:
+                    pairs.setdefault(kind, {}).setdefault(other, set()).add(obj.id)
+                else:
+                    pairs.setdefault(kind, {}).setdefault(obj.id, set()).add(other)
+    for ids in entities.itervalues():
+        ids.discard(None)
+    return pairs, entities
+
+
+def update_membership(connection, pairs, entities):
+    '''Refresh the event_membership rows of what changed_memberships collected'''
+    kinds = membership_kinds()
+    for (key, ids) in entities.iteritems():
+        if ids:
+            for kind in kinds.itervalues():
+                _refresh(connection, kind, key, ids)
+    for (kind, changes) in pairs.iteritems():
+        for (i, user_ids) in changes.iteritems():
+            _refresh(connection, kinds[kind], pair_keys[kind], [i], user_ids)
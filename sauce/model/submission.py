@@ -22,21 +22,28 @@
 #
 
 import logging
+from collections import Counter
 from datetime import datetime
 from difflib import unified_diff
 from time import time
 
+from paste.deploy.converters import asint
+from tg import config
 from tg.caching import cached_property
 
-from sqlalchemy import Column, ForeignKey
-from sqlalchemy.orm import backref, deferred, relationship
-from sqlalchemy.sql import desc
-from sqlalchemy.types import Boolean, DateTime, Float, Integer, PickleType, Unicode
+from sqlalchemy import Column, ForeignKey, Index, func
+from sqlalchemy.orm import backref, relationship
+from sqlalchemy.sql import and_, case, desc, exists, select
+from sqlalchemy.types import Boolean, DateTime, Float, Integer, PickleType, String, Unicode
+from zope.sqlalchemy import mark_changed
 
 from sauce.lib.helpers import link
 from sauce.lib.runner import Runner
 from sauce.model import DBSession, DeclarativeBase
+from sauce.model.archive import TestrunArchive
+from sauce.model.blob import Blob, BlobText
 from sauce.model.event import Lesson
+from sauce.model.grading import GradingMemo
 from sauce.model.test import Testrun
 from sauce.model.user import Team, User
 
@@ -68,7 +75,9 @@ class Submission(DeclarativeBase):
 
     filename = Column(Unicode(255), nullable=True,
         doc='The submitted filename, if any')
-    source = deferred(Column(Unicode(10 * 1024 * 1024), nullable=True), group='data',
+    source_blob = Column(String(64), ForeignKey('blobs.hash'), nullable=True,
+        doc='Hash of the Blob with the source code')
+    source = BlobText('source_blob',
         doc='The submitted source code')
 
     assignment_id = Column(Integer, ForeignKey('assignments.id'), nullable=False, index=True)
@@ -98,7 +107,24 @@ class Submission(DeclarativeBase):
 #    complete = Column(Boolean, default=False)
 #    '''Whether submission is finally submitted or not'''
 
+    # Summary of the testruns, so that listings don't need to load them
+    result = Column(Boolean, nullable=True,
+        doc='Whether all tests passed, None if no tests have been run')
+    passed = Column(Integer, nullable=False, default=0,
+        doc='Number of passed testruns')
+    failed = Column(Integer, nullable=False, default=0,
+        doc='Number of failed testruns, not counting skipped ones')
+    total = Column(Integer, nullable=False, default=0,
+        doc='Number of testruns')
+    runtime = Column(Float, nullable=False, default=0.0,
+        doc='Sum of the runtime of all testruns')
+    testrun_date = Column(DateTime, nullable=True,
+        doc='Date of the newest testrun')
+    summary_columns = ('result', 'passed', 'failed', 'total', 'runtime', 'testrun_date')
+
     __mapper_args__ = {'order_by': [desc(created), desc(modified)]}
+    # For the keyset pagination of submission listings
+    __table_args__ = (Index('idx_submission_assignment_modified', assignment_id, modified, id),)
 
     def __repr__(self):
         return (u'<Submission: id=%r, assignment_id=%r, user_id=%r>'
@@ -170,15 +196,34 @@ class Submission(DeclarativeBase):
         end_foot = start_foot + self.scaffold_foot_lines_len
         return start_head, end_head, start_foot, end_foot
 
-    def run_tests(self):
+    def run_tests(self, staged=False):
+        '''Compile the submission and run the tests of its assignment
+
+        If staged is set and runner.staged_failures is configured, tests
+        are run in the order of their failure rates and the remaining
+        ones are skipped after that many failures, see Runner.test.
+        After the assignment has ended, all tests are run anyway.
+        '''
 
         compilation = None
         testruns = []
+        rows = []
         result = False
 
         # Consistency checks
         if self.language and self.full_source and self.assignment:
-            with Runner(self) as r:
+            memo_key = None
+            if GradingMemo.enabled():
+                memo_key = GradingMemo.key_for(self)
+                memo = GradingMemo.lookup(memo_key, self.assignment_id)
+                if memo:
+                    return memo.apply(self)
+            with Runner(self, parallel=asint(config.get('runner.parallel', 0)),
+                    compile_cache=config.get('runner.compile_cache'),
+                    workspace_root=config.get('runner.workspace_root'),
+                    workspace_pool=asint(config.get('runner.workspace_pool', 0)),
+                    workspace_quota=asint(config.get('runner.workspace_quota', 0)),
+                    fixture_cache=config.get('runner.fixture_cache')) as r:
                 log.debug('Starting Runner for submission %r', self)
                 # First compile, if needed
                 compilation = r.compile()
@@ -187,31 +232,25 @@ class Submission(DeclarativeBase):
                     log.debug('Compilation result: %s', compilation.result)
 
                 if not compilation or compilation.result:
-                    # Delete old testruns
-                    self.testruns = []
-                    #DBSession.flush()
-
                     # Then run all the tests
+                    max_failures = asint(config.get('runner.staged_failures', 0))
+                    if staged and max_failures and self.assignment.is_active:
+                        test_kwargs = dict(max_failures=max_failures,
+                            failure_rates=Testrun.failure_rates(self.assignment.tests))
+                    else:
+                        test_kwargs = {}
                     testruns = []
                     start = time()
-                    for t in r.test():
+                    for t in r.test(**test_kwargs):
                         testruns.append(t)
-                        self.testruns.append(
-                            Testrun(
-                                submission=self, test=t.test,
-                                result=t.result, partial=t.partial,
-                                runtime=t.runtime,
-                                output_data=t.output_data,
-                                error_data=t.error_data,
-                            )
-                        )
                     end = time()
                     test_time = end - start
                     log.debug('Test runs total runtime: %f', test_time)
                     log.debug('Test runs results: %r', list(str(t.result) for t in testruns))
 
                     try:
-                        DBSession.flush()
+                        # Replaces the old testruns
+                        rows = self.store_testruns(testruns)
                     except:
                         log.exception('Could not save testrun results')
                         raise
@@ -220,8 +259,138 @@ class Submission(DeclarativeBase):
                     log.debug('Test runs result: %s ', result)
                 else:
                     log.debug('Test runs not run')
+            if memo_key:
+                GradingMemo.store(memo_key, self, compilation, testruns, rows)
         return (compilation, testruns, result)
 
+    def store_testruns(self, testresults):
+        '''Replace the testruns of this submission with new ones from testresults
+
+        Output data is stored in relation to the expected output, see
+        Testrun.output_args. Returns the inserted rows, see
+        store_testrun_rows.
+        '''
+        rows, texts = [], {}
+        for t in testresults or ():
+            row = dict(test_id=t.test.id,
+                result=t.result, partial=t.partial, skipped=t.skipped,
+                runtime=t.runtime, limit_hit=t.limit)
+            row.update(Testrun.usage_args(t.usage))
+            (row['output_mode'], output, expected) = Testrun.output_args(
+                Blob.coerce(t.output_data), Blob.coerce(t.output_test))
+            for (key, text) in (('output_blob', output), ('error_blob', Blob.coerce(t.error_data)),
+                    ('expected_blob', expected)):
+                row[key] = h = Blob.hash_text(text) if text is not None else None
+                if h:
+                    texts[h] = text
+            rows.append(row)
+        return self.store_testrun_rows(rows, texts)
+
+    def store_testrun_rows(self, rows, texts=None):
+        '''Replace the testruns of this submission with rows for the testruns table
+
+        The old testruns are removed with one DELETE and the new ones are
+        inserted with one executemany INSERT, instead of one statement per
+        row from the unit of work. The testruns collection is loaded again
+        on the next access. texts has to contain the texts of all blobs
+        the rows refer to that may be missing.
+        Returns the inserted rows.
+        '''
+        self.delete_testruns()
+        connection = DBSession.connection()
+        table = Testrun.__table__
+        # New testruns replace the archived ones as well
+        archive = self.__dict__.get('testrun_archive')
+        if archive is not None and archive in DBSession:
+            DBSession.expunge(archive)
+        self.__dict__.pop('_archived_testruns', None)
+        connection.execute(TestrunArchive.__table__.delete()
+            .where(TestrunArchive.__table__.c.submission_id == self.id))
+        DBSession.expire(self, ['testrun_archive'])
+        rows = [dict(row, submission_id=self.id, date=datetime.now()) for row in rows]
+        if rows:
+            Blob.acquire(connection, Counter(row[key] for row in rows for key in Testrun.blob_keys if row[key]),
+                texts or {})
+            connection.execute(table.insert(), rows)
+        self.set_summary(rows)
+        mark_changed(DBSession())
+        DBSession.expire(self, ['testruns'])
+        for test in self.assignment.tests:
+            DBSession.expire(test, ['testruns'])
+        return rows
+
+    def delete_testruns(self, keep_summary=False):
+        '''Delete the testruns of this submission with one DELETE
+
+        The summary columns are cleared, unless keep_summary is set.
+        '''
+        DBSession.flush()
+        connection = DBSession.connection()
+        table = Testrun.__table__
+        # The rows of the old testruns are deleted below
+        for testrun in self.__dict__.get('testruns', ()):
+            if testrun in DBSession:
+                DBSession.expunge(testrun)
+        where = table.c.submission_id == self.id
+        old = Counter(h for row in connection.execute(select([table.c[key] for key in Testrun.blob_keys])
+            .where(where)) for h in row if h)
+        connection.execute(table.delete().where(where))
+        Blob.release(connection, old)
+        mark_changed(DBSession())
+        DBSession.expire(self, ['testruns'])
+        for test in self.assignment.tests:
+            DBSession.expire(test, ['testruns'])
+        if not keep_summary:
+            self.set_summary([])
+
+    @property
+    def archived_testruns(self):
+        '''The testruns of this submission from the archive, if any'''
+        if not self.testrun_archive:
+            return []
+        if '_archived_testruns' not in self.__dict__:
+            self.__dict__['_archived_testruns'] = self.testrun_archive.load()
+        return self.__dict__['_archived_testruns']
+
+    def set_summary(self, testruns):
+        '''Set the summary columns from testruns, given as rows'''
+        self.total = len(testruns)
+        self.passed = sum(1 for t in testruns if t['result'])
+        self.failed = sum(1 for t in testruns if not (t['result'] or t['skipped']))
+        self.result = self.passed == self.total if testruns else None
+        self.runtime = sum(t['runtime'] or 0.0 for t in testruns)
+        self.testrun_date = max(t['date'] for t in testruns) if testruns else None
+
+    @classmethod
+    def update_summaries(cls, ids=None):
+        '''Compute the summary columns of submissions from their testruns
+
+        Updates all submissions, or the ones with the given ids, in one
+        statement. Submissions whose testruns have been archived keep
+        their summaries, which were computed before archiving.
+        Returns the number of updated submissions.
+        '''
+        table, t, archive = cls.__table__, Testrun.__table__, TestrunArchive.__table__
+
+        def aggregate(expr):
+            return select([expr]).where(t.c.submission_id == table.c.id).as_scalar()
+
+        total = aggregate(func.count(t.c.id))
+        passed = aggregate(func.coalesce(func.sum(case([(t.c.result, 1)], else_=0)), 0))
+        update = table.update().values(
+            total=total, passed=passed,
+            failed=aggregate(func.coalesce(func.sum(
+                case([(and_(~t.c.result, ~t.c.skipped), 1)], else_=0)), 0)),
+            result=case([(total == 0, None), (passed == total, True)], else_=False),
+            runtime=aggregate(func.coalesce(func.sum(t.c.runtime), 0.0)),
+            testrun_date=aggregate(func.max(t.c.date)))
+        update = update.where(~exists().where(archive.c.submission_id == table.c.id))
+        if ids is not None:
+            update = update.where(table.c.id.in_(ids))
+        count = DBSession.connection().execute(update).rowcount
+        mark_changed(DBSession())
+        return count
+
     @property
     def name(self):
         return unicode(self)
@@ -241,7 +410,8 @@ class Submission(DeclarativeBase):
 
     @property
     def visible_testruns(self):
-        return list(testrun for testrun in self.testruns if testrun.test.visible)
+        return list(testrun for testrun in self.testruns or self.archived_testruns
+            if testrun.test.visible)
 
 # Not usable since student may have no team
 #    @property
@@ -252,33 +422,20 @@ class Submission(DeclarativeBase):
 #            return None
 
     @property
-    def result(self):
-        if self.testruns:
-            for t in self.testruns:
-                if not t.result:
-                    return False
-            return True
-        return None
+    def skipped(self):
+        '''Number of skipped testruns'''
+        return self.total - self.passed - self.failed
 
     @property
-    def runtime(self):
-        return sum(t.runtime for t in self.testruns)
-
-    @property
-    def testrun_date(self):
-        try:
-            return sorted(self.testruns, key=lambda t: t.date).pop().date
-        except IndexError:
-            return None
+    def grading_job(self):
+        '''The most recent GradingJob for this submission, if any'''
+        return self.grading_jobs[-1] if self.grading_jobs else None
 
     @property
     def teams(self):
         '''Returns a list of teams that are eligible for this submission'''
-        teams = set()
-        for lesson in self.assignment.sheet.event.lessons:
-            teams |= set(lesson.teams)
-        teams &= set(self.user.teams)
-        return teams
+        event_id = self.assignment.sheet.event_id
+        return set(t for t in self.user.teams if t.lesson.event_id == event_id)
 
     @property
     def team(self):
@@ -364,7 +521,9 @@ class Judgement(DeclarativeBase):
     #    backref=backref('judgement', uselist=False)
     #    )
 
-    corrected_source = deferred(Column(Unicode(10 * 1024 * 1024), nullable=True), group='data',
+    corrected_source_blob = Column(String(64), ForeignKey('blobs.hash'), nullable=True,
+        doc='Hash of the Blob with the corrected source code')
+    corrected_source = BlobText('corrected_source_blob',
         doc='Tutor-corrected source code')
 
     comment = Column(Unicode(1024 * 1024), nullable=True,
@@ -23,15 +23,20 @@
 
 import logging
 from datetime import datetime
+from hashlib import sha256
 from warnings import warn
 
-from sqlalchemy import Column, ForeignKey, Index
+from paste.deploy.converters import asbool
+from tg import config
+from sqlalchemy import Column, ForeignKey, Index, func
 from sqlalchemy.inspection import inspect
 from sqlalchemy.orm import backref, deferred, relationship
-from sqlalchemy.sql.expression import asc
-from sqlalchemy.types import Boolean, DateTime, Enum, Float, Integer, Unicode
+from sqlalchemy.sql.expression import asc, case
+from sqlalchemy.types import Boolean, DateTime, Enum, Float, Integer, String, Unicode
 
-from sauce.model import DeclarativeBase
+from sauce.lib.conversion import conversion_options, Converter, make_formatter, compare, compare_numeric, numpy
+from sauce.model import DBSession, DeclarativeBase
+from sauce.model.blob import BlobText, delta, patch
 
 try:
     from nose.tools import nottest
@@ -45,6 +50,17 @@ __all__ = ('Test', 'Testrun')
 
 log = logging.getLogger(__name__)
 
+# Normalized expected output of tests by test id and Test.expected_output_key,
+# shared by all sessions of this process
+_expected_outputs = {}
+# Maximum number of entries in _expected_outputs
+EXPECTED_OUTPUTS_SIZE = 256
+
+# Expected output of tests with tolerances as arrays of numbers, by the same keys
+_expected_arrays = {}
+# Maximum number of entries in _expected_arrays, which can be big
+EXPECTED_ARRAYS_SIZE = 16
+
 
 @nottest
 class Test(DeclarativeBase):
@@ -80,11 +96,26 @@ class Test(DeclarativeBase):
                 {outfile}: Full path to test output file
             ''')
 
-    input_data = deferred(Column(Unicode(10 * 1024 * 1024)), group='data')
-    output_data = deferred(Column(Unicode(10 * 1024 * 1024)), group='data')
+    input_hash = Column(String(64), ForeignKey('blobs.hash'), nullable=True,
+        doc='SHA-256 of input_data, the hash of its Blob')
+    input_data = BlobText('input_hash',
+        doc='Input data')
+    output_hash = Column(String(64), ForeignKey('blobs.hash'), nullable=True,
+        doc='SHA-256 of output_data, the hash of its Blob')
+    output_data = BlobText('output_hash',
+        doc='Output data')
+
+    expected_key = Column(String(64), nullable=True,
+        doc='Value of expected_output_key that expected_output was computed for')
+    expected_output = deferred(Column(Unicode(10 * 1024 * 1024), nullable=True), group='expected',
+        doc='output_data after all conversion options have been applied')
 
     _timeout = Column('timeout', Float)
 
+    resource_profile_id = Column(Integer, ForeignKey('resource_profiles.id'), nullable=True)
+    resource_profile = relationship('ResourceProfile', backref='tests',
+        doc='Resource limits for this test, taking precedence over the ones of the assignment')
+
     # Validator options
 
     # Output ignore options
@@ -120,6 +151,12 @@ class Test(DeclarativeBase):
         doc='Parse every substring in output to float before comparison')
     float_precision = Column(Integer, nullable=True,
         doc='The precision (number of decimal digits) to compare for floats')
+    abs_tolerance = Column(Float, nullable=True,
+        doc='''Absolute tolerance for comparing floats
+            If this or rel_tolerance is set, parsed floats are compared
+            numerically instead of as formatted strings''')
+    rel_tolerance = Column(Float, nullable=True,
+        doc='Relative tolerance for comparing floats, relative to the expected value')
 
     strip_parse_errors = Column(Boolean, nullable=False, default=False,
         doc='How to handle parsing errors - strip or leave unparsed fragments')
@@ -141,6 +178,9 @@ class Test(DeclarativeBase):
 
     __mapper_args__ = {'order_by': [assignment_id, name]}
 
+    # Options that convert and unconvert depend on
+    conversion_attrs = conversion_options._fields + ('float_precision',)
+
     def __repr__(self):
         return (u'<Test: id=%r, assignment_id=%r, name=%r>'
             % (self.id, self.assignment_id, self.name)
@@ -174,117 +214,25 @@ class Test(DeclarativeBase):
         '''Parent entity for generic hierarchy traversal'''
         return self.assignment
 
+    @property
+    def converter(self):
+        '''The Converter for the conversion options of this test'''
+        options = conversion_options(*(getattr(self, a) for a in conversion_options._fields))
+        # The pipeline is only built again if the options change
+        converter = getattr(self, '_converter', None)
+        if converter is None or converter.options != options:
+            converter = self._converter = Converter(options)
+        return converter
+
     def convert(self, data):
         '''Performs all conversion options specified'''
-        data = data.strip()
-        # Normalize the values from database since they might be ''
-        if self.separator:
-            separator = self.separator
-        else:
-            separator = None
-
-        if self.comment_prefix:
-            data = '\n'.join(l.strip() for l in data.splitlines()
-                if not l.strip().startswith(self.comment_prefix))
-        else:
-            data = '\n'.join(l.strip() for l in data.splitlines())
-
-        if self.ignore_case:
-            data = data.lower()
-
-        # if we need to sort output for parallel
-        if self.parallel_sort:
-            tmp = data.splitlines()
-            liste = {}
-            rest = []
-            result = ""
-            for i in tmp:
-                if unicode(i).find("[") > -1 and unicode(i).find("]") > -1:
-                    pos = int(unicode(i)[unicode(i).find("[") + 1:
-                        unicode(i).find("]")])
-                    if pos in liste:
-                        liste[pos].append(i)
-                    else:
-                        liste[pos] = []
-                        liste[pos].append(i)
-                else:
-                    rest.append(i)
-            for i in rest:
-                result += unicode(i) + "\n"
-            for i in liste:
-                result += '\n'.join(unicode(j) for j in liste[i]) + "\n"
-            data = result
-
-        if self.splitlines and self.split:
-            d = [[ll for ll in l.split(separator) if ll]
-                for l in data.splitlines()]
-        elif self.splitlines:
-            d = [l for l in data.splitlines()]
-        elif self.split:
-            d = [l for l in data.split(separator) if l]
-        else:
-            d = data
-
-        def make_parser():
-            # TODO: Allow parsing errors to be logged/shown somewhere, not hiding them all
-            _parser = None
-
-            if self.parse_float:
-                _parser = float
-            if self.parse_int:
-                _parser = int
-
-            if _parser:
-                if self.strip_parse_errors:
-                    def parser(x):
-                        try:
-                            return _parser(x)
-                        except:
-                            log.debug('Error while parsing', exc_info=True)
-                            return u''
-                else:
-                    def parser(x):
-                        try:
-                            return _parser(x)
-                        except:
-                            log.debug('Error while parsing', exc_info=True)
-                            return x
-                return parser
-            else:
-                return None
-
-        parser = make_parser()
-        if parser:
-            if self.splitlines and self.split:
-                d = [[parser(b) for b in a] for a in d]
-            elif self.splitlines or self.split:
-                d = [parser(a) for a in d]
-            else:
-                d = parser(d)
-
-        if self.sort:
-            d = sorted(d)
-
-        return d
+        return self.converter(data)
 
     def unconvert(self, data):
         '''Reverts the conversions from convert'''
 
         sep = self.separator or u' '
-
-        def make_fmt():
-            if self.parse_float and self.float_precision is not None:
-                def fmt(obj):
-                    try:
-                        return (u'%%.%df' % self.float_precision) % obj
-                    except:
-                        log.debug('Error converting float to string with precision', exc_info=True)
-                        return unicode(obj)
-                return fmt
-            else:
-                return unicode
-
-        fmt = make_fmt()
+        fmt = make_formatter(self.parse_float, self.float_precision)
 
         if self.splitlines and self.split:
             d = '\n'.join([sep.join(map(fmt, a)) for a in data])
@@ -298,12 +246,153 @@ class Test(DeclarativeBase):
         # Convert to unicode again, just to be sure
         return unicode(d)
 
+    @property
+    def expected_output_key(self):
+        '''Hash of output_data and the conversion options'''
+        h = sha256()
+        for value in (self.output_hash,) + tuple(getattr(self, a) for a in self.conversion_attrs):
+            h.update(unicode(value).encode('utf-8'))
+            h.update('\0')
+        return h.hexdigest()
+
+    def _expected(self):
+        '''Convert output_data like the observed output in validate'''
+        return self.unconvert(self.convert(self.output_data)).strip() if self.output_data else u''
+
+    def expected(self):
+        '''Return output_data converted like the observed output in validate
+
+        The result is cached in this process, so that it is computed
+        only once for each version of the test. If store_expected_output
+        has stored it for the current version, it is taken from there.
+        The test itself is never changed, so that grading does not
+        update the shared test rows.
+        '''
+        if not self.output_hash:
+            return self._expected()
+        key = self.expected_output_key
+        try:
+            return _expected_outputs[(self.id, key)]
+        except KeyError:
+            pass
+        if self.expected_key == key and self.expected_output is not None:
+            expected_output = self.expected_output
+        else:
+            log.debug('Computing expected output of Test %r', self.id)
+            expected_output = self._expected()
+        if len(_expected_outputs) >= EXPECTED_OUTPUTS_SIZE:
+            _expected_outputs.clear()
+        _expected_outputs[(self.id, key)] = expected_output
+        return expected_output
+
+    def store_expected_output(self):
+        '''Store the expected output for the current version of the test
+
+        Called when a test is saved, so that other processes can reuse it.
+        '''
+        key = self.expected_output_key
+        if self.expected_key != key:
+            log.debug('Storing expected output of Test %r', self.id)
+            self.expected_key, self.expected_output = key, self._expected()
+
+    def invalidate_expected_output(self):
+        '''Forget the cached expected output of this test'''
+        for cache in (_expected_outputs, _expected_arrays):
+            for k in [k for k in cache if k[0] == self.id]:
+                cache.pop(k, None)
+        self.expected_key, self.expected_output = None, None
+
+    def compare(self, output_data, expected_output=None):
+        '''Compare output_data with the expected output of this test
+
+        Unless the converted output needs sorting, it is converted and
+        compared piece by piece, so that a mismatch at the beginning
+        stops the conversion of a large output.
+
+        Returns a comparison of result, partial and the position in the
+        expected output where the observed output differs.
+        '''
+        if expected_output is None:
+            expected_output = self.expected()
+        if not output_data:
+            chunks = []
+        elif self.sort or self.parallel_sort:
+            # Sorting needs all the data at once anyway
+            chunks = [self.unconvert(self.convert(output_data))]
+        else:
+            chunks = self.converter.chunks(output_data,
+                make_formatter(self.parse_float, self.float_precision), self.separator or u' ')
+        c = compare(expected_output, chunks)
+        if c.partial and not self.show_partial_match:
+            c = c._replace(partial=False)
+        return c
+
+    @property
+    def numeric(self):
+        '''Whether parsed floats are compared with tolerances'''
+        return bool(self.parse_float and not self.parse_int
+            and (self.abs_tolerance is not None or self.rel_tolerance is not None))
+
+    def expected_array(self):
+        '''Return output_data parsed into an array of floats, like expected'''
+        key = (self.id, self.expected_output_key)
+        try:
+            return _expected_arrays[key]
+        except KeyError:
+            pass
+        expected_array = self.converter.array(self.output_data or u'')
+        if self.output_hash:
+            if len(_expected_arrays) >= EXPECTED_ARRAYS_SIZE:
+                _expected_arrays.clear()
+            _expected_arrays[key] = expected_array
+        return expected_array
+
+    def compare_numeric(self, output_data):
+        '''Compare the numbers in output_data with the expected ones
+
+        All numbers are parsed at once and compared with abs_tolerance
+        and rel_tolerance. Returns a deviation with the index and
+        magnitude of the largest deviation beyond the tolerances, or
+        None if numpy is not available or not all items in the outputs
+        are numbers.
+        '''
+        if numpy is None:
+            log.debug('Comparing Test %r without tolerances, numpy is not available', self.id)
+            return None
+        try:
+            expected_array = self.expected_array()
+            observed_array = self.converter.array(output_data or u'')
+        except ValueError:
+            log.debug('Comparing Test %r without tolerances, not all items are numbers', self.id)
+            return None
+        d = compare_numeric(expected_array, observed_array, self.abs_tolerance, self.rel_tolerance)
+        if d.partial and not self.show_partial_match:
+            d = d._replace(partial=False)
+        return d
+
     def validate(self, output_data):
         ''''''
 
         try:
-            expected_output = self.unconvert(self.convert(self.output_data)).strip() if self.output_data else u''
-            observed_output = self.unconvert(self.convert(output_data)).strip() if output_data else u''
+            d = self.compare_numeric(output_data) if self.numeric else None
+            if d is None:
+                result, partial, position = self.compare(output_data)
+                if not result and position is not None:
+                    expected_output = self.expected()
+                    line = expected_output.count(u'\n', 0, position) + 1
+                    column = position - expected_output.rfind(u'\n', 0, position)
+                    return (result, partial, self.output_data, output_data,
+                        u'\nFirst difference from the expected output at line %d, column %d\n'
+                        % (line, column))
+            else:
+                result, partial = d.result, d.partial
+                if d.index is not None:
+                    return (result, partial, self.output_data, output_data,
+                        u'\nLargest deviation beyond the tolerances: %g at number %d\n'
+                        % (d.magnitude, d.index + 1))
+                if not result:
+                    return (result, partial, self.output_data, output_data,
+                        u'\nExpected %d numbers, got %d\n' % (d.expected_length, d.observed_length))
         except Exception as e:
             log.warn('Error converting test data', exc_info=True)
             msg = u'''
@@ -315,13 +404,6 @@ please notify someone about this error.
 ''' % unicode(e.message, errors='ignore')
             return (False, False, self.output_data, output_data, msg)
 
-        if expected_output == observed_output:
-            result, partial = True, False
-        elif self.show_partial_match and observed_output and expected_output.startswith(observed_output):
-            result, partial = False, True
-        else:
-            result, partial = False, False
-
         return (result, partial, self.output_data, output_data, u'')
 
     @property
@@ -341,19 +423,43 @@ class Testrun(DeclarativeBase):
 
     date = Column(DateTime, nullable=False, default=datetime.now)
 
-    output_data = deferred(Column(Unicode(10 * 1024 * 1024)), group='data',
-        doc='''Output data from testrun
+    output_blob = Column(String(64), ForeignKey('blobs.hash'), nullable=True,
+        doc='Hash of the Blob with the output data or its delta')
+    _output_data = BlobText('output_blob',
+        doc='The stored output data, see output_mode')
+    output_mode = Column(Unicode(8), nullable=True,
+        doc='''How the output data is stored
 
-            Captured from stdout or content of test output file, depending
-            on the test specification
+            None if output_blob holds the output data, u'same' if it was
+            identical to expected_output and u'delta' if output_blob
+            holds a delta against expected_output
             ''')
-    error_data = deferred(Column(Unicode(10 * 1024 * 1024)), group='data',
+    expected_blob = Column(String(64), ForeignKey('blobs.hash'), nullable=True,
+        doc='Hash of the Blob with the expected output, if output_mode is set')
+    expected_output = BlobText('expected_blob',
+        doc='Output data that the test expected when it was run')
+    error_blob = Column(String(64), ForeignKey('blobs.hash'), nullable=True,
+        doc='Hash of the Blob with the error data')
+    error_data = BlobText('error_blob',
         doc='Error data from testrun (stderr)')
+    # Columns that refer to blobs
+    blob_keys = ('output_blob', 'error_blob', 'expected_blob')
 
     runtime = Column(Float)
 
+    user_time = Column(Float, nullable=True,
+        doc='CPU time spent in user mode in seconds')
+    system_time = Column(Float, nullable=True,
+        doc='CPU time spent in kernel mode in seconds')
+    max_rss = Column(Integer, nullable=True,
+        doc='Peak resident set size in kilobytes')
+    limit_hit = Column(Unicode(32), nullable=True,
+        doc='Resource limit that the test process probably ran into')
+
     result = Column(Boolean, nullable=False, default=False)
     partial = Column(Boolean, nullable=False, default=False)
+    skipped = Column(Boolean, nullable=False, default=False,
+        doc='Test was not run because a staged run stopped after too many failures')
 
     test_id = Column(Integer, ForeignKey('tests.id'), nullable=False, index=True)
     test = relationship('Test',
@@ -374,6 +480,87 @@ class Testrun(DeclarativeBase):
     __mapper_args__ = {'order_by': asc(date)}
     __table_args__ = (Index('idx_test_submission', test_id, submission_id),)
 
+    @property
+    def output_data(self):
+        '''Output data from testrun
+
+        Captured from stdout or content of test output file, depending
+        on the test specification. Rebuilt from the expected output when
+        it is accessed first, if it was stored as marker or delta.
+        '''
+        if self.output_mode is None:
+            return self._output_data
+        key = (self.output_mode, self.output_blob, self.expected_blob)
+        cached = self.__dict__.get('_output_cache')
+        if cached and cached[0] == key:
+            return cached[1]
+        if self.output_mode == u'same':
+            output = self.expected_output
+        else:
+            output = patch(self.expected_output, self._output_data)
+        self.__dict__['_output_cache'] = (key, output)
+        return output
+
+    @output_data.setter
+    def output_data(self, value):
+        self.output_mode, self.expected_output = None, None
+        self._output_data = value
+
+    @staticmethod
+    def output_args(output_data, expected_output):
+        '''Return how output_data is stored in relation to expected_output
+
+        Gives the output_mode and the texts for the output_blob and
+        expected_blob. Unless blobs.output_delta is disabled, output that
+        is identical to the expected output is only marked as such and
+        output that differs in one place is stored as delta.
+        '''
+        if (output_data is None or not expected_output
+                or not asbool(config.get('blobs.output_delta', True))):
+            return (None, output_data, None)
+        if output_data == expected_output:
+            return (u'same', None, expected_output)
+        d = delta(expected_output, output_data)
+        if d is None:
+            return (None, output_data, None)
+        return (u'delta', d, expected_output)
+
+    @staticmethod
+    def usage_args(usage):
+        '''Keyword arguments for the resource usage reported by the runner'''
+        if not usage:
+            return dict(user_time=None, system_time=None, max_rss=None)
+        return dict(user_time=usage.user_time, system_time=usage.system_time,
+            max_rss=usage.max_rss)
+
+    @classmethod
+    def failure_rates(cls, tests):
+        '''Return the rate of failed testruns for each of tests by test id
+
+        Skipped testruns are not counted. Tests without any testruns
+        get a rate of 0.5, so that they are not run last.
+        '''
+        ids = [t.id for t in tests if t.id is not None]
+        if not ids:
+            return {}
+        q = (DBSession.query(cls.test_id, func.count(cls.id),
+                func.sum(case([(cls.result, 0)], else_=1)))
+            .filter(cls.test_id.in_(ids), ~cls.skipped)
+            .group_by(cls.test_id))
+        counts = dict((test_id, (runs, failed or 0)) for (test_id, runs, failed) in q)
+        rates = {}
+        for test_id in ids:
+            runs, failed = counts.get(test_id, (0, 0))
+            rates[test_id] = (failed + 1.0) / (runs + 2.0)
+        return rates
+
+    @property
+    def cpu_time(self):
+        '''Total CPU time in seconds, if known'''
+        if self.user_time is None or self.system_time is None:
+            return None
+        return self.user_time + self.system_time
+
     def __repr__(self):
         return (u'<Testrun: id=%r, test_id=%r, submission_id=%r>'
             % (self.id, self.test_id, self.submission_id)
@@ -29,7 +29,7 @@ from hashlib import sha256
 from random import choice
 from warnings import warn
 
-from sqlalchemy import Column, ForeignKey, Table
+from sqlalchemy import Column, ForeignKey, Index, Table, select
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import backref, relationship, synonym
 from sqlalchemy.types import DateTime, Enum, Integer, Unicode
@@ -225,6 +225,32 @@ event_members = Table('event_members', metadata,
     Column('event_id', Integer, ForeignKey('events.id'), primary_key=True),
 )
 
+# All teachers, tutors and members of events with the lesson and team they
+# are in, maintained from the tables above by sauce.model.membership
+event_membership = Table('event_membership', metadata,
+    Column('event_id', Integer, ForeignKey('events.id', ondelete='CASCADE'), nullable=False),
+    Column('lesson_id', Integer, ForeignKey('lessons.id', ondelete='CASCADE'), nullable=True),
+    Column('team_id', Integer, ForeignKey('teams.id', ondelete='CASCADE'), nullable=True),
+    Column('user_id', Integer, ForeignKey('users.id', ondelete='CASCADE'), nullable=False),
+    Column('role', Unicode(8), nullable=False),
+    Index('ix_event_membership_event_id', 'event_id', 'role', 'user_id'),
+    Index('ix_event_membership_lesson_id', 'lesson_id', 'role', 'user_id'),
+    Index('ix_event_membership_team_id', 'team_id', 'user_id'),
+    Index('ix_event_membership_user_id', 'user_id'),
+)
+
+
+def membership_user_ids(role, **kwargs):
+    '''Select the ids of the users with role in event_membership
+
+    The keyword arguments filter the rows by event_id, lesson_id or team_id.
+    '''
+    t = event_membership
+    q = select([t.c.user_id]).where(t.c.role == role)
+    for (key, value) in kwargs.iteritems():
+        q = q.where(t.c[key] == value)
+    return q
+
 
 class Team(DeclarativeBase):
     __tablename__ = 'teams'
@@ -262,7 +288,12 @@ class Team(DeclarativeBase):
 
     @property
     def submissions(self):
-        return [submission for user in self.members for submission in user.submissions]
+        if self.id is None:
+            return [submission for user in self.members for submission in user.submissions]
+        from sauce.model.submission import Submission
+        return (Submission.query
+            .filter(Submission.user_id.in_(membership_user_ids(u'member', team_id=self.id)))
+            .order_by(Submission.user_id, Submission.id).all())
 
     @property
     def users(self):  # pragma: no cover
@@ -65,11 +65,33 @@ ${parent.headers()}
       <span class="label label-inverse">None</span>
     % endif
     </dd>
+  % if score is not None:
     <dt>Score:</dt>
       <dd><span class="badge badge-info">${score}</span></dd>
+  % endif
 
 </dl>
 
+% if pending:
+  <div class="alert alert-info">
+    <strong>Your submission is being tested.</strong>
+    This page will be updated automatically once the results are available.
+  </div>
+  <script type="text/javascript">
+    (function poll() {
+      setTimeout(function() {
+        $.getJSON("${tg.url('./status')}", function(data) {
+          if (data.pending) {
+            poll();
+          } else {
+            window.location.reload();
+          }
+        }).error(poll);
+      }, 2000);
+    })();
+  </script>
+% endif
+
 % if compilation:
   <h2>Compilation result</h2>
   % if compilation.result:
@@ -137,7 +159,12 @@ ${parent.headers()}
         <tr>
           <th>Result</th>
           <td colspan="2">
-          % if testrun.result:
+          % if testrun.skipped:
+            <span class="label label-info" title="This test was not run because too many other tests failed already.
+  Fix these first, all tests are run when the assignment is over.">
+              Skipped
+            </span>
+          % elif testrun.result:
             <span class="label label-success" title="Your submission is correct. Congratulations!">
               Success
             </span>
@@ -158,7 +185,7 @@ ${parent.headers()}
           </td>
         </tr>
       % endif
-      % if testrun.test.visibility in ('visible', 'data_only') or request.allowance(testrun):
+      % if not testrun.skipped and (testrun.test.visibility in ('visible', 'data_only') or request.allowance(testrun)):
         % if testrun.test.argv:
           <tr>
             <th>Command line arguments</th>
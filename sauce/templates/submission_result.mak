@@ -22,6 +22,26 @@
   </a>
 </div>
 
+% if pending:
+  <div class="alert alert-info" id="grading-pending">
+    <strong>Your submission is being tested.</strong>
+    This page will be updated automatically once the results are available.
+  </div>
+  <script type="text/javascript">
+    (function poll() {
+      setTimeout(function() {
+        $.getJSON("${tg.url(submission.url + '/status')}", function(data) {
+          if (data.pending) {
+            poll();
+          } else {
+            window.location.reload();
+          }
+        }).error(poll);
+      }, 2000);
+    })();
+  </script>
+% endif
+
 % if compilation:
   <h2>Compilation result</h2>
   % if compilation.result:
@@ -85,11 +105,34 @@
         <th>Runtime</th>
         <td colspan="2">${testrun.runtime} seconds</td>
       </tr>
+      % if testrun.cpu_time is not None:
+      <tr>
+        <th>CPU time</th>
+        <td colspan="2">${'%.3f' % testrun.cpu_time} seconds
+          (${'%.3f' % testrun.user_time} user, ${'%.3f' % testrun.system_time} system)</td>
+      </tr>
+      % endif
+      % if testrun.max_rss is not None:
+      <tr>
+        <th>Peak memory</th>
+        <td colspan="2">${'%.1f' % (testrun.max_rss / 1024.0)} MB</td>
+      </tr>
+      % endif
       % if testrun.test.visibility in ('visible', 'result_only') or request.allowance(testrun):
         <tr>
           <th>Result</th>
           <td colspan="2">
-          % if testrun.result:
+          % if testrun.limit_hit:
+            <span class="label label-inverse" title="Your program was stopped because it used too many resources.">
+              ${h.resource_limit_name(testrun.limit_hit)} limit exceeded
+            </span>
+          % endif
+          % if testrun.skipped:
+            <span class="label label-info" title="This test was not run because too many other tests failed already.
+  Fix these first, all tests are run when the assignment is over.">
+              Skipped
+            </span>
+          % elif testrun.result:
             <span class="label label-success" title="Your submission is correct. Congratulations!">
               Success
             </span>
@@ -110,7 +153,7 @@
           </td>
         </tr>
       % endif
-      % if testrun.test.visibility in ('visible', 'data_only') or request.allowance(testrun):
+      % if not testrun.skipped and (testrun.test.visibility in ('visible', 'data_only') or request.allowance(testrun)):
         % if testrun.test.argv:
           <tr>
             <th>Command line arguments</th>
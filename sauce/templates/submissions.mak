@@ -35,7 +35,40 @@ definite_filters: ${unicode(definite_filters) | n}
 -->
 
 % if not view:
+  % if next_cursor:
+${c.table(value=values, **table_args) | n}
+<p id="submissions-more">
+  <button class="btn" data-next="${next_cursor}">More submissions</button>
+  <span class="muted">Showing <span class="shown">${len(values)}</span> of ${count} submissions</span>
+</p>
+<script type="text/javascript">
+  $('#submissions-more button').click(function() {
+    var button = $(this).attr('disabled', true);
+    $.getJSON("${rows_url}", {after: button.data('next')}, function(data) {
+      var table = $('table.tablesorter'), tbody = table.children('tbody');
+      $.each(data.rows, function(i, row) {
+        // The cells are escaped by the server like in the datagrid
+        var tr = $('<tr>').addClass(tbody.children('tr').length % 2 ? 'odd' : 'even');
+        $.each(row, function(j, cell) {
+          tr.append($('<td>').addClass('col_' + j).html(cell));
+        });
+        tbody.append(tr);
+      });
+      table.trigger('update');
+      $('#submissions-more .shown').text(table.find('tbody tr').length);
+      if (data.next) {
+        button.data('next', data.next).attr('disabled', false);
+      } else {
+        button.remove();
+      }
+    }).error(function() {
+      button.attr('disabled', false);
+    });
+  });
+</script>
+  % else:
 ${c.table(value=values) | n}
+  % endif
 % else:
 
 <p>
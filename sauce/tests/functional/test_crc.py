@@ -98,6 +98,25 @@ class TestEventAdminController(TestCase):
             'Lesson A/B', 'Lesson C/D', 'Lesson E',
             no=('Lesson Old A'))
 
+    def test_tests_edit(self):
+        '''Edit Test page on event admin page with the data stored as blobs'''
+        url = '/events/demo/admin/tests/1/edit'
+        response = app.get(url, extra_environ=self.environ)
+        ''':type response: webtest.TestResponse'''
+        response.mustcontain('Hello, Word?!')
+
+        form = response.forms[0]
+        form['output_data'] = u'Hello, World!'
+        form['input_data'] = u'42'
+        # The disabled id field would be submitted along with the hidden one
+        params = [(k, v) for (k, v) in form.submit_fields() if k != 'id'] + [('id', '1')]
+        app.post('/events/demo/admin/tests/1', params=params, extra_environ=self.environ, status=302)
+
+        test = model.DBSession.query(model.Test).get(1)
+        self.assertEqual(test.output_data, u'Hello, World!')
+        self.assertEqual(test.input_data, u'42')
+        self.assertEqual(model.DBSession.query(model.Blob).get(test.output_hash).refcount, 1)
+
 
 class TestLessonController(TestCase):
 
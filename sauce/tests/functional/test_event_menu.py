@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+'''Tests for the cached event menu'''
+#
+## SAUCE - System for AUtomated Code Evaluation
+## Copyright (C) 2013 Moritz Schlarb
+##
+## This program is free software: you can redistribute it and/or modify
+## it under the terms of the GNU Affero General Public License as published by
+## the Free Software Foundation, either version 3 of the License, or
+## any later version.
+##
+## This program is distributed in the hope that it will be useful,
+## but WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+## GNU Affero General Public License for more details.
+##
+## You should have received a copy of the GNU Affero General Public License
+## along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+try:
+    from unittest2 import TestCase
+except ImportError:
+    from unittest import TestCase
+
+from datetime import datetime, timedelta
+
+import transaction
+from sqlalchemy import event
+from tg import config
+
+from sauce.tests import load_app, setup_app, teardown_db
+from sauce import model
+from sauce.lib import menu
+
+
+__all__ = ['TestEventMenu']
+
+app = None
+''':type app: webtest.TestApp'''
+app_config = None
+
+
+def setUpModule():
+    global app, app_config
+    app = load_app()
+    # setup_app loads another configuration, keep the one of the app
+    app_config = config._current_obj()
+    setup_app()
+
+
+def tearDownModule():
+    model.DBSession.remove()
+    teardown_db()
+
+
+class TestEventMenu(TestCase):
+
+    def setUp(self):
+        menu.invalidate_event_menu()
+        self.statements = []
+        event.listen(model.DBSession.get_bind(), 'before_cursor_execute', self.count)
+
+    def tearDown(self):
+        event.remove(model.DBSession.get_bind(), 'before_cursor_execute', self.count)
+        app_config.pop('events.menu_cache', None)
+        menu.invalidate_event_menu()
+
+    def count(self, conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith('SELECT') and 'FROM events' in statement:
+            self.statements.append(statement)
+
+    def events_queries(self, url='/'):
+        self.statements = []
+        response = app.get(url)
+        self.assertIn('Programming in the Past', response)
+        return len(self.statements)
+
+    def test_queries_saved(self):
+        '''The event lists are only queried for the first request'''
+        app_config['events.menu_cache'] = '0'
+        uncached = self.events_queries()
+        app_config['events.menu_cache'] = '60'
+        first = self.events_queries()
+        second = self.events_queries()
+        self.assertEqual(first, uncached)
+        # current_events, future_events and previous_events
+        self.assertEqual(first - second, 3)
+
+    def test_invalidate_on_change(self):
+        self.events_queries()
+        e = model.Event.query.filter_by(_url='past').one()
+        e.name = u'Programming in the Distant Past'
+        transaction.commit()
+        response = app.get('/')
+        self.assertIn('Programming in the Distant Past', response)
+        e = model.Event.query.filter_by(_url='past').one()
+        e.name = u'Programming in the Past'
+        transaction.commit()
+
+    def test_expire_when_event_starts(self):
+        self.events_queries()
+        e = model.Event.query.filter_by(_url='future').one()
+        start_time = e.start_time
+        e.start_time = datetime.now() + timedelta(seconds=10)
+        transaction.commit()
+        self.events_queries()
+        (expires, _) = menu._event_menu
+        self.assertLessEqual(expires, datetime.now() + timedelta(seconds=10))
+        e = model.Event.query.filter_by(_url='future').one()
+        e.start_time = start_time
+        transaction.commit()
+
+    def test_menu_per_request(self):
+        '''Every request gets its own event menu from the cached event lists'''
+        self.events_queries()
+        m = menu.cached_menu_events()
+        length = len(m)
+        m.append(menu.MenuHeader(u'Changed'))
+        self.assertEqual(self.events_queries(), 0)
+        self.assertIsNot(menu.cached_menu_events(), m)
+        self.assertEqual(len(menu.cached_menu_events()), length)
+
+    def test_render_unchanged(self):
+        '''Rendering a menu does not change it'''
+        m = menu.Menu(u'Events')
+        m.append(menu.MenuItem(u'Listing', '/events'))
+        first = m.render(direction='vertical')
+        self.assertEqual(m.render(direction='vertical'), first)
+        self.assertEqual(first.count(u'Events'), 1)
+        self.assertEqual(len(m), 1)
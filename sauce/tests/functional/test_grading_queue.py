@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+'''Tests for grading submissions through the queue'''
+#
+## SAUCE - System for AUtomated Code Evaluation
+## Copyright (C) 2013 Moritz Schlarb
+##
+## This program is free software: you can redistribute it and/or modify
+## it under the terms of the GNU Affero General Public License as published by
+## the Free Software Foundation, either version 3 of the License, or
+## any later version.
+##
+## This program is distributed in the hope that it will be useful,
+## but WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+## GNU Affero General Public License for more details.
+##
+## You should have received a copy of the GNU Affero General Public License
+## along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+try:
+    from unittest2 import TestCase
+except ImportError:
+    from unittest import TestCase
+
+from datetime import datetime, timedelta
+
+import transaction
+from tg import config
+
+from sauce.tests import load_app, setup_app, teardown_db
+from sauce import model
+from sauce.lib import worker
+
+
+__all__ = ['TestGradingQueue']
+
+app = None
+''':type app: webtest.TestApp'''
+app_config = None
+
+
+def setUpModule():
+    global app, app_config
+    app = load_app()
+    # setup_app loads another configuration, keep the one of the app
+    app_config = config._current_obj()
+    setup_app()
+
+
+def tearDownModule():
+    model.DBSession.remove()
+    teardown_db()
+
+
+class TestGradingQueue(TestCase):
+
+    environ = {'REMOTE_USER': 'tutor1'}
+
+    def setUp(self):
+        app_config['grading.queue'] = 'true'
+
+    def tearDown(self):
+        app_config.pop('grading.queue', None)
+
+    def test_result_pending_until_processed(self):
+        kw = dict(extra_environ=self.environ)
+
+        response = app.get('/events/demo/sheets/1/assignments/1/submit', **kw)
+        url = response.location[len('http://localhost'):-len('/edit')]
+        response = response.follow(**kw)
+        response.form.set('filename', 'submission.txt')
+        response.form.set('full_source', 'SourceCodeFromField')
+        response = response.form.submit(**kw)
+
+        response = app.get(url + '/result', **kw)
+        response.mustcontain('grading-pending')
+        self.assertTrue(app.get(url + '/status', **kw).json['pending'])
+
+        # Reloading the page must not enqueue the submission again
+        app.get(url + '/result', **kw)
+        self.assertEqual(model.GradingJob.query.filter_by(state='pending').count(), 1)
+
+        self.assertTrue(worker.process('test'))
+        self.assertFalse(worker.process('test'))
+
+        status = app.get(url + '/status', **kw).json
+        self.assertFalse(status['pending'])
+        self.assertEqual(status['state'], 'done')
+
+        response = app.get(url + '/result', **kw)
+        response.mustcontain('Testrun results', no=['grading-pending'])
+
+        # Forcing a new run enqueues a new job and redirects to the plain page
+        response = app.get(url + '/result', params=dict(force_test=1), **kw)
+        response = response.follow(**kw)
+        response.mustcontain('grading-pending')
+
+        self.assertTrue(worker.process('test'))
+        job = model.GradingJob.query.filter_by(state='done').one()
+        self.assertEqual(job.worker, 'test')
+
+    def test_staged_completed_after_end(self):
+        kw = dict(extra_environ={'REMOTE_USER': 'studenta1'})
+        # The worker runs outside of the requests of the app
+        app_config['runner.staged_failures'] = config['runner.staged_failures'] = '1'
+        try:
+            response = app.get('/events/demo/sheets/2/assignments/1/submit', **kw)
+            url = response.location[len('http://localhost'):-len('/edit')]
+            response = response.follow(**kw)
+            response.form.set('filename', 'submission.py')
+            response.form.set('full_source', 'print 42')
+            response = response.form.submit(**kw)
+
+            app.get(url + '/result', **kw)
+            self.assertTrue(worker.process('test'))
+            submission = model.Submission.query.get(int(url.rsplit('/', 1)[1]))
+            self.assertTrue(submission.grading_job.staged)
+            self.assertGreater(submission.skipped, 0)
+
+            # Once the assignment is over, the skipped tests are run
+            assignment = submission.assignment
+            assignment._end_time = datetime.now() - timedelta(minutes=1)
+            transaction.commit()
+
+            response = app.get(url + '/result', **kw)
+            response.mustcontain('grading-pending')
+            job = model.GradingJob.query.filter_by(state='pending').one()
+            self.assertFalse(job.staged)
+            self.assertTrue(worker.process('test'))
+            submission = model.Submission.query.get(int(url.rsplit('/', 1)[1]))
+            self.assertEqual(submission.skipped, 0)
+
+            app.get(url + '/result', **kw)
+            self.assertEqual(model.GradingJob.query.filter_by(state='pending').count(), 0)
+        finally:
+            app_config.pop('runner.staged_failures', None)
+            config.pop('runner.staged_failures', None)
+            transaction.abort()
+            assignment = model.Assignment.query.filter_by(name=u'Square it').one()
+            assignment._end_time = None
+            transaction.commit()
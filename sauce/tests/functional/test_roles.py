@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+'''Tests for the RoleIndex of the teachers and tutors'''
+#
+## SAUCE - System for AUtomated Code Evaluation
+## Copyright (C) 2013 Moritz Schlarb
+##
+## This program is free software: you can redistribute it and/or modify
+## it under the terms of the GNU Affero General Public License as published by
+## the Free Software Foundation, either version 3 of the License, or
+## any later version.
+##
+## This program is distributed in the hope that it will be useful,
+## but WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+## GNU Affero General Public License for more details.
+##
+## You should have received a copy of the GNU Affero General Public License
+## along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+try:
+    from unittest2 import TestCase
+except ImportError:
+    from unittest import TestCase
+
+from warnings import catch_warnings, simplefilter
+
+from sqlalchemy import event
+
+from sauce.tests import load_app, setup_app, teardown_db
+from sauce import model
+from sauce.lib.authz import RoleIndex
+
+
+__all__ = ['TestRoleIndex']
+
+app = None
+''':type app: webtest.TestApp'''
+
+
+def setUpModule():
+    global app
+    app = load_app()
+    setup_app()
+
+
+def tearDownModule():
+    model.DBSession.remove()
+    teardown_db()
+
+
+def traverse(user, obj):
+    '''Check the object hierarchy for teachers and tutors like before the RoleIndex'''
+    while obj:
+        for group in ('teachers', 'tutors'):
+            if user in getattr(obj, group, []):
+                return True
+        for attr in ('teacher', 'tutor'):
+            if user is getattr(obj, attr, None):
+                return True
+        obj = getattr(obj, 'parent', None)
+    return False
+
+
+class TestRoleIndex(TestCase):
+
+    def setUp(self):
+        self.users = model.User.query.all()
+        self.objects = [obj for cls in (model.Event, model.Lesson, model.Sheet, model.Assignment,
+                model.Submission, model.Judgement, model.Test, model.Testrun)
+            for obj in cls.query.all()]
+
+    def tearDown(self):
+        model.DBSession.rollback()
+
+    def test_one_query(self):
+        user = model.User.query.filter_by(user_name='teacher1').one()
+        statements = []
+
+        def count(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        roles = RoleIndex(user)
+        event.listen(model.DBSession.get_bind(), 'before_cursor_execute', count)
+        try:
+            for obj in self.objects:
+                roles.allowance(obj)
+        finally:
+            event.remove(model.DBSession.get_bind(), 'before_cursor_execute', count)
+        self.assertEqual(len(statements), 1)
+
+    def test_allowance(self):
+        '''The RoleIndex agrees with traversing the object hierarchy'''
+        with catch_warnings():
+            # Event.teacher and Lesson.tutor are deprecated
+            simplefilter('ignore', DeprecationWarning)
+            for user in self.users:
+                roles = RoleIndex(user)
+                for obj in self.objects:
+                    self.assertEqual(roles.allowance(obj), traverse(user, obj), (user, obj))
+
+    def test_has_role(self):
+        for user in self.users:
+            roles = RoleIndex(user)
+            for e in model.Event.query:
+                self.assertEqual(roles.has_role(e, 'teacher'), user in e.teachers or user is e._teacher)
+                self.assertEqual(roles.has_role(e, 'tutor'), user in e.tutors or
+                    any(user is l._tutor for l in e.lessons))
+                self.assertEqual(roles.has_role(e, 'member'), user in e.members)
+            for l in model.Lesson.query:
+                self.assertEqual(roles.has_role(l, 'member'), user in l.members)
+            for t in model.Team.query:
+                self.assertEqual(roles.has_role(t, 'member'), user in t)
+
+    def test_anonymous(self):
+        roles = RoleIndex(None)
+        self.assertFalse(roles.has_role(model.Event.query.first(), 'teacher', 'tutor', 'member'))
@@ -22,6 +22,13 @@ try:
 except ImportError:
     from unittest import TestCase
 
+import json
+import re
+
+import transaction
+from sqlalchemy import event
+from tg import config
+
 from sauce.tests import load_app, setup_app, teardown_db
 from sauce import model
 
@@ -30,11 +37,13 @@ __all__ = ['TestSubmissionTable']
 
 app = None
 ''':type app: webtest.TestApp'''
+app_config = None
 
 
 def setUpModule():
-    global app
+    global app, app_config
     app = load_app()
+    app_config = config._current_obj()
     setup_app()
 
 
@@ -60,3 +69,138 @@ class TestSubmissionTable(TestCase):
         ''':type response: webtest.TestResponse'''
         response.mustcontain('Student C1', 'Student D1', 'Long Term Student 2',
             no=('Student A1', 'Student B1', 'Student Old1', 'Student Old2'))
+
+    def count_queries(self, url, user):
+        statements = []
+
+        def count(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(model.DBSession.get_bind(), 'before_cursor_execute', count)
+        try:
+            app.get(url, extra_environ={'REMOTE_USER': user})
+        finally:
+            event.remove(model.DBSession.get_bind(), 'before_cursor_execute', count)
+        return len(statements)
+
+    def test_query_count(self):
+        '''The number of queries does not depend on the number of submissions'''
+        urls = (('/events/demo/submissions/', 'teacher1'), ('/events/demo/lessons/2/submissions/', 'tutor1'))
+        # Warm up the caches that are filled by the first request
+        for (url, user) in urls:
+            self.count_queries(url, user)
+        before = [self.count_queries(url, user) for (url, user) in urls]
+
+        assignment = model.Assignment.query.filter_by(id=1).one()
+        language = model.Language.query.first()
+        submissions = [model.Submission(assignment=assignment, language=language,
+                user=user, source=u'print "Hello World!"')
+            for user in model.Event.query.filter_by(_url='demo').one().members for _ in range(2)]
+        model.DBSession.add_all(submissions)
+        transaction.commit()
+        try:
+            after = [self.count_queries(url, user) for (url, user) in urls]
+            self.assertEqual(after, before)
+        finally:
+            for submission in submissions:
+                model.DBSession.delete(model.DBSession.merge(submission))
+            transaction.commit()
+
+
+class TestSubmissionPaging(TestCase):
+
+    def setUp(self):
+        app_config['submissions.page_size'] = 3
+
+    def tearDown(self):
+        del app_config['submissions.page_size']
+
+    def submission_ids(self, text):
+        return [int(i) for i in re.findall(r'/submissions/(\d+)/show', text)]
+
+    def test_pages(self):
+        '''All submissions are shown page by page in descending order'''
+        environ = {'REMOTE_USER': 'teacher1'}
+        response = app.get('/events/demo/submissions/', extra_environ=environ)
+        response.mustcontain('More submissions')
+        ids = self.submission_ids(response.body)
+        self.assertEqual(len(ids), 3)
+        cursor = re.search(r'data-next="([^"]+)"', response.body).group(1)
+        count = None
+        while cursor:
+            page = app.get('/events/demo/submissions/rows', params={'after': cursor},
+                extra_environ=environ).json
+            self.assertLessEqual(len(page['rows']), 3)
+            count = page['count']
+            ids.extend(self.submission_ids(u''.join(row[0] for row in page['rows'])))
+            cursor = page['next']
+        self.assertEqual(len(ids), count)
+        self.assertEqual(len(set(ids)), count)
+        submissions = dict((s.id, s) for s in model.Submission.query.filter(model.Submission.id.in_(ids)))
+        keys = [(submissions[i].modified, i) for i in ids]
+        self.assertEqual(keys, sorted(keys, reverse=True))
+
+    def test_filters(self):
+        '''The rows of the next pages are filtered like the first page'''
+        environ = {'REMOTE_USER': 'teacher1'}
+        response = app.get('/events/demo/submissions/sheet/1', extra_environ=environ)
+        ids = self.submission_ids(response.body)
+        cursor = re.search(r'data-next="([^"]+)"', response.body)
+        cursor = cursor and cursor.group(1)
+        while cursor:
+            page = app.get('/events/demo/submissions/rows/sheet/1', params={'after': cursor},
+                extra_environ=environ).json
+            ids.extend(self.submission_ids(u''.join(row[0] for row in page['rows'])))
+            cursor = page['next']
+        sheet = (model.Sheet.query.join(model.Event).filter(model.Event._url == 'demo')
+            .filter(model.Sheet.sheet_id == 1).one())
+        self.assertEqual(sorted(ids), sorted(s.id for a in sheet.assignments for s in a.submissions))
+
+    def test_all(self):
+        '''A page size of 0 shows all submissions at once'''
+        app_config['submissions.page_size'] = 0
+        response = app.get('/events/demo/submissions/', extra_environ={'REMOTE_USER': 'teacher1'})
+        self.assertNotIn('More submissions', response.body)
+        event = model.Event.query.filter_by(_url='demo').one()
+        self.assertEqual(len(self.submission_ids(response.body)),
+            sum(len(a.submissions) for s in event.sheets for a in s.assignments))
+
+    def test_sorting(self):
+        '''Only tables that show all submissions are sortable'''
+        environ = {'REMOTE_USER': 'teacher1'}
+        response = app.get('/events/demo/submissions/', extra_environ=environ)
+        options = json.loads(re.search(r'tablesorter\((.*?)\)', response.body).group(1))
+        self.assertEqual(options['sortList'], [])
+        self.assertTrue(all(not h['sorter'] for h in options['headers'].itervalues()))
+
+        app_config['submissions.page_size'] = 0
+        response = app.get('/events/demo/submissions/', extra_environ=environ)
+        options = json.loads(re.search(r'tablesorter\((.*?)\)', response.body).group(1))
+        self.assertTrue(options['sortList'])
+        self.assertLess(len(options['headers']), 13)
+
+    def test_escaped(self):
+        '''The rows of the next pages are escaped like the first page'''
+        environ = {'REMOTE_USER': 'teacher1'}
+        languages = dict((l.id, l.name) for l in model.Language.query)
+        for language in model.Language.query:
+            language.name = u'<b>%s</b>' % language.name
+        transaction.commit()
+        try:
+            response = app.get('/events/demo/submissions/', extra_environ=environ)
+            cursor = re.search(r'data-next="([^"]+)"', response.body).group(1)
+            page = app.get('/events/demo/submissions/rows', params={'after': cursor},
+                extra_environ=environ).json
+            cells = [cell for row in page['rows'] for cell in row]
+            self.assertTrue(any(u'&lt;b&gt;' in cell for cell in cells))
+            self.assertFalse(any(u'<b>' in cell for cell in cells))
+            # The actions are still HTML
+            self.assertTrue(all(u'<a href=' in row[0] for row in page['rows']))
+        finally:
+            for language in model.Language.query:
+                language.name = languages[language.id]
+            transaction.commit()
+
+    def test_invalid_cursor(self):
+        app.get('/events/demo/submissions/rows', params={'after': 'foo'},
+            extra_environ={'REMOTE_USER': 'teacher1'}, status=400)
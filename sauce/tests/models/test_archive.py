@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+'''Tests for archiving testruns'''
+#
+## SAUCE - System for AUtomated Code Evaluation
+## Copyright (C) 2013 Moritz Schlarb
+##
+## This program is free software: you can redistribute it and/or modify
+## it under the terms of the GNU Affero General Public License as published by
+## the Free Software Foundation, either version 3 of the License, or
+## any later version.
+##
+## This program is distributed in the hope that it will be useful,
+## but WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+## GNU Affero General Public License for more details.
+##
+## You should have received a copy of the GNU Affero General Public License
+## along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from datetime import datetime, timedelta
+
+try:
+    from unittest2 import TestCase
+except ImportError:
+    from unittest import TestCase
+
+from sauce.lib.archive import archivable
+from sauce.model import (DBSession, Assignment, Blob, Course, Sheet, Test, Testrun, TestrunArchive,
+    Submission, User, Language, Interpreter)
+
+__all__ = ['TestTestrunArchive']
+
+
+class TestTestrunArchive(TestCase):
+
+    def setUp(self):
+        self.event = Course(name=u'Archive', _url='archive', enabled=True,
+            start_time=datetime.now() - timedelta(days=100), end_time=datetime.now() - timedelta(days=10))
+        self.sheet = Sheet(name=u'Archive', sheet_id=1, event=self.event)
+        self.assignment = Assignment(id=27, name=u'Archive', assignment_id=27, timeout=1, sheet=self.sheet)
+        self.tests = [Test(assignment=self.assignment, input_data=unicode(i), output_data=u'%d\n' % i)
+            for i in range(3)]
+        self.language = Language(id=27, name=u'Python', extension_src=u'py', extension_bin=u'py',
+            interpreter=Interpreter(id=27, name=u'Python', path=u'/usr/bin/python2.7', argv=u'{binfile}'))
+        self.user = User(user_name=u'archive', email_address=u'archive@example.com', display_name=u'Archive')
+        self.submission = Submission(assignment=self.assignment, language=self.language,
+            user=self.user, source=u'print raw_input() * 1000')
+        DBSession.add_all([self.event, self.sheet, self.assignment, self.language, self.user,
+            self.submission] + self.tests)
+        DBSession.flush()
+        self.submission.run_tests()
+
+    def tearDown(self):
+        DBSession.rollback()
+
+    def test_archivable(self):
+        self.assertEqual(archivable(datetime.now()).all(), [(self.submission.id,)])
+        self.assertEqual(archivable(datetime.now() - timedelta(days=20)).all(), [])
+
+    def test_archive(self):
+        s = self.submission
+        testruns = sorted(set(s.testruns), key=lambda t: (t.date, t.id))
+        expected = [(t.id, t.test.id, t.date, t.result, t.output_data, t.error_data) for t in testruns]
+        summary = (s.result, s.passed, s.failed, s.total, s.runtime, s.testrun_date)
+        blobs = DBSession.query(Blob).count()
+
+        self.assertEqual(TestrunArchive.archive(s), 3)
+        DBSession.flush()
+        self.assertEqual(DBSession.query(Testrun).filter_by(submission_id=s.id).count(), 0)
+        self.assertEqual(archivable(datetime.now()).all(), [])
+        # The output blobs are released
+        self.assertLess(DBSession.query(Blob).count(), blobs)
+        self.assertEqual((s.result, s.passed, s.failed, s.total, s.runtime, s.testrun_date), summary)
+
+        # Load everything from the database again
+        DBSession.expunge_all()
+        s = DBSession.query(Submission).get(s.id)
+        self.assertEqual(s.testruns, [])
+        archived = s.archived_testruns
+        self.assertEqual([(t.id, t.test.id, t.date, t.result, t.output_data, t.error_data) for t in archived],
+            expected)
+        self.assertEqual(s.visible_testruns, archived)
+        self.assertFalse(any(t in DBSession for t in archived))
+        DBSession.flush()
+        self.assertEqual(DBSession.query(Testrun).filter_by(submission_id=s.id).count(), 0)
+
+    def test_backfill(self):
+        '''The backfill keeps the summaries of archived submissions'''
+        s = self.submission
+        summary = (s.result, s.passed, s.failed, s.total, s.runtime, s.testrun_date)
+        TestrunArchive.archive(s)
+        DBSession.flush()
+        # What sauce-backfill does for every batch of submissions
+        self.assertEqual(Submission.update_summaries([s.id]), 0)
+        Submission.update_summaries()
+        DBSession.expunge_all()
+        s = DBSession.query(Submission).get(s.id)
+        self.assertEqual((s.result, s.passed, s.failed, s.total, s.runtime, s.testrun_date), summary)
+        self.assertIsNotNone(s.testrun_archive)
+
+    def test_run_again(self):
+        '''Running the tests again replaces the archived testruns'''
+        s = self.submission
+        TestrunArchive.archive(s)
+        self.assertEqual(len(s.archived_testruns), 3)
+        s.run_tests()
+        self.assertIsNone(s.testrun_archive)
+        self.assertEqual(s.archived_testruns, [])
+        self.assertEqual(len(s.testruns), 3)
+        self.assertEqual(DBSession.query(TestrunArchive).count(), 0)
+
+    def test_delete(self):
+        TestrunArchive.archive(self.submission)
+        DBSession.delete(self.submission)
+        DBSession.flush()
+        self.assertEqual(DBSession.query(TestrunArchive).count(), 0)
@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+'''Tests for the blob store'''
+#
+## SAUCE - System for AUtomated Code Evaluation
+## Copyright (C) 2013 Moritz Schlarb
+##
+## This program is free software: you can redistribute it and/or modify
+## it under the terms of the GNU Affero General Public License as published by
+## the Free Software Foundation, either version 3 of the License, or
+## any later version.
+##
+## This program is distributed in the hope that it will be useful,
+## but WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+## GNU Affero General Public License for more details.
+##
+## You should have received a copy of the GNU Affero General Public License
+## along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+try:
+    from unittest2 import TestCase
+except ImportError:
+    from unittest import TestCase
+
+from tg import config
+
+from sauce.model import (DBSession, Assignment, Blob, Test, Testrun, Submission, User,
+    Language, Interpreter)
+from sauce.model.blob import delta, patch
+
+__all__ = ['TestPack', 'TestDelta', 'TestBlob', 'TestOutputDelta']
+
+
+class TestPack(TestCase):
+
+    def test_pack(self):
+        for text in (u'', u'short', u'ä' * 1000, u'abc' * 1000):
+            row = Blob.pack(text)
+            self.assertEqual(row['size'], len(text.encode('utf-8')))
+            self.assertEqual(Blob.unpack(row['compression'], row['data']), text)
+
+    def test_compression(self):
+        self.assertEqual(Blob.pack(u'abc' * 1000)['compression'], u'zlib')
+        self.assertLess(len(Blob.pack(u'abc' * 1000)['data']), 3000)
+        # Not worth it
+        self.assertIsNone(Blob.pack(u'abc')['compression'])
+        row = Blob.pack(u'abc' * 1000, 'none')
+        self.assertIsNone(row['compression'])
+        self.assertEqual(row['data'], 'abc' * 1000)
+
+    def test_coerce(self):
+        self.assertIsNone(Blob.coerce(None))
+        self.assertEqual(Blob.coerce('ä'), u'ä')
+        self.assertEqual(Blob.coerce(42), u'42')
+
+
+class TestDelta(TestCase):
+
+    def test_delta(self):
+        base = u'\n'.join(unicode(i) for i in range(1000))
+        for text in (base[:500], base[:2000] + u'x' + base[2001:], base[:100] + u'ä' + base[100:],
+                base + u'\n', base[10:]):
+            d = delta(base, text)
+            self.assertLess(len(d), len(text) / 2)
+            self.assertEqual(patch(base, d), text)
+
+    def test_no_delta(self):
+        '''Texts that differ too much are not stored as delta'''
+        self.assertIsNone(delta(u'abc' * 100, u'xyz' * 100))
+        self.assertIsNone(delta(u'a', u'b'))
+        base = u'\n'.join(unicode(i) for i in range(1000))
+        self.assertIsNone(delta(base, u'x' + base + u'x'))
+
+
+class TestBlob(TestCase):
+
+    def setUp(self):
+        self.assignment = Assignment(id=24, name=u'Blob', assignment_id=24, timeout=1)
+        self.tests = [Test(assignment=self.assignment, input_data=unicode(i), output_data=unicode(i))
+            for i in range(3)]
+        self.language = Language(id=24, name=u'Python', extension_src=u'py', extension_bin=u'py',
+            interpreter=Interpreter(id=24, name=u'Python', path=u'/usr/bin/python2.7', argv=u'{binfile}'))
+        self.user = User(user_name=u'blob', email_address=u'blob@example.com', display_name=u'Blob')
+        DBSession.add_all([self.assignment, self.language, self.user] + self.tests)
+        DBSession.flush()
+
+    def tearDown(self):
+        DBSession.rollback()
+
+    def submission(self, source):
+        submission = Submission(assignment=self.assignment, language=self.language,
+            user=self.user, source=source)
+        DBSession.add(submission)
+        DBSession.flush()
+        return submission
+
+    def blob(self, text):
+        return DBSession.query(Blob).get(Blob.hash_text(text))
+
+    def refcount(self, text):
+        blob = self.blob(text)
+        if blob is None:
+            return 0
+        DBSession.refresh(blob)
+        return blob.refcount
+
+    def test_deduplication(self):
+        '''Identical sources are stored only once'''
+        source = u'print "Hello World!"' * 100
+        s1, s2 = self.submission(source), self.submission(source)
+        self.assertEqual(s1.source_blob, s2.source_blob)
+        self.assertEqual(self.refcount(source), 2)
+        self.assertEqual(self.blob(source).size, len(source))
+
+        DBSession.delete(s1)
+        DBSession.flush()
+        self.assertEqual(self.refcount(source), 1)
+        DBSession.delete(s2)
+        DBSession.flush()
+        self.assertIsNone(self.blob(source))
+
+    def test_update(self):
+        s = self.submission(u'old')
+        self.assertEqual(self.refcount(u'old'), 1)
+        s.source = u'new'
+        DBSession.flush()
+        self.assertIsNone(self.blob(u'old'))
+        self.assertEqual(self.refcount(u'new'), 1)
+        s.source = None
+        DBSession.flush()
+        self.assertIsNone(s.source_blob)
+        self.assertIsNone(self.blob(u'new'))
+
+    def test_acquire_release(self):
+        connection = DBSession.connection()
+        text = u'acquired' * 100
+        h = Blob.hash_text(text)
+        Blob.acquire(connection, {h: 2}, {h: text})
+        self.assertEqual(self.refcount(text), 2)
+        Blob.acquire(connection, {h: 1}, {})
+        self.assertEqual(self.refcount(text), 3)
+        Blob.release(connection, {h: 2})
+        self.assertEqual(self.refcount(text), 1)
+        Blob.release(connection, {h: 1})
+        self.assertIsNone(self.blob(text))
+
+    def test_load(self):
+        '''The text is loaded from the blobs table'''
+        source = u'ä' * 1000
+        s = self.submission(source)
+        DBSession.expunge(s)
+        s = DBSession.query(Submission).get(s.id)
+        self.assertNotIn('_blobs', s.__dict__)
+        self.assertEqual(s.source, source)
+
+    def test_testruns(self):
+        '''Identical output of testruns is stored only once'''
+        s = self.submission(u'print raw_input()')
+        (_, testruns, result) = s.run_tests()
+        self.assertTrue(result)
+        self.assertEqual(set(t.output_data for t in s.testruns), set([u'0\n', u'1\n', u'2\n']))
+        # The error output of all testruns is empty
+        self.assertEqual(self.refcount(u''), 3)
+
+        s.run_tests()
+        self.assertEqual(self.refcount(u''), 3)
+        self.assertEqual(self.refcount(u'1\n'), 1)
+
+        t = self.submission(u'print raw_input()')
+        t.run_tests()
+        self.assertEqual(self.refcount(u''), 6)
+        self.assertEqual(self.refcount(u'1\n'), 2)
+
+
+class TestOutputDelta(TestCase):
+
+    def setUp(self):
+        self.assignment = Assignment(id=25, name=u'Delta', assignment_id=25, timeout=1)
+        self.test = Test(assignment=self.assignment, input_data=u'1000',
+            output_data=u''.join(u'%d\n' % i for i in range(1000)))
+        self.language = Language(id=25, name=u'Python', extension_src=u'py', extension_bin=u'py',
+            interpreter=Interpreter(id=25, name=u'Python', path=u'/usr/bin/python2.7', argv=u'{binfile}'))
+        self.user = User(user_name=u'delta', email_address=u'delta@example.com', display_name=u'Delta')
+        DBSession.add_all([self.assignment, self.test, self.language, self.user])
+        DBSession.flush()
+
+    def tearDown(self):
+        config.pop('blobs.output_delta', None)
+        DBSession.rollback()
+
+    def run_source(self, source):
+        submission = Submission(assignment=self.assignment, language=self.language,
+            user=self.user, source=source)
+        DBSession.add(submission)
+        DBSession.flush()
+        submission.run_tests()
+        testrun = submission.testruns[0]
+        # Load it again from the database
+        DBSession.expunge(testrun)
+        return DBSession.query(Testrun).get(testrun.id)
+
+    def test_same(self):
+        testrun = self.run_source(u'for i in range(input()): print i')
+        self.assertTrue(testrun.result)
+        self.assertEqual(testrun.output_mode, u'same')
+        self.assertIsNone(testrun.output_blob)
+        self.assertEqual(testrun.expected_blob, self.test.output_hash)
+        self.assertEqual(testrun.output_data, self.test.output_data)
+
+    def test_delta(self):
+        testrun = self.run_source(u'for i in range(input()): print i if i != 500 else "x"')
+        self.assertFalse(testrun.result)
+        self.assertEqual(testrun.output_mode, u'delta')
+        self.assertLess(DBSession.query(Blob).get(testrun.output_blob).size, 100)
+        self.assertEqual(testrun.output_data, self.test.output_data.replace(u'\n500\n', u'\nx\n'))
+
+    def test_full(self):
+        testrun = self.run_source(u'print "Hello World!"')
+        self.assertIsNone(testrun.output_mode)
+        self.assertIsNone(testrun.expected_blob)
+        self.assertEqual(testrun.output_data, u'Hello World!\n')
+
+    def test_disabled(self):
+        config['blobs.output_delta'] = 'false'
+        testrun = self.run_source(u'for i in range(input()): print i')
+        self.assertIsNone(testrun.output_mode)
+        self.assertEqual(testrun.output_data, self.test.output_data)
+
+    def test_set(self):
+        '''Setting the output stores it as it is'''
+        testrun = self.run_source(u'for i in range(input()): print i')
+        testrun.output_data = u'Hello World!\n'
+        DBSession.flush()
+        self.assertIsNone(testrun.output_mode)
+        self.assertIsNone(testrun.expected_blob)
+        self.assertEqual(testrun.output_data, u'Hello World!\n')
@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+'''Tests for the grading memo, staged grading and storing testruns'''
+#
+## SAUCE - System for AUtomated Code Evaluation
+## Copyright (C) 2013 Moritz Schlarb
+##
+## This program is free software: you can redistribute it and/or modify
+## it under the terms of the GNU Affero General Public License as published by
+## the Free Software Foundation, either version 3 of the License, or
+## any later version.
+##
+## This program is distributed in the hope that it will be useful,
+## but WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+## GNU Affero General Public License for more details.
+##
+## You should have received a copy of the GNU Affero General Public License
+## along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from datetime import datetime, timedelta
+
+try:
+    from unittest2 import TestCase
+except ImportError:
+    from unittest import TestCase
+
+from sqlalchemy import event
+from tg import config
+
+from sauce.model import (DBSession, Assignment, Test, Testrun, Submission, User,
+    Language, Interpreter, GradingMemo, Blob)
+
+__all__ = ['TestGradingMemo', 'TestStagedGrading', 'TestStoreTestruns']
+
+
+class TestGradingMemo(TestCase):
+
+    def setUp(self):
+        config['grading.memo'] = 'true'
+        self.assignment = Assignment(id=21, name=u'Memo', assignment_id=21, timeout=1)
+        self.test = Test(assignment=self.assignment, output_data=u'Hello World!')
+        self.language = Language(id=21, name=u'Python', extension_src=u'py', extension_bin=u'py',
+            interpreter=Interpreter(id=21, name=u'Python', path=u'/usr/bin/python2.7', argv=u'{binfile}'))
+        self.user = User(user_name=u'memo', email_address=u'memo@example.com', display_name=u'Memo')
+        DBSession.add_all((self.assignment, self.test, self.language, self.user))
+        DBSession.flush()
+
+    def tearDown(self):
+        config.pop('grading.memo', None)
+        DBSession.rollback()
+
+    def submission(self, source):
+        submission = Submission(assignment=self.assignment, language=self.language,
+            user=self.user, source=source)
+        DBSession.add(submission)
+        DBSession.flush()
+        return submission
+
+    def test_memo(self):
+        '''Identical submissions are only run once'''
+        source = u'print "Hello World!"'
+
+        (_, testruns, result) = self.submission(source).run_tests()
+        self.assertTrue(result)
+        self.assertEqual(GradingMemo.statistics(self.assignment)['misses'], 1)
+
+        submission = self.submission(source)
+        (_, memo_testruns, result) = submission.run_tests()
+        self.assertTrue(result)
+        self.assertEqual(len(submission.testruns), 1)
+        self.assertEqual(submission.testruns[0].output_data, testruns[0].output_data)
+        self.assertEqual(submission.testruns[0].max_rss, testruns[0].usage.max_rss)
+        self.assertEqual([t.test for t in memo_testruns], [self.test])
+
+        stats = GradingMemo.statistics(self.assignment)
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+
+    def test_memo_blobs(self):
+        '''Memos refer to the output in the blobs, which they keep'''
+        source = u'print "Hello World!"\nimport sys\nsys.stderr.write("Oops")'
+        submission = self.submission(source)
+        submission.run_tests()
+        memo = GradingMemo.lookup(GradingMemo.key_for(submission))
+        self.assertEqual([row['test_id'] for row in memo.testruns], [self.test.id])
+        self.assertNotIn('Oops', repr(memo.testruns))
+        error_blob = memo.testruns[0]['error_blob']
+        self.assertEqual(DBSession.query(Blob).get(error_blob).refcount, 2)
+
+        # The blobs outlive the testruns they have been stored for
+        DBSession.delete(submission)
+        DBSession.flush()
+        submission = self.submission(source)
+        submission.run_tests()
+        self.assertEqual(GradingMemo.statistics(self.assignment)['hits'], 1)
+        self.assertEqual(submission.testruns[0].error_data, u'Oops')
+        self.assertEqual(submission.testruns[0].output_data, u'Hello World!\n')
+
+        DBSession.delete(submission)
+        DBSession.delete(memo)
+        DBSession.flush()
+        self.assertIsNone(DBSession.query(Blob).get(error_blob))
+
+    def test_key_deferred(self):
+        '''The memo key does not load the input and output data of the tests'''
+        submission_id = self.submission(u'print "Hello World!"').id
+        DBSession.expunge_all()
+        submission = DBSession.query(Submission).get(submission_id)
+        key = GradingMemo.key_for(submission)
+        test = submission.assignment.tests[0]
+        self.assertNotIn('_blobs', test.__dict__)
+
+        # But the data is represented by its hash
+        test.output_data = u'Goodbye World!'
+        DBSession.flush()
+        self.assertNotEqual(GradingMemo.key_for(submission), key)
+
+    def test_memo_invalidated(self):
+        '''Changing a test changes the memo key'''
+        submission = self.submission(u'print "Hello World!"')
+        key = GradingMemo.key_for(submission)
+        submission.run_tests()
+
+        self.test.output_data = u'Goodbye World!'
+        DBSession.flush()
+        self.assertNotEqual(GradingMemo.key_for(submission), key)
+        (_, _, result) = submission.run_tests()
+        self.assertFalse(result)
+
+        stats = GradingMemo.statistics(self.assignment)
+        self.assertEqual((stats['hits'], stats['misses']), (0, 2))
+
+    def test_statistics(self):
+        '''Every miss is counted, even if no memo is stored or memos are deleted'''
+        source = u'print "Hello World!"'
+        self.submission(source).run_tests()
+        self.submission(source).run_tests()
+        for memo in GradingMemo.query.filter_by(assignment_id=self.assignment.id):
+            DBSession.delete(memo)
+        DBSession.flush()
+        self.submission(source).run_tests()
+
+        # Outcomes with timeouts are not remembered
+        self.assignment.timeout = 0.5
+        self.submission(u'while True: pass').run_tests()
+        self.submission(u'while True: pass').run_tests()
+
+        stats = GradingMemo.statistics(self.assignment)
+        self.assertEqual((stats['hits'], stats['misses']), (1, 4))
+        self.assertGreater(stats['saved_runtime'], 0.0)
+        self.assertEqual(GradingMemo.statistics()['misses'], 4)
+
+
+class TestStagedGrading(TestCase):
+
+    def setUp(self):
+        config['runner.staged_failures'] = '1'
+        now = datetime.now()
+        self.assignment = Assignment(id=22, name=u'Staged', assignment_id=22, timeout=1,
+            _start_time=now - timedelta(days=1), _end_time=now + timedelta(days=1))
+        self.tests = [Test(assignment=self.assignment, input_data=name, output_data=u'Hello %s!' % name)
+            for name in (u'Alice', u'Bob', u'Carol')]
+        self.language = Language(id=22, name=u'Python', extension_src=u'py', extension_bin=u'py',
+            interpreter=Interpreter(id=22, name=u'Python', path=u'/usr/bin/python2.7', argv=u'{binfile}'))
+        self.user = User(user_name=u'staged', email_address=u'staged@example.com', display_name=u'Staged')
+        DBSession.add_all([self.assignment, self.language, self.user] + self.tests)
+        DBSession.flush()
+
+    def tearDown(self):
+        config.pop('runner.staged_failures', None)
+        DBSession.rollback()
+
+    def submission(self, source):
+        submission = Submission(assignment=self.assignment, language=self.language,
+            user=self.user, source=source)
+        DBSession.add(submission)
+        DBSession.flush()
+        return submission
+
+    def test_failure_rates(self):
+        alice, bob, carol = self.tests
+        self.assertEqual(Testrun.failure_rates(self.tests), {alice.id: 0.5, bob.id: 0.5, carol.id: 0.5})
+        # Fails for Bob only
+        self.submission(u'name = raw_input()\nprint "Hello %s!" % name.replace("Bob", "Rob")').run_tests()
+        rates = Testrun.failure_rates(self.tests)
+        self.assertLess(rates[alice.id], rates[bob.id])
+        self.assertEqual(rates[alice.id], rates[carol.id])
+
+    def test_staged(self):
+        alice, bob, carol = self.tests
+        self.submission(u'name = raw_input()\nprint "Hello %s!" % name.replace("Bob", "Rob")').run_tests()
+
+        submission = self.submission(u'print "Hello World!"')
+        (_, testruns, result) = submission.run_tests(staged=True)
+        self.assertFalse(result)
+        # The test that failed before is run first
+        self.assertEqual([t.test for t in testruns], [bob, alice, carol])
+        self.assertEqual([t.skipped for t in testruns], [False, True, True])
+        self.assertEqual(sorted(t.skipped for t in set(submission.testruns)), [False, True, True])
+        # Skipped testruns don't count for the failure rates
+        self.assertEqual(Testrun.failure_rates([alice])[alice.id], 1.0 / 3)
+
+        # Full run without staging, or when the assignment is over
+        (_, testruns, _) = submission.run_tests()
+        self.assertFalse(any(t.skipped for t in testruns))
+        self.assignment._end_time = datetime.now() - timedelta(minutes=1)
+        (_, testruns, _) = submission.run_tests(staged=True)
+        self.assertFalse(any(t.skipped for t in testruns))
+
+
+class TestStoreTestruns(TestCase):
+
+    def setUp(self):
+        self.assignment = Assignment(id=23, name=u'Bulk', assignment_id=23, timeout=1)
+        self.tests = [Test(assignment=self.assignment, input_data=unicode(i), output_data=unicode(i))
+            for i in range(5)]
+        self.language = Language(id=23, name=u'Python', extension_src=u'py', extension_bin=u'py',
+            interpreter=Interpreter(id=23, name=u'Python', path=u'/usr/bin/python2.7', argv=u'{binfile}'))
+        self.user = User(user_name=u'bulk', email_address=u'bulk@example.com', display_name=u'Bulk')
+        self.submission = Submission(assignment=self.assignment, language=self.language,
+            user=self.user, source=u'print raw_input()')
+        DBSession.add_all([self.assignment, self.language, self.user, self.submission] + self.tests)
+        DBSession.flush()
+
+    def tearDown(self):
+        DBSession.rollback()
+
+    def test_store_testruns(self):
+        statements = []
+
+        def count(conn, cursor, statement, parameters, context, executemany):
+            if 'testruns' in statement and not statement.startswith('SELECT'):
+                statements.append(statement.split()[0])
+
+        self.submission.run_tests()
+        self.assertEqual(len(self.submission.testruns), 5)
+        old = set(self.submission.testruns)
+
+        engine = DBSession.get_bind()
+        event.listen(engine, 'before_cursor_execute', count)
+        try:
+            (_, testruns, result) = self.submission.run_tests()
+        finally:
+            event.remove(engine, 'before_cursor_execute', count)
+        self.assertTrue(result)
+        # One DELETE for all old rows, one executemany INSERT for the new ones
+        self.assertEqual(statements, ['DELETE', 'INSERT'])
+        self.assertEqual(len(self.submission.testruns), 5)
+        # The old testruns are not in the session anymore
+        self.assertFalse(old & set(self.submission.testruns))
+        self.assertFalse(any(t in DBSession for t in old))
+        self.assertEqual([t.test for t in self.submission.testruns], self.tests)
+        self.assertEqual(len(self.tests[0].testruns), 1)
+        self.assertEqual(DBSession.query(Testrun).filter_by(submission_id=self.submission.id).count(), 5)
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+'''Tests for the event membership table'''
+#
+## SAUCE - System for AUtomated Code Evaluation
+## Copyright (C) 2013 Moritz Schlarb
+##
+## This program is free software: you can redistribute it and/or modify
+## it under the terms of the GNU Affero General Public License as published by
+## the Free Software Foundation, either version 3 of the License, or
+## any later version.
+##
+## This program is distributed in the hope that it will be useful,
+## but WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+## GNU Affero General Public License for more details.
+##
+## You should have received a copy of the GNU Affero General Public License
+## along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from datetime import datetime, timedelta
+
+try:
+    from unittest2 import TestCase
+except ImportError:
+    from unittest import TestCase
+
+from sqlalchemy import select
+
+from sauce.model import DBSession, Course, Lesson, Team, User
+from sauce.model.membership import rebuild_membership
+from sauce.model.user import event_membership
+
+__all__ = ['TestEventMembership']
+
+
+class TestEventMembership(TestCase):
+
+    def setUp(self):
+        self.users = [User(user_name=u'membership%d' % i, email_address=u'membership%d@example.com' % i,
+            display_name=u'Membership %d' % i) for i in range(6)]
+        (self.teacher, self.tutor, self.member, self.lesson_member, self.team_member, self.other) = self.users
+        self.events = [Course(name=u'Membership %d' % i, _url='membership%d' % i, enabled=True,
+            start_time=datetime.now() - timedelta(days=1), end_time=datetime.now() + timedelta(days=1))
+            for i in range(2)]
+        self.event = self.events[0]
+        self.event.teachers.append(self.teacher)
+        self.event._members.append(self.member)
+        self.lesson = Lesson(lesson_id=1, name=u'Membership', event=self.event,
+            tutors=[self.tutor], _members=[self.lesson_member])
+        self.team = Team(name=u'Membership', lesson=self.lesson, members=[self.team_member])
+        DBSession.add_all(self.users + self.events + [self.lesson, self.team])
+        DBSession.flush()
+
+    def tearDown(self):
+        DBSession.rollback()
+
+    def rows(self):
+        t = event_membership
+        return sorted(DBSession.execute(select([t.c.event_id, t.c.lesson_id, t.c.team_id, t.c.user_id, t.c.role])
+            .where(t.c.event_id.in_([e.id for e in self.events]))).fetchall())
+
+    def expected(self):
+        e, l, t = self.event.id, self.lesson.id, self.team.id
+        return sorted([
+            (e, None, None, self.teacher.id, u'teacher'),
+            (e, l, None, self.tutor.id, u'tutor'),
+            (e, None, None, self.member.id, u'member'),
+            (e, l, None, self.lesson_member.id, u'member'),
+            (e, l, t, self.team_member.id, u'member'),
+        ])
+
+    def test_created(self):
+        self.assertEqual(self.rows(), self.expected())
+        self.assertEqual(self.event.members, set([self.member, self.lesson_member, self.team_member]))
+        self.assertEqual(self.event.tutors, set([self.tutor]))
+        self.assertEqual(self.event.teams, set([self.team]))
+        self.assertEqual(self.lesson.members, set([self.lesson_member, self.team_member]))
+        self.assertEqual(self.event.members_query().all(),
+            sorted([self.member, self.lesson_member, self.team_member], key=lambda u: u.user_name))
+
+    def test_rebuild(self):
+        DBSession.execute(event_membership.delete())
+        rebuild_membership(DBSession.connection())
+        self.assertEqual(self.rows(), self.expected())
+
+    def test_add_and_remove(self):
+        self.team.members.append(self.other)
+        DBSession.flush()
+        self.assertIn((self.event.id, self.lesson.id, self.team.id, self.other.id, u'member'), self.rows())
+        self.assertIn(self.other, self.event.members)
+
+        self.other.teams.remove(self.team)
+        self.other._lessons.append(self.lesson)
+        self.assertIn(self.other, self.lesson.members)
+        self.assertNotIn((self.event.id, self.lesson.id, self.team.id, self.other.id, u'member'), self.rows())
+
+        self.lesson.tutors.remove(self.tutor)
+        self.assertEqual(self.event.tutors, set())
+
+    def test_move(self):
+        other = Lesson(lesson_id=1, name=u'Other', event=self.events[1])
+        DBSession.add(other)
+        DBSession.flush()
+        self.team.lesson = other
+        DBSession.flush()
+        self.assertEqual(self.event.members, set([self.member, self.lesson_member]))
+        self.assertEqual(self.events[1].members, set([self.team_member]))
+        self.assertEqual(other.members, set([self.team_member]))
+
+    def test_delete_team(self):
+        DBSession.delete(self.team)
+        DBSession.flush()
+        self.assertEqual(self.rows(), [r for r in self.expected() if r[2] is None])
+
+    def test_delete_user(self):
+        DBSession.delete(self.lesson_member)
+        DBSession.flush()
+        self.assertEqual(self.lesson.members, set([self.team_member]))
+        self.assertNotIn(self.lesson_member.id, [r[3] for r in self.rows()])
+
+    def test_delete_lesson(self):
+        DBSession.delete(self.lesson)
+        DBSession.flush()
+        self.assertEqual(sorted(r[4] for r in self.rows()), [u'member', u'teacher'])
+        self.assertEqual(self.event.members, set([self.member]))
+
+    def test_incremental(self):
+        # Only the rows of the changed memberships are touched
+        t = event_membership
+        DBSession.execute(t.delete().where(t.c.role == u'teacher'))
+        self.lesson._members.append(self.other)
+        DBSession.flush()
+        self.assertIn((self.event.id, self.lesson.id, None, self.other.id, u'member'), self.rows())
+        self.assertNotIn(u'teacher', [r[4] for r in self.rows()])
+
+        self.event.teachers.append(self.other)
+        DBSession.flush()
+        self.assertEqual([r[3] for r in self.rows() if r[4] == u'teacher'], [self.other.id])
+
+    def test_move_lesson(self):
+        self.lesson.event = self.events[1]
+        DBSession.flush()
+        self.assertEqual(self.event.members, set([self.member]))
+        self.assertEqual(self.event.tutors, set())
+        self.assertEqual(self.events[1].members, set([self.lesson_member, self.team_member]))
+        self.assertEqual(self.events[1].tutors, set([self.tutor]))
@@ -27,9 +27,11 @@ try:
 except ImportError:
     from unittest import TestCase
 
-from sauce.model import Assignment, Submission
+from sauce.model import (DBSession, Assignment, Submission, Test, User,
+    Language, Interpreter)
+from sauce.widgets.submission_table import SubmissionTableFiller
 
-__all__ = ['TestAssignment', 'TestSubmission']
+__all__ = ['TestAssignment', 'TestSubmission', 'TestSubmissionSummary']
 
 
 class TestAssignment(TestCase):
@@ -231,3 +233,83 @@ class TestSubmission(TestCase):
         assert end_head == 3, end_head
         assert start_foot == 5, start_foot
         assert end_foot == 8, end_foot
+
+
+class TestSubmissionSummary(TestCase):
+
+    def setUp(self):
+        self.assignment = Assignment(id=26, name=u'Summary', assignment_id=26, timeout=1)
+        self.tests = [Test(assignment=self.assignment, input_data=unicode(i), output_data=u'1')
+            for i in range(3)]
+        self.language = Language(id=26, name=u'Python', extension_src=u'py', extension_bin=u'py',
+            interpreter=Interpreter(id=26, name=u'Python', path=u'/usr/bin/python2.7', argv=u'{binfile}'))
+        self.user = User(user_name=u'summary', email_address=u'summary@example.com', display_name=u'Summary')
+        self.submission = Submission(assignment=self.assignment, language=self.language,
+            user=self.user, source=u'print raw_input()')
+        DBSession.add_all([self.assignment, self.language, self.user, self.submission] + self.tests)
+        DBSession.flush()
+
+    def tearDown(self):
+        DBSession.rollback()
+
+    def assertSummary(self, submission, result, passed, failed, total):
+        self.assertEqual((submission.result, submission.passed, submission.failed, submission.total),
+            (result, passed, failed, total))
+
+    def test_summary(self):
+        s = self.submission
+        self.assertSummary(s, None, 0, 0, 0)
+        self.assertIsNone(s.testrun_date)
+
+        s.run_tests()
+        self.assertSummary(s, False, 1, 2, 3)
+        self.assertEqual(s.runtime, sum(t.runtime for t in s.testruns))
+        self.assertEqual(s.testrun_date, max(t.date for t in s.testruns))
+
+        s.source = u'print 1'
+        s.run_tests()
+        self.assertSummary(s, True, 3, 0, 3)
+
+    def test_delete_test(self):
+        '''Deleting a test updates the summaries of its testruns' submissions'''
+        s = self.submission
+        s.run_tests()
+        self.assertSummary(s, False, 1, 2, 3)
+        failed = [t for t in self.tests if t.input_data != u'1']
+        DBSession.delete(failed[0])
+        DBSession.flush()
+        self.assertSummary(s, False, 1, 1, 2)
+        DBSession.delete(failed[1])
+        DBSession.flush()
+        self.assertSummary(s, True, 1, 0, 1)
+
+    def test_delete_testruns(self):
+        s = self.submission
+        s.run_tests()
+        s.delete_testruns(keep_summary=True)
+        self.assertSummary(s, False, 1, 2, 3)
+        s.delete_testruns()
+        DBSession.flush()
+        DBSession.refresh(s)
+        self.assertSummary(s, None, 0, 0, 0)
+        self.assertIsNone(s.testrun_date)
+
+    def test_update_summaries(self):
+        s = self.submission
+        s.run_tests()
+        summary = (s.result, s.passed, s.failed, s.total, s.runtime, s.testrun_date)
+        s.result, s.passed, s.failed, s.total, s.runtime, s.testrun_date = None, 0, 0, 0, 0.0, None
+        DBSession.flush()
+
+        self.assertEqual(Submission.update_summaries([s.id]), 1)
+        DBSession.refresh(s)
+        self.assertEqual((s.result, s.passed, s.failed, s.total, s.runtime, s.testrun_date), summary)
+
+    def test_table(self):
+        '''Listing the result does not load the testruns'''
+        self.submission.run_tests()
+        DBSession.flush()
+        DBSession.expunge(self.submission)
+        s = DBSession.query(Submission).get(self.submission.id)
+        self.assertIn(u'Failed', SubmissionTableFiller(DBSession).result(s))
+        self.assertNotIn('testruns', s.__dict__)
@@ -0,0 +1,324 @@
+# -*- coding: utf-8 -*-
+'''Tests for the conversion of test output data'''
+#
+## SAUCE - System for AUtomated Code Evaluation
+## Copyright (C) 2013 Moritz Schlarb
+##
+## This program is free software: you can redistribute it and/or modify
+## it under the terms of the GNU Affero General Public License as published by
+## the Free Software Foundation, either version 3 of the License, or
+## any later version.
+##
+## This program is distributed in the hope that it will be useful,
+## but WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+## GNU Affero General Public License for more details.
+##
+## You should have received a copy of the GNU Affero General Public License
+## along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+import os
+import random
+from itertools import product
+
+try:
+    from unittest2 import TestCase
+except ImportError:
+    from unittest import TestCase
+
+from sauce.lib.conversion import conversion_options, Converter, iterlines, compare, compare_numeric, numpy
+
+import logging
+log = logging.getLogger(__name__)
+
+__all__ = ['TestConversion']
+
+
+def legacy_convert(self, data):
+    '''Test.convert before the conversion pipeline, for reference'''
+    data = data.strip()
+    # Normalize the values from database since they might be ''
+    if self.separator:
+        separator = self.separator
+    else:
+        separator = None
+
+    if self.comment_prefix:
+        data = '\n'.join(l.strip() for l in data.splitlines()
+            if not l.strip().startswith(self.comment_prefix))
+    else:
+        data = '\n'.join(l.strip() for l in data.splitlines())
+
+    if self.ignore_case:
+        data = data.lower()
+
+    # if we need to sort output for parallel
+    if self.parallel_sort:
+        tmp = data.splitlines()
+        liste = {}
+        rest = []
+        result = ""
+        for i in tmp:
+            if unicode(i).find("[") > -1 and unicode(i).find("]") > -1:
+                pos = int(unicode(i)[unicode(i).find("[") + 1:
+                    unicode(i).find("]")])
+                if pos in liste:
+                    liste[pos].append(i)
+                else:
+                    liste[pos] = []
+                    liste[pos].append(i)
+            else:
+                rest.append(i)
+        for i in rest:
+            result += unicode(i) + "\n"
+        for i in liste:
+            result += '\n'.join(unicode(j) for j in liste[i]) + "\n"
+        data = result
+
+    if self.splitlines and self.split:
+        d = [[ll for ll in l.split(separator) if ll]
+            for l in data.splitlines()]
+    elif self.splitlines:
+        d = [l for l in data.splitlines()]
+    elif self.split:
+        d = [l for l in data.split(separator) if l]
+    else:
+        d = data
+
+    def make_parser():
+        # TODO: Allow parsing errors to be logged/shown somewhere, not hiding them all
+        _parser = None
+
+        if self.parse_float:
+            _parser = float
+        if self.parse_int:
+            _parser = int
+
+        if _parser:
+            if self.strip_parse_errors:
+                def parser(x):
+                    try:
+                        return _parser(x)
+                    except:
+                        log.debug('Error while parsing', exc_info=True)
+                        return u''
+            else:
+                def parser(x):
+                    try:
+                        return _parser(x)
+                    except:
+                        log.debug('Error while parsing', exc_info=True)
+                        return x
+            return parser
+        else:
+            return None
+
+    parser = make_parser()
+    if parser:
+        if self.splitlines and self.split:
+            d = [[parser(b) for b in a] for a in d]
+        elif self.splitlines or self.split:
+            d = [parser(a) for a in d]
+        else:
+            d = parser(d)
+
+    if self.sort:
+        d = sorted(d)
+
+    return d
+
+
+def legacy_unconvert(self, d):
+    '''Test.unconvert without float precision, for reference'''
+    sep = self.separator or u' '
+    if self.splitlines and self.split:
+        d = '\n'.join([sep.join(map(unicode, a)) for a in d])
+    elif self.splitlines:
+        d = '\n'.join(map(unicode, d))
+    elif self.split:
+        d = sep.join(map(unicode, d))
+    else:
+        d = unicode(d)
+    return unicode(d)
+
+
+def legacy_validate(options, expected_data, output_data):
+    '''result and partial like Test.validate before the comparator'''
+    expected = legacy_unconvert(options, legacy_convert(options, expected_data)).strip() if expected_data else u''
+    observed = legacy_unconvert(options, legacy_convert(options, output_data)).strip() if output_data else u''
+    if expected == observed:
+        return (True, False)
+    elif observed and expected.startswith(observed):
+        return (False, True)
+    return (False, False)
+
+
+SAMPLES = [
+    u'', u'\n', u'  \n\n  ', u'Hello World', u'Hello World\n', u'\n\n  Hello  World  \n\n',
+    u'#Result:\n1,2,3\n4,5,6\n,7,8,9\n', u'1, 2,,3\n\n4 ,5\n6\n\n\n',
+    u'a\r\nb\rc\x0bd\x1ce\u2028f\x85g', u'  # comment\nA B\n# c\n\nC d\n#\n',
+    u'[1] one\nplain\n[0] zero\n[1] uno\n\n[x] bad', u'[2] b\n[1] a\n[2] c',
+    u'x--y---z\n--\nw', u'3.5 2.25\n1e3 inf\n7 x\n', u'\t42\t\n\x0c17\n',
+]
+
+# Small block sizes to get lines and separators across block boundaries
+BLOCKSIZES = [1, 2, 5, 64 * 1024]
+
+SEPARATORS = [None, u'', u',', u'--', u'\n', u'\n\n', u' ']
+
+
+class TestConversion(TestCase):
+    '''Test that the conversion pipeline behaves exactly like the old Test.convert'''
+
+    def assertSameConversion(self, options, data):
+        try:
+            expected = legacy_convert(options, data)
+        except Exception as e:
+            for blocksize in BLOCKSIZES:
+                with self.assertRaises(type(e)):
+                    Converter(options, blocksize)(data)
+            return
+        for blocksize in BLOCKSIZES:
+            self.assertEqual(Converter(options, blocksize)(data), expected, (options, blocksize, data))
+
+    def assertSameComparison(self, options, expected_data, output_data):
+        try:
+            legacy = legacy_validate(options, expected_data, output_data)
+        except Exception:
+            return
+        expected = legacy_unconvert(options, legacy_convert(options, expected_data)).strip() if expected_data else u''
+        for blocksize in BLOCKSIZES:
+            converter = Converter(options, blocksize)
+            chunks = converter.chunks(output_data, unicode, options.separator or u' ') if output_data else []
+            c = compare(expected, chunks)
+            self.assertEqual(c[0:2], legacy, (options, blocksize, expected_data, output_data))
+            if c.result:
+                self.assertIsNone(c.position)
+            else:
+                self.assertLessEqual(c.position, len(expected))
+                # Everything before the position matches
+                observed = legacy_unconvert(options, legacy_convert(options, output_data)).strip()
+                self.assertTrue(observed.startswith(expected[:c.position]))
+
+    def test_chunks(self):
+        for data in SAMPLES:
+            for separator in SEPARATORS:
+                for (splitlines, split) in product([False, True], [False, True]):
+                    options = conversion_options(u'#', False, False, separator, splitlines, split, False,
+                        False, False, False)
+                    for blocksize in BLOCKSIZES:
+                        self.assertEqual(u''.join(Converter(options, blocksize).chunks(data, unicode,
+                            separator or u' ')),
+                            legacy_unconvert(options, legacy_convert(options, data)))
+
+    def test_compare(self):
+        self.assertEqual(compare(u'Hello World', [u'Hello', u' ', u'World']), (True, False, None))
+        self.assertEqual(compare(u'Hello World', [u'  ', u'\n Hello W']), (False, True, 7))
+        self.assertEqual(compare(u'Hello World', [u'Hello', u' ', u'Welt']), (False, False, 7))
+        self.assertEqual(compare(u'Hello World', [u'Hello World', u'  \n']), (True, False, None))
+        self.assertEqual(compare(u'Hello World', []), (False, False, 0))
+        self.assertEqual(compare(u'', [u' ', u'\n']), (True, False, None))
+        self.assertEqual(compare(u'', [u'x']), (False, False, 0))
+
+    def test_compare_early_exit(self):
+        consumed = []
+
+        def chunks():
+            for i in xrange(1000):
+                consumed.append(i)
+                yield u'b'
+        self.assertEqual(compare(u'aaa', chunks()), (False, False, 0))
+        self.assertEqual(consumed, [0])
+
+    def test_compare_matrix(self):
+        for (comment_prefix, ignore_case, splitlines, split, parse) in \
+                product([None, u'#'], [False, True], [False, True], [False, True],
+                        [None, 'int', 'strip']):
+            for separator in SEPARATORS:
+                options = conversion_options(comment_prefix, ignore_case, False,
+                    separator, splitlines, split, False,
+                    parse == 'int', parse == 'strip', parse == 'strip')
+                for (expected_data, output_data) in product(SAMPLES[3:8], SAMPLES):
+                    self.assertSameComparison(options, expected_data, output_data)
+                    self.assertSameComparison(options, expected_data, expected_data[:len(expected_data) // 2])
+
+    def test_iterlines(self):
+        for data in SAMPLES + [s.encode('utf-8') for s in SAMPLES]:
+            for blocksize in BLOCKSIZES:
+                self.assertEqual([line for batch in iterlines(data, blocksize) for line in batch],
+                    data.splitlines())
+
+    def test_matrix(self):
+        for (comment_prefix, ignore_case, parallel_sort, splitlines, split, sort, parse) in \
+                product([None, u'#'], [False, True], [False, True], [False, True], [False, True],
+                        [False, True], [None, 'int', 'float', 'strip']):
+            for separator in SEPARATORS:
+                options = conversion_options(comment_prefix, ignore_case, parallel_sort,
+                    separator, splitlines, split, sort,
+                    parse == 'int', parse in ('float', 'strip'), parse == 'strip')
+                for data in SAMPLES:
+                    self.assertSameConversion(options, data)
+
+    def test_random(self):
+        rnd = random.Random(42)
+        alphabet = u'ab1.,- #[]\n\n\r\t'
+        for _ in xrange(2000):
+            data = u''.join(rnd.choice(alphabet) for _ in xrange(rnd.randint(0, 40)))
+            options = conversion_options(rnd.choice([None, u'#']), rnd.random() < 0.5, rnd.random() < 0.2,
+                rnd.choice(SEPARATORS), rnd.random() < 0.5, rnd.random() < 0.5, rnd.random() < 0.5,
+                False, rnd.random() < 0.5, rnd.random() < 0.5)
+            self.assertSameConversion(options, data)
+
+    def test_array(self):
+        if numpy is None:
+            self.skipTest('numpy not available')
+        for data in SAMPLES:
+            for separator in SEPARATORS:
+                for (splitlines, split, sort) in product([False, True], repeat=3):
+                    if sort and not (splitlines or split):
+                        # Sorts the characters of the output
+                        continue
+                    options = conversion_options(u'#', False, False, separator, splitlines, split, sort,
+                        False, True, False)
+                    try:
+                        expected = legacy_convert(options, data)
+                    except Exception:
+                        continue
+                    if splitlines and split:
+                        expected = [t for a in expected for t in a]
+                    elif not (splitlines or split):
+                        expected = [expected]
+                    expected = [t for t in expected if t != u'']
+                    if sort:
+                        expected.sort()
+                    for blocksize in BLOCKSIZES:
+                        converter = Converter(options, blocksize)
+                        if not all(isinstance(t, float) for t in expected):
+                            with self.assertRaises(ValueError):
+                                converter.array(data)
+                        else:
+                            self.assertEqual(list(converter.array(data)), expected)
+
+    def test_compare_numeric(self):
+        if numpy is None:
+            self.skipTest('numpy not available')
+        a = numpy.array
+        self.assertEqual(compare_numeric(a([1.0, 2.0]), a([1.0, 2.0])), (True, False, None, None, 2, 2))
+        # Deviations within the tolerances are not reported
+        self.assertEqual(compare_numeric(a([1.0, 2.0]), a([1.0, 2.1]), 0.2), (True, False, None, None, 2, 2))
+        self.assertFalse(compare_numeric(a([1.0, 2.0]), a([1.0, 2.1]), 0.01).result)
+        self.assertTrue(compare_numeric(a([100.0]), a([101.0]), None, 0.01).result)
+        self.assertFalse(compare_numeric(a([1.0]), a([1.02]), None, 0.01).result)
+        d = compare_numeric(a([1.0, 5.0, 3.0]), a([1.5, 2.0, 3.0]), 1.0)
+        self.assertEqual((d.result, d.partial, d.index, d.magnitude), (False, False, 1, 3.0))
+        # Only the deviations beyond the tolerances are reported
+        d = compare_numeric(a([100.0, 1.0]), a([105.0, 1.5]), 0.1, 0.1)
+        self.assertEqual((d.result, d.index, d.magnitude), (False, 1, 0.5))
+        self.assertEqual(compare_numeric(a([1.0, 2.0]), a([1.0])), (False, True, None, None, 2, 1))
+        self.assertEqual(compare_numeric(a([1.0]), a([1.0, 2.0])), (False, False, None, None, 1, 2))
+        self.assertEqual(compare_numeric(a([]), a([])), (True, False, None, None, 0, 0))
+        inf, nan = float('inf'), float('nan')
+        self.assertTrue(compare_numeric(a([inf, nan]), a([inf, nan])).result)
+        d = compare_numeric(a([1.0, 2.0]), a([nan, 2.0]), 1.0)
+        self.assertEqual((d.result, d.index), (False, 0))
@@ -22,6 +22,12 @@
 ## along with this program.  If not, see <http://www.gnu.org/licenses/>.
 #
 
+import os
+from time import time
+from threading import Event
+from tempfile import mkdtemp
+from shutil import rmtree
+
 try:
     from unittest2 import TestCase
 except ImportError:
@@ -30,7 +36,8 @@ from sauce.tests import *
 
 from sauce.model import Assignment, Submission, Language, Compiler, Interpreter, Test, User
 
-from sauce.lib.runner import Runner, MAX_DATA_LENGTH
+from sauce.lib import runner
+from sauce.lib.runner import Runner, WorkspacePool, MAX_DATA_LENGTH
 
 __all__ = ['TestRunner']
 
@@ -115,6 +122,47 @@ int main(void) {
                 for testrun in testruns:
                     self.assertTrue(testrun.result, 'C testrun failed')
 
+    def test_compile_cache(self):
+        '''Test runner with a cached C compilation'''
+
+        self.sc = Submission(id=13, assignment=self.a,
+                             language=self.lc, user=self.s)
+        self.sc.source = r'''
+#include <stdio.h>
+
+int main(void) {
+    printf("Hello World!\n");
+    return 0;
+}
+'''
+
+        cache = mkdtemp()
+        compile = runner.compile
+        try:
+            with Runner(self.sc, compile_cache=cache) as r:
+                compilation = r.compile()
+                self.assertTrue(compilation.result, 'C compilation failed')
+
+            def fail(*args, **kwargs):
+                raise AssertionError('Compiler invoked despite cached compilation')
+            runner.compile = fail
+
+            with Runner(self.sc, compile_cache=cache) as r:
+                self.assertEqual(r.compile(), compilation)
+                testruns = [testrun for testrun in r.test()]
+                self.assertTrue(testruns)
+                for testrun in testruns:
+                    self.assertTrue(testrun.result, 'C testrun from cache failed')
+
+            # A changed source must not be taken from the cache
+            self.sc.source += u'\n'
+            runner.compile = compile
+            with Runner(self.sc, compile_cache=cache) as r:
+                self.assertTrue(r.compile().result, 'C compilation failed')
+        finally:
+            runner.compile = compile
+            rmtree(cache)
+
     def test_run_python(self):
         '''Test runner with a python submission'''
 
@@ -131,6 +179,7 @@ print "Hello World!"
                 testruns = [testrun for testrun in r.test()]
                 for testrun in testruns:
                     self.assertTrue(testrun.result, 'Python testrun failed')
+                    self.assertGreater(testrun.usage.max_rss, 0, 'Python testrun memory usage unknown')
 
     def test_run_python_file(self):
         '''Test runner with a python submission and file input/output'''
@@ -290,3 +339,173 @@ print "Hello %s!" % (sys.stdin.read())
             testruns = [testrun for testrun in r.test()]
             for testrun in testruns:
                 self.assertTrue(testrun.result, 'Python testrun failed')
+
+    def test_run_parallel(self):
+        '''Test runner with tests run in parallel'''
+
+        a = Assignment(id=4, name='Assignment D',
+            description='Write a program that says Hello to someone from a file to a file.',
+            timeout=2)
+        tests = [Test(input_type='file', output_type='file',
+                      assignment=a, input_data=name, output_data='Hello %s!' % name,
+                      argv='{infile} {outfile}')
+                 for name in ('Alice', 'Bob', 'Carol', 'Dave')]
+
+        self.sp = Submission(id=13, assignment=a,
+                             language=self.lp, user=self.s)
+        self.sp.source = r'''
+import sys
+import time
+filein = sys.argv[1]
+fileout = sys.argv[2]
+time.sleep(0.5)
+with open(filein, 'r') as fi:
+    with open(fileout, 'w') as fo:
+        fo.write("Hello %s!" % fi.read())
+'''
+
+        with Runner(self.sp, parallel=4) as r:
+            start = time()
+            testruns = [testrun for testrun in r.test()]
+            end = time()
+        self.assertEqual([testrun.test for testrun in testruns], tests)
+        for testrun in testruns:
+            self.assertTrue(testrun.result, 'Parallel testrun failed: %r' % (testrun.output_data,))
+        # Four tests sleeping 0.5 seconds each should not take 2 seconds
+        self.assertLess(end - start, 2)
+
+    def test_staged(self):
+        '''Test runner stopping after too many failed tests'''
+
+        a = Assignment(id=5, name='Assignment E',
+            description='Write a program that says Hello to someone whos name is on stdin',
+            timeout=1)
+        tests = [Test(id=i, input_type='stdin', output_type='stdout',
+                      assignment=a, input_data=name, output_data='Hello %s!' % name)
+                 for (i, name) in enumerate(('Alice', 'Bob', 'Carol', 'Dave', 'Eve'), 1)]
+
+        self.sp = Submission(id=14, assignment=a,
+                             language=self.lp, user=self.s)
+        # Only knows Alice and Carol
+        self.sp.source = r'''
+name = raw_input()
+if name in ('Alice', 'Carol'):
+    print "Hello %s!" % name
+'''
+        failure_rates = {1: 0.1, 2: 0.2, 3: 0.9, 4: 0.5}
+
+        for parallel in (None, 4):
+            with Runner(self.sp, parallel=parallel) as r:
+                testruns = list(r.test(max_failures=2, failure_rates=failure_rates))
+            # Ordered by failure rate, stopped after the failures of Dave and Bob
+            self.assertEqual([t.test.id for t in testruns], [3, 4, 2, 1, 5])
+            self.assertEqual([t.result for t in testruns], [True, False, False, False, False])
+            self.assertEqual([t.skipped for t in testruns], [False, False, False, True, True])
+
+            with Runner(self.sp, parallel=parallel) as r:
+                testruns = list(r.test())
+            self.assertEqual([t.test for t in testruns], tests)
+            self.assertEqual([t.result for t in testruns], [True, False, True, False, False])
+            self.assertFalse(any(t.skipped for t in testruns))
+
+    def test_staged_parallel_stop(self):
+        '''Queued tests are not run after a parallel staged run has stopped'''
+
+        a = Assignment(id=6, name='Assignment F',
+            description='Write a program that fails slowly',
+            timeout=2)
+        tests = [Test(id=i, input_type='stdin', output_type='stdout',
+                      assignment=a, input_data=u'', output_data=u'Hello!')
+                 for i in range(1, 9)]
+
+        self.sp = Submission(id=15, assignment=a,
+                             language=self.lp, user=self.s)
+        self.sp.source = r'''
+import time
+time.sleep(0.3)
+'''
+        runs = []
+        with Runner(self.sp, parallel=2) as r:
+            run = r._run
+
+            def counting_run(*args):
+                runs.append(args)
+                return run(*args)
+            r._run = counting_run
+            testruns = list(r.test(max_failures=1, failure_rates={}))
+            self.assertEqual([t.skipped for t in testruns], [False] + [True] * 7)
+            # At most the tests that were already running when the first one failed
+            self.assertLessEqual(len(runs), 4)
+
+            # Jobs that are picked up after the stop are not run at all
+            stop = Event()
+            stop.set()
+            del runs[:]
+            self.assertIsNone(r._run_copy(r._prepare(tests[0]), stop))
+            self.assertEqual(runs, [])
+
+    def test_workspace_pool(self):
+        '''Test runner with pooled workspaces and a workspace quota'''
+
+        self.sp = Submission(id=14, assignment=self.a,
+                             language=self.lp, user=self.s)
+        self.sp.source = r'''
+with open('junk', 'w') as f:
+    f.write('x' * 2 * 1024 * 1024)
+print "Hello World!"
+'''
+
+        root = mkdtemp()
+        try:
+            with Runner(self.sp, workspace_root=root, workspace_pool=1, workspace_quota=1) as r:
+                tempdir = r.tempdir
+                self.assertTrue(tempdir.startswith(root))
+                testruns = [testrun for testrun in r.test()]
+            self.assertTrue(testruns)
+            for testrun in testruns:
+                self.assertFalse(testrun.result, 'Quota testrun should fail')
+                self.assertIn(testrun.limit, ('file_size', 'workspace'))
+
+            # The emptied workspace is handed out again
+            self.assertEqual(os.listdir(tempdir), [])
+            self.sp.source = u'print "Hello World!"\n'
+            with Runner(self.sp, workspace_root=root, workspace_pool=1, workspace_quota=1) as r:
+                self.assertEqual(r.tempdir, tempdir)
+                testruns = [testrun for testrun in r.test()]
+            for testrun in testruns:
+                self.assertTrue(testrun.result, 'Pooled testrun failed')
+        finally:
+            WorkspacePool.get(root, 1).close()
+            rmtree(root)
+
+    def test_fixture_cache(self):
+        '''Test runner with prepared test input from the fixture cache'''
+
+        self.t.id = 1
+        self.t.input_data = u'  Wörld\r\n'
+        self.assertIsNotNone(self.t.input_hash)
+        self.sp = Submission(id=15, assignment=self.a,
+                             language=self.lp, user=self.s)
+        self.sp.source = ur'''# -*- coding: utf-8 -*-
+import sys
+print "Hello World!" if sys.stdin.read() == "Wörld" else "Wrong input"
+'''
+
+        cache = mkdtemp()
+        try:
+            for _ in range(2):
+                with Runner(self.sp, fixture_cache=cache) as r:
+                    testruns = [testrun for testrun in r.test()]
+                self.assertTrue(testruns)
+                for testrun in testruns:
+                    self.assertTrue(testrun.result, 'Testrun with cached input failed: %r' % testrun.output_data)
+                self.assertTrue(os.listdir(os.path.join(cache, '1')))
+
+            # A changed input must not be taken from the cache
+            self.t.input_data = u'Mars'
+            with Runner(self.sp, fixture_cache=cache) as r:
+                testruns = [testrun for testrun in r.test()]
+            for testrun in testruns:
+                self.assertFalse(testrun.result, 'Testrun with changed input succeeded')
+        finally:
+            rmtree(cache)
@@ -28,7 +28,9 @@ except ImportError:
 
 from nose.tools import eq_
 
+from sauce.lib.conversion import numpy
 from sauce.model import Assignment, Test, DBSession
+from sauce.model.test import _expected_outputs
 
 from sauce.tests import setup_db, teardown_db
 
@@ -240,3 +242,92 @@ class TestTest(TestCase):
         result, _, expected, output, _ = test.validate(d)
         converted_output = test.unconvert(test.convert(d))
         assert result is True, (expected, output, converted_output)
+
+    def test_expected_output_cache(self):
+        test = Test(
+            assignment_id=42,
+            output_data=u'3 2 1\n',
+            sort=True,
+        )
+        DBSession.add(test)
+        DBSession.flush()
+        # Stored when the test is saved
+        self.assertEqual(test.expected_key, test.expected_output_key)
+        self.assertEqual(test.expected_output, u'1 2 3')
+        self.assertTrue(test.validate(u'1 2 3')[0])
+
+        # Computed only once per version of the test
+        convert = test.convert
+        try:
+            test.convert = lambda data: self.fail('Expected output converted again')
+            self.assertEqual(test.expected(), u'1 2 3')
+        finally:
+            test.convert = convert
+
+        # Changed options and output data are recognized
+        test.sort = False
+        self.assertFalse(test.validate(u'1 2 3')[0])
+        test.output_data = u'1 2 3 4'
+        self.assertTrue(test.validate(u'1 2 3 4')[0])
+        DBSession.flush()
+        self.assertEqual(test.expected_key, test.expected_output_key)
+        self.assertEqual(test.expected_output, u'1 2 3 4')
+        test.invalidate_expected_output()
+        self.assertIsNone(test.expected_key)
+
+    def test_expected_output_readonly(self):
+        '''Validating does not change the test'''
+        test = Test(
+            assignment_id=42,
+            output_data=u'3 2 1\n',
+            sort=True,
+        )
+        DBSession.add(test)
+        DBSession.flush()
+        # Like a test that has been saved before the expected output was stored
+        DBSession.query(Test).filter_by(id=test.id).update({'expected_key': None}, synchronize_session='evaluate')
+        _expected_outputs.clear()
+        self.assertTrue(test.validate(u'1 2 3')[0])
+        self.assertFalse(DBSession.is_modified(test))
+        self.assertIsNone(test.expected_key)
+
+    def test_first_difference(self):
+        '''The position of the first difference is shown'''
+        test = Test(
+            assignment_id=42,
+            output_data=u'Hello\nWorld\n',
+            splitlines=True, split=False,
+        )
+        DBSession.add(test)
+        DBSession.flush()
+        self.assertEqual(test.validate(u'Hello\nWorld\n')[4], u'')
+        msg = test.validate(u'Hello\nWorms\n')[4]
+        self.assertIn(u'at line 2, column 4', msg)
+        result, partial, _, _, msg = test.validate(u'Hel')
+        self.assertTupleEqual((result, partial), (False, True))
+        self.assertIn(u'at line 1, column 4', msg)
+
+    def test_tolerances(self):
+        if numpy is None:
+            self.skipTest('numpy not available')
+        test = Test(
+            assignment_id=42,
+            output_data=u'1.0 2.0 3.0\n100.0\n',
+            parse_float=True, abs_tolerance=0.01, rel_tolerance=0.001,
+        )
+        DBSession.add(test)
+        DBSession.flush()
+        self.assertTrue(test.numeric)
+        self.assertTupleEqual(test.validate(u'#Result:\n1.005 1.999 3\n100.09')[0:2], (True, False))
+        result, partial, _, _, msg = test.validate(u'1.0 2.0')
+        self.assertTupleEqual((result, partial), (False, True))
+        self.assertIn(u'Expected 4 numbers, got 2', msg)
+        result, partial, _, _, msg = test.validate(u'1.0 2.5 3.0 100.0')
+        self.assertTupleEqual((result, partial), (False, False))
+        self.assertIn(u'0.5 at number 2', msg)
+        d = test.compare_numeric(u'1.0 2.0 3.02 100.0')
+        self.assertEqual(d.index, 2)
+        self.assertAlmostEqual(d.magnitude, 0.02)
+        # Items that are no numbers are compared as before
+        self.assertIsNone(test.compare_numeric(u'1.0 2.0 three 100.0'))
+        self.assertFalse(test.validate(u'1.0 2.0 three 100.0')[0])
@@ -21,12 +21,18 @@
 ## along with this program.  If not, see <http://www.gnu.org/licenses/>.
 #
 
+import os
+from shutil import rmtree
+from tempfile import mkdtemp
+from time import sleep, time
+
 try:
     from unittest2 import TestCase
 except ImportError:
     from unittest import TestCase
 
-from sauce.lib.runner import TimeoutProcess
+from sauce.lib import runner
+from sauce.lib.runner import TimeoutProcess, limits, resource_limits
 
 __all__ = ['TestTimeoutProcess']
 
@@ -56,3 +62,107 @@ class TestTimeoutProcess(TestCase):
         t = self.timeoutProcess(argv, timeout)
         # If process does not finish before timeout, it returns -15
         self.assertNotEqual(t.returncode, 0, "%s did not run into %d second timeout..." % (" ".join(argv), timeout))
+
+    def test_fail_group(self):
+        '''Test that the descendants of a timed out program are killed'''
+
+        tempdir = mkdtemp()
+        try:
+            t = self.timeoutProcess(['/bin/sh', '-c', '(sleep 1.5; touch alive) & sleep 10'], 0.5, cwd=tempdir)
+            self.assertEqual(t.returncode, -1)
+            sleep(2)
+            self.assertFalse(os.path.exists(os.path.join(tempdir, 'alive')))
+        finally:
+            rmtree(tempdir)
+
+    def test_strays(self):
+        '''Test that descendants left running by a program are killed and counted'''
+
+        strays = runner.stray_processes[0]
+        start = time()
+        t = self.timeoutProcess(['/bin/sh', '-c', 'sleep 10 & echo started'], 5)
+        self.assertLess(time() - start, 2)
+        self.assertEqual(t.returncode, 0)
+        self.assertEqual(t.stdout, u'started\n')
+        self.assertEqual(self.timeoutProcess.strays, 1)
+        self.assertEqual(runner.stray_processes[0], strays + 1)
+
+    def test_stdin(self):
+        '''Test a program that echoes more input than fits into a pipe'''
+
+        data = 'Hello World!\n' * 100000
+        t = self.timeoutProcess(['/bin/cat'], 5, stdin=data)
+        self.assertEqual(t.returncode, 0)
+        self.assertEqual(t.stdout, data)
+
+    def test_decode(self):
+        '''Test that output is decoded even if it arrives in pieces'''
+
+        t = self.timeoutProcess(['/bin/sh', '-c', r'printf "\303"; sleep 0.1; printf "\244 \377"'], 5)
+        self.assertEqual(t.returncode, 0)
+        self.assertEqual(t.stdout, u'\xe4 ')
+
+    def test_start_error(self):
+        '''Test that localized error messages of the system are reported'''
+
+        def fail(*args, **kwargs):
+            raise OSError(2, 'Datei oder Verzeichnis nicht gefunden: \xc3\xa4')
+        popen = runner.Popen
+        runner.Popen = fail
+        try:
+            t = self.timeoutProcess(['/bin/date'], 1)
+        finally:
+            runner.Popen = popen
+        self.assertEqual(t.returncode, -127)
+        self.assertIn(u'nicht gefunden: \xe4', t.stderr)
+
+    def test_max_length(self):
+        '''Test a program that does not stop writing output'''
+
+        timeoutProcess = TimeoutProcess(max_length=1024)
+        t = timeoutProcess(['/usr/bin/yes'], 5)
+        self.assertNotEqual(t.returncode, 0)
+        self.assertIn('TRUNCATED', t.stdout)
+        self.assertIn('killed', t.stderr)
+        self.assertLess(len(t.stdout), 1024 + 100)
+
+    def test_usage(self):
+        '''Test that CPU time and peak memory are measured'''
+
+        t = self.timeoutProcess(['/bin/sh', '-c', 'i=0; while [ $i -lt 100000 ]; do i=$((i+1)); done'], 10)
+        self.assertEqual(t.returncode, 0)
+        self.assertGreater(t.usage.user_time + t.usage.system_time, 0)
+        self.assertGreater(t.usage.max_rss, 0)
+
+    def test_cpu_time_limit(self):
+        '''Test a program that runs into its CPU time limit'''
+
+        t = self.timeoutProcess(['/bin/sh', '-c', 'while true; do :; done'], 10,
+            limits=limits(None, 1, None, None, None))
+        self.assertNotEqual(t.returncode, 0)
+        self.assertEqual(t.limit, 'cpu_time')
+        self.assertIn('Resource limit exceeded', t.stderr)
+
+    def test_file_size_limit(self):
+        '''Test a program that runs into its file size limit'''
+
+        tempdir = mkdtemp()
+        try:
+            t = self.timeoutProcess(['/bin/sh', '-c', 'exec head -c 2000000 /dev/zero > out'], 10,
+                limits=limits(None, None, 1, None, None), cwd=tempdir)
+        finally:
+            rmtree(tempdir)
+        self.assertNotEqual(t.returncode, 0)
+        self.assertEqual(t.limit, 'file_size')
+
+    def test_resource_limits(self):
+        '''Test that the most specific resource profile wins'''
+
+        class Profile(object):
+            def __init__(self, **kwargs):
+                for field in limits._fields:
+                    setattr(self, field, kwargs.get(field))
+
+        self.assertIsNone(resource_limits(None, Profile()))
+        l = resource_limits(Profile(memory=64), None, Profile(memory=256, cpu_time=5))
+        self.assertEqual(l, limits(64, 5, None, None, None))
@@ -25,6 +25,7 @@
 #
 
 import logging
+from datetime import datetime
 
 from tg import request, flash, url
 
@@ -32,16 +33,30 @@ from sauce.model.user import lesson_members, team_members
 from sprox.tablebase import TableBase
 from sprox.fillerbase import TableFiller
 
-from sauce.model import Lesson, Submission, Team, User
+from sauce.model import Assignment, Lesson, Sheet, Submission, Team, User
 import sauce.lib.helpers as h
 
 from sauce.widgets.datagrid import JSSortableDataGrid
 from webhelpers.html import literal
 
-from sqlalchemy import union
+from sqlalchemy import and_, or_, union
+from sqlalchemy.orm import joinedload, subqueryload
 
 log = logging.getLogger(__name__)
 
+CURSOR_FORMAT = '%Y-%m-%dT%H:%M:%S.%f'
+
+
+def encode_cursor(submission):
+    '''Keyset cursor for the submissions that come after submission'''
+    return u'%s_%d' % (submission.modified.strftime(CURSOR_FORMAT), submission.id)
+
+
+def decode_cursor(cursor):
+    '''Return (modified, id) from cursor, raises ValueError if it is invalid'''
+    (modified, _, submission_id) = cursor.rpartition('_')
+    return (datetime.strptime(modified, CURSOR_FORMAT), int(submission_id))
+
 
 def _actions(filler, subm):
     result = [u'<a href="%s/show" class="btn btn-mini" title="Show">'
@@ -51,11 +66,12 @@ def _actions(filler, subm):
             and getattr(request, 'user', None) == subm.user):
         result.append(u'<a href="%s/edit" class="btn btn-mini" title="Edit">'
             '<i class="icon-pencil"></i></a>' % (subm.url))
-    if (getattr(request, 'user', None) in subm.assignment.sheet.event.tutorsandteachers
+    is_tutor = filler.event_values(subm.assignment.sheet.event)['is_tutor']
+    if (is_tutor
             or 'manage' in request.permissions):
         result.append(u'<a href="%s/judge" class="btn btn-mini" title="Judge">'
             '<i class="icon-tag"></i></a>' % (subm.url))
-    if (getattr(request, 'user', None) in subm.assignment.sheet.event.tutorsandteachers
+    if (is_tutor
             or getattr(request, 'user', None) == subm.user
             or 'manage' in request.permissions):
         result.append(u'<a class="btn btn-mini btn-danger" data-toggle="modal" '
@@ -88,8 +104,9 @@ def _actions(filler, subm):
 
 class SubmissionTable(TableBase):
     __model__ = Submission
-    __omit_fields__ = ['source', 'assignment_id', 'language_id', 'user_id',
-        'testruns', 'filename', 'complete']
+    __omit_fields__ = ['source', 'source_blob', 'assignment_id', 'language_id', 'user_id',
+        'testruns', 'filename', 'complete',
+        'passed', 'failed', 'total', 'runtime', 'testrun_date', 'testrun_archive', 'grading_jobs']
     __field_order__ = ['id', 'user', 'team', 'assignment', 'language',
         'created', 'modified', 'result', 'judgement', 'grade', 'comment', 'public']
     __add_fields__ = {'team': None, 'result': None, 'grade': None}
@@ -102,8 +119,9 @@ class SubmissionTable(TableBase):
 
 class SubmissionTableFiller(TableFiller):
     __model__ = Submission
-    __omit_fields__ = ['source', 'assignment_id', 'language_id', 'user_id',
-        'testruns', 'filename', 'complete']
+    __omit_fields__ = ['source', 'source_blob', 'assignment_id', 'language_id', 'user_id',
+        'testruns', 'filename', 'complete',
+        'passed', 'failed', 'total', 'runtime', 'testrun_date', 'testrun_archive', 'grading_jobs']
     __add_fields__ = {'team': None, 'result': None, 'grade': None}
     __actions__ = _actions
 
@@ -130,22 +148,26 @@ class SubmissionTableFiller(TableFiller):
 
     def team(self, obj):
         try:
-            return u', '.join(t.name for t in set(obj.user.teams) & set(obj.assignment.sheet.event.teams))
+            teams = self.event_values(obj.assignment.sheet.event)['teams']
+            return u', '.join(t.name for t in obj.user.teams if t.id in teams)
         except:  # pragma: no cover
             return u''
 
     def result(self, obj):
         if obj.result is not None:
             if obj.result:
-                return u'<span class="label label-success" title="%s">Success</a>' % (h.strftime(obj.testrun_date, False))
+                return (u'<span class="label label-success" title="%s">Success</a>'
+                    % (h.strftime(obj.testrun_date, False)))
             else:
-                return u'<span class="label label-important" title="%s">Failed</a>' % (h.strftime(obj.testrun_date, False))
+                return (u'<span class="label label-important" title="%s">Failed</a>'
+                    % (h.strftime(obj.testrun_date, False)))
         else:
             return u'<span class="label">None</a>'
 
     def judgement(self, obj):
         if obj.judgement:
-            return u'<a href="%s/judge" class="label label-info" title="%s">Yes</a>' % (obj.url, h.strftime(obj.judgement.date, False))
+            return (u'<a href="%s/judge" class="label label-info" title="%s">Yes</a>'
+                % (obj.url, h.strftime(obj.judgement.date, False)))
         else:
             return u'<a href="%s/judge" class="label">No</a>' % (obj.url)
 
@@ -191,15 +213,39 @@ class SubmissionTableFiller(TableFiller):
 
     def __init__(self, *args, **kw):
         self.lesson = kw.pop('lesson', None)
+        self.next_cursor = None
+        self._event_values = {}
         super(SubmissionTableFiller, self).__init__(*args, **kw)
 
+    def event_values(self, event):
+        '''Values that are the same for all submissions to event
+
+        They are computed once per table instead of once per row.
+        '''
+        try:
+            return self._event_values[event.id]
+        except KeyError:
+            values = self._event_values[event.id] = dict(
+                is_tutor=getattr(request, 'user', None) in event.tutorsandteachers,
+                teams=set(t.id for t in event.teams),
+            )
+            return values
+
     def _do_get_provider_count_and_objs(self, **kw):
         '''Custom getter function respecting lesson
 
-        Returns the result count from the database and a query object
+        Returns the result count from the database and a query object.
+
+        If limit is given, only that many submissions are returned, the
+        most recently modified first, starting after the keyset cursor
+        after. The cursor for the next page is in next_cursor then.
         '''
         # TODO: Code duplication with CRC?!
 
+        limit = kw.pop('limit', None)
+        after = kw.pop('after', None)
+        self.next_cursor = None
+
         qry = Submission.query
 
         # Process lesson filter
@@ -241,7 +287,8 @@ class SubmissionTableFiller(TableFiller):
         for field_name, value in kwfilters.iteritems():
             field = getattr(self.__model__, field_name)
             try:
-                if self.__provider__.is_relation(self.__model__, field_name) and isinstance(value, list):  # pragma: no cover
+                if (self.__provider__.is_relation(self.__model__, field_name)
+                        and isinstance(value, list)):  # pragma: no cover
                     value = value[0]
                     qry = qry.filter(field.contains(value))
                 else:
@@ -252,4 +299,26 @@ class SubmissionTableFiller(TableFiller):
         # Get total count
         count = qry.count()
 
-        return count, qry
+        # Load everything that is displayed with the submissions at once
+        qry = qry.options(
+            joinedload(Submission.user).subqueryload(User.teams),
+            joinedload(Submission.language),
+            joinedload(Submission.judgement),
+            joinedload(Submission.assignment).joinedload(Assignment.sheet).joinedload(Sheet.event),
+        )
+        self._event_values = {}
+
+        if limit is None:
+            return count, qry
+
+        qry = qry.order_by(None).order_by(Submission.modified.desc(), Submission.id.desc())
+        if after:
+            (modified, submission_id) = decode_cursor(after)
+            qry = qry.filter(or_(Submission.modified < modified,
+                and_(Submission.modified == modified, Submission.id < submission_id)))
+        objs = qry.limit(limit + 1).all()
+        if len(objs) > limit:
+            objs = objs[:limit]
+            self.next_cursor = encode_cursor(objs[-1])
+
+        return count, objs
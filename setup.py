@@ -106,6 +106,7 @@ extras_require = {
     'tests': tests_require,
     'nose': tests_require,
     'nosetests': tests_require,
+    'numeric': ['numpy'],
     'sentry': ['raven'],
     'shell': ['ipython'],
     'lti': [
@@ -146,6 +147,11 @@ setup(
         'gearbox.plugins': [
             'turbogears-devtools = tg.devtools'
         ],
+        'console_scripts': [
+            'sauce-worker = sauce.lib.worker:main',
+            'sauce-backfill = sauce.lib.backfill:main',
+            'sauce-archive = sauce.lib.archive:main',
+        ],
     },
     zip_safe=False,
 )